@@ -1,282 +1,157 @@
 # --- Import necessary libraries ---
-import streamlit as st
+import os
 
-class WinningNumbers:
-    """A class to calculate winning numbers"""
+import streamlit as st
 
-    def __init__(self, _lottery_id, _input_numbers):
-        """Initialize the class with lottery ID and the user's numbers."""
-        self._lottery_id = _lottery_id
-        self._input_numbers = _input_numbers
+from cache import ResultCache
+from core import TicketChecker
+from luck import BaselineLoader, WIN_TIER
+from metrics import Metrics, export_to_file, serve_metrics
+from payout import PayoutSimulator
+from stats import CoOccurrenceStats
+from snapshot import SNAPSHOT_PATH, SnapshotStorage, write_snapshot
+from storage import EmbeddedStorage, PostgresStorage
+
+# Storage behind the app, chosen with the LOTTERY_STORAGE environment variable:
+# - memory: the draw table is loaded once from PostgreSQL and answered in memory (default),
+# - postgres: every lookup is a PostgreSQL query,
+# - embedded: built from the data_refining CSVs, no database server needed,
+# - snapshot: the memory-mapped file of snapshot.py (LOTTERY_SNAPSHOT), shared by every process on the host.
+STORAGE_BACKENDS = ('memory', 'postgres', 'embedded', 'snapshot')
+
+# Seconds between two writes of the LOTTERY_METRICS_FILE.
+METRICS_FILE_INTERVAL = 15
+
+
+def _connect_postgresql():
+    """
+    Return the app's PostgreSQL connection.
+    All DB variables are handled by st.connection and defined in .streamlit/secrets.toml file.
+    """
+    return st.connection("postgresql", type="sql")
+
+
+@st.cache_resource(ttl="1d")
+def load_storage():
+    """
+    Create the storage shared by every session of the process.
+    The data changes weekly, so an in-memory history is rebuilt at most once a day.
+    """
+    backend = os.environ.get('LOTTERY_STORAGE', 'memory')
+    if backend not in STORAGE_BACKENDS:
+        print(f"Invalid LOTTERY_STORAGE value: {backend}. Must be one of {list(STORAGE_BACKENDS)}")
+        backend = 'memory'
+
+    if backend == 'embedded':
+        return EmbeddedStorage.from_csv()
+
+    storage = PostgresStorage(_connect_postgresql, load_metrics())
+    if backend == 'snapshot':
+        path = os.environ.get('LOTTERY_SNAPSHOT', SNAPSHOT_PATH)
         try:
-            self._match_count = st.session_state[f"matches_{_lottery_id}"]
-        except KeyError:
-            self._match_count = None
-
-        # All DB variables are handled by st.connection
-        # and defined in .streamlit/secrets.toml file.
-
-        # Placeholders to store the SQL queries.
-        self.query_matches = ""
-        self.query_total = ""
-
-    def _check_validity_lottery(self):
-        """Validate lottery ID is in the allowed list."""
-        # Ensure the lottery_id is a string for comparison
+            return SnapshotStorage(path)
+        except (OSError, ValueError) as e:
+            print(f"Snapshot {path} could not be opened: {e}. Writing it from the database.")
+            rows = storage.draws()
+            if rows:
+                write_snapshot(path, rows)
+                return SnapshotStorage(path)
+    elif backend == 'memory':
+        rows = storage.draws()
+        if rows:
+            return EmbeddedStorage(rows)
+    else:
+        return storage
+
+    # The history could not be read (printed by draws), every lookup queries the database until the reload.
+    print("The draw history could not be loaded, answering from PostgreSQL.")
+    return storage
+
+
+@st.cache_resource
+def _load_statistics():
+    """Create the number, pair and triple frequency tables shared by every session of the process."""
+    return CoOccurrenceStats()
+
+
+def load_statistics():
+    """
+    Return the frequency tables, the results page shows them without a database query.
+    The first call fills them with the storage's history, later ones only add the draws ingested
+    since, when the storage's latest draw date is newer than the tables' one.
+    """
+    statistics = _load_statistics()
+    storage = load_storage()
+    version = storage.latest_draw_date()
+    if version is not None and version != statistics.latest_draw_date():
+        statistics.add_new_draws(storage.draws())
+    return statistics
+
+
+@st.cache_resource(ttl="1d")
+def load_payout_simulator():
+    """
+    Build the payout simulator once per process from the storage's history,
+    the results page then shows the prizes and the return of a ticket without a database query.
+    """
+    return PayoutSimulator(load_storage().draws())
+
+
+@st.cache_resource
+def load_luck_baselines():
+    """
+    Create the BaselineLoader shared by every session of the process. It reads the baselines saved by
+    `python luck.py` (LOTTERY_BASELINE_DIR) for the current history, a missing or stale one is computed
+    in a background thread and the results page shows no luck section until it is ready.
+    """
+    return BaselineLoader()
+
+
+@st.cache_resource
+def load_metrics():
+    """
+    Create the Metrics shared by every session of the process and start their exposition:
+    - LOTTERY_METRICS_PORT: a Prometheus scrape endpoint at http://host:port/metrics,
+    - LOTTERY_METRICS_FILE: a file rewritten every METRICS_FILE_INTERVAL seconds,
+      e.g. in the textfile collector directory of the Prometheus node exporter.
+    Without either the metrics are only recorded.
+    """
+    metrics = Metrics()
+
+    port = os.environ.get('LOTTERY_METRICS_PORT')
+    if port:
         try:
-            lottery_id_str = str(self._lottery_id)
-
-            # Define the list of supported lotteries
-            allowed_lotteries = ['hu5', 'hu6', 'hu7']
+            serve_metrics(metrics, int(port))
+        except (OSError, ValueError) as e:
+            print(f"Metrics endpoint on port {port} could not be started: {e}")
 
-            # Check if the provided ID is in our allowed list
-            if lottery_id_str not in allowed_lotteries:
-                # Print an error if invalid and return None
-                print(f"Invalid lottery_id value: {lottery_id_str}. Must be one of {allowed_lotteries}")
-                return None  # Invalid
-
-            return lottery_id_str  # Return the valid string ID
-
-        except TypeError:
-            print("Invalid lottery ID type. Cannot convert to string.")
-            return None # Invalid
-
-    def _check_validity_match_count(self):
-        """
-        Validates the match count for the current lottery ID from session state.
-        Returns the valid match count (int) on success, or None on failure.
-        """
-        try:
-            # 1. Get the rules for the current lottery
-            rules = {'hu5': [1,2,3,4,5], 'hu6': [1,2,3,4,5,6], 'hu7': [1,2,3,4,5,6,7]}
+    path = os.environ.get('LOTTERY_METRICS_FILE')
+    if path:
+        export_to_file(metrics, path, METRICS_FILE_INTERVAL)
+    return metrics
 
-            # 2. Get the match range
-            match_range = rules[self._lottery_id]
 
-            # 3. Convert to integer
-            # This will raise ValueError/TypeError if it's not a valid int
-            match_count = int(self._match_count)
+@st.cache_resource
+def load_result_cache():
+    """Create the ResultCache shared by every session of the process."""
+    return ResultCache()
 
-            # 4. Check if the integer is in the valid range
-            if match_count in match_range:
-                return match_count
-            else:
-                # It's an int, but out of range (e.g., 0 or 8 for a 6-limit)
-                return None
 
-        except (KeyError, ValueError, TypeError):
-            print(f"Error validating match count for {self._lottery_id}.")
-            return None
+class WinningNumbers(TicketChecker):
+    """Streamlit adapter of TicketChecker, the match count comes from the session state."""
 
-    def _check_validity_numbers(self):
+    def __init__(self, _lottery_id, _input_numbers, storage=None, cache=None, metrics=None):
         """
-        Validate numbers:
-        - Convert to list of integers.
-        - Check for correct length and range based on lottery_id.
-        Returns list of valid integers or None if validation fails.
+        Initialize the class with lottery ID and the user's numbers.
+        The storage (see storage.py) answers the lookups, PostgresStorage on st.connection by default,
+        an optional ResultCache answers repeated tickets without running them again
+        and optional Metrics record the stage durations, cache lookups and errors.
         """
-        # Convert input from a set to a list if necessary
-        if isinstance(self._input_numbers, set):
-            self._input_numbers = list(self._input_numbers)
-
-        # Check if the input list is empty
-        if not self._input_numbers:
-            print("Error: No numbers provided.")
-            return None
-
-        try:
-            # Convert all numbers in the list to integers
-            numbers_list = [int(n) for n in self._input_numbers]
-        except (ValueError, TypeError):
-            # Fail if any number cannot be converted to an integer
-            print("Error: All input numbers must be convertible to integers.")
-            return None  # Failed validation
-
-        # Define validation rules for each lottery type
-        rules = {
-            'hu5': {'length': 5, 'min': 1, 'max': 90},  # 5 numbers, 1-90
-            'hu6': {'length': 6, 'min': 1, 'max': 45},  # 6 numbers, 1-45
-            'hu7': {'length': 7, 'min': 1, 'max': 35}  # 7 numbers, 1-35
-        }
-
-        # Get the specific rule set for the current lottery_id
-        lottery_rule = rules.get(self._lottery_id)
-
-        # Apply the rules if they exist
-        if lottery_rule:
-            # Check if the correct number of numbers was provided
-            if len(numbers_list) != lottery_rule['length']:
-                print(
-                    f"Error: Lottery '{self._lottery_id}' requires {lottery_rule['length']}"
-                    f" numbers, but {len(numbers_list)} were provided.")
-                return None  # Failed validation
-
-            # Check if all numbers are within the allowed min/max range
-            for num in numbers_list:
-                if not (lottery_rule['min'] <= num <= lottery_rule['max']):
-                    print(
-                        f"Error: Number {num} is out of range for '{self._lottery_id}'"
-                        f" ({lottery_rule['min']}-{lottery_rule['max']}).")
-                    return None  # Failed validation
-
-        # If all checks pass, return the validated list of integers
-        return numbers_list
-
-    def _run_db_queries(self, query_matches, match_params, query_total, total_params):
-        """Helper method to connect to the DB and execute queries using st.connection."""
         try:
-            # 1. Initialize the connection.
-            # This uses secrets.toml by default.
-            conn = st.connection("postgresql", type="sql")
-
-            # 2. First query: find all matching draws
-            # conn.query() returns a Pandas DataFrame.
-            # Pass parameters using the 'params' argument.
-            df_matches = conn.query(query_matches, params=match_params, ttl="1m")
-
-            # 3. Second query: find the total number of draws
-            df_total = conn.query(query_total, params=total_params, ttl="1m")
-
-            # Convert the matches DataFrame to a list of tuples,
-            results = list(df_matches.itertuples(index=False, name=None))
-
-            # Extract the single count value from the total_draws DataFrame
-            total_draws = int(df_total.iloc[0, 0])
-
-            # Return the data in the format your other methods expect
-            return results, total_draws
-
-        except Exception as e:
-            # Handle any query or connection errors
-            print(f"Database query error: {e}")
-            return [], 0
-
-    def check_lottery_numbers(self):
-        """
-        Main method to check lottery numbers against the database.
-        It validates input, defines queries, runs them, and formats the output.
-        """
-
-        formatted_results, total_draws, winning_draws = [], 0, 0
-
-        # Step 1: Validate the lottery ID
-        lottery = self._check_validity_lottery()
-        if not lottery:
-            return  formatted_results, total_draws, winning_draws  # Invalid lottery_id, return empty results
-
-        # Step 2: Validate the user's numbers
-        numbers = self._check_validity_numbers()
-        if not numbers:
-            return  formatted_results, total_draws, winning_draws  # Invalid numbers, return empty results
-
-        # Step 3: Validate the user's match count
-        match_count = self._check_validity_match_count()
-        if not match_count:
-            return  formatted_results, total_draws, winning_draws  # Invalid match count, return empty results
-
-        # Initialize variables
-        formatted_results = []
-        total_draws = 0
-
-        # --- Logic for 'hu7' (which has two sets of numbers) ---
-        if self._lottery_id == 'hu7':
-            self.query_matches = """
-                        SELECT
-                            sub_a.draw_date,
-                            sub_a.numbers,
-                            sub_a.match_count AS match_count_a,
-                            sub_b.numbers,
-                            sub_b.match_count AS match_count_b,
-                            COUNT(*) OVER () AS total_count 
-                        FROM
-                            (
-                                SELECT
-                                    draw_date, numbers,
-                                    CARDINALITY(ARRAY(
-                                        SELECT UNNEST(numbers)
-                                        INTERSECT
-                                        SELECT UNNEST(:numbers_a) -- This is numbers_set_a
-                                    )) AS match_count
-                                FROM draw
-                                WHERE lottery_id = :id_a -- This is lottery_id 'hu7a'
-                            ) AS sub_a
-
-                        INNER JOIN
-                            (
-                                SELECT
-                                    draw_date, numbers,
-                                    CARDINALITY(ARRAY(
-                                        SELECT UNNEST(numbers)
-                                        INTERSECT
-                                        SELECT UNNEST(:numbers_b) -- This is numbers_set_b
-                                    )) AS match_count
-                                FROM draw
-                                WHERE lottery_id = :id_b -- This is lottery_id 'hu7b'
-                            ) AS sub_b
-                        ON
-                            sub_a.draw_date = sub_b.draw_date
-                        WHERE
-                            sub_b.match_count = :match_count OR
-                            sub_a.match_count = :match_count
-                        ORDER BY
-                            sub_a.draw_date DESC
-                        LIMIT 20;
-                            """
-            self.query_total = "SELECT COUNT(*) FROM draw WHERE lottery_id = :id;"
-
-            match_params = {
-                "numbers_a": numbers,
-                "id_a": 'hu7a',
-                "numbers_b": numbers,
-                "id_b": 'hu7b',
-                "match_count": match_count
-            }
-            total_params = {"id": 'hu7a'}
-
-            # Get raw data from DB using the helper method
-            raw_results, total_draws = self._run_db_queries(
-                self.query_matches, match_params, self.query_total, total_params
-            )
-
-            # --- Format results for hu7 (Date, Match A, Match B) ---
-            formatted_results = [(row[0].strftime("%Y-%m-%d"), row[1], row[2], row[3], row[4]) for row in
-                                 raw_results]
-
-
-            winning_draws = raw_results[0][-1] if raw_results else 0
-
-        # --- Logic for 'hu5' or 'hu6' (which have one set of numbers) ---
-        elif self._lottery_id == 'hu5' or self._lottery_id == 'hu6':
-            self.query_matches = """
-            SELECT *, COUNT(*) OVER () AS total_count 
-            FROM (
-                SELECT draw_date, numbers,
-                       CARDINALITY(ARRAY(
-                           SELECT UNNEST(numbers)
-                           INTERSECT
-                           SELECT UNNEST(:number)
-                       )) AS match_count
-                FROM draw
-                WHERE lottery_id = :id
-            ) AS sub
-            WHERE match_count = :match_count
-            ORDER BY draw_date DESC
-            LIMIT 20;
-            """
-            self.query_total = "SELECT COUNT(*) FROM draw WHERE lottery_id = :id;"
-
-            match_params = {"number": numbers, "id": lottery, 'match_count': match_count}
-            total_params = {"id": lottery}
-
-            # Get raw data from DB using the helper method
-            raw_results, total_draws = self._run_db_queries(
-                self.query_matches, match_params, self.query_total, total_params
-            )
-
-            # --- Format results for hu5/hu6 (Date, Match Count) ---
-            formatted_results = [(row[0].strftime("%Y-%m-%d"), row[1], row[2]) for row in raw_results]
-
-            winning_draws = raw_results[0][-1] if raw_results else 0
+            match_count = st.session_state[f"matches_{_lottery_id}"]
+        except KeyError:
+            match_count = None
 
-        # Return the final formatted results and the total draw count
-        return formatted_results, total_draws, winning_draws
+        if storage is None:
+            storage = PostgresStorage(_connect_postgresql, metrics)
+        super().__init__(_lottery_id, _input_numbers, storage, match_count, cache, metrics)
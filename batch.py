@@ -0,0 +1,143 @@
+# --- Import necessary libraries ---
+import numpy as np
+
+from bitmap_index import pad_draws
+from engine import DRAW_RULES, group_draws, pair_hu7
+
+# Ticket shape of every lottery the user can play.
+TICKET_RULES = {
+    'hu5': {'length': 5, 'max': 90, 'draws': ['hu5']},
+    'hu6': {'length': 6, 'max': 45, 'draws': ['hu6']},
+    'hu7': {'length': 7, 'max': 35, 'draws': ['hu7a', 'hu7b']}
+}
+
+# Fewest matches that win a prize (see rules_en.txt).
+PRIZE_MIN_MATCHES = {'hu5': 2, 'hu6': 3, 'hu7': 4}
+
+# Upper bound of the (tickets x draws) match count matrix held in memory at once.
+MAX_CHUNK_ELEMENTS = 2 ** 24
+
+
+def one_hot(numbers, max_number):
+    """
+    Convert a (n, k) int array of ball numbers to a (n, max_number) float32 0/1 matrix.
+    Column n - 1 belongs to ball n, the 0 padding of short draws is dropped.
+    """
+    numbers = np.asarray(numbers, dtype=np.int64)
+    matrix = np.zeros((len(numbers), max_number + 1), dtype=np.float32)
+    matrix[np.arange(len(numbers))[:, None], numbers] = 1
+    return matrix[:, 1:]
+
+
+class BatchChecker:
+    """
+    Checks many tickets against the full draw history at once.
+    The match counts of a chunk of tickets are a one-hot ticket matrix
+    times the transposed one-hot draw matrix.
+    """
+
+    def __init__(self, rows):
+        """Build the one-hot draw matrices from (lottery_id, draw_date, numbers) rows."""
+        self._matrices = {}
+        self._dates = {}  # Per lottery the date of every matrix column, newest draw first
+        draws = group_draws(rows)
+
+        for lottery_id in ('hu5', 'hu6'):
+            if lottery_id in draws:
+                rule = DRAW_RULES[lottery_id]
+                numbers = pad_draws(draws[lottery_id][1], rule['length'])
+                self._matrices[lottery_id] = [one_hot(numbers, rule['max']).T]
+                self._dates[lottery_id] = draws[lottery_id][0]
+
+        # hu7: one matrix per draw, aligned on the paired dates.
+        if 'hu7a' in draws and 'hu7b' in draws:
+            pairs = pair_hu7(draws['hu7a'][0], draws['hu7b'][0])
+            self._matrices['hu7'] = []
+            self._dates['hu7'] = [draws['hu7a'][0][pair[0]] for pair in pairs]
+            for lottery_id, side in (('hu7a', 0), ('hu7b', 1)):
+                rule = DRAW_RULES[lottery_id]
+                numbers = pad_draws([draws[lottery_id][1][pair[side]] for pair in pairs], rule['length'])
+                self._matrices['hu7'].append(one_hot(numbers, rule['max']).T)
+
+    def _validate_tickets(self, lottery_id, tickets):
+        """Return the tickets as a (M, k) int array or raise ValueError."""
+        if lottery_id not in TICKET_RULES:
+            raise ValueError(f"Invalid lottery_id value: {lottery_id}. Must be one of {list(TICKET_RULES)}")
+        rule = TICKET_RULES[lottery_id]
+
+        tickets = np.asarray(tickets, dtype=np.int64)
+        if tickets.ndim != 2 or tickets.shape[1] != rule['length']:
+            raise ValueError(f"Lottery '{lottery_id}' requires an (M, {rule['length']}) array of tickets,"
+                             f" but the shape is {tickets.shape}.")
+        if tickets.size and (tickets.min() < 1 or tickets.max() > rule['max']):
+            raise ValueError(f"Ticket numbers are out of range for '{lottery_id}' (1-{rule['max']}).")
+        if tickets.size and (np.diff(np.sort(tickets, axis=1), axis=1) == 0).any():
+            raise ValueError("Every ticket must have distinct numbers.")
+        return tickets
+
+    def dates(self, lottery_id):
+        """Return the draw dates of a lottery, in the order of the match count columns (newest first)."""
+        return list(self._dates.get(lottery_id, []))
+
+    def _chunk_counts(self, lottery_id, tickets, chunk_size=None):
+        """
+        Yield (start, stop, counts) for consecutive chunks of already validated tickets,
+        counts is a list of (stop - start, n_draws) uint8 match count arrays, one per draw (two for hu7).
+        Chunks keep the match count matrix below MAX_CHUNK_ELEMENTS, the uint8 copy adds a quarter
+        of the float32 product instead of doubling it.
+        """
+        draw_matrices = self._matrices.get(lottery_id)
+        if not draw_matrices or not len(tickets):
+            return
+
+        n_draws = draw_matrices[0].shape[1]
+        if chunk_size is None:
+            chunk_size = max(1, MAX_CHUNK_ELEMENTS // max(n_draws, 1))
+
+        for start in range(0, len(tickets), chunk_size):
+            stop = min(start + chunk_size, len(tickets))
+            ticket_matrix = one_hot(tickets[start:stop], TICKET_RULES[lottery_id]['max'])
+            yield start, stop, [(ticket_matrix @ draw_matrix).astype(np.uint8) for draw_matrix in draw_matrices]
+
+    def match_counts(self, lottery_id, tickets):
+        """
+        Return the (M, n_draws) uint8 match counts of every ticket against every draw,
+        one array per draw (two for hu7). Holds the full matrix, use check() for large M.
+        """
+        tickets = self._validate_tickets(lottery_id, tickets)
+        ticket_matrix = one_hot(tickets, TICKET_RULES[lottery_id]['max'])
+        return [(ticket_matrix @ draw_matrix).astype(np.uint8) for draw_matrix in self._matrices.get(lottery_id, [])]
+
+    def check(self, lottery_id, tickets, chunk_size=None):
+        """
+        Check M tickets against the whole history of a lottery.
+        Returns (histograms, wins):
+        - histograms: (M, k + 1) int64, draws at every match level 0..k per ticket
+          (a hu7 date is counted at the level of both of its draws, once if they are equal).
+        - wins: (M,) int64, draws with a prize (hu7: either draw) per ticket.
+        Tickets are processed in chunks so the match count matrix stays below MAX_CHUNK_ELEMENTS.
+        """
+        tickets = self._validate_tickets(lottery_id, tickets)
+        rule = TICKET_RULES[lottery_id]
+        n_levels = rule['length'] + 1
+        n_tickets = len(tickets)
+
+        histograms = np.zeros((n_tickets, n_levels), dtype=np.int64)
+        wins = np.zeros(n_tickets, dtype=np.int64)
+
+        for start, stop, counts in self._chunk_counts(lottery_id, tickets, chunk_size):
+            # Offset every row's counts so one bincount builds all histograms of the chunk.
+            offsets = np.arange(stop - start)[:, None] * n_levels
+            levels = np.bincount((counts[0] + offsets).ravel(), minlength=(stop - start) * n_levels)
+            if len(counts) == 2:
+                # hu7: add the manual draw's level only where it differs from the mechanical one.
+                differs = counts[1] != counts[0]
+                levels += np.bincount((counts[1] + offsets)[differs], minlength=(stop - start) * n_levels)
+            histograms[start:stop] = levels.reshape(-1, n_levels)
+
+            won = counts[0] >= PRIZE_MIN_MATCHES[lottery_id]
+            for other in counts[1:]:
+                won |= other >= PRIZE_MIN_MATCHES[lottery_id]
+            wins[start:stop] = won.sum(axis=1)
+
+        return histograms, wins
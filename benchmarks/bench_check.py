@@ -0,0 +1,235 @@
+"""
+Benchmark suite of the check path (check_lottery_numbers) across engines and history sizes.
+
+Run from the repository root:
+    python -m benchmarks.bench_check [--sizes 1000 10000 100000 1000000 10000000] [--repeat 200]
+                                     [--output bench_check.json] [--baseline old.json --tolerance 0.2]
+
+Every engine answers "how many draws had exactly m matches with this ticket, and which are the
+latest 20" for random tickets on synthetic histories of every lottery (hu5, hu6, hu7):
+- core: TicketChecker.check_lottery_numbers on an EmbeddedStorage (the app's default path),
+  up to --max-row-draws draws, as it keeps one Python object per draw and weekly dates.
+- bit_sliced_index: BitSlicedIndex, the NumPy bitmap index, at every size.
+- postgres: TicketChecker on PostgresStorage at the shipped size, if DATABASE_URL is set to a
+  database loaded with data_refining/SQL_commands/lottery.sql.
+
+Every result has the build time, p50/p95/p99 latency, throughput and the peak memory traced
+by tracemalloc while building the engine from the generated history and querying it.
+The results are written to --output as JSON. With --baseline the p50 latencies are compared
+with an earlier run and the exit status is 1 if any got slower than --tolerance allows.
+"""
+# --- Import necessary libraries ---
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from batch import PRIZE_MIN_MATCHES, TICKET_RULES
+from bitmap_index import BitSlicedIndex
+from core import TicketChecker
+from engine import DRAW_RULES
+from storage import EmbeddedStorage
+from benchmarks.synthetic import synthetic_draws, synthetic_rows
+
+DEFAULT_SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+RESULT_LIMIT = 20
+
+
+def random_tickets(lottery_id, n_tickets, seed):
+    """Return n_tickets random tickets of a lottery as lists of ints."""
+    rule = TICKET_RULES[lottery_id]
+    return synthetic_draws(rule['draws'][0], n_tickets, seed=seed).tolist()
+
+
+def time_calls(func, tickets):
+    """Call func once per ticket and return the latencies in microseconds."""
+    latencies = np.empty(len(tickets))
+    for i, ticket in enumerate(tickets):
+        start = time.perf_counter()
+        func(ticket)
+        latencies[i] = time.perf_counter() - start
+    return latencies * 1e6
+
+
+def summarize(engine, lottery_id, n_draws, build_seconds, latencies, peak_bytes):
+    """Return the JSON record of one measurement."""
+    return {
+        'engine': engine,
+        'lottery_id': lottery_id,
+        'n_draws': n_draws,
+        'build_s': round(build_seconds, 6),
+        'calls': len(latencies),
+        'p50_us': round(float(np.percentile(latencies, 50)), 2),
+        'p95_us': round(float(np.percentile(latencies, 95)), 2),
+        'p99_us': round(float(np.percentile(latencies, 99)), 2),
+        'mean_us': round(float(latencies.mean()), 2),
+        'throughput_per_s': round(float(len(latencies) / (latencies.sum() / 1e6)), 1),
+        'peak_memory_bytes': peak_bytes
+    }
+
+
+def measure(engine, lottery_id, n_draws, build, query, tickets):
+    """
+    Build an engine and time its queries, return the JSON record.
+    tracemalloc slows down every allocation, so the peak memory is traced on a separate
+    build with a few queries and the timed build and queries run untraced.
+    """
+    tracemalloc.start()
+    try:
+        built = build()
+        time_calls(lambda ticket: query(built, ticket), tickets[:5])
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    del built
+
+    start = time.perf_counter()
+    built = build()
+    build_seconds = time.perf_counter() - start
+    latencies = time_calls(lambda ticket: query(built, ticket), tickets)
+    return summarize(engine, lottery_id, n_draws, build_seconds, latencies, peak_bytes)
+
+
+def history_rows(lottery_id, n_draws, seed):
+    """Return synthetic draw table rows of a ticket lottery, hu7 has a draw a and b on every date."""
+    rows = []
+    for offset, draw_lottery_id in enumerate(TICKET_RULES[lottery_id]['draws']):
+        rows.extend(synthetic_rows(draw_lottery_id, n_draws, seed + offset))
+    return rows
+
+
+def bench_core(lottery_id, n_draws, tickets, seed):
+    """Measure TicketChecker.check_lottery_numbers on an EmbeddedStorage."""
+    match_count = PRIZE_MIN_MATCHES[lottery_id]
+
+    def query(storage, ticket):
+        return TicketChecker(lottery_id, ticket, storage, match_count).check_lottery_numbers()
+
+    rows = history_rows(lottery_id, n_draws, seed)
+    return measure('core', lottery_id, n_draws, lambda: EmbeddedStorage(rows), query, tickets)
+
+
+def bench_bit_sliced_index(lottery_id, n_draws, tickets, seed):
+    """Measure the winning count and the latest matching draws on BitSlicedIndex."""
+    match_count = PRIZE_MIN_MATCHES[lottery_id]
+    draw_lottery_ids = TICKET_RULES[lottery_id]['draws']
+    draws = [synthetic_draws(draw_lottery_id, n_draws, seed + offset)
+             for offset, draw_lottery_id in enumerate(draw_lottery_ids)]
+
+    def build():
+        return [BitSlicedIndex(numbers, DRAW_RULES[draw_lottery_id]['max'])
+                for numbers, draw_lottery_id in zip(draws, draw_lottery_ids)]
+
+    def query(indexes, ticket):
+        # hu7: a date matches if either of its draws does.
+        mask = indexes[0].match_mask(ticket, match_count)
+        for index in indexes[1:]:
+            mask |= index.match_mask(ticket, match_count)
+        winning_draws = int(np.bitwise_count(mask).sum())
+        mask_bits = np.unpackbits(mask.view(np.uint8), bitorder='little')
+        return np.flatnonzero(mask_bits[:n_draws])[:RESULT_LIMIT], winning_draws
+
+    return measure('bit_sliced_index', lottery_id, n_draws, build, query, tickets)
+
+
+def bench_postgres(lottery_id, database_url, tickets):
+    """Measure TicketChecker.check_lottery_numbers on PostgresStorage (shipped data, no query cache)."""
+    import pandas as pd
+    import sqlalchemy
+
+    from storage import PostgresStorage
+
+    db_engine = sqlalchemy.create_engine(database_url)
+
+    class _Connection:
+        """Stand-in for st.connection("postgresql", type="sql") without caching."""
+
+        def query(self, sql, params=None, ttl=None):
+            with db_engine.connect() as conn:
+                return pd.read_sql(sqlalchemy.text(sql), conn, params=params)
+
+    storage = PostgresStorage(_Connection)
+    match_count = PRIZE_MIN_MATCHES[lottery_id]
+
+    def query(_, ticket):
+        return TicketChecker(lottery_id, ticket, storage, match_count).check_lottery_numbers()
+
+    n_draws = query(None, tickets[0])[1]
+    return measure('postgres', lottery_id, n_draws, lambda: storage, query, tickets)
+
+
+def compare(results, baseline_path, tolerance):
+    """Print the p50 change against a baseline JSON and return the regressed records."""
+    with open(baseline_path) as f:
+        baseline = {(r['engine'], r['lottery_id'], r['n_draws']): r for r in json.load(f)['results']}
+
+    regressions = []
+    for result in results:
+        old = baseline.get((result['engine'], result['lottery_id'], result['n_draws']))
+        if old is None:
+            continue
+        change = result['p50_us'] / old['p50_us'] - 1
+        flag = "REGRESSION" if change > tolerance else ""
+        print(f"{result['engine']:<17} {result['lottery_id']:<4} {result['n_draws']:>10,} draws"
+              f"   p50 {old['p50_us']:>12,.1f} -> {result['p50_us']:>12,.1f} us   {change:+7.1%} {flag}")
+        if flag:
+            regressions.append(result)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="History sizes in draws.")
+    parser.add_argument('--lotteries', nargs='+', default=list(TICKET_RULES), choices=list(TICKET_RULES))
+    parser.add_argument('--repeat', type=int, default=200, help="Timed calls (random tickets) per measurement.")
+    parser.add_argument('--max-row-draws', type=int, default=10 ** 5,
+                        help="Largest history of the core engine.")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='bench_check.json', help="JSON file of the results.")
+    parser.add_argument('--baseline', help="JSON file of an earlier run to compare with.")
+    parser.add_argument('--tolerance', type=float, default=0.2, help="Allowed relative p50 slowdown.")
+    args = parser.parse_args()
+
+    results = []
+    for lottery_id in args.lotteries:
+        tickets = random_tickets(lottery_id, args.repeat, args.seed + 100)
+        for n_draws in args.sizes:
+            if n_draws <= args.max_row_draws:
+                results.append(bench_core(lottery_id, n_draws, tickets, args.seed))
+            results.append(bench_bit_sliced_index(lottery_id, n_draws, tickets, args.seed))
+        if os.environ.get('DATABASE_URL'):
+            results.append(bench_postgres(lottery_id, os.environ['DATABASE_URL'], tickets))
+
+        for r in results:
+            if r['lottery_id'] == lottery_id:
+                print(f"{r['engine']:<17} {lottery_id:<4} {r['n_draws']:>10,} draws   build {r['build_s']:>8.3f} s"
+                      f"   p50 {r['p50_us']:>11,.1f} us   p99 {r['p99_us']:>11,.1f} us"
+                      f"   {r['throughput_per_s']:>10,.0f}/s   peak {r['peak_memory_bytes'] / 2 ** 20:>8,.1f} MiB")
+
+    report = {
+        'meta': {
+            'created': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'python': sys.version.split()[0],
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'seed': args.seed
+        },
+        'results': results
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline and compare(results, args.baseline, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
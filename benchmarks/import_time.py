@@ -0,0 +1,62 @@
+"""
+Cold-start import cost of the Streamlit-free core compared with the Streamlit backend.
+
+Run from the repository root:
+    python -m benchmarks.import_time --repeat 5
+
+Every import runs in a fresh interpreter with -X importtime. The report shows the median
+cumulative import time, the median wall time of the whole process and the number of loaded modules.
+"""
+# --- Import necessary libraries ---
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+# What a worker or CLI needs versus what the Streamlit app loads.
+TARGETS = {
+    'core': ['core'],
+    'core + storage + cache': ['core', 'storage', 'cache'],
+    'backend (Streamlit)': ['backend'],
+}
+
+
+def measure(modules):
+    """Return (cumulative import µs, process wall seconds, loaded modules) of importing modules in a fresh interpreter."""
+    code = f"import {', '.join(modules) or 'sys'}; import sys; print(len(sys.modules))"
+    start = time.perf_counter()
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                               capture_output=True, text=True, check=True)
+    wall = time.perf_counter() - start
+
+    # Lines look like "import time:  self [us] | cumulative | imported package",
+    # the cumulative time of a target includes everything it imported first.
+    cumulative = 0
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split('|')
+        if name.strip() in modules and not name.startswith('  '):
+            cumulative += int(cumulative_us)
+
+    return cumulative, wall, int(completed.stdout.strip())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5, help="Fresh interpreters per target.")
+    args = parser.parse_args()
+
+    baseline = statistics.median(measure([])[1] for _ in range(args.repeat))
+    print(f"{'target':<24} {'imports [ms]':>13} {'process [ms]':>13} {'modules':>8}")
+    print(f"{'python (empty)':<24} {'':>13} {baseline * 1000:>13.1f}")
+    for name, modules in TARGETS.items():
+        runs = [measure(modules) for _ in range(args.repeat)]
+        imports = statistics.median(run[0] for run in runs) / 1000
+        wall = statistics.median(run[1] for run in runs) * 1000
+        print(f"{name:<24} {imports:>13.1f} {wall:>13.1f} {runs[0][2]:>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""
+Per-click cost of the number picker on a real Streamlit server.
+
+Run from the repository root:
+    python -m benchmarks.picker_clicks [--lottery hu5] [--clicks 200]
+
+Starts `streamlit run streamlit_app.py` headless on a free port and talks to it over the
+websocket like a browser: it picks English, accepts the disclaimer, opens the lottery's picker
+and then clicks numbers on and off. For every click it measures the round trip until the
+server reports the run finished, the script runs it took, and the bytes the server sent.
+The server CPU time is read from /proc (Linux) before and after the clicks.
+"""
+# --- Import necessary libraries ---
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from tornado.websocket import websocket_connect
+
+# A run is over when the server reports one of these, FINISHED_EARLY_FOR_RERUN is followed by another run.
+FINISHED = (ForwardMsg.FINISHED_SUCCESSFULLY, ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY)
+
+
+def free_port():
+    """Return a free TCP port on localhost."""
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def cpu_seconds(pid):
+    """Return the user + system CPU seconds of a process (Linux /proc)."""
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(')', 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+
+
+class StreamlitClient:
+    """Minimal websocket client of a Streamlit session, clicking buttons by label or key."""
+
+    def __init__(self, connection):
+        self._connection = connection
+        self.buttons = {}  # label or widget key: (widget id, fragment id)
+
+    @classmethod
+    async def connect(cls, port):
+        return cls(await websocket_connect(f"ws://127.0.0.1:{port}/_stcore/stream"))
+
+    async def rerun(self, widget_id=None, fragment_id=''):
+        """
+        Request a rerun, with a button trigger if widget_id is given.
+        Returns (round trip seconds, script runs, bytes received) once the run is finished.
+        """
+        message = BackMsg()
+        message.rerun_script.fragment_id = fragment_id
+        if widget_id:
+            state = message.rerun_script.widget_states.widgets.add()
+            state.id = widget_id
+            state.trigger_value = True
+
+        start = time.perf_counter()
+        await self._connection.write_message(message.SerializeToString(), binary=True)
+        runs, received = 0, 0
+        while True:
+            raw = await self._connection.read_message()
+            received += len(raw)
+            forward = ForwardMsg()
+            forward.ParseFromString(raw)
+            kind = forward.WhichOneof('type')
+            if kind == 'delta' and forward.delta.new_element.WhichOneof('type') == 'button':
+                button = forward.delta.new_element.button
+                widget = (button.id, forward.delta.fragment_id)
+                self.buttons[button.label] = widget
+                self.buttons[button.id.rsplit('-', 1)[-1]] = widget  # The key of keyed buttons
+            elif kind == 'script_finished':
+                runs += 1
+                if forward.script_finished in FINISHED:
+                    return time.perf_counter() - start, runs, received
+
+    async def click(self, name):
+        """Click a button by its label or key, inside its fragment if it has one."""
+        widget_id, fragment_id = self.buttons[name]
+        return await self.rerun(widget_id, fragment_id)
+
+
+async def bench(port, pid, lottery_id, clicks):
+    """Open the picker of a lottery and return the per-click measurements."""
+    client = await StreamlitClient.connect(port)
+    await client.rerun()
+    for name in ("English", "✅ I Accept", {'hu5': "Ötöslottó", 'hu6': "Hatoslottó", 'hu7': "Skandináv lottó"}[lottery_id]):
+        await client.click(name)
+
+    # Warm up, then toggle the numbers 1..4 on and off.
+    for n in (1, 1):
+        await client.click(f"num_{lottery_id}_{n}")
+
+    cpu_before = cpu_seconds(pid)
+    results = [await client.click(f"num_{lottery_id}_{1 + (i // 2) % 4}") for i in range(clicks)]
+    cpu = cpu_seconds(pid) - cpu_before
+    return results, cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--lottery', default='hu5', choices=['hu5', 'hu6', 'hu7'])
+    parser.add_argument('--clicks', type=int, default=200, help="Timed number clicks.")
+    args = parser.parse_args()
+
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', 'streamlit_app.py', '--server.headless', 'true',
+         '--server.port', str(port), '--browser.gatherUsageStats', 'false'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        for _ in range(100):
+            try:
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+                break
+            except OSError:
+                time.sleep(0.2)
+
+        results, cpu = asyncio.run(bench(port, server.pid, args.lottery, args.clicks))
+    finally:
+        server.terminate()
+        server.wait()
+
+    seconds = sorted(r[0] for r in results)
+    print(f"{args.lottery}: {args.clicks} number clicks")
+    print(f"  round trip   p50 {statistics.median(seconds) * 1000:.1f} ms"
+          f"   p95 {seconds[int(len(seconds) * 0.95) - 1] * 1000:.1f} ms")
+    print(f"  server CPU   {cpu / args.clicks * 1000:.1f} ms per click")
+    print(f"  script runs  {statistics.mean(r[1] for r in results):.1f} per click")
+    print(f"  payload      {statistics.mean(r[2] for r in results) / 1024:.1f} KiB per click")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Server render cost of the Streamlit pages: script time, elements and websocket payload per rerun.
+
+Run from the repository root:
+    python -m benchmarks.render [--repeat 20] [--page-sizes 20 100]
+
+Every scenario runs streamlit_app with Streamlit's AppTest on the embedded storage (the
+data_refining CSVs, no database needed). The first run fills the session state, then the page
+is rerun --repeat times, like after a click that changes nothing on it. Per rerun the report shows
+the median script time, the number of element deltas and the bytes of all ForwardMsgs the
+server would send over the websocket.
+"""
+# --- Import necessary libraries ---
+import argparse
+import os
+import statistics
+import time
+
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+# streamlit_app with a configurable page size, imported once and reused by every run.
+SCRIPT = """
+import streamlit_app
+streamlit_app.StreamlitFrontend.PAGE_SIZE = {page_size}
+streamlit_app.run_app()
+"""
+
+# Results page of a ticket with many winning draws per lottery: (lottery_id, numbers, match count).
+SCENARIOS = {
+    'results hu5': ('hu5', (1, 2, 3, 4, 5), 2),
+    'results hu6': ('hu6', (1, 2, 3, 4, 5, 6), 2),
+    'results hu7': ('hu7', (1, 2, 3, 4, 5, 6, 7), 3),
+}
+
+# The ForwardMsgs of the last script run, recorded by the patched LocalScriptRunner.run.
+_last_run = {}
+
+
+def _recording_run(run):
+    """Wrap LocalScriptRunner.run to record the time and the messages of every script run."""
+    def wrapper(self, *args, **kwargs):
+        start = time.perf_counter()
+        tree = run(self, *args, **kwargs)
+        _last_run['seconds'] = time.perf_counter() - start
+        _last_run['messages'] = list(self.forward_msgs())
+        return tree
+    return wrapper
+
+
+def results_app(lottery_id, numbers, match_count, page_size):
+    """Return an AppTest on the results page of a ticket."""
+    at = AppTest.from_string(SCRIPT.format(page_size=page_size), default_timeout=60)
+    at.session_state["language"] = "en"
+    at.session_state["disclaimer_accepted"] = True
+    at.session_state["lottery_id"] = lottery_id
+    at.session_state[f"selected_numbers_{lottery_id}"] = set(numbers)
+    at.session_state[f"matches_{lottery_id}"] = match_count
+    at.session_state["get_winning_numbers"] = True
+    return at
+
+
+def measure(at, repeat):
+    """Return (median rerun seconds, element deltas, payload bytes) of an AppTest page."""
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+
+    seconds = []
+    for _ in range(repeat):
+        at.run()
+        seconds.append(_last_run['seconds'])
+
+    messages = _last_run['messages']
+    deltas = sum(1 for message in messages if message.WhichOneof('type') == 'delta')
+    payload = sum(message.ByteSize() for message in messages)
+    return statistics.median(seconds), deltas, payload
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=20, help="Timed reruns per scenario.")
+    parser.add_argument('--page-sizes', type=int, nargs='+', default=[20, 100], help="Result rows per page.")
+    args = parser.parse_args()
+
+    os.environ.setdefault('LOTTERY_STORAGE', 'embedded')
+    LocalScriptRunner.run = _recording_run(LocalScriptRunner.run)
+
+    print(f"{'scenario':<14} {'rows':>5} {'rerun [ms]':>11} {'elements':>9} {'payload [KiB]':>14}")
+    for name, (lottery_id, numbers, match_count) in SCENARIOS.items():
+        for page_size in args.page_sizes:
+            seconds, deltas, payload = measure(results_app(lottery_id, numbers, match_count, page_size), args.repeat)
+            print(f"{name:<14} {page_size:>5} {seconds * 1000:>11.1f} {deltas:>9} {payload / 1024:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+# --- Import necessary libraries ---
+import datetime
+
+import numpy as np
+
+from bitmap_index import random_draws
+from engine import DRAW_RULES
+
+# Weekly draws counted backwards from the last shipped draw.
+LAST_DRAW_DATE = datetime.date(2025, 11, 1)
+
+
+def synthetic_draws(lottery_id, n_draws, seed=0, chunk_size=100_000):
+    """
+    Generate a (n_draws, k) int array of random draws for a lottery_id of the draw table.
+    Every draw has k distinct sorted numbers in 1..max, drawn in chunks to bound memory.
+    seed is an int or a numpy Generator.
+    """
+    rule = DRAW_RULES[lottery_id]
+    rng = np.random.default_rng(seed)
+    draws = np.empty((n_draws, rule['length']), dtype=np.int64)
+    for start in range(0, n_draws, chunk_size):
+        stop = min(start + chunk_size, n_draws)
+        draws[start:stop] = random_draws(stop - start, rule['length'], rule['max'], rng)
+    return draws
+
+
+def synthetic_rows(lottery_id, n_draws, seed=0):
+    """
+    Generate (lottery_id, draw_date, numbers) rows like the draw table, newest draw first.
+    Dates stop at datetime.date.min, so keep n_draws below ~100k.
+    """
+    draws = synthetic_draws(lottery_id, n_draws, seed)
+    return [
+        (lottery_id, LAST_DRAW_DATE - datetime.timedelta(weeks=i), draws[i].tolist())
+        for i in range(n_draws)
+    ]
+
+
+def synthetic_history(lottery_ids, n_draws, seed=0, last_date=LAST_DRAW_DATE, irregular=False):
+    """
+    Generate the (lottery_id, draw_date, numbers) rows of several lottery_ids drawn on the same
+    n_draws dates, newest first, e.g. ('hu7a', 'hu7b') for paired hu7 draws. The dates go back
+    weekly from last_date, or with irregular=True by a random 3 to 7 days. Used by the tests as
+    a small history.
+    """
+    rng = np.random.default_rng(seed)
+    gaps = rng.integers(3, 8, n_draws) if irregular else np.full(n_draws, 7)
+    dates = [last_date - datetime.timedelta(days=int(days)) for days in np.cumsum(gaps) - gaps[0]]
+    draws = [synthetic_draws(lottery_id, n_draws, rng) for lottery_id in lottery_ids]
+    return [(lottery_id, date, lottery_draws[i].tolist())
+            for i, date in enumerate(dates)
+            for lottery_id, lottery_draws in zip(lottery_ids, draws)]
@@ -0,0 +1,151 @@
+# --- Import necessary libraries ---
+import numpy as np
+
+from engine import DRAW_RULES, group_draws
+
+
+def pad_draws(numbers, length):
+    """
+    Convert a list of draws to a (n_draws, length) int array.
+    Short draws are padded with 0, which no ticket contains: the rows of a storage are not checked for
+    length (a database loaded before lottery.sql fixed the 1999-10-13 hu7a row still has 6 numbers),
+    and an empty list still gives a (0, length) array.
+    """
+    draws = np.zeros((len(numbers), length), dtype=np.int64)
+    for i, draw in enumerate(numbers):
+        draws[i, :len(draw)] = draw
+    return draws
+
+
+def random_draws(count, length, max_number, rng):
+    """
+    Return a (count, length) int array of uniformly random draws of distinct numbers in 1..max_number,
+    sorted per row: the `length` smallest of max_number random keys per row pick a uniform subset.
+    """
+    keys = rng.random((count, max_number))
+    return np.sort(np.argpartition(keys, length - 1, axis=1)[:, :length] + 1, axis=1)
+
+
+class BitSlicedIndex:
+    """
+    Vertical (transposed) bitmap index of one lottery_id.
+    For every ball number it keeps a packed bit-vector of the draws that contained it,
+    so the match counts of a ticket are the sum of its k bit-vectors.
+    The sum is kept in bit-sliced counters: plane i holds bit i of every draw's match count.
+    """
+
+    def __init__(self, draws, max_number):
+        """
+        Build the index from a (n_draws, k) array-like of ball numbers, padded with 0
+        where a draw has fewer numbers. The order of the draws is kept,
+        bit j of every vector belongs to draws[j].
+        """
+        draws = np.asarray(draws, dtype=np.int64)
+        self.n_draws = len(draws)
+        self.max_number = max_number
+        n_words = (self.n_draws + 63) // 64
+
+        # One row of 64-bit words per ball number (row 0 collects the padding and is never queried).
+        self._vectors = np.zeros((max_number + 1, n_words), dtype=np.uint64)
+        if self.n_draws:
+            draw_index = np.repeat(np.arange(self.n_draws), draws.shape[1])
+            bits = np.left_shift(np.uint64(1), (draw_index % 64).astype(np.uint64))
+            np.bitwise_or.at(self._vectors, (draws.ravel(), draw_index // 64), bits)
+
+    def _count_planes(self, numbers):
+        """Add the bit-vectors of the ticket's numbers into bit-sliced counters."""
+        n_planes = len(numbers).bit_length()
+        planes = [np.zeros(self._vectors.shape[1], dtype=np.uint64) for _ in range(n_planes)]
+        for added, n in enumerate(numbers, start=1):
+            # Ripple-carry add a 1-bit vector into the counters.
+            # After `added` vectors no count can exceed `added`, so higher planes are skipped.
+            carry = self._vectors[int(n)]
+            for i in range(added.bit_length()):
+                next_carry = planes[i] & carry
+                planes[i] ^= carry
+                carry = next_carry
+        return planes
+
+    def match_counts(self, numbers):
+        """Return the match count of the ticket against every draw as a uint8 array."""
+        counts = np.zeros(self.n_draws, dtype=np.uint8)
+        for i, plane in enumerate(self._count_planes(numbers)):
+            plane_bits = np.unpackbits(plane.view(np.uint8), bitorder='little')[:self.n_draws]
+            counts |= plane_bits << i
+        return counts
+
+    def match_mask(self, numbers, match_count):
+        """Return the packed bit-vector of the draws with exactly match_count matches."""
+        mask = np.full(self._vectors.shape[1], np.iinfo(np.uint64).max, dtype=np.uint64)
+        planes = self._count_planes(numbers)
+        if match_count >> len(planes):
+            return np.zeros_like(mask)  # More matches than numbers on the ticket
+
+        for i, plane in enumerate(planes):
+            mask &= plane if (match_count >> i) & 1 else ~plane
+
+        # Clear the padding bits after the last draw.
+        if self.n_draws % 64:
+            mask[-1] &= np.uint64((1 << (self.n_draws % 64)) - 1)
+        return mask
+
+    def count_matches(self, numbers, match_count):
+        """Return how many draws have exactly match_count matches with the ticket."""
+        return int(np.bitwise_count(self.match_mask(numbers, match_count)).sum())
+
+    def level_masks(self, tickets):
+        """
+        Return the (M, k + 1, n_words) packed bit-vectors of the draws at every match level 0..k
+        for an (M, k) int array of tickets, e.g. a chunk of an exhaustive ticket search.
+        The bit-sliced counters of all tickets are added at once, one ticket column at a time.
+        """
+        tickets = np.asarray(tickets, dtype=np.int64)
+        n_tickets, length = tickets.shape
+        n_words = self._vectors.shape[1]
+
+        planes = np.zeros((length.bit_length(), n_tickets, n_words), dtype=np.uint64)
+        for added, column in enumerate(tickets.T, start=1):
+            carry = self._vectors[column]
+            for i in range(added.bit_length()):
+                next_carry = planes[i] & carry
+                planes[i] ^= carry
+                carry = next_carry
+
+        # Split the draws plane by plane: after plane i every mask holds the draws whose
+        # count has the bits 0..i of its level, so every level costs one AND per plane.
+        level_masks = {0: None}  # None: every draw
+        for i, plane in enumerate(planes):
+            inverted = ~plane
+            split = {}
+            for level, mask in level_masks.items():
+                for bit_level, bit_mask in ((level, inverted), (level | 1 << i, plane)):
+                    if bit_level <= length:
+                        split[bit_level] = bit_mask if mask is None else mask & bit_mask
+            level_masks = split
+
+        masks = np.empty((n_tickets, length + 1, n_words), dtype=np.uint64)
+        for level, mask in level_masks.items():
+            masks[:, level] = mask
+
+        # Clear the padding bits after the last draw.
+        if self.n_draws % 64:
+            masks[:, :, -1] &= np.uint64((1 << (self.n_draws % 64)) - 1)
+        return masks
+
+    def matching_draws(self, numbers, match_count):
+        """Return the indices of the draws with exactly match_count matches."""
+        mask_bits = np.unpackbits(self.match_mask(numbers, match_count).view(np.uint8), bitorder='little')
+        return np.flatnonzero(mask_bits[:self.n_draws])
+
+
+def build_indexes(rows):
+    """
+    Build a BitSlicedIndex for every lottery_id of the draw table (hu5, hu6, hu7a, hu7b)
+    from (lottery_id, draw_date, numbers) rows. The draws are indexed newest first.
+    Returns a dict of lottery_id: (dates, index).
+    """
+    indexes = {}
+    for lottery_id, (dates, numbers) in group_draws(rows).items():
+        rule = DRAW_RULES[lottery_id]
+        indexes[lottery_id] = (dates, BitSlicedIndex(pad_draws(numbers, rule['length']), rule['max']))
+    return indexes
@@ -0,0 +1,67 @@
+# --- Import necessary libraries ---
+import threading
+from collections import OrderedDict
+
+
+class ResultCache:
+    """
+    Application-level LRU cache of check results, shared by every session of the process.
+    Keys are canonical, so {5, 3, 1, 2, 4} and [1, 2, 3, 4, 5] hit the same entry.
+    The cache is tied to a data version (the latest draw date) and is emptied when it changes.
+    """
+
+    def __init__(self, max_size=4096):
+        """Create an empty cache holding at most max_size results."""
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._version = None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()  # Streamlit runs every session in its own thread
+
+    @staticmethod
+    def make_key(lottery_id, numbers, *params):
+        """Return the canonical key (lottery, sorted ticket, *params), e.g. params = (match count,)."""
+        return (lottery_id, tuple(sorted(int(n) for n in numbers))) + params
+
+    def validate(self, version):
+        """Drop every entry if the data version differs from the one the entries were computed on."""
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+
+    def __contains__(self, key):
+        """Return whether a result is cached, without touching the counters or the LRU order."""
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key):
+        """Return the cached result and mark it as recently used, or None on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        """Store a result, evicting the least recently used one if the cache is full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        """Return the hit/miss counters and the current size."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'version': self._version
+            }
@@ -0,0 +1,297 @@
+# No third-party imports: the checks run in process pools, batch jobs and
+# HTTP workers without loading Streamlit or pandas.
+import datetime
+
+from metrics import NullMetrics
+
+
+class TicketChecker:
+    """
+    Checks a ticket against the draw history, independent of any UI.
+    Every input is an explicit parameter, the storage (see storage.py) answers the lookups.
+    """
+
+    def __init__(self, lottery_id, numbers, storage, match_count=None, cache=None, metrics=None):
+        """
+        Initialize with the lottery ID, the ticket numbers, the storage answering the lookups
+        and the match count to filter for (only needed by check_lottery_numbers).
+        An optional ResultCache answers repeated tickets without running them again,
+        optional Metrics (see metrics.py) record the stage durations, cache lookups and errors.
+        """
+        self._lottery_id = lottery_id
+        self._input_numbers = numbers
+        self._match_count = match_count
+        self._storage = storage
+        self._cache = cache
+        self._metrics = metrics or NullMetrics()
+
+    @property
+    def _lottery_label(self):
+        """The lottery label of the metrics, user input outside the supported lotteries is 'invalid'."""
+        return self._lottery_id if self._lottery_id in ('hu5', 'hu6', 'hu7') else 'invalid'
+
+    def _invalid(self, *empty_results):
+        """Count a ticket that failed validation and return the empty results."""
+        self._metrics.error('validation', self._lottery_label)
+        return empty_results
+
+    def _check_validity_lottery(self):
+        """Validate lottery ID is in the allowed list."""
+        # Ensure the lottery_id is a string for comparison
+        try:
+            lottery_id_str = str(self._lottery_id)
+
+            # Define the list of supported lotteries
+            allowed_lotteries = ['hu5', 'hu6', 'hu7']
+
+            # Check if the provided ID is in our allowed list
+            if lottery_id_str not in allowed_lotteries:
+                # Print an error if invalid and return None
+                print(f"Invalid lottery_id value: {lottery_id_str}. Must be one of {allowed_lotteries}")
+                return None  # Invalid
+
+            return lottery_id_str  # Return the valid string ID
+
+        except TypeError:
+            print("Invalid lottery ID type. Cannot convert to string.")
+            return None # Invalid
+
+    def _check_validity_match_count(self):
+        """
+        Validates the match count for the current lottery ID.
+        Returns the valid match count (int) on success, or None on failure.
+        """
+        try:
+            # 1. Get the rules for the current lottery
+            rules = {'hu5': [1,2,3,4,5], 'hu6': [1,2,3,4,5,6], 'hu7': [1,2,3,4,5,6,7]}
+
+            # 2. Get the match range
+            match_range = rules[self._lottery_id]
+
+            # 3. Convert to integer
+            # This will raise ValueError/TypeError if it's not a valid int
+            match_count = int(self._match_count)
+
+            # 4. Check if the integer is in the valid range
+            if match_count in match_range:
+                return match_count
+            else:
+                # It's an int, but out of range (e.g., 0 or 8 for a 6-limit)
+                return None
+
+        except (KeyError, ValueError, TypeError):
+            print(f"Error validating match count for {self._lottery_id}.")
+            return None
+
+    def _check_validity_numbers(self):
+        """
+        Validate numbers:
+        - Convert to list of integers.
+        - Check for correct length and range based on lottery_id.
+        Returns list of valid integers or None if validation fails.
+        """
+        # Convert input from a set to a list if necessary
+        if isinstance(self._input_numbers, set):
+            self._input_numbers = list(self._input_numbers)
+
+        # Check if the input list is empty
+        if not self._input_numbers:
+            print("Error: No numbers provided.")
+            return None
+
+        try:
+            # Convert all numbers in the list to integers
+            numbers_list = [int(n) for n in self._input_numbers]
+        except (ValueError, TypeError):
+            # Fail if any number cannot be converted to an integer
+            print("Error: All input numbers must be convertible to integers.")
+            return None  # Failed validation
+
+        # Define validation rules for each lottery type
+        rules = {
+            'hu5': {'length': 5, 'min': 1, 'max': 90},  # 5 numbers, 1-90
+            'hu6': {'length': 6, 'min': 1, 'max': 45},  # 6 numbers, 1-45
+            'hu7': {'length': 7, 'min': 1, 'max': 35}  # 7 numbers, 1-35
+        }
+
+        # Get the specific rule set for the current lottery_id
+        lottery_rule = rules.get(self._lottery_id)
+
+        # Apply the rules if they exist
+        if lottery_rule:
+            # Check if the correct number of numbers was provided
+            if len(numbers_list) != lottery_rule['length']:
+                print(
+                    f"Error: Lottery '{self._lottery_id}' requires {lottery_rule['length']}"
+                    f" numbers, but {len(numbers_list)} were provided.")
+                return None  # Failed validation
+
+            # Check if all numbers are within the allowed min/max range
+            for num in numbers_list:
+                if not (lottery_rule['min'] <= num <= lottery_rule['max']):
+                    print(
+                        f"Error: Number {num} is out of range for '{self._lottery_id}'"
+                        f" ({lottery_rule['min']}-{lottery_rule['max']}).")
+                    return None  # Failed validation
+
+        # If all checks pass, return the validated list of integers
+        return numbers_list
+
+    @staticmethod
+    def _check_validity_before(before):
+        """
+        Validate the page cursor: None (first page), a date or a 'YYYY-MM-DD' string,
+        e.g. the date column of the last result row of the previous page.
+        Returns (valid, date or None).
+        """
+        if before is None or isinstance(before, datetime.date):
+            return True, before
+
+        try:
+            return True, datetime.date.fromisoformat(str(before))
+        except ValueError:
+            print(f"Invalid page cursor: {before}. Must be a date in YYYY-MM-DD format.")
+            return False, None
+
+    @staticmethod
+    def _check_validity_limit(limit):
+        """Validate the page size: a positive int, every storage returns at most `limit` rows."""
+        if isinstance(limit, int) and not isinstance(limit, bool) and limit > 0:
+            return True
+
+        print(f"Invalid page size: {limit}. Must be a positive integer.")
+        return False
+
+    def _latest_draw_date(self):
+        """Return the date of the newest draw, the data version the result cache is tied to."""
+        return self._storage.latest_draw_date()
+
+    def _cached(self, key_params, compute):
+        """
+        Return the cached result for key_params = (lottery, numbers, *params) or compute and store it.
+        Failed lookups (no draws) are not stored.
+        """
+        lottery = self._lottery_label
+
+        def timed_compute():
+            try:
+                with self._metrics.time('lookup', lottery):
+                    return compute()
+            except Exception:
+                self._metrics.error('lookup', lottery)
+                raise
+
+        if self._cache is None:
+            return timed_compute()
+
+        key = self._cache.make_key(*key_params)
+        self._cache.validate(self._latest_draw_date())
+        result = self._cache.get(key)
+        self._metrics.cache_request(result is not None, lottery)
+        if result is not None:
+            return result
+
+        result = timed_compute()
+        if result[1] and key not in self._cache:  # total_draws, and not stored by another session meanwhile
+            self._cache.put(key, result)
+        return result
+
+    def check_lottery_numbers(self, limit=20, before=None):
+        """
+        Main method to check lottery numbers against the storage.
+        It validates input, runs the storage lookup, and returns the formatted output.
+        The results are a page of at most `limit` draws older than `before`, pass the date
+        of the last row to get the next page (keyset pagination on draw_date).
+        """
+
+        formatted_results, total_draws, winning_draws = [], 0, 0
+
+        # The validation stage, an invalid input is counted as a validation error.
+        with self._metrics.time('validation', self._lottery_label):
+            # Step 1: Validate the lottery ID
+            lottery = self._check_validity_lottery()
+            if not lottery:
+                return self._invalid(formatted_results, total_draws, winning_draws)  # Invalid lottery_id
+
+            # Step 2: Validate the user's numbers
+            numbers = self._check_validity_numbers()
+            if not numbers:
+                return self._invalid(formatted_results, total_draws, winning_draws)  # Invalid numbers
+
+            # Step 3: Validate the user's match count
+            match_count = self._check_validity_match_count()
+            if not match_count:
+                return self._invalid(formatted_results, total_draws, winning_draws)  # Invalid match count
+
+            # Step 4: Validate the page cursor
+            valid, before = self._check_validity_before(before)
+            if not valid:
+                return self._invalid(formatted_results, total_draws, winning_draws)  # Invalid cursor
+
+            # Step 5: Validate the page size
+            if not self._check_validity_limit(limit):
+                return self._invalid(formatted_results, total_draws, winning_draws)  # Invalid page size
+
+        return self._cached(
+            (lottery, numbers, match_count, limit, before),
+            lambda: self._storage.check(lottery, numbers, match_count, limit, before)
+        )
+
+    def check_lottery_histogram(self, limit=20):
+        """
+        Count the draws at every match level 0..k with a single lookup,
+        together with the latest `limit` draws of each level.
+        Returns ({match_count: (winning_draws, formatted_results)}, total_draws),
+        so the results of any match count can be shown without another lookup.
+        """
+
+        histogram, total_draws = {}, 0
+
+        with self._metrics.time('validation', self._lottery_label):
+            # Step 1: Validate the lottery ID
+            lottery = self._check_validity_lottery()
+            if not lottery:
+                return self._invalid(histogram, total_draws)  # Invalid lottery_id, return empty results
+
+            # Step 2: Validate the user's numbers
+            numbers = self._check_validity_numbers()
+            if not numbers:
+                return self._invalid(histogram, total_draws)  # Invalid numbers, return empty results
+
+            # Step 3: Validate the number of latest draws per level
+            if not self._check_validity_limit(limit):
+                return self._invalid(histogram, total_draws)  # Invalid limit, return empty results
+
+        return self._cached(
+            (lottery, numbers, 'histogram', limit),
+            lambda: self._storage.histogram(lottery, numbers, limit)
+        )
+
+    def check_lottery_windows(self):
+        """
+        Return (MatchWindows, total_draws): the prefix sums of the ticket's match counts over the draws,
+        built once from a single storage lookup. They answer the draw counts of any date window at any
+        match level in O(1) and the wins per year, see windows.py. A cached entry holds the int16 prefix
+        sums of the ticket only, the draw calendar is shared by every ticket of the lottery.
+        """
+        # numpy is only loaded by the callers of this method.
+        from windows import MatchWindows
+
+        windows, total_draws = None, 0
+
+        with self._metrics.time('validation', self._lottery_label):
+            # Step 1: Validate the lottery ID
+            lottery = self._check_validity_lottery()
+            if not lottery:
+                return self._invalid(windows, total_draws)  # Invalid lottery_id, return empty results
+
+            # Step 2: Validate the user's numbers
+            numbers = self._check_validity_numbers()
+            if not numbers:
+                return self._invalid(windows, total_draws)  # Invalid numbers, return empty results
+
+        def compute():
+            windows = MatchWindows(lottery, *self._storage.match_series(lottery, numbers))
+            return windows, windows.n_draws
+
+        return self._cached((lottery, numbers, 'windows'), compute)
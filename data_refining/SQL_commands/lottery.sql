@@ -1,5 +1,14 @@
+DROP TABLE IF EXISTS draw_hu7;
 DROP TABLE IF EXISTS draw;
 DROP TABLE IF EXISTS lottery;
+DROP FUNCTION IF EXISTS numbers_mask;
+
+-- Packs the numbers of a draw into a bit string, bit n (1-based, from the left) is set for ball n.
+-- BIT(90) fits every lottery, hu6/hu7 only use the first 45/35 bits.
+CREATE FUNCTION numbers_mask(numbers INT[]) RETURNS BIT(90)
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT COALESCE(bit_or(B'1'::BIT(90) >> (n - 1)), B'0'::BIT(90)) FROM UNNEST(numbers) AS n
+$$;
 
 CREATE TABLE lottery (
     id SERIAL PRIMARY KEY,
@@ -19,9 +28,40 @@ CREATE TABLE draw (
     lottery_id VARCHAR(4),
     draw_date DATE NOT NULL,
     numbers INT[] NOT NULL,
+    -- Precomputed on insert, match counts are bit_count(mask & ticket_mask) (PostgreSQL 14+).
+    mask BIT(90) GENERATED ALWAYS AS (numbers_mask(numbers)) STORED,
     UNIQUE(lottery_id, draw_date)
 );
 
+-- Newest-first scans of one lottery, covering the mask so match counts need no heap access.
+CREATE INDEX draw_lottery_date_idx ON draw (lottery_id, draw_date DESC) INCLUDE (mask);
+
+-- Index plans of the high match counts (see planner.py): a k-of-k check is a B-tree lookup of the
+-- ticket's mask, a check with few expected hits probes the GIN index for the draws containing a
+-- match_count-subset of the ticket (numbers @> subset).
+CREATE INDEX draw_lottery_mask_idx ON draw (lottery_id, mask);
+CREATE INDEX draw_numbers_idx ON draw USING GIN (numbers);
+
+-- hu7 has a mechanical (hu7a) and a manual (hu7b) draw on every date, stored as one row per date
+-- so both match counts and "either draw matches" come from one scan without a join on draw_date.
+-- The draw table holds hu5 and hu6.
+CREATE TABLE draw_hu7 (
+    id SERIAL PRIMARY KEY,
+    draw_date DATE NOT NULL UNIQUE,
+    numbers_a INT[] NOT NULL,  -- Mechanical draw (lottery hu7a)
+    numbers_b INT[] NOT NULL,  -- Manual draw (lottery hu7b)
+    mask_a BIT(90) GENERATED ALWAYS AS (numbers_mask(numbers_a)) STORED,
+    mask_b BIT(90) GENERATED ALWAYS AS (numbers_mask(numbers_b)) STORED
+);
+
+CREATE INDEX draw_hu7_date_idx ON draw_hu7 (draw_date DESC) INCLUDE (mask_a, mask_b);
+
+-- The index plans of planner.py for either draw of a date, combined by a bitmap OR.
+CREATE INDEX draw_hu7_mask_a_idx ON draw_hu7 (mask_a);
+CREATE INDEX draw_hu7_mask_b_idx ON draw_hu7 (mask_b);
+CREATE INDEX draw_hu7_numbers_a_idx ON draw_hu7 USING GIN (numbers_a);
+CREATE INDEX draw_hu7_numbers_b_idx ON draw_hu7 USING GIN (numbers_b);
+
 INSERT INTO draw (draw_date, lottery_id, numbers) VALUES
 ('2025-11-01', 'hu5', ARRAY[11,20,29,42,55]),
 ('2025-10-25', 'hu5', ARRAY[12,30,49,51,66]),
@@ -5366,2726 +5406,1364 @@ INSERT INTO draw (draw_date, lottery_id, numbers) VALUES
 ('1992-05-17', 'hu6', ARRAY[6,9,10,24,37,38]),
 ('1992-05-10', 'hu6', ARRAY[3,16,24,26,36,40]);
 
-INSERT INTO draw (draw_date, lottery_id, numbers) VALUES
-('2025-10-29', 'hu7a', ARRAY[4,6,9,10,20,29,30]),
-('2025-10-22', 'hu7a', ARRAY[1,2,4,7,9,16,23]),
-('2025-10-15', 'hu7a', ARRAY[8,10,11,15,18,22,28]),
-('2025-10-08', 'hu7a', ARRAY[10,12,17,21,23,27,28]),
-('2025-10-01', 'hu7a', ARRAY[6,7,8,13,17,23,31]),
-('2025-09-24', 'hu7a', ARRAY[2,6,8,10,16,17,26]),
-('2025-09-17', 'hu7a', ARRAY[1,9,11,13,15,18,19]),
-('2025-09-10', 'hu7a', ARRAY[9,16,17,20,27,31,32]),
-('2025-09-03', 'hu7a', ARRAY[5,9,18,23,27,28,33]),
-('2025-08-27', 'hu7a', ARRAY[1,5,12,14,23,31,35]),
-('2025-08-20', 'hu7a', ARRAY[1,2,4,12,15,16,35]),
-('2025-08-13', 'hu7a', ARRAY[3,13,15,24,25,30,35]),
-('2025-08-06', 'hu7a', ARRAY[1,3,7,12,17,19,21]),
-('2025-07-30', 'hu7a', ARRAY[6,8,13,21,26,30,35]),
-('2025-07-23', 'hu7a', ARRAY[11,12,16,26,28,31,33]),
-('2025-07-16', 'hu7a', ARRAY[1,12,14,26,31,32,34]),
-('2025-07-09', 'hu7a', ARRAY[9,14,17,20,27,30,31]),
-('2025-07-02', 'hu7a', ARRAY[1,4,11,12,18,27,35]),
-('2025-06-25', 'hu7a', ARRAY[4,7,10,20,21,24,28]),
-('2025-06-18', 'hu7a', ARRAY[2,8,17,21,23,28,30]),
-('2025-06-11', 'hu7a', ARRAY[1,6,7,12,15,17,31]),
-('2025-06-04', 'hu7a', ARRAY[2,12,16,20,23,28,31]),
-('2025-05-28', 'hu7a', ARRAY[2,7,16,18,23,30,34]),
-('2025-05-21', 'hu7a', ARRAY[2,6,18,20,24,27,35]),
-('2025-05-14', 'hu7a', ARRAY[5,10,11,16,19,20,22]),
-('2025-05-07', 'hu7a', ARRAY[5,6,10,26,33,34,35]),
-('2025-04-30', 'hu7a', ARRAY[9,11,12,14,27,30,34]),
-('2025-04-23', 'hu7a', ARRAY[7,9,13,22,25,30,31]),
-('2025-04-16', 'hu7a', ARRAY[1,9,13,17,23,24,31]),
-('2025-04-09', 'hu7a', ARRAY[7,9,12,13,15,17,26]),
-('2025-04-02', 'hu7a', ARRAY[1,5,16,27,28,31,34]),
-('2025-03-26', 'hu7a', ARRAY[3,12,19,23,24,31,34]),
-('2025-03-19', 'hu7a', ARRAY[1,2,7,10,28,29,30]),
-('2025-03-12', 'hu7a', ARRAY[2,6,17,21,24,30,33]),
-('2025-03-05', 'hu7a', ARRAY[6,9,12,22,26,32,33]),
-('2025-02-26', 'hu7a', ARRAY[6,8,16,22,25,26,34]),
-('2025-02-19', 'hu7a', ARRAY[2,9,10,14,23,24,31]),
-('2025-02-12', 'hu7a', ARRAY[2,4,11,18,19,26,27]),
-('2025-02-05', 'hu7a', ARRAY[1,4,9,14,28,32,35]),
-('2025-01-29', 'hu7a', ARRAY[3,5,15,17,20,30,33]),
-('2025-01-22', 'hu7a', ARRAY[3,6,9,12,16,27,30]),
-('2025-01-15', 'hu7a', ARRAY[12,16,18,24,28,32,34]),
-('2025-01-08', 'hu7a', ARRAY[3,8,9,13,17,19,27]),
-('2025-01-01', 'hu7a', ARRAY[1,3,4,6,12,16,30]),
-('2024-12-27', 'hu7a', ARRAY[2,6,10,11,13,17,31]),
-('2024-12-18', 'hu7a', ARRAY[3,8,9,10,16,23,27]),
-('2024-12-11', 'hu7a', ARRAY[8,11,15,23,25,27,31]),
-('2024-12-04', 'hu7a', ARRAY[8,12,14,24,26,28,31]),
-('2024-11-27', 'hu7a', ARRAY[6,8,10,14,30,31,35]),
-('2024-11-20', 'hu7a', ARRAY[5,6,8,13,20,27,35]),
-('2024-11-13', 'hu7a', ARRAY[1,5,11,22,23,25,31]),
-('2024-11-06', 'hu7a', ARRAY[6,13,14,15,19,25,31]),
-('2024-10-30', 'hu7a', ARRAY[5,14,16,17,26,34,35]),
-('2024-10-23', 'hu7a', ARRAY[1,9,20,25,27,31,32]),
-('2024-10-16', 'hu7a', ARRAY[3,6,8,10,16,26,35]),
-('2024-10-09', 'hu7a', ARRAY[4,8,9,18,22,25,34]),
-('2024-10-02', 'hu7a', ARRAY[5,9,13,14,17,20,30]),
-('2024-09-25', 'hu7a', ARRAY[4,12,13,15,26,28,35]),
-('2024-09-18', 'hu7a', ARRAY[1,6,11,17,28,29,31]),
-('2024-09-11', 'hu7a', ARRAY[8,10,11,14,15,18,27]),
-('2024-09-04', 'hu7a', ARRAY[4,6,11,12,14,18,19]),
-('2024-08-28', 'hu7a', ARRAY[8,10,15,17,24,29,31]),
-('2024-08-21', 'hu7a', ARRAY[1,12,13,15,23,32,34]),
-('2024-08-14', 'hu7a', ARRAY[4,7,14,15,23,30,35]),
-('2024-08-07', 'hu7a', ARRAY[2,11,18,24,29,32,34]),
-('2024-07-31', 'hu7a', ARRAY[2,8,18,22,27,31,32]),
-('2024-07-24', 'hu7a', ARRAY[6,20,21,24,25,26,33]),
-('2024-07-17', 'hu7a', ARRAY[3,7,22,27,29,30,34]),
-('2024-07-10', 'hu7a', ARRAY[1,15,16,17,19,30,34]),
-('2024-07-03', 'hu7a', ARRAY[11,13,14,16,20,23,28]),
-('2024-06-26', 'hu7a', ARRAY[4,5,14,17,21,28,33]),
-('2024-06-19', 'hu7a', ARRAY[13,19,20,25,28,30,34]),
-('2024-06-12', 'hu7a', ARRAY[1,5,10,23,31,32,34]),
-('2024-06-05', 'hu7a', ARRAY[3,4,7,10,14,16,17]),
-('2024-05-29', 'hu7a', ARRAY[1,4,10,11,17,24,25]),
-('2024-05-22', 'hu7a', ARRAY[8,14,15,19,29,34,35]),
-('2024-05-15', 'hu7a', ARRAY[3,7,8,9,10,23,24]),
-('2024-05-08', 'hu7a', ARRAY[2,4,11,12,26,27,31]),
-('2024-05-01', 'hu7a', ARRAY[1,11,14,20,21,30,33]),
-('2024-04-24', 'hu7a', ARRAY[1,2,4,9,20,23,25]),
-('2024-04-17', 'hu7a', ARRAY[8,10,12,22,24,30,34]),
-('2024-04-10', 'hu7a', ARRAY[4,13,17,20,28,30,35]),
-('2024-04-03', 'hu7a', ARRAY[1,2,6,9,11,13,31]),
-('2024-03-27', 'hu7a', ARRAY[6,8,13,14,22,23,35]),
-('2024-03-20', 'hu7a', ARRAY[7,9,23,26,29,31,33]),
-('2024-03-13', 'hu7a', ARRAY[3,4,7,18,19,22,26]),
-('2024-03-06', 'hu7a', ARRAY[9,11,13,18,23,24,26]),
-('2024-02-28', 'hu7a', ARRAY[1,6,9,12,16,20,27]),
-('2024-02-21', 'hu7a', ARRAY[8,10,14,20,23,24,35]),
-('2024-02-14', 'hu7a', ARRAY[5,10,15,20,21,28,30]),
-('2024-02-07', 'hu7a', ARRAY[1,6,18,19,24,27,32]),
-('2024-01-31', 'hu7a', ARRAY[1,18,20,21,25,28,35]),
-('2024-01-24', 'hu7a', ARRAY[6,12,14,27,30,33,35]),
-('2024-01-17', 'hu7a', ARRAY[3,9,11,19,22,25,32]),
-('2024-01-10', 'hu7a', ARRAY[1,9,12,15,20,30,34]),
-('2024-01-03', 'hu7a', ARRAY[3,8,10,11,30,31,35]),
-('2023-12-27', 'hu7a', ARRAY[8,10,12,19,21,26,32]),
-('2023-12-20', 'hu7a', ARRAY[8,12,13,15,20,22,34]),
-('2023-12-13', 'hu7a', ARRAY[4,5,7,13,21,23,32]),
-('2023-12-06', 'hu7a', ARRAY[1,4,13,24,28,30,35]),
-('2023-11-29', 'hu7a', ARRAY[1,5,8,11,16,22,34]),
-('2023-11-22', 'hu7a', ARRAY[3,6,11,15,22,25,27]),
-('2023-11-15', 'hu7a', ARRAY[2,4,13,21,22,32,34]),
-('2023-11-08', 'hu7a', ARRAY[14,17,20,29,32,34,35]),
-('2023-11-01', 'hu7a', ARRAY[4,9,12,19,24,29,35]),
-('2023-10-25', 'hu7a', ARRAY[4,5,11,14,18,22,29]),
-('2023-10-18', 'hu7a', ARRAY[4,6,8,12,17,27,30]),
-('2023-10-11', 'hu7a', ARRAY[2,15,20,28,29,31,33]),
-('2023-10-04', 'hu7a', ARRAY[6,11,12,20,26,30,34]),
-('2023-09-27', 'hu7a', ARRAY[7,11,15,19,22,26,33]),
-('2023-09-20', 'hu7a', ARRAY[7,12,20,21,22,29,34]),
-('2023-09-13', 'hu7a', ARRAY[1,10,16,22,32,34,35]),
-('2023-09-06', 'hu7a', ARRAY[5,6,10,14,18,26,28]),
-('2023-08-30', 'hu7a', ARRAY[2,10,11,15,16,20,33]),
-('2023-08-23', 'hu7a', ARRAY[3,4,5,6,9,12,25]),
-('2023-08-16', 'hu7a', ARRAY[3,5,15,16,23,25,29]),
-('2023-08-09', 'hu7a', ARRAY[3,4,10,17,29,31,33]),
-('2023-08-02', 'hu7a', ARRAY[2,3,4,11,14,19,35]),
-('2023-07-26', 'hu7a', ARRAY[1,3,8,17,20,27,32]),
-('2023-07-19', 'hu7a', ARRAY[2,3,6,19,22,27,30]),
-('2023-07-12', 'hu7a', ARRAY[5,11,17,19,25,26,30]),
-('2023-07-05', 'hu7a', ARRAY[7,20,21,22,23,25,26]),
-('2023-06-28', 'hu7a', ARRAY[2,4,16,24,25,26,32]),
-('2023-06-21', 'hu7a', ARRAY[3,5,9,12,13,26,29]),
-('2023-06-14', 'hu7a', ARRAY[7,8,15,26,30,31,34]),
-('2023-06-07', 'hu7a', ARRAY[6,7,10,14,17,25,26]),
-('2023-05-31', 'hu7a', ARRAY[1,2,5,11,12,19,20]),
-('2023-05-24', 'hu7a', ARRAY[3,7,14,16,19,29,32]),
-('2023-05-17', 'hu7a', ARRAY[3,7,22,23,27,31,33]),
-('2023-05-10', 'hu7a', ARRAY[8,12,16,18,29,30,35]),
-('2023-05-03', 'hu7a', ARRAY[12,16,19,24,29,31,32]),
-('2023-04-26', 'hu7a', ARRAY[6,22,23,27,29,30,31]),
-('2023-04-19', 'hu7a', ARRAY[7,12,16,20,21,22,24]),
-('2023-04-12', 'hu7a', ARRAY[3,11,15,17,23,30,35]),
-('2023-04-05', 'hu7a', ARRAY[1,4,8,19,33,34,35]),
-('2023-03-29', 'hu7a', ARRAY[2,3,9,20,21,29,33]),
-('2023-03-22', 'hu7a', ARRAY[1,2,3,8,21,22,23]),
-('2023-03-15', 'hu7a', ARRAY[1,3,7,12,15,30,33]),
-('2023-03-08', 'hu7a', ARRAY[8,10,22,27,28,29,35]),
-('2023-03-01', 'hu7a', ARRAY[1,15,16,30,32,33,35]),
-('2023-02-22', 'hu7a', ARRAY[3,8,11,17,21,33,34]),
-('2023-02-15', 'hu7a', ARRAY[19,23,24,27,30,32,34]),
-('2023-02-08', 'hu7a', ARRAY[2,6,9,13,14,19,26]),
-('2023-02-01', 'hu7a', ARRAY[3,5,7,13,19,26,31]),
-('2023-01-25', 'hu7a', ARRAY[2,6,19,25,29,32,33]),
-('2023-01-18', 'hu7a', ARRAY[5,6,8,9,27,28,34]),
-('2023-01-11', 'hu7a', ARRAY[2,6,14,16,17,27,34]),
-('2023-01-04', 'hu7a', ARRAY[3,4,13,16,24,27,32]),
-('2022-12-28', 'hu7a', ARRAY[3,5,14,19,20,29,31]),
-('2022-12-21', 'hu7a', ARRAY[4,5,7,8,10,26,28]),
-('2022-12-14', 'hu7a', ARRAY[8,12,13,16,21,24,33]),
-('2022-12-07', 'hu7a', ARRAY[9,19,21,23,26,27,29]),
-('2022-11-30', 'hu7a', ARRAY[3,5,8,10,17,30,32]),
-('2022-11-23', 'hu7a', ARRAY[3,4,16,19,32,34,35]),
-('2022-11-16', 'hu7a', ARRAY[7,8,11,12,16,25,31]),
-('2022-11-09', 'hu7a', ARRAY[8,9,12,13,14,29,32]),
-('2022-11-02', 'hu7a', ARRAY[19,22,25,26,29,31,35]),
-('2022-10-26', 'hu7a', ARRAY[3,17,18,19,25,26,28]),
-('2022-10-19', 'hu7a', ARRAY[2,3,10,25,26,30,32]),
-('2022-10-12', 'hu7a', ARRAY[3,8,12,14,16,21,33]),
-('2022-10-05', 'hu7a', ARRAY[4,9,13,22,24,31,35]),
-('2022-09-28', 'hu7a', ARRAY[10,11,12,14,19,23,31]),
-('2022-09-21', 'hu7a', ARRAY[1,2,4,7,11,20,32]),
-('2022-09-14', 'hu7a', ARRAY[4,13,18,19,23,31,34]),
-('2022-09-07', 'hu7a', ARRAY[1,4,11,14,17,19,20]),
-('2022-08-31', 'hu7a', ARRAY[1,20,25,29,30,33,34]),
-('2022-08-24', 'hu7a', ARRAY[5,11,15,20,23,30,31]),
-('2022-08-17', 'hu7a', ARRAY[1,3,8,13,15,17,18]),
-('2022-08-10', 'hu7a', ARRAY[7,12,14,16,20,34,35]),
-('2022-08-03', 'hu7a', ARRAY[3,4,5,7,12,18,21]),
-('2022-07-27', 'hu7a', ARRAY[2,14,16,18,21,29,33]),
-('2022-07-20', 'hu7a', ARRAY[3,6,7,11,16,18,23]),
-('2022-07-13', 'hu7a', ARRAY[10,14,22,24,25,31,32]),
-('2022-07-06', 'hu7a', ARRAY[14,19,20,21,22,26,32]),
-('2022-06-29', 'hu7a', ARRAY[5,17,24,25,27,28,34]),
-('2022-06-22', 'hu7a', ARRAY[6,15,21,23,25,27,28]),
-('2022-06-15', 'hu7a', ARRAY[5,8,16,23,30,32,34]),
-('2022-06-08', 'hu7a', ARRAY[8,9,12,15,19,25,30]),
-('2022-06-01', 'hu7a', ARRAY[5,13,15,20,27,28,31]),
-('2022-05-25', 'hu7a', ARRAY[1,6,11,12,18,24,33]),
-('2022-05-18', 'hu7a', ARRAY[7,18,19,23,25,29,35]),
-('2022-05-11', 'hu7a', ARRAY[1,3,8,18,19,24,28]),
-('2022-05-04', 'hu7a', ARRAY[1,5,11,12,14,27,35]),
-('2022-04-27', 'hu7a', ARRAY[6,7,19,21,25,31,33]),
-('2022-04-20', 'hu7a', ARRAY[10,12,18,19,20,25,30]),
-('2022-04-13', 'hu7a', ARRAY[5,6,8,10,16,17,32]),
-('2022-04-06', 'hu7a', ARRAY[5,8,17,18,31,32,33]),
-('2022-03-30', 'hu7a', ARRAY[5,7,17,18,19,23,32]),
-('2022-03-23', 'hu7a', ARRAY[1,8,10,20,22,26,30]),
-('2022-03-16', 'hu7a', ARRAY[1,2,10,12,13,22,32]),
-('2022-03-09', 'hu7a', ARRAY[1,4,6,7,8,19,32]),
-('2022-03-02', 'hu7a', ARRAY[14,18,19,22,23,27,35]),
-('2022-02-23', 'hu7a', ARRAY[4,8,10,12,18,21,22]),
-('2022-02-16', 'hu7a', ARRAY[4,9,10,14,19,27,34]),
-('2022-02-09', 'hu7a', ARRAY[4,14,15,20,21,22,28]),
-('2022-02-02', 'hu7a', ARRAY[3,6,8,15,25,27,31]),
-('2022-01-26', 'hu7a', ARRAY[2,18,24,30,31,32,34]),
-('2022-01-19', 'hu7a', ARRAY[2,6,11,16,27,32,35]),
-('2022-01-12', 'hu7a', ARRAY[2,7,20,22,25,27,32]),
-('2022-01-05', 'hu7a', ARRAY[1,2,16,17,25,27,29]),
-('2021-12-29', 'hu7a', ARRAY[2,7,18,30,31,34,35]),
-('2021-12-22', 'hu7a', ARRAY[13,18,22,23,24,26,31]),
-('2021-12-15', 'hu7a', ARRAY[5,12,19,25,28,29,35]),
-('2021-12-08', 'hu7a', ARRAY[2,4,25,29,30,33,35]),
-('2021-12-01', 'hu7a', ARRAY[4,18,19,21,22,26,30]),
-('2021-11-24', 'hu7a', ARRAY[4,5,11,15,19,20,32]),
-('2021-11-17', 'hu7a', ARRAY[3,10,13,16,17,18,19]),
-('2021-11-10', 'hu7a', ARRAY[2,13,19,25,28,29,33]),
-('2021-11-03', 'hu7a', ARRAY[9,15,23,25,29,30,32]),
-('2021-10-27', 'hu7a', ARRAY[5,8,16,21,23,24,32]),
-('2021-10-20', 'hu7a', ARRAY[9,12,19,22,28,31,33]),
-('2021-10-13', 'hu7a', ARRAY[3,19,23,25,28,34,35]),
-('2021-10-06', 'hu7a', ARRAY[7,11,17,21,23,28,34]),
-('2021-09-29', 'hu7a', ARRAY[4,6,9,12,23,25,31]),
-('2021-09-22', 'hu7a', ARRAY[4,7,9,10,15,25,27]),
-('2021-09-15', 'hu7a', ARRAY[1,7,20,22,27,28,30]),
-('2021-09-08', 'hu7a', ARRAY[1,11,16,18,24,26,33]),
-('2021-09-01', 'hu7a', ARRAY[16,17,21,24,29,34,35]),
-('2021-08-25', 'hu7a', ARRAY[4,16,19,20,23,34,35]),
-('2021-08-18', 'hu7a', ARRAY[7,19,22,28,30,31,32]),
-('2021-08-11', 'hu7a', ARRAY[3,4,14,15,25,26,27]),
-('2021-08-04', 'hu7a', ARRAY[2,5,6,16,24,28,29]),
-('2021-07-28', 'hu7a', ARRAY[3,6,9,15,26,30,35]),
-('2021-07-21', 'hu7a', ARRAY[9,13,17,24,26,28,35]),
-('2021-07-14', 'hu7a', ARRAY[1,7,8,14,15,17,25]),
-('2021-07-07', 'hu7a', ARRAY[1,6,13,24,25,27,35]),
-('2021-06-30', 'hu7a', ARRAY[4,5,7,17,20,30,35]),
-('2021-06-23', 'hu7a', ARRAY[2,6,8,12,14,18,23]),
-('2021-06-16', 'hu7a', ARRAY[5,6,14,15,20,28,34]),
-('2021-06-09', 'hu7a', ARRAY[4,9,10,15,16,19,29]),
-('2021-06-02', 'hu7a', ARRAY[5,7,24,25,28,29,35]),
-('2021-05-26', 'hu7a', ARRAY[3,7,16,18,19,22,32]),
-('2021-05-19', 'hu7a', ARRAY[9,15,17,21,24,27,33]),
-('2021-05-12', 'hu7a', ARRAY[2,3,12,21,25,29,34]),
-('2021-05-05', 'hu7a', ARRAY[4,5,12,19,22,23,27]),
-('2021-04-28', 'hu7a', ARRAY[2,9,11,12,24,26,34]),
-('2021-04-21', 'hu7a', ARRAY[10,12,13,14,20,27,29]),
-('2021-04-14', 'hu7a', ARRAY[4,8,10,16,17,20,27]),
-('2021-04-07', 'hu7a', ARRAY[5,9,10,13,14,16,30]),
-('2021-03-31', 'hu7a', ARRAY[2,4,10,14,25,33,34]),
-('2021-03-24', 'hu7a', ARRAY[4,8,13,15,22,34,35]),
-('2021-03-17', 'hu7a', ARRAY[1,6,9,10,13,16,23]),
-('2021-03-10', 'hu7a', ARRAY[2,5,12,13,15,32,34]),
-('2021-03-03', 'hu7a', ARRAY[3,5,21,24,26,30,35]),
-('2021-02-24', 'hu7a', ARRAY[1,5,14,18,26,27,28]),
-('2021-02-17', 'hu7a', ARRAY[11,14,18,23,25,28,34]),
-('2021-02-10', 'hu7a', ARRAY[1,3,4,9,14,16,31]),
-('2021-02-03', 'hu7a', ARRAY[5,10,19,22,23,32,34]),
-('2021-01-27', 'hu7a', ARRAY[1,12,16,22,25,29,34]),
-('2021-01-20', 'hu7a', ARRAY[7,8,11,12,13,23,27]),
-('2021-01-13', 'hu7a', ARRAY[4,12,15,18,24,28,34]),
-('2021-01-06', 'hu7a', ARRAY[4,6,13,20,30,31,35]),
-('2020-12-30', 'hu7a', ARRAY[3,4,5,7,16,18,28]),
-('2020-12-23', 'hu7a', ARRAY[6,8,10,13,17,18,20]),
-('2020-12-16', 'hu7a', ARRAY[9,10,18,20,22,24,33]),
-('2020-12-09', 'hu7a', ARRAY[3,16,17,21,26,28,29]),
-('2020-12-02', 'hu7a', ARRAY[5,16,17,20,22,29,32]),
-('2020-11-25', 'hu7a', ARRAY[1,4,23,25,27,33,34]),
-('2020-11-18', 'hu7a', ARRAY[4,10,20,25,26,29,34]),
-('2020-11-11', 'hu7a', ARRAY[20,22,26,27,29,30,33]),
-('2020-11-04', 'hu7a', ARRAY[4,11,19,20,22,25,26]),
-('2020-10-28', 'hu7a', ARRAY[2,9,23,24,26,28,30]),
-('2020-10-21', 'hu7a', ARRAY[1,3,9,14,19,20,31]),
-('2020-10-14', 'hu7a', ARRAY[19,20,21,26,31,33,34]),
-('2020-10-07', 'hu7a', ARRAY[9,12,13,14,20,27,35]),
-('2020-09-30', 'hu7a', ARRAY[3,6,7,8,10,14,28]),
-('2020-09-23', 'hu7a', ARRAY[7,12,13,22,24,28,32]),
-('2020-09-16', 'hu7a', ARRAY[1,5,7,22,23,30,33]),
-('2020-09-09', 'hu7a', ARRAY[1,6,9,18,20,23,35]),
-('2020-09-02', 'hu7a', ARRAY[2,11,14,16,20,22,31]),
-('2020-08-26', 'hu7a', ARRAY[2,3,8,11,13,20,31]),
-('2020-08-19', 'hu7a', ARRAY[5,14,15,22,24,31,33]),
-('2020-08-12', 'hu7a', ARRAY[5,7,11,14,16,19,25]),
-('2020-08-05', 'hu7a', ARRAY[2,21,23,25,27,28,30]),
-('2020-07-29', 'hu7a', ARRAY[3,4,5,6,13,15,20]),
-('2020-07-22', 'hu7a', ARRAY[5,12,13,15,22,26,34]),
-('2020-07-15', 'hu7a', ARRAY[10,18,19,21,22,32,33]),
-('2020-07-08', 'hu7a', ARRAY[6,11,12,15,23,29,32]),
-('2020-07-01', 'hu7a', ARRAY[6,12,15,16,19,22,34]),
-('2020-06-24', 'hu7a', ARRAY[4,5,6,7,8,12,16]),
-('2020-06-17', 'hu7a', ARRAY[5,6,11,16,22,24,32]),
-('2020-06-10', 'hu7a', ARRAY[1,7,13,14,22,24,33]),
-('2020-06-03', 'hu7a', ARRAY[3,4,11,15,22,31,34]),
-('2020-05-27', 'hu7a', ARRAY[2,4,18,19,21,29,33]),
-('2020-05-20', 'hu7a', ARRAY[6,8,12,14,24,28,33]),
-('2020-05-13', 'hu7a', ARRAY[2,6,17,19,22,25,27]),
-('2020-05-06', 'hu7a', ARRAY[3,8,9,19,20,27,31]),
-('2020-04-29', 'hu7a', ARRAY[9,11,18,24,27,29,31]),
-('2020-04-22', 'hu7a', ARRAY[5,10,13,16,20,33,35]),
-('2020-04-15', 'hu7a', ARRAY[9,10,14,23,24,26,32]),
-('2020-04-08', 'hu7a', ARRAY[8,15,16,25,28,31,32]),
-('2020-04-01', 'hu7a', ARRAY[9,15,17,20,22,26,29]),
-('2020-03-25', 'hu7a', ARRAY[1,3,15,17,26,33,34]),
-('2020-03-18', 'hu7a', ARRAY[1,8,9,11,19,20,21]),
-('2020-03-11', 'hu7a', ARRAY[1,3,5,7,12,14,21]),
-('2020-03-04', 'hu7a', ARRAY[1,2,4,9,10,13,27]),
-('2020-02-26', 'hu7a', ARRAY[1,10,13,17,19,22,30]),
-('2020-02-19', 'hu7a', ARRAY[12,23,26,30,31,32,35]),
-('2020-02-12', 'hu7a', ARRAY[1,4,5,9,11,27,31]),
-('2020-02-05', 'hu7a', ARRAY[9,12,14,17,20,21,32]),
-('2020-01-29', 'hu7a', ARRAY[8,10,22,26,28,32,34]),
-('2020-01-22', 'hu7a', ARRAY[3,10,13,30,31,33,34]),
-('2020-01-15', 'hu7a', ARRAY[3,4,16,17,18,27,32]),
-('2020-01-08', 'hu7a', ARRAY[3,11,19,22,25,26,30]),
-('2020-01-01', 'hu7a', ARRAY[3,18,19,26,28,29,33]),
-('2019-12-25', 'hu7a', ARRAY[5,12,13,18,21,26,32]),
-('2019-12-18', 'hu7a', ARRAY[2,8,9,11,14,23,33]),
-('2019-12-11', 'hu7a', ARRAY[8,12,15,16,20,29,35]),
-('2019-12-04', 'hu7a', ARRAY[10,15,19,20,29,32,35]),
-('2019-11-27', 'hu7a', ARRAY[1,8,11,13,21,23,34]),
-('2019-11-20', 'hu7a', ARRAY[4,10,12,15,28,29,34]),
-('2019-11-13', 'hu7a', ARRAY[4,13,16,21,23,27,30]),
-('2019-11-06', 'hu7a', ARRAY[5,6,11,19,21,26,35]),
-('2019-10-30', 'hu7a', ARRAY[7,9,13,27,29,34,35]),
-('2019-10-23', 'hu7a', ARRAY[1,9,13,24,25,29,30]),
-('2019-10-16', 'hu7a', ARRAY[1,4,6,15,27,29,31]),
-('2019-10-09', 'hu7a', ARRAY[18,19,20,27,28,29,35]),
-('2019-10-02', 'hu7a', ARRAY[3,4,10,12,26,28,32]),
-('2019-09-25', 'hu7a', ARRAY[1,7,11,27,28,31,35]),
-('2019-09-18', 'hu7a', ARRAY[7,16,18,20,21,22,27]),
-('2019-09-11', 'hu7a', ARRAY[1,14,16,17,20,30,32]),
-('2019-09-04', 'hu7a', ARRAY[4,6,8,13,22,32,34]),
-('2019-08-28', 'hu7a', ARRAY[1,4,6,12,21,22,32]),
-('2019-08-21', 'hu7a', ARRAY[5,7,11,19,20,24,34]),
-('2019-08-14', 'hu7a', ARRAY[3,15,20,23,30,32,35]),
-('2019-08-07', 'hu7a', ARRAY[2,5,12,14,23,28,35]),
-('2019-07-31', 'hu7a', ARRAY[4,6,12,15,26,29,35]),
-('2019-07-24', 'hu7a', ARRAY[1,4,9,22,24,33,34]),
-('2019-07-17', 'hu7a', ARRAY[2,3,6,8,12,17,31]),
-('2019-07-10', 'hu7a', ARRAY[1,12,13,21,22,27,28]),
-('2019-07-03', 'hu7a', ARRAY[8,16,18,19,20,24,33]),
-('2019-06-26', 'hu7a', ARRAY[3,12,16,21,27,31,33]),
-('2019-06-19', 'hu7a', ARRAY[6,10,12,19,22,25,26]),
-('2019-06-12', 'hu7a', ARRAY[3,5,9,21,22,25,27]),
-('2019-06-05', 'hu7a', ARRAY[1,6,9,11,20,32,35]),
-('2019-05-29', 'hu7a', ARRAY[6,10,14,18,25,31,32]),
-('2019-05-22', 'hu7a', ARRAY[1,9,13,17,26,34,35]),
-('2019-05-15', 'hu7a', ARRAY[3,13,23,29,30,31,33]),
-('2019-05-08', 'hu7a', ARRAY[4,9,14,17,23,26,35]),
-('2019-05-01', 'hu7a', ARRAY[5,8,17,19,20,21,35]),
-('2019-04-24', 'hu7a', ARRAY[1,2,6,21,24,28,32]),
-('2019-04-17', 'hu7a', ARRAY[3,16,19,24,30,32,33]),
-('2019-04-10', 'hu7a', ARRAY[3,4,7,10,14,17,23]),
-('2019-04-03', 'hu7a', ARRAY[5,10,12,13,20,26,27]),
-('2019-03-27', 'hu7a', ARRAY[2,3,10,12,13,14,23]),
-('2019-03-20', 'hu7a', ARRAY[1,3,5,15,17,23,30]),
-('2019-03-13', 'hu7a', ARRAY[5,10,18,22,25,32,35]),
-('2019-03-06', 'hu7a', ARRAY[15,17,19,24,26,33,34]),
-('2019-02-27', 'hu7a', ARRAY[1,4,7,11,16,18,20]),
-('2019-02-20', 'hu7a', ARRAY[8,10,13,14,16,20,31]),
-('2019-02-13', 'hu7a', ARRAY[1,5,8,9,25,26,31]),
-('2019-02-06', 'hu7a', ARRAY[2,6,8,21,25,29,31]),
-('2019-01-30', 'hu7a', ARRAY[1,12,17,19,22,30,32]),
-('2019-01-23', 'hu7a', ARRAY[1,2,8,15,24,30,34]),
-('2019-01-16', 'hu7a', ARRAY[3,5,6,7,18,23,32]),
-('2019-01-09', 'hu7a', ARRAY[10,16,17,20,22,29,31]),
-('2019-01-02', 'hu7a', ARRAY[2,11,19,26,27,29,34]),
-('2018-12-26', 'hu7a', ARRAY[4,7,8,18,19,23,33]),
-('2018-12-19', 'hu7a', ARRAY[4,8,18,19,20,23,30]),
-('2018-12-12', 'hu7a', ARRAY[4,7,8,13,16,23,35]),
-('2018-12-05', 'hu7a', ARRAY[6,11,15,17,18,27,31]),
-('2018-11-28', 'hu7a', ARRAY[3,6,7,10,23,28,29]),
-('2018-11-21', 'hu7a', ARRAY[4,7,8,14,15,20,35]),
-('2018-11-14', 'hu7a', ARRAY[5,11,17,25,26,29,31]),
-('2018-11-07', 'hu7a', ARRAY[9,12,14,20,30,31,33]),
-('2018-10-31', 'hu7a', ARRAY[2,14,18,20,26,28,32]),
-('2018-10-24', 'hu7a', ARRAY[8,11,16,22,25,32,33]),
-('2018-10-17', 'hu7a', ARRAY[6,8,10,16,18,21,33]),
-('2018-10-10', 'hu7a', ARRAY[1,3,7,9,12,17,29]),
-('2018-10-03', 'hu7a', ARRAY[8,9,10,15,16,20,26]),
-('2018-09-26', 'hu7a', ARRAY[3,8,11,12,14,29,35]),
-('2018-09-19', 'hu7a', ARRAY[1,8,15,18,24,27,31]),
-('2018-09-12', 'hu7a', ARRAY[2,10,11,18,20,26,34]),
-('2018-09-05', 'hu7a', ARRAY[1,8,10,21,24,34,35]),
-('2018-08-29', 'hu7a', ARRAY[5,12,19,22,24,29,31]),
-('2018-08-22', 'hu7a', ARRAY[3,11,16,24,25,27,29]),
-('2018-08-15', 'hu7a', ARRAY[2,9,17,21,23,25,31]),
-('2018-08-08', 'hu7a', ARRAY[2,5,10,25,26,34,35]),
-('2018-08-01', 'hu7a', ARRAY[2,13,17,19,20,21,34]),
-('2018-07-25', 'hu7a', ARRAY[3,5,12,15,18,24,25]),
-('2018-07-18', 'hu7a', ARRAY[6,11,13,16,17,21,23]),
-('2018-07-11', 'hu7a', ARRAY[5,12,13,16,20,21,32]),
-('2018-07-04', 'hu7a', ARRAY[2,6,10,12,27,28,33]),
-('2018-06-27', 'hu7a', ARRAY[1,6,11,13,16,20,25]),
-('2018-06-20', 'hu7a', ARRAY[1,8,23,25,28,29,34]),
-('2018-06-13', 'hu7a', ARRAY[2,8,18,19,20,24,25]),
-('2018-06-06', 'hu7a', ARRAY[2,6,8,15,16,22,29]),
-('2018-05-30', 'hu7a', ARRAY[3,6,13,23,27,31,32]),
-('2018-05-23', 'hu7a', ARRAY[2,6,13,16,23,31,33]),
-('2018-05-16', 'hu7a', ARRAY[2,4,6,8,10,18,34]),
-('2018-05-09', 'hu7a', ARRAY[4,9,15,20,24,32,34]),
-('2018-05-02', 'hu7a', ARRAY[5,6,25,27,29,32,34]),
-('2018-04-25', 'hu7a', ARRAY[1,4,5,6,22,23,32]),
-('2018-04-18', 'hu7a', ARRAY[4,9,10,14,24,27,35]),
-('2018-04-11', 'hu7a', ARRAY[6,9,10,13,17,27,29]),
-('2018-04-04', 'hu7a', ARRAY[1,7,15,19,26,28,33]),
-('2018-03-28', 'hu7a', ARRAY[3,4,22,23,29,31,32]),
-('2018-03-21', 'hu7a', ARRAY[3,13,16,20,26,27,35]),
-('2018-03-14', 'hu7a', ARRAY[8,19,20,21,24,30,33]),
-('2018-03-07', 'hu7a', ARRAY[2,3,4,12,19,23,32]),
-('2018-02-28', 'hu7a', ARRAY[2,3,17,20,22,26,32]),
-('2018-02-21', 'hu7a', ARRAY[5,8,21,23,24,34,35]),
-('2018-02-14', 'hu7a', ARRAY[7,10,17,18,28,29,31]),
-('2018-02-07', 'hu7a', ARRAY[4,11,12,17,21,23,34]),
-('2018-01-31', 'hu7a', ARRAY[2,3,6,12,17,31,35]),
-('2018-01-24', 'hu7a', ARRAY[1,6,14,16,22,28,33]),
-('2018-01-17', 'hu7a', ARRAY[2,6,11,13,15,29,33]),
-('2018-01-10', 'hu7a', ARRAY[5,6,13,16,19,26,31]),
-('2018-01-03', 'hu7a', ARRAY[3,6,12,20,22,30,35]),
-('2017-12-27', 'hu7a', ARRAY[9,11,17,18,25,27,35]),
-('2017-12-20', 'hu7a', ARRAY[11,19,22,24,25,26,31]),
-('2017-12-13', 'hu7a', ARRAY[3,14,19,21,22,23,30]),
-('2017-12-06', 'hu7a', ARRAY[6,9,12,15,17,22,24]),
-('2017-11-29', 'hu7a', ARRAY[2,3,5,16,17,27,32]),
-('2017-11-22', 'hu7a', ARRAY[7,14,18,22,25,26,29]),
-('2017-11-15', 'hu7a', ARRAY[5,10,21,27,28,31,33]),
-('2017-11-08', 'hu7a', ARRAY[2,7,17,19,24,30,33]),
-('2017-11-01', 'hu7a', ARRAY[15,16,24,25,28,30,35]),
-('2017-10-25', 'hu7a', ARRAY[11,18,20,26,27,28,35]),
-('2017-10-18', 'hu7a', ARRAY[1,6,13,19,24,33,35]),
-('2017-10-11', 'hu7a', ARRAY[1,3,5,7,14,23,28]),
-('2017-10-04', 'hu7a', ARRAY[13,15,16,19,21,23,28]),
-('2017-09-27', 'hu7a', ARRAY[10,14,21,24,33,34,35]),
-('2017-09-20', 'hu7a', ARRAY[1,3,5,12,15,25,33]),
-('2017-09-13', 'hu7a', ARRAY[3,4,12,17,22,24,34]),
-('2017-09-06', 'hu7a', ARRAY[6,11,17,28,30,32,34]),
-('2017-08-30', 'hu7a', ARRAY[3,9,11,12,13,24,27]),
-('2017-08-23', 'hu7a', ARRAY[8,10,14,20,27,29,30]),
-('2017-08-16', 'hu7a', ARRAY[1,3,7,21,23,32,33]),
-('2017-08-09', 'hu7a', ARRAY[5,7,13,14,19,23,29]),
-('2017-08-02', 'hu7a', ARRAY[5,9,11,17,25,32,34]),
-('2017-07-26', 'hu7a', ARRAY[1,3,6,13,17,20,33]),
-('2017-07-19', 'hu7a', ARRAY[12,19,21,28,29,31,34]),
-('2017-07-12', 'hu7a', ARRAY[1,2,3,10,25,30,31]),
-('2017-07-05', 'hu7a', ARRAY[3,10,13,22,24,26,35]),
-('2017-06-28', 'hu7a', ARRAY[5,16,19,26,27,30,34]),
-('2017-06-21', 'hu7a', ARRAY[9,11,13,20,24,25,32]),
-('2017-06-14', 'hu7a', ARRAY[14,15,18,21,23,25,34]),
-('2017-06-07', 'hu7a', ARRAY[2,7,15,21,27,28,31]),
-('2017-05-31', 'hu7a', ARRAY[4,12,14,25,29,31,34]),
-('2017-05-24', 'hu7a', ARRAY[2,3,4,14,18,22,26]),
-('2017-05-17', 'hu7a', ARRAY[5,11,14,15,26,27,35]),
-('2017-05-10', 'hu7a', ARRAY[1,11,15,17,23,26,34]),
-('2017-05-03', 'hu7a', ARRAY[4,8,17,23,31,32,34]),
-('2017-04-26', 'hu7a', ARRAY[2,4,5,20,24,26,28]),
-('2017-04-19', 'hu7a', ARRAY[2,3,14,15,17,19,31]),
-('2017-04-12', 'hu7a', ARRAY[18,19,21,22,25,31,35]),
-('2017-04-05', 'hu7a', ARRAY[4,8,11,13,26,27,30]),
-('2017-03-29', 'hu7a', ARRAY[4,7,11,16,28,30,32]),
-('2017-03-22', 'hu7a', ARRAY[1,6,7,12,18,25,35]),
-('2017-03-15', 'hu7a', ARRAY[14,17,27,29,30,31,33]),
-('2017-03-08', 'hu7a', ARRAY[7,8,11,12,29,32,33]),
-('2017-03-01', 'hu7a', ARRAY[3,4,5,18,19,24,29]),
-('2017-02-22', 'hu7a', ARRAY[4,17,21,22,25,26,27]),
-('2017-02-15', 'hu7a', ARRAY[3,7,10,26,27,32,34]),
-('2017-02-08', 'hu7a', ARRAY[3,8,14,17,20,28,32]),
-('2017-02-01', 'hu7a', ARRAY[7,18,22,24,25,32,33]),
-('2017-01-25', 'hu7a', ARRAY[4,12,14,23,25,30,34]),
-('2017-01-18', 'hu7a', ARRAY[1,9,15,16,20,28,33]),
-('2017-01-11', 'hu7a', ARRAY[2,3,5,8,15,23,33]),
-('2017-01-04', 'hu7a', ARRAY[1,6,8,12,22,25,31]),
-('2016-12-28', 'hu7a', ARRAY[12,16,22,25,29,30,32]),
-('2016-12-21', 'hu7a', ARRAY[3,4,7,10,12,22,33]),
-('2016-12-14', 'hu7a', ARRAY[1,4,7,13,20,23,29]),
-('2016-12-07', 'hu7a', ARRAY[4,8,15,21,27,30,34]),
-('2016-11-30', 'hu7a', ARRAY[3,4,8,13,14,17,30]),
-('2016-11-23', 'hu7a', ARRAY[2,3,10,13,14,20,27]),
-('2016-11-16', 'hu7a', ARRAY[2,21,22,26,30,32,35]),
-('2016-11-09', 'hu7a', ARRAY[2,5,6,15,20,21,34]),
-('2016-11-02', 'hu7a', ARRAY[2,3,7,16,21,26,29]),
-('2016-10-26', 'hu7a', ARRAY[10,16,17,19,26,30,33]),
-('2016-10-19', 'hu7a', ARRAY[5,17,19,22,28,31,35]),
-('2016-10-12', 'hu7a', ARRAY[7,17,18,19,25,28,35]),
-('2016-10-05', 'hu7a', ARRAY[1,3,4,5,9,19,35]),
-('2016-09-28', 'hu7a', ARRAY[3,17,24,25,28,31,34]),
-('2016-09-21', 'hu7a', ARRAY[5,8,19,20,23,31,34]),
-('2016-09-14', 'hu7a', ARRAY[9,17,19,22,23,26,30]),
-('2016-09-07', 'hu7a', ARRAY[3,9,13,14,15,26,27]),
-('2016-08-31', 'hu7a', ARRAY[5,12,18,21,29,30,31]),
-('2016-08-24', 'hu7a', ARRAY[1,2,20,26,30,31,34]),
-('2016-08-17', 'hu7a', ARRAY[6,11,24,30,32,33,34]),
-('2016-08-10', 'hu7a', ARRAY[5,7,10,18,19,21,23]),
-('2016-08-03', 'hu7a', ARRAY[6,8,14,20,21,24,35]),
-('2016-07-27', 'hu7a', ARRAY[13,16,18,25,26,32,35]),
-('2016-07-20', 'hu7a', ARRAY[6,8,10,18,31,32,34]),
-('2016-07-13', 'hu7a', ARRAY[2,6,9,10,15,17,31]),
-('2016-07-06', 'hu7a', ARRAY[1,4,9,12,15,16,34]),
-('2016-06-29', 'hu7a', ARRAY[13,15,16,20,22,32,34]),
-('2016-06-22', 'hu7a', ARRAY[4,5,11,18,20,31,35]),
-('2016-06-15', 'hu7a', ARRAY[14,15,17,20,24,26,33]),
-('2016-06-08', 'hu7a', ARRAY[2,5,23,28,31,32,34]),
-('2016-06-01', 'hu7a', ARRAY[3,4,6,8,31,33,35]),
-('2016-05-25', 'hu7a', ARRAY[6,10,12,13,21,33,35]),
-('2016-05-18', 'hu7a', ARRAY[10,13,14,15,19,25,28]),
-('2016-05-11', 'hu7a', ARRAY[18,19,23,29,30,32,33]),
-('2016-05-04', 'hu7a', ARRAY[1,11,13,14,16,19,31]),
-('2016-04-27', 'hu7a', ARRAY[4,8,18,20,22,27,32]),
-('2016-04-20', 'hu7a', ARRAY[5,7,8,12,25,26,30]),
-('2016-04-13', 'hu7a', ARRAY[2,13,15,16,20,28,30]),
-('2016-04-06', 'hu7a', ARRAY[5,11,16,22,28,30,33]),
-('2016-03-30', 'hu7a', ARRAY[5,13,15,19,25,29,34]),
-('2016-03-23', 'hu7a', ARRAY[6,8,10,15,22,26,33]),
-('2016-03-16', 'hu7a', ARRAY[3,5,10,25,28,32,35]),
-('2016-03-09', 'hu7a', ARRAY[4,10,17,20,24,29,35]),
-('2016-03-02', 'hu7a', ARRAY[4,5,7,14,25,30,31]),
-('2016-02-24', 'hu7a', ARRAY[7,12,21,23,26,28,30]),
-('2016-02-17', 'hu7a', ARRAY[5,7,12,15,23,26,31]),
-('2016-02-10', 'hu7a', ARRAY[11,12,16,20,27,30,31]),
-('2016-02-03', 'hu7a', ARRAY[4,6,13,26,29,31,33]),
-('2016-01-27', 'hu7a', ARRAY[4,6,9,15,19,20,28]),
-('2016-01-20', 'hu7a', ARRAY[2,11,13,21,25,33,35]),
-('2016-01-13', 'hu7a', ARRAY[2,13,25,27,28,29,35]),
-('2016-01-06', 'hu7a', ARRAY[6,22,23,24,26,27,35]),
-('2015-12-30', 'hu7a', ARRAY[6,8,11,17,25,29,32]),
-('2015-12-23', 'hu7a', ARRAY[14,19,22,23,24,28,29]),
-('2015-12-16', 'hu7a', ARRAY[1,8,9,11,16,17,31]),
-('2015-12-09', 'hu7a', ARRAY[1,6,9,13,21,32,33]),
-('2015-12-02', 'hu7a', ARRAY[3,8,12,14,20,31,32]),
-('2015-11-25', 'hu7a', ARRAY[1,4,7,9,16,20,25]),
-('2015-11-18', 'hu7a', ARRAY[3,8,19,24,28,31,34]),
-('2015-11-11', 'hu7a', ARRAY[1,2,3,6,16,28,35]),
-('2015-11-04', 'hu7a', ARRAY[8,11,21,27,29,31,35]),
-('2015-10-28', 'hu7a', ARRAY[2,5,8,16,25,29,34]),
-('2015-10-21', 'hu7a', ARRAY[2,3,16,20,29,34,35]),
-('2015-10-14', 'hu7a', ARRAY[1,15,16,19,21,24,33]),
-('2015-10-07', 'hu7a', ARRAY[4,8,9,17,21,23,32]),
-('2015-09-30', 'hu7a', ARRAY[2,4,17,23,32,33,35]),
-('2015-09-23', 'hu7a', ARRAY[1,3,18,19,22,28,31]),
-('2015-09-16', 'hu7a', ARRAY[2,4,15,25,26,29,31]),
-('2015-09-09', 'hu7a', ARRAY[1,3,7,14,20,26,35]),
-('2015-09-02', 'hu7a', ARRAY[1,8,9,12,15,22,29]),
-('2015-08-26', 'hu7a', ARRAY[4,7,11,16,18,25,28]),
-('2015-08-19', 'hu7a', ARRAY[4,12,17,29,32,33,35]),
-('2015-08-12', 'hu7a', ARRAY[3,17,28,29,31,33,34]),
-('2015-08-05', 'hu7a', ARRAY[5,8,20,21,23,25,33]),
-('2015-07-29', 'hu7a', ARRAY[10,15,19,22,30,33,34]),
-('2015-07-22', 'hu7a', ARRAY[5,7,17,20,24,32,34]),
-('2015-07-15', 'hu7a', ARRAY[5,10,11,13,23,34,35]),
-('2015-07-08', 'hu7a', ARRAY[3,11,12,18,25,26,30]),
-('2015-07-01', 'hu7a', ARRAY[3,5,8,12,25,30,34]),
-('2015-06-24', 'hu7a', ARRAY[2,3,4,12,24,28,29]),
-('2015-06-17', 'hu7a', ARRAY[2,5,20,24,28,34,35]),
-('2015-06-10', 'hu7a', ARRAY[5,16,19,24,27,28,31]),
-('2015-06-03', 'hu7a', ARRAY[5,18,19,26,27,34,35]),
-('2015-05-27', 'hu7a', ARRAY[3,13,25,27,29,30,32]),
-('2015-05-20', 'hu7a', ARRAY[1,8,10,18,22,32,33]),
-('2015-05-13', 'hu7a', ARRAY[4,18,19,21,24,26,31]),
-('2015-05-06', 'hu7a', ARRAY[3,5,17,18,19,20,26]),
-('2015-04-29', 'hu7a', ARRAY[1,5,13,15,19,24,33]),
-('2015-04-22', 'hu7a', ARRAY[2,6,16,18,19,26,35]),
-('2015-04-15', 'hu7a', ARRAY[5,9,10,12,14,24,25]),
-('2015-04-08', 'hu7a', ARRAY[3,4,12,17,20,23,33]),
-('2015-04-01', 'hu7a', ARRAY[5,6,7,9,13,14,31]),
-('2015-03-25', 'hu7a', ARRAY[1,4,9,11,21,22,25]),
-('2015-03-18', 'hu7a', ARRAY[3,12,15,18,19,26,31]),
-('2015-03-11', 'hu7a', ARRAY[3,11,12,22,30,31,35]),
-('2015-03-04', 'hu7a', ARRAY[1,15,16,18,19,25,31]),
-('2015-02-25', 'hu7a', ARRAY[3,14,24,25,27,29,32]),
-('2015-02-18', 'hu7a', ARRAY[6,7,16,30,32,33,34]),
-('2015-02-11', 'hu7a', ARRAY[18,20,22,25,27,28,33]),
-('2015-02-04', 'hu7a', ARRAY[8,12,16,19,21,23,29]),
-('2015-01-28', 'hu7a', ARRAY[4,5,12,14,18,26,30]),
-('2015-01-21', 'hu7a', ARRAY[4,11,13,14,19,26,28]),
-('2015-01-14', 'hu7a', ARRAY[5,9,13,14,24,26,34]),
-('2015-01-07', 'hu7a', ARRAY[1,3,10,14,17,18,28]),
-('2015-01-01', 'hu7a', ARRAY[9,13,15,19,24,27,33]),
-('2014-12-24', 'hu7a', ARRAY[3,6,12,17,21,24,25]),
-('2014-12-17', 'hu7a', ARRAY[3,5,13,24,31,32,35]),
-('2014-12-10', 'hu7a', ARRAY[8,10,12,19,26,30,31]),
-('2014-12-03', 'hu7a', ARRAY[7,10,15,21,23,26,30]),
-('2014-11-26', 'hu7a', ARRAY[1,6,7,12,24,29,31]),
-('2014-11-19', 'hu7a', ARRAY[1,13,17,20,27,28,33]),
-('2014-11-12', 'hu7a', ARRAY[4,10,12,24,27,30,32]),
-('2014-11-05', 'hu7a', ARRAY[6,13,15,16,21,28,32]),
-('2014-10-29', 'hu7a', ARRAY[2,11,20,23,24,28,33]),
-('2014-10-22', 'hu7a', ARRAY[5,7,11,15,18,27,28]),
-('2014-10-15', 'hu7a', ARRAY[1,6,9,13,16,21,23]),
-('2014-10-08', 'hu7a', ARRAY[2,3,7,15,16,31,34]),
-('2014-10-01', 'hu7a', ARRAY[8,10,13,21,22,34,35]),
-('2014-09-24', 'hu7a', ARRAY[1,3,11,19,21,24,25]),
-('2014-09-17', 'hu7a', ARRAY[9,14,21,23,25,27,33]),
-('2014-09-10', 'hu7a', ARRAY[2,5,15,18,21,27,34]),
-('2014-09-03', 'hu7a', ARRAY[9,11,13,24,26,33,34]),
-('2014-08-27', 'hu7a', ARRAY[2,5,9,14,28,30,33]),
-('2014-08-20', 'hu7a', ARRAY[5,8,20,21,22,32,35]),
-('2014-08-13', 'hu7a', ARRAY[1,5,6,18,20,25,35]),
-('2014-08-06', 'hu7a', ARRAY[2,8,15,21,23,31,34]),
-('2014-07-30', 'hu7a', ARRAY[4,13,16,17,27,28,32]),
-('2014-07-23', 'hu7a', ARRAY[9,12,17,20,21,26,27]),
-('2014-07-16', 'hu7a', ARRAY[2,5,10,16,17,26,34]),
-('2014-07-09', 'hu7a', ARRAY[2,7,8,9,13,16,27]),
-('2014-07-02', 'hu7a', ARRAY[7,9,18,20,21,22,25]),
-('2014-06-25', 'hu7a', ARRAY[7,12,13,16,19,24,27]),
-('2014-06-18', 'hu7a', ARRAY[2,4,19,22,23,24,28]),
-('2014-06-11', 'hu7a', ARRAY[12,17,19,21,23,29,30]),
-('2014-06-04', 'hu7a', ARRAY[7,8,14,23,27,28,29]),
-('2014-05-28', 'hu7a', ARRAY[6,11,12,18,23,29,34]),
-('2014-05-21', 'hu7a', ARRAY[2,3,10,16,20,22,35]),
-('2014-05-14', 'hu7a', ARRAY[7,19,21,29,30,31,34]),
-('2014-05-07', 'hu7a', ARRAY[2,4,11,13,14,26,28]),
-('2014-04-30', 'hu7a', ARRAY[1,3,12,21,22,25,35]),
-('2014-04-23', 'hu7a', ARRAY[1,2,15,19,21,30,35]),
-('2014-04-16', 'hu7a', ARRAY[1,3,8,12,14,18,23]),
-('2014-04-09', 'hu7a', ARRAY[1,7,9,16,25,26,30]),
-('2014-04-02', 'hu7a', ARRAY[3,7,14,22,28,31,32]),
-('2014-03-26', 'hu7a', ARRAY[3,10,15,16,19,20,30]),
-('2014-03-19', 'hu7a', ARRAY[1,8,11,19,23,29,31]),
-('2014-03-12', 'hu7a', ARRAY[3,6,7,10,20,23,32]),
-('2014-03-05', 'hu7a', ARRAY[1,7,12,15,23,25,34]),
-('2014-02-26', 'hu7a', ARRAY[1,9,11,12,16,20,32]),
-('2014-02-19', 'hu7a', ARRAY[7,11,14,15,19,23,25]),
-('2014-02-12', 'hu7a', ARRAY[7,20,21,24,29,34,35]),
-('2014-02-05', 'hu7a', ARRAY[8,16,19,22,29,30,33]),
-('2014-01-29', 'hu7a', ARRAY[7,19,25,29,31,32,34]),
-('2014-01-22', 'hu7a', ARRAY[4,6,17,19,24,28,30]),
-('2014-01-15', 'hu7a', ARRAY[12,13,17,19,28,30,35]),
-('2014-01-08', 'hu7a', ARRAY[3,14,15,16,20,23,33]),
-('2014-01-01', 'hu7a', ARRAY[4,6,10,18,20,25,30]),
-('2013-12-25', 'hu7a', ARRAY[5,8,11,17,24,30,35]),
-('2013-12-18', 'hu7a', ARRAY[1,2,7,18,21,29,30]),
-('2013-12-11', 'hu7a', ARRAY[4,6,7,13,14,26,29]),
-('2013-12-04', 'hu7a', ARRAY[1,2,5,23,24,28,32]),
-('2013-11-27', 'hu7a', ARRAY[3,9,15,17,19,21,25]),
-('2013-11-20', 'hu7a', ARRAY[5,8,10,17,21,31,32]),
-('2013-11-13', 'hu7a', ARRAY[1,8,10,11,18,25,35]),
-('2013-11-06', 'hu7a', ARRAY[2,4,5,14,20,31,35]),
-('2013-10-30', 'hu7a', ARRAY[3,5,6,7,10,17,28]),
-('2013-10-23', 'hu7a', ARRAY[2,5,11,16,24,25,28]),
-('2013-10-16', 'hu7a', ARRAY[1,5,8,17,28,29,35]),
-('2013-10-09', 'hu7a', ARRAY[1,3,11,12,15,27,31]),
-('2013-10-02', 'hu7a', ARRAY[11,16,19,21,22,24,31]),
-('2013-09-25', 'hu7a', ARRAY[5,6,14,18,21,29,35]),
-('2013-09-18', 'hu7a', ARRAY[6,10,11,24,26,29,32]),
-('2013-09-11', 'hu7a', ARRAY[10,16,24,25,26,28,31]),
-('2013-09-04', 'hu7a', ARRAY[9,14,16,22,24,25,27]),
-('2013-08-28', 'hu7a', ARRAY[2,5,6,14,19,30,33]),
-('2013-08-21', 'hu7a', ARRAY[1,7,15,28,31,32,33]),
-('2013-08-14', 'hu7a', ARRAY[2,5,13,15,16,21,34]),
-('2013-08-07', 'hu7a', ARRAY[5,7,13,14,15,27,34]),
-('2013-07-31', 'hu7a', ARRAY[1,8,18,19,20,23,31]),
-('2013-07-24', 'hu7a', ARRAY[3,16,23,24,26,30,33]),
-('2013-07-17', 'hu7a', ARRAY[1,10,12,15,19,28,33]),
-('2013-07-10', 'hu7a', ARRAY[3,6,10,13,18,20,25]),
-('2013-07-03', 'hu7a', ARRAY[5,8,13,21,22,27,30]),
-('2013-06-26', 'hu7a', ARRAY[15,17,20,22,24,26,29]),
-('2013-06-19', 'hu7a', ARRAY[2,6,9,11,14,30,31]),
-('2013-06-12', 'hu7a', ARRAY[1,9,11,14,31,33,34]),
-('2013-06-05', 'hu7a', ARRAY[4,7,10,22,26,31,34]),
-('2013-05-29', 'hu7a', ARRAY[12,21,24,25,27,28,32]),
-('2013-05-22', 'hu7a', ARRAY[6,9,10,16,24,31,32]),
-('2013-05-15', 'hu7a', ARRAY[5,17,19,24,25,27,33]),
-('2013-05-08', 'hu7a', ARRAY[4,10,14,20,26,31,34]),
-('2013-05-02', 'hu7a', ARRAY[8,12,16,17,20,23,24]),
-('2013-04-24', 'hu7a', ARRAY[2,14,15,16,24,27,29]),
-('2013-04-17', 'hu7a', ARRAY[8,10,12,21,23,33,35]),
-('2013-04-10', 'hu7a', ARRAY[1,2,17,19,21,22,26]),
-('2013-04-03', 'hu7a', ARRAY[2,7,8,13,22,28,35]),
-('2013-03-27', 'hu7a', ARRAY[5,12,13,19,26,33,35]),
-('2013-03-20', 'hu7a', ARRAY[8,11,19,22,23,25,30]),
-('2013-03-13', 'hu7a', ARRAY[5,12,16,19,21,27,35]),
-('2013-03-06', 'hu7a', ARRAY[2,5,6,8,13,22,26]),
-('2013-02-27', 'hu7a', ARRAY[3,6,15,17,20,27,33]),
-('2013-02-20', 'hu7a', ARRAY[6,17,18,19,23,31,33]),
-('2013-02-13', 'hu7a', ARRAY[4,12,13,24,29,33,34]),
-('2013-02-06', 'hu7a', ARRAY[3,7,16,19,21,33,35]),
-('2013-01-30', 'hu7a', ARRAY[1,4,13,21,23,24,35]),
-('2013-01-23', 'hu7a', ARRAY[2,3,9,22,26,28,30]),
-('2013-01-16', 'hu7a', ARRAY[4,17,23,24,29,30,35]),
-('2013-01-09', 'hu7a', ARRAY[1,6,9,15,22,25,31]),
-('2013-01-02', 'hu7a', ARRAY[5,8,12,14,16,19,29]),
-('2012-12-26', 'hu7a', ARRAY[1,7,15,22,24,28,30]),
-('2012-12-19', 'hu7a', ARRAY[5,10,14,23,28,33,34]),
-('2012-12-12', 'hu7a', ARRAY[4,5,8,9,23,26,34]),
-('2012-12-05', 'hu7a', ARRAY[8,14,17,27,28,29,30]),
-('2012-11-28', 'hu7a', ARRAY[6,7,13,25,32,33,34]),
-('2012-11-21', 'hu7a', ARRAY[9,11,14,21,24,27,33]),
-('2012-11-14', 'hu7a', ARRAY[1,4,9,13,16,21,23]),
-('2012-11-07', 'hu7a', ARRAY[5,10,11,13,17,25,32]),
-('2012-10-31', 'hu7a', ARRAY[2,7,21,22,24,28,32]),
-('2012-10-24', 'hu7a', ARRAY[4,9,10,13,15,19,35]),
-('2012-10-17', 'hu7a', ARRAY[10,13,14,16,19,25,27]),
-('2012-10-10', 'hu7a', ARRAY[6,13,15,17,18,19,23]),
-('2012-10-03', 'hu7a', ARRAY[2,7,12,21,25,29,32]),
-('2012-09-26', 'hu7a', ARRAY[13,18,22,24,29,30,33]),
-('2012-09-19', 'hu7a', ARRAY[15,20,21,26,29,32,34]),
-('2012-09-12', 'hu7a', ARRAY[2,11,12,15,21,24,29]),
-('2012-09-05', 'hu7a', ARRAY[2,3,12,16,20,30,32]),
-('2012-08-29', 'hu7a', ARRAY[5,9,14,17,18,19,34]),
-('2012-08-22', 'hu7a', ARRAY[4,6,8,11,27,28,30]),
-('2012-08-15', 'hu7a', ARRAY[2,5,15,17,24,27,30]),
-('2012-08-08', 'hu7a', ARRAY[2,5,9,11,16,22,25]),
-('2012-08-01', 'hu7a', ARRAY[9,13,18,21,25,26,32]),
-('2012-07-25', 'hu7a', ARRAY[5,6,9,10,14,17,28]),
-('2012-07-18', 'hu7a', ARRAY[13,16,22,26,29,32,34]),
-('2012-07-11', 'hu7a', ARRAY[1,5,8,10,14,18,19]),
-('2012-07-04', 'hu7a', ARRAY[5,10,14,21,23,25,35]),
-('2012-06-27', 'hu7a', ARRAY[4,11,15,21,22,23,26]),
-('2012-06-20', 'hu7a', ARRAY[10,11,15,18,24,29,32]),
-('2012-06-13', 'hu7a', ARRAY[1,5,17,19,26,29,34]),
-('2012-06-06', 'hu7a', ARRAY[2,6,7,9,25,30,32]),
-('2012-05-30', 'hu7a', ARRAY[6,9,19,20,28,30,35]),
-('2012-05-23', 'hu7a', ARRAY[8,16,21,22,31,33,35]),
-('2012-05-16', 'hu7a', ARRAY[15,16,17,21,27,29,33]),
-('2012-05-09', 'hu7a', ARRAY[4,11,12,22,25,26,28]),
-('2012-05-02', 'hu7a', ARRAY[1,4,8,25,26,28,33]),
-('2012-04-25', 'hu7a', ARRAY[4,7,17,18,19,27,30]),
-('2012-04-18', 'hu7a', ARRAY[10,11,12,14,19,34,35]),
-('2012-04-11', 'hu7a', ARRAY[3,10,14,17,22,25,31]),
-('2012-04-04', 'hu7a', ARRAY[7,10,15,16,19,28,32]),
-('2012-03-28', 'hu7a', ARRAY[2,5,15,19,27,29,34]),
-('2012-03-21', 'hu7a', ARRAY[5,7,12,19,23,31,32]),
-('2012-03-14', 'hu7a', ARRAY[4,6,13,20,25,28,35]),
-('2012-03-07', 'hu7a', ARRAY[6,8,10,18,29,30,32]),
-('2012-02-29', 'hu7a', ARRAY[2,5,9,10,16,21,24]),
-('2012-02-22', 'hu7a', ARRAY[4,5,9,14,25,27,33]),
-('2012-02-15', 'hu7a', ARRAY[3,4,12,14,18,23,33]),
-('2012-02-08', 'hu7a', ARRAY[4,5,11,13,21,28,30]),
-('2012-02-01', 'hu7a', ARRAY[2,6,13,14,15,27,34]),
-('2012-01-25', 'hu7a', ARRAY[1,12,14,17,22,27,33]),
-('2012-01-18', 'hu7a', ARRAY[5,6,17,22,27,31,32]),
-('2012-01-11', 'hu7a', ARRAY[3,10,14,16,21,25,29]),
-('2012-01-04', 'hu7a', ARRAY[12,21,22,23,24,29,35]),
-('2011-12-28', 'hu7a', ARRAY[1,3,4,10,16,18,33]),
-('2011-12-21', 'hu7a', ARRAY[2,3,8,13,15,20,35]),
-('2011-12-14', 'hu7a', ARRAY[4,5,12,14,16,18,33]),
-('2011-12-07', 'hu7a', ARRAY[13,19,23,25,27,32,34]),
-('2011-11-30', 'hu7a', ARRAY[4,7,11,22,31,32,33]),
-('2011-11-23', 'hu7a', ARRAY[1,7,11,12,17,25,27]),
-('2011-11-16', 'hu7a', ARRAY[1,4,8,11,15,23,35]),
-('2011-11-09', 'hu7a', ARRAY[1,8,18,23,24,34,35]),
-('2011-11-02', 'hu7a', ARRAY[5,6,9,14,20,22,30]),
-('2011-10-26', 'hu7a', ARRAY[2,9,12,15,21,32,34]),
-('2011-10-19', 'hu7a', ARRAY[10,13,18,19,21,25,29]),
-('2011-10-12', 'hu7a', ARRAY[1,11,14,16,24,26,28]),
-('2011-10-05', 'hu7a', ARRAY[2,4,19,21,25,34,35]),
-('2011-09-28', 'hu7a', ARRAY[3,10,18,20,26,29,35]),
-('2011-09-21', 'hu7a', ARRAY[2,5,11,12,18,26,34]),
-('2011-09-14', 'hu7a', ARRAY[4,5,8,20,21,26,33]),
-('2011-09-07', 'hu7a', ARRAY[1,2,4,10,12,17,28]),
-('2011-08-31', 'hu7a', ARRAY[13,16,18,19,24,31,34]),
-('2011-08-24', 'hu7a', ARRAY[2,3,12,14,24,29,32]),
-('2011-08-17', 'hu7a', ARRAY[2,3,4,10,27,28,35]),
-('2011-08-10', 'hu7a', ARRAY[4,5,10,13,16,18,31]),
-('2011-08-03', 'hu7a', ARRAY[1,5,6,7,14,17,23]),
-('2011-07-27', 'hu7a', ARRAY[7,9,16,20,21,23,24]),
-('2011-07-20', 'hu7a', ARRAY[2,5,13,14,19,20,26]),
-('2011-07-13', 'hu7a', ARRAY[20,21,29,31,32,33,34]),
-('2011-07-06', 'hu7a', ARRAY[1,5,12,18,19,21,31]),
-('2011-06-29', 'hu7a', ARRAY[7,11,15,16,21,22,34]),
-('2011-06-22', 'hu7a', ARRAY[2,7,18,19,28,31,33]),
-('2011-06-15', 'hu7a', ARRAY[1,3,13,17,20,30,31]),
-('2011-06-08', 'hu7a', ARRAY[7,12,15,16,17,27,28]),
-('2011-06-01', 'hu7a', ARRAY[8,12,15,24,26,34,35]),
-('2011-05-25', 'hu7a', ARRAY[8,10,12,22,28,32,34]),
-('2011-05-18', 'hu7a', ARRAY[2,15,16,19,26,30,35]),
-('2011-05-11', 'hu7a', ARRAY[2,4,9,22,23,26,29]),
-('2011-05-04', 'hu7a', ARRAY[4,6,9,14,17,27,28]),
-('2011-04-27', 'hu7a', ARRAY[3,13,17,18,23,24,28]),
-('2011-04-20', 'hu7a', ARRAY[3,6,7,20,21,25,33]),
-('2011-04-13', 'hu7a', ARRAY[8,16,24,29,30,31,32]),
-('2011-04-06', 'hu7a', ARRAY[6,8,12,27,28,32,35]),
-('2011-03-30', 'hu7a', ARRAY[1,7,9,11,27,29,32]),
-('2011-03-23', 'hu7a', ARRAY[6,7,12,17,24,29,30]),
-('2011-03-16', 'hu7a', ARRAY[4,9,21,23,25,28,29]),
-('2011-03-09', 'hu7a', ARRAY[3,9,15,21,24,28,29]),
-('2011-03-02', 'hu7a', ARRAY[4,7,8,9,15,24,28]),
-('2011-02-23', 'hu7a', ARRAY[3,5,8,9,20,22,30]),
-('2011-02-16', 'hu7a', ARRAY[10,12,19,25,28,29,35]),
-('2011-02-09', 'hu7a', ARRAY[7,10,15,17,24,28,34]),
-('2011-02-02', 'hu7a', ARRAY[2,4,13,20,21,25,34]),
-('2011-01-26', 'hu7a', ARRAY[6,7,10,14,18,22,23]),
-('2011-01-19', 'hu7a', ARRAY[1,2,8,9,22,31,32]),
-('2011-01-12', 'hu7a', ARRAY[3,11,20,30,32,34,35]),
-('2011-01-05', 'hu7a', ARRAY[5,8,14,17,31,32,34]),
-('2010-12-29', 'hu7a', ARRAY[4,6,10,13,14,15,24]),
-('2010-12-22', 'hu7a', ARRAY[13,15,16,17,20,26,33]),
-('2010-12-15', 'hu7a', ARRAY[2,4,7,10,15,24,26]),
-('2010-12-08', 'hu7a', ARRAY[9,17,20,23,32,33,34]),
-('2010-12-01', 'hu7a', ARRAY[8,9,12,19,21,29,33]),
-('2010-11-24', 'hu7a', ARRAY[5,15,17,25,27,32,33]),
-('2010-11-17', 'hu7a', ARRAY[4,10,14,16,17,25,28]),
-('2010-11-10', 'hu7a', ARRAY[2,3,13,24,25,27,32]),
-('2010-11-03', 'hu7a', ARRAY[16,24,25,26,27,34,35]),
-('2010-10-27', 'hu7a', ARRAY[1,3,6,10,19,28,34]),
-('2010-10-20', 'hu7a', ARRAY[6,12,13,20,21,27,29]),
-('2010-10-13', 'hu7a', ARRAY[3,5,8,10,12,27,34]),
-('2010-10-06', 'hu7a', ARRAY[2,3,4,15,16,22,25]),
-('2010-09-29', 'hu7a', ARRAY[11,12,16,19,27,32,34]),
-('2010-09-22', 'hu7a', ARRAY[8,17,18,23,26,28,32]),
-('2010-09-15', 'hu7a', ARRAY[6,19,25,26,28,31,34]),
-('2010-09-08', 'hu7a', ARRAY[1,4,5,8,10,21,28]),
-('2010-09-01', 'hu7a', ARRAY[9,13,18,21,24,30,33]),
-('2010-08-25', 'hu7a', ARRAY[4,5,12,13,18,30,33]),
-('2010-08-18', 'hu7a', ARRAY[1,8,13,18,20,22,24]),
-('2010-08-11', 'hu7a', ARRAY[6,10,13,14,21,31,35]),
-('2010-08-04', 'hu7a', ARRAY[2,6,9,11,24,26,27]),
-('2010-07-28', 'hu7a', ARRAY[5,6,8,19,30,33,35]),
-('2010-07-21', 'hu7a', ARRAY[10,11,12,14,25,31,32]),
-('2010-07-14', 'hu7a', ARRAY[5,7,16,21,26,32,35]),
-('2010-07-07', 'hu7a', ARRAY[2,5,8,17,20,23,32]),
-('2010-06-30', 'hu7a', ARRAY[12,14,15,16,18,30,32]),
-('2010-06-23', 'hu7a', ARRAY[11,12,15,20,22,30,34]),
-('2010-06-16', 'hu7a', ARRAY[1,2,5,11,14,26,27]),
-('2010-06-09', 'hu7a', ARRAY[3,9,12,15,19,21,32]),
-('2010-06-02', 'hu7a', ARRAY[16,19,20,25,26,30,32]),
-('2010-05-26', 'hu7a', ARRAY[4,5,6,8,10,26,27]),
-('2010-05-19', 'hu7a', ARRAY[1,3,8,13,20,22,26]),
-('2010-05-12', 'hu7a', ARRAY[5,9,11,14,19,24,28]),
-('2010-05-05', 'hu7a', ARRAY[1,4,13,18,20,24,27]),
-('2010-04-28', 'hu7a', ARRAY[3,11,12,27,29,30,32]),
-('2010-04-21', 'hu7a', ARRAY[2,4,9,18,19,32,34]),
-('2010-04-14', 'hu7a', ARRAY[14,16,19,25,30,32,34]),
-('2010-04-07', 'hu7a', ARRAY[2,8,15,21,23,28,32]),
-('2010-03-31', 'hu7a', ARRAY[3,7,12,13,22,26,31]),
-('2010-03-24', 'hu7a', ARRAY[1,4,15,24,29,30,35]),
-('2010-03-17', 'hu7a', ARRAY[3,4,9,16,21,22,27]),
-('2010-03-10', 'hu7a', ARRAY[3,8,11,16,24,28,31]),
-('2010-03-03', 'hu7a', ARRAY[2,8,14,17,18,26,30]),
-('2010-02-24', 'hu7a', ARRAY[2,7,11,14,15,26,34]),
-('2010-02-17', 'hu7a', ARRAY[8,15,21,29,31,34,35]),
-('2010-02-10', 'hu7a', ARRAY[6,13,15,17,23,27,28]),
-('2010-02-03', 'hu7a', ARRAY[1,11,18,27,28,29,32]),
-('2010-01-27', 'hu7a', ARRAY[2,4,8,14,20,23,24]),
-('2010-01-20', 'hu7a', ARRAY[10,13,14,16,22,26,32]),
-('2010-01-13', 'hu7a', ARRAY[1,16,17,20,22,29,33]),
-('2010-01-06', 'hu7a', ARRAY[3,8,9,11,12,13,31]),
-('2009-12-30', 'hu7a', ARRAY[6,14,18,19,26,28,30]),
-('2009-12-23', 'hu7a', ARRAY[4,6,7,25,27,29,32]),
-('2009-12-16', 'hu7a', ARRAY[5,9,10,18,22,25,26]),
-('2009-12-09', 'hu7a', ARRAY[5,9,15,24,26,30,35]),
-('2009-12-02', 'hu7a', ARRAY[8,9,11,24,25,30,34]),
-('2009-11-25', 'hu7a', ARRAY[1,2,4,9,15,26,29]),
-('2009-11-18', 'hu7a', ARRAY[4,10,11,12,13,15,19]),
-('2009-11-11', 'hu7a', ARRAY[4,12,23,24,28,33,34]),
-('2009-11-04', 'hu7a', ARRAY[6,15,20,24,29,32,33]),
-('2009-10-28', 'hu7a', ARRAY[6,8,17,18,22,24,26]),
-('2009-10-21', 'hu7a', ARRAY[3,4,6,18,27,32,34]),
-('2009-10-14', 'hu7a', ARRAY[2,12,13,15,21,32,33]),
-('2009-10-07', 'hu7a', ARRAY[2,5,7,18,31,33,34]),
-('2009-09-30', 'hu7a', ARRAY[1,5,13,18,19,20,31]),
-('2009-09-23', 'hu7a', ARRAY[3,5,7,10,15,20,32]),
-('2009-09-16', 'hu7a', ARRAY[3,5,14,15,18,28,31]),
-('2009-09-09', 'hu7a', ARRAY[2,4,5,27,29,30,32]),
-('2009-09-02', 'hu7a', ARRAY[2,19,25,27,28,30,31]),
-('2009-08-26', 'hu7a', ARRAY[2,6,8,11,20,29,33]),
-('2009-08-19', 'hu7a', ARRAY[10,13,17,19,23,28,33]),
-('2009-08-12', 'hu7a', ARRAY[3,7,8,12,15,17,29]),
-('2009-08-05', 'hu7a', ARRAY[4,8,10,11,19,30,33]),
-('2009-07-29', 'hu7a', ARRAY[4,14,16,27,28,30,31]),
-('2009-07-22', 'hu7a', ARRAY[4,8,9,24,28,30,33]),
-('2009-07-15', 'hu7a', ARRAY[2,6,7,9,12,23,29]),
-('2009-07-08', 'hu7a', ARRAY[5,15,18,20,27,31,33]),
-('2009-07-01', 'hu7a', ARRAY[7,9,10,15,19,25,32]),
-('2009-06-24', 'hu7a', ARRAY[1,2,7,17,20,30,31]),
-('2009-06-17', 'hu7a', ARRAY[2,9,14,16,21,25,28]),
-('2009-06-10', 'hu7a', ARRAY[2,6,21,26,28,30,32]),
-('2009-06-03', 'hu7a', ARRAY[13,16,21,31,33,34,35]),
-('2009-05-27', 'hu7a', ARRAY[4,7,11,20,22,27,31]),
-('2009-05-20', 'hu7a', ARRAY[1,2,14,20,24,30,31]),
-('2009-05-13', 'hu7a', ARRAY[1,5,9,15,19,26,27]),
-('2009-05-06', 'hu7a', ARRAY[4,11,12,30,31,33,35]),
-('2009-04-29', 'hu7a', ARRAY[18,24,27,29,32,33,35]),
-('2009-04-22', 'hu7a', ARRAY[1,4,9,14,23,24,29]),
-('2009-04-15', 'hu7a', ARRAY[1,8,16,18,20,24,26]),
-('2009-04-08', 'hu7a', ARRAY[2,4,6,7,20,22,35]),
-('2009-04-01', 'hu7a', ARRAY[9,10,11,13,14,20,22]),
-('2009-03-25', 'hu7a', ARRAY[1,9,19,25,27,32,35]),
-('2009-03-18', 'hu7a', ARRAY[2,16,21,22,23,27,29]),
-('2009-03-11', 'hu7a', ARRAY[2,13,14,16,17,19,25]),
-('2009-03-04', 'hu7a', ARRAY[1,3,7,11,16,29,35]),
-('2009-02-25', 'hu7a', ARRAY[6,7,8,13,27,31,34]),
-('2009-02-18', 'hu7a', ARRAY[5,10,13,19,25,26,34]),
-('2009-02-11', 'hu7a', ARRAY[2,5,18,23,26,34,35]),
-('2009-02-04', 'hu7a', ARRAY[6,7,12,14,25,26,29]),
-('2009-01-28', 'hu7a', ARRAY[3,4,8,12,14,18,24]),
-('2009-01-21', 'hu7a', ARRAY[1,3,4,7,14,15,29]),
-('2009-01-14', 'hu7a', ARRAY[19,20,26,27,30,31,35]),
-('2009-01-07', 'hu7a', ARRAY[7,9,11,17,18,27,35]),
-('2008-12-31', 'hu7a', ARRAY[4,7,12,19,25,29,30]),
-('2008-12-24', 'hu7a', ARRAY[11,15,16,19,21,26,34]),
-('2008-12-17', 'hu7a', ARRAY[3,13,15,16,19,30,31]),
-('2008-12-10', 'hu7a', ARRAY[3,4,5,8,13,23,31]),
-('2008-12-03', 'hu7a', ARRAY[6,14,15,16,17,21,24]),
-('2008-11-26', 'hu7a', ARRAY[5,6,10,18,22,27,30]),
-('2008-11-19', 'hu7a', ARRAY[4,5,14,19,28,29,32]),
-('2008-11-12', 'hu7a', ARRAY[2,6,14,19,21,32,33]),
-('2008-11-05', 'hu7a', ARRAY[7,8,9,11,21,25,28]),
-('2008-10-29', 'hu7a', ARRAY[11,19,20,23,25,27,34]),
-('2008-10-22', 'hu7a', ARRAY[5,10,13,20,26,27,30]),
-('2008-10-15', 'hu7a', ARRAY[6,7,14,17,21,23,32]),
-('2008-10-08', 'hu7a', ARRAY[3,13,19,22,30,31,35]),
-('2008-10-01', 'hu7a', ARRAY[1,3,6,12,18,22,30]),
-('2008-09-24', 'hu7a', ARRAY[1,11,12,14,19,20,23]),
-('2008-09-17', 'hu7a', ARRAY[10,11,12,14,23,24,27]),
-('2008-09-10', 'hu7a', ARRAY[5,8,14,21,26,32,34]),
-('2008-09-03', 'hu7a', ARRAY[2,3,4,18,19,25,26]),
-('2008-08-27', 'hu7a', ARRAY[17,22,24,27,30,31,34]),
-('2008-08-21', 'hu7a', ARRAY[1,6,19,23,27,28,32]),
-('2008-08-13', 'hu7a', ARRAY[11,14,16,19,28,29,34]),
-('2008-08-06', 'hu7a', ARRAY[4,6,15,19,24,31,34]),
-('2008-07-30', 'hu7a', ARRAY[2,11,21,26,28,34,35]),
-('2008-07-23', 'hu7a', ARRAY[11,18,21,22,27,29,32]),
-('2008-07-16', 'hu7a', ARRAY[5,8,15,16,22,30,31]),
-('2008-07-09', 'hu7a', ARRAY[2,4,10,12,24,32,34]),
-('2008-07-02', 'hu7a', ARRAY[8,14,18,19,23,29,35]),
-('2008-06-25', 'hu7a', ARRAY[6,9,14,16,19,22,26]),
-('2008-06-18', 'hu7a', ARRAY[1,5,14,15,20,23,34]),
-('2008-06-11', 'hu7a', ARRAY[2,9,10,11,13,21,32]),
-('2008-06-04', 'hu7a', ARRAY[10,19,20,25,29,31,33]),
-('2008-05-28', 'hu7a', ARRAY[10,11,19,25,27,30,33]),
-('2008-05-21', 'hu7a', ARRAY[12,16,25,28,29,30,32]),
-('2008-05-14', 'hu7a', ARRAY[2,8,19,22,23,27,32]),
-('2008-05-07', 'hu7a', ARRAY[2,8,11,16,18,19,27]),
-('2008-04-30', 'hu7a', ARRAY[2,6,14,20,23,25,34]),
-('2008-04-23', 'hu7a', ARRAY[1,4,8,12,22,28,35]),
-('2008-04-16', 'hu7a', ARRAY[4,10,16,21,24,28,32]),
-('2008-04-09', 'hu7a', ARRAY[6,15,18,24,25,26,33]),
-('2008-04-02', 'hu7a', ARRAY[11,13,15,16,20,21,31]),
-('2008-03-26', 'hu7a', ARRAY[1,2,7,9,29,30,35]),
-('2008-03-19', 'hu7a', ARRAY[2,7,10,13,19,20,25]),
-('2008-03-12', 'hu7a', ARRAY[5,10,19,23,24,25,27]),
-('2008-03-05', 'hu7a', ARRAY[3,6,16,19,24,29,30]),
-('2008-02-27', 'hu7a', ARRAY[7,8,10,11,12,32,34]),
-('2008-02-20', 'hu7a', ARRAY[1,11,13,14,17,18,35]),
-('2008-02-13', 'hu7a', ARRAY[1,5,6,16,17,29,32]),
-('2008-02-06', 'hu7a', ARRAY[2,5,9,23,26,28,30]),
-('2008-01-30', 'hu7a', ARRAY[6,9,13,22,25,29,31]),
-('2008-01-23', 'hu7a', ARRAY[7,8,13,14,17,21,29]),
-('2008-01-16', 'hu7a', ARRAY[4,5,13,20,27,31,33]),
-('2008-01-09', 'hu7a', ARRAY[8,9,10,23,24,26,27]),
-('2008-01-02', 'hu7a', ARRAY[9,19,22,25,27,29,30]),
-('2007-12-27', 'hu7a', ARRAY[2,12,13,18,20,25,30]),
-('2007-12-19', 'hu7a', ARRAY[18,22,24,27,29,30,32]),
-('2007-12-12', 'hu7a', ARRAY[2,4,8,16,18,19,32]),
-('2007-12-05', 'hu7a', ARRAY[9,11,16,17,19,22,31]),
-('2007-11-28', 'hu7a', ARRAY[9,13,25,27,28,29,35]),
-('2007-11-21', 'hu7a', ARRAY[11,12,15,20,23,25,31]),
-('2007-11-14', 'hu7a', ARRAY[1,3,4,10,15,21,27]),
-('2007-11-07', 'hu7a', ARRAY[3,10,13,19,23,28,31]),
-('2007-10-31', 'hu7a', ARRAY[2,10,13,17,20,21,35]),
-('2007-10-24', 'hu7a', ARRAY[2,3,19,21,22,30,35]),
-('2007-10-17', 'hu7a', ARRAY[13,17,18,25,30,32,35]),
-('2007-10-10', 'hu7a', ARRAY[1,3,4,11,14,21,29]),
-('2007-10-03', 'hu7a', ARRAY[4,7,8,12,16,27,31]),
-('2007-09-26', 'hu7a', ARRAY[5,12,14,26,29,30,34]),
-('2007-09-19', 'hu7a', ARRAY[4,8,9,11,13,17,30]),
-('2007-09-12', 'hu7a', ARRAY[5,10,11,13,15,24,32]),
-('2007-09-05', 'hu7a', ARRAY[4,6,7,21,22,28,35]),
-('2007-08-29', 'hu7a', ARRAY[2,5,16,25,32,34,35]),
-('2007-08-22', 'hu7a', ARRAY[3,10,14,17,20,26,27]),
-('2007-08-15', 'hu7a', ARRAY[3,5,9,17,27,29,34]),
-('2007-08-08', 'hu7a', ARRAY[9,14,20,25,26,27,35]),
-('2007-08-01', 'hu7a', ARRAY[5,14,19,20,27,28,34]),
-('2007-07-25', 'hu7a', ARRAY[1,3,11,24,26,31,35]),
-('2007-07-18', 'hu7a', ARRAY[16,17,18,20,21,25,29]),
-('2007-07-11', 'hu7a', ARRAY[1,2,7,12,15,24,33]),
-('2007-07-04', 'hu7a', ARRAY[6,10,11,16,22,26,31]),
-('2007-06-27', 'hu7a', ARRAY[3,10,14,15,18,24,35]),
-('2007-06-20', 'hu7a', ARRAY[11,16,18,25,27,29,30]),
-('2007-06-13', 'hu7a', ARRAY[6,11,13,16,21,31,34]),
-('2007-06-06', 'hu7a', ARRAY[5,7,10,19,20,27,33]),
-('2007-05-30', 'hu7a', ARRAY[1,6,8,15,18,26,32]),
-('2007-05-23', 'hu7a', ARRAY[5,7,8,9,15,33,34]),
-('2007-05-16', 'hu7a', ARRAY[7,11,14,18,23,28,29]),
-('2007-05-09', 'hu7a', ARRAY[2,6,8,19,21,25,30]),
-('2007-05-02', 'hu7a', ARRAY[1,8,18,22,24,32,34]),
-('2007-04-25', 'hu7a', ARRAY[1,11,20,21,23,31,33]),
-('2007-04-18', 'hu7a', ARRAY[4,20,21,29,31,32,34]),
-('2007-04-11', 'hu7a', ARRAY[4,10,27,29,30,31,33]),
-('2007-04-04', 'hu7a', ARRAY[1,2,17,21,23,27,33]),
-('2007-03-28', 'hu7a', ARRAY[2,7,13,20,22,28,30]),
-('2007-03-21', 'hu7a', ARRAY[1,3,5,16,18,24,28]),
-('2007-03-14', 'hu7a', ARRAY[2,7,10,19,25,31,35]),
-('2007-03-07', 'hu7a', ARRAY[1,3,5,11,14,19,27]),
-('2007-02-28', 'hu7a', ARRAY[3,6,21,23,24,33,34]),
-('2007-02-21', 'hu7a', ARRAY[5,10,12,14,19,21,28]),
-('2007-02-14', 'hu7a', ARRAY[1,2,15,16,20,28,30]),
-('2007-02-07', 'hu7a', ARRAY[2,17,19,22,23,31,33]),
-('2007-01-31', 'hu7a', ARRAY[12,17,19,21,24,28,33]),
-('2007-01-24', 'hu7a', ARRAY[3,7,16,19,23,28,33]),
-('2007-01-17', 'hu7a', ARRAY[6,10,11,16,18,19,25]),
-('2007-01-10', 'hu7a', ARRAY[6,7,10,12,14,15,27]),
-('2007-01-03', 'hu7a', ARRAY[2,6,9,16,21,26,30]),
-('2006-12-27', 'hu7a', ARRAY[2,6,8,12,15,23,30]),
-('2006-12-20', 'hu7a', ARRAY[1,17,19,23,26,28,33]),
-('2006-12-13', 'hu7a', ARRAY[1,2,14,18,23,29,30]),
-('2006-12-06', 'hu7a', ARRAY[11,13,14,22,29,31,33]),
-('2006-11-29', 'hu7a', ARRAY[1,11,12,16,19,27,29]),
-('2006-11-22', 'hu7a', ARRAY[3,7,9,11,12,18,19]),
-('2006-11-15', 'hu7a', ARRAY[2,4,17,20,26,27,34]),
-('2006-11-08', 'hu7a', ARRAY[2,3,11,13,16,22,28]),
-('2006-11-02', 'hu7a', ARRAY[8,9,12,16,22,28,29]),
-('2006-10-25', 'hu7a', ARRAY[6,7,8,12,13,21,22]),
-('2006-10-18', 'hu7a', ARRAY[3,7,14,18,24,25,33]),
-('2006-10-11', 'hu7a', ARRAY[3,7,9,12,13,30,34]),
-('2006-10-04', 'hu7a', ARRAY[1,9,11,16,18,27,29]),
-('2006-09-27', 'hu7a', ARRAY[3,15,16,24,25,29,34]),
-('2006-09-20', 'hu7a', ARRAY[8,11,16,20,30,32,34]),
-('2006-09-13', 'hu7a', ARRAY[5,7,9,13,20,24,28]),
-('2006-09-06', 'hu7a', ARRAY[5,8,11,13,14,23,25]),
-('2006-08-30', 'hu7a', ARRAY[3,6,14,19,21,34,35]),
-('2006-08-23', 'hu7a', ARRAY[9,14,22,24,25,30,34]),
-('2006-08-16', 'hu7a', ARRAY[9,12,18,19,24,27,32]),
-('2006-08-09', 'hu7a', ARRAY[1,9,12,17,19,20,29]),
-('2006-08-02', 'hu7a', ARRAY[1,2,5,10,15,16,28]),
-('2006-07-26', 'hu7a', ARRAY[3,4,10,16,19,24,32]),
-('2006-07-19', 'hu7a', ARRAY[4,5,12,13,21,26,35]),
-('2006-07-12', 'hu7a', ARRAY[8,14,17,24,26,31,34]),
-('2006-07-05', 'hu7a', ARRAY[2,11,12,13,18,29,30]),
-('2006-06-28', 'hu7a', ARRAY[4,16,19,20,23,27,28]),
-('2006-06-21', 'hu7a', ARRAY[2,12,17,18,25,28,31]),
-('2006-06-14', 'hu7a', ARRAY[1,6,9,12,19,28,32]),
-('2006-06-07', 'hu7a', ARRAY[12,14,15,20,21,27,34]),
-('2006-05-31', 'hu7a', ARRAY[2,7,11,19,22,23,31]),
-('2006-05-24', 'hu7a', ARRAY[4,8,11,12,22,31,35]),
-('2006-05-17', 'hu7a', ARRAY[4,6,10,13,21,33,35]),
-('2006-05-10', 'hu7a', ARRAY[2,7,8,13,16,23,26]),
-('2006-05-03', 'hu7a', ARRAY[2,13,16,27,28,29,31]),
-('2006-04-26', 'hu7a', ARRAY[2,8,10,17,23,30,35]),
-('2006-04-19', 'hu7a', ARRAY[3,10,12,25,26,28,32]),
-('2006-04-12', 'hu7a', ARRAY[3,4,12,14,16,26,27]),
-('2006-04-05', 'hu7a', ARRAY[1,4,11,15,16,27,33]),
-('2006-03-29', 'hu7a', ARRAY[5,11,17,21,28,31,32]),
-('2006-03-22', 'hu7a', ARRAY[4,5,7,9,14,26,35]),
-('2006-03-16', 'hu7a', ARRAY[11,13,14,18,25,27,29]),
-('2006-03-08', 'hu7a', ARRAY[6,9,13,16,24,33,35]),
-('2006-03-01', 'hu7a', ARRAY[3,5,9,15,20,28,29]),
-('2006-02-22', 'hu7a', ARRAY[2,6,11,12,14,29,34]),
-('2006-02-15', 'hu7a', ARRAY[6,9,11,18,27,28,31]),
-('2006-02-08', 'hu7a', ARRAY[3,6,12,27,29,31,33]),
-('2006-02-01', 'hu7a', ARRAY[6,11,16,21,22,28,30]),
-('2006-01-25', 'hu7a', ARRAY[4,5,18,23,27,29,30]),
-('2006-01-18', 'hu7a', ARRAY[4,5,7,9,10,27,30]),
-('2006-01-11', 'hu7a', ARRAY[5,6,9,15,27,33,34]),
-('2006-01-04', 'hu7a', ARRAY[11,16,24,26,27,32,33]),
-('2005-12-28', 'hu7a', ARRAY[12,18,21,24,27,28,35]),
-('2005-12-21', 'hu7a', ARRAY[3,7,16,18,27,33,35]),
-('2005-12-14', 'hu7a', ARRAY[1,5,7,11,12,26,34]),
-('2005-12-07', 'hu7a', ARRAY[5,6,9,16,25,30,31]),
-('2005-11-30', 'hu7a', ARRAY[2,3,13,14,21,24,34]),
-('2005-11-23', 'hu7a', ARRAY[1,3,12,18,28,30,31]),
-('2005-11-16', 'hu7a', ARRAY[1,10,13,14,20,23,33]),
-('2005-11-09', 'hu7a', ARRAY[7,14,16,20,21,24,30]),
-('2005-11-02', 'hu7a', ARRAY[8,14,19,23,26,27,33]),
-('2005-10-26', 'hu7a', ARRAY[7,19,22,25,30,32,34]),
-('2005-10-19', 'hu7a', ARRAY[1,9,15,21,24,27,28]),
-('2005-10-12', 'hu7a', ARRAY[5,6,8,10,15,30,31]),
-('2005-10-05', 'hu7a', ARRAY[1,4,5,6,7,24,31]),
-('2005-09-28', 'hu7a', ARRAY[1,7,14,19,25,30,34]),
-('2005-09-21', 'hu7a', ARRAY[1,2,6,12,18,28,30]),
-('2005-09-14', 'hu7a', ARRAY[5,10,11,16,23,24,33]),
-('2005-09-07', 'hu7a', ARRAY[1,6,10,15,16,22,32]),
-('2005-08-31', 'hu7a', ARRAY[4,10,14,15,21,27,35]),
-('2005-08-24', 'hu7a', ARRAY[9,11,21,25,27,33,34]),
-('2005-08-17', 'hu7a', ARRAY[4,6,17,23,27,28,30]),
-('2005-08-10', 'hu7a', ARRAY[1,6,15,17,19,21,26]),
-('2005-08-03', 'hu7a', ARRAY[3,8,9,10,13,17,25]),
-('2005-07-27', 'hu7a', ARRAY[7,8,10,12,24,27,30]),
-('2005-07-20', 'hu7a', ARRAY[3,10,12,13,14,19,28]),
-('2005-07-13', 'hu7a', ARRAY[5,6,10,15,20,23,26]),
-('2005-07-06', 'hu7a', ARRAY[1,2,3,5,6,9,21]),
-('2005-06-29', 'hu7a', ARRAY[2,3,6,9,10,12,14]),
-('2005-06-22', 'hu7a', ARRAY[2,5,9,16,17,18,25]),
-('2005-06-15', 'hu7a', ARRAY[14,21,24,26,27,29,31]),
-('2005-06-08', 'hu7a', ARRAY[2,17,19,21,23,27,32]),
-('2005-06-01', 'hu7a', ARRAY[5,9,12,18,26,30,32]),
-('2005-05-25', 'hu7a', ARRAY[10,11,14,22,27,32,35]),
-('2005-05-18', 'hu7a', ARRAY[16,17,18,21,25,29,34]),
-('2005-05-11', 'hu7a', ARRAY[5,6,8,15,25,29,30]),
-('2005-05-04', 'hu7a', ARRAY[4,7,10,29,31,32,34]),
-('2005-04-27', 'hu7a', ARRAY[3,18,19,25,30,32,35]),
-('2005-04-20', 'hu7a', ARRAY[4,14,16,19,27,28,33]),
-('2005-04-13', 'hu7a', ARRAY[6,9,11,13,21,26,34]),
-('2005-04-06', 'hu7a', ARRAY[7,11,14,15,22,26,35]),
-('2005-03-30', 'hu7a', ARRAY[6,23,24,27,29,32,34]),
-('2005-03-23', 'hu7a', ARRAY[7,13,25,28,32,33,34]),
-('2005-03-16', 'hu7a', ARRAY[11,15,16,21,27,30,32]),
-('2005-03-09', 'hu7a', ARRAY[2,14,19,24,30,33,35]),
-('2005-03-02', 'hu7a', ARRAY[1,3,7,17,25,26,29]),
-('2005-02-23', 'hu7a', ARRAY[8,19,24,28,32,34,35]),
-('2005-02-16', 'hu7a', ARRAY[1,7,11,12,27,29,32]),
-('2005-02-09', 'hu7a', ARRAY[3,4,11,18,30,32,35]),
-('2005-02-02', 'hu7a', ARRAY[3,4,12,17,22,23,26]),
-('2005-01-26', 'hu7a', ARRAY[2,13,24,27,32,33,34]),
-('2005-01-19', 'hu7a', ARRAY[1,13,17,23,25,29,34]),
-('2005-01-12', 'hu7a', ARRAY[1,11,12,15,16,17,22]),
-('2005-01-05', 'hu7a', ARRAY[8,12,16,17,20,21,26]),
-('2004-12-29', 'hu7a', ARRAY[1,6,10,11,27,31,33]),
-('2004-12-22', 'hu7a', ARRAY[1,2,19,25,28,29,31]),
-('2004-12-15', 'hu7a', ARRAY[8,9,16,21,22,24,35]),
-('2004-12-08', 'hu7a', ARRAY[6,7,15,16,22,24,34]),
-('2004-12-01', 'hu7a', ARRAY[1,12,13,19,23,26,33]),
-('2004-11-24', 'hu7a', ARRAY[3,6,11,19,22,25,30]),
-('2004-11-17', 'hu7a', ARRAY[3,6,11,14,21,22,30]),
-('2004-11-10', 'hu7a', ARRAY[1,7,11,25,26,32,35]),
-('2004-11-03', 'hu7a', ARRAY[11,19,23,26,28,30,31]),
-('2004-10-27', 'hu7a', ARRAY[11,16,21,22,26,27,30]),
-('2004-10-20', 'hu7a', ARRAY[2,5,9,20,23,25,34]),
-('2004-10-13', 'hu7a', ARRAY[2,13,14,15,16,23,24]),
-('2004-10-06', 'hu7a', ARRAY[3,7,23,24,27,31,35]),
-('2004-09-29', 'hu7a', ARRAY[2,22,27,29,30,31,33]),
-('2004-09-22', 'hu7a', ARRAY[3,6,7,10,15,20,26]),
-('2004-09-15', 'hu7a', ARRAY[9,11,13,17,18,28,33]),
-('2004-09-08', 'hu7a', ARRAY[2,7,9,10,14,24,33]),
-('2004-09-01', 'hu7a', ARRAY[2,10,14,15,16,24,33]),
-('2004-08-25', 'hu7a', ARRAY[1,3,6,9,17,22,31]),
-('2004-08-18', 'hu7a', ARRAY[3,4,13,24,27,32,34]),
-('2004-08-11', 'hu7a', ARRAY[1,12,14,16,17,22,25]),
-('2004-08-04', 'hu7a', ARRAY[11,13,17,21,25,30,31]),
-('2004-07-28', 'hu7a', ARRAY[1,3,15,23,28,34,35]),
-('2004-07-21', 'hu7a', ARRAY[3,10,16,26,30,32,35]),
-('2004-07-14', 'hu7a', ARRAY[8,11,14,18,28,34,35]),
-('2004-07-07', 'hu7a', ARRAY[14,15,19,21,32,34,35]),
-('2004-06-30', 'hu7a', ARRAY[1,10,20,23,29,31,33]),
-('2004-06-23', 'hu7a', ARRAY[1,2,13,14,18,26,33]),
-('2004-06-16', 'hu7a', ARRAY[3,9,13,15,25,28,34]),
-('2004-06-09', 'hu7a', ARRAY[1,2,16,20,21,27,32]),
-('2004-06-02', 'hu7a', ARRAY[8,10,11,14,16,19,32]),
-('2004-05-26', 'hu7a', ARRAY[4,10,11,14,15,21,32]),
-('2004-05-19', 'hu7a', ARRAY[4,6,10,16,18,31,33]),
-('2004-05-12', 'hu7a', ARRAY[4,5,10,13,20,21,32]),
-('2004-05-05', 'hu7a', ARRAY[4,6,13,23,29,34,35]),
-('2004-04-28', 'hu7a', ARRAY[4,12,17,24,29,31,33]),
-('2004-04-21', 'hu7a', ARRAY[2,17,18,21,29,31,33]),
-('2004-04-14', 'hu7a', ARRAY[6,10,23,27,32,33,35]),
-('2004-04-07', 'hu7a', ARRAY[10,19,20,25,29,31,34]),
-('2004-03-31', 'hu7a', ARRAY[9,11,15,17,21,26,32]),
-('2004-03-24', 'hu7a', ARRAY[9,15,17,18,20,21,33]),
-('2004-03-17', 'hu7a', ARRAY[5,19,21,24,26,28,30]),
-('2004-03-10', 'hu7a', ARRAY[1,3,7,22,24,26,34]),
-('2004-03-03', 'hu7a', ARRAY[7,9,21,22,23,24,29]),
-('2004-02-25', 'hu7a', ARRAY[1,7,19,23,25,27,35]),
-('2004-02-18', 'hu7a', ARRAY[1,4,5,18,26,27,34]),
-('2004-02-11', 'hu7a', ARRAY[2,11,12,15,16,23,28]),
-('2004-02-04', 'hu7a', ARRAY[2,4,14,15,24,28,31]),
-('2004-01-28', 'hu7a', ARRAY[7,14,16,22,25,26,28]),
-('2004-01-21', 'hu7a', ARRAY[1,7,15,16,19,20,22]),
-('2004-01-14', 'hu7a', ARRAY[1,2,4,8,9,28,35]),
-('2004-01-07', 'hu7a', ARRAY[1,4,8,11,16,25,28]),
-('2003-12-31', 'hu7a', ARRAY[6,8,9,15,26,28,30]),
-('2003-12-24', 'hu7a', ARRAY[9,11,21,25,26,27,34]),
-('2003-12-17', 'hu7a', ARRAY[6,10,16,17,18,30,31]),
-('2003-12-10', 'hu7a', ARRAY[11,14,16,17,21,27,29]),
-('2003-12-03', 'hu7a', ARRAY[17,19,20,22,27,28,29]),
-('2003-11-26', 'hu7a', ARRAY[5,7,14,23,26,27,30]),
-('2003-11-19', 'hu7a', ARRAY[1,6,13,19,21,24,30]),
-('2003-11-12', 'hu7a', ARRAY[2,6,12,16,18,24,29]),
-('2003-11-05', 'hu7a', ARRAY[5,17,18,19,27,34,35]),
-('2003-10-29', 'hu7a', ARRAY[5,6,12,16,18,29,31]),
-('2003-10-22', 'hu7a', ARRAY[2,6,10,12,18,28,32]),
-('2003-10-15', 'hu7a', ARRAY[1,4,18,20,29,32,35]),
-('2003-10-08', 'hu7a', ARRAY[3,6,14,17,24,29,34]),
-('2003-10-01', 'hu7a', ARRAY[3,4,10,14,26,28,32]),
-('2003-09-24', 'hu7a', ARRAY[4,9,21,22,27,33,34]),
-('2003-09-17', 'hu7a', ARRAY[7,12,14,18,23,33,34]),
-('2003-09-10', 'hu7a', ARRAY[7,18,19,26,27,28,34]),
-('2003-09-03', 'hu7a', ARRAY[5,9,12,15,17,22,32]),
-('2003-08-27', 'hu7a', ARRAY[2,4,8,29,32,33,35]),
-('2003-08-20', 'hu7a', ARRAY[4,17,19,22,24,26,29]),
-('2003-08-13', 'hu7a', ARRAY[2,5,10,14,25,26,29]),
-('2003-08-06', 'hu7a', ARRAY[2,3,9,15,26,27,29]),
-('2003-07-30', 'hu7a', ARRAY[5,12,14,18,22,24,25]),
-('2003-07-23', 'hu7a', ARRAY[6,7,12,16,18,32,33]),
-('2003-07-16', 'hu7a', ARRAY[1,15,16,19,27,31,32]),
-('2003-07-09', 'hu7a', ARRAY[5,7,17,22,27,29,30]),
-('2003-07-02', 'hu7a', ARRAY[6,10,14,22,31,33,34]),
-('2003-06-25', 'hu7a', ARRAY[2,9,12,17,23,30,32]),
-('2003-06-18', 'hu7a', ARRAY[2,5,9,20,21,22,23]),
-('2003-06-11', 'hu7a', ARRAY[4,7,13,17,19,25,26]),
-('2003-06-04', 'hu7a', ARRAY[9,10,13,17,23,28,31]),
-('2003-05-28', 'hu7a', ARRAY[4,13,18,28,31,34,35]),
-('2003-05-21', 'hu7a', ARRAY[5,6,9,14,18,20,30]),
-('2003-05-14', 'hu7a', ARRAY[8,11,19,22,24,29,35]),
-('2003-05-07', 'hu7a', ARRAY[1,7,18,27,30,33,35]),
-('2003-04-30', 'hu7a', ARRAY[2,13,15,19,24,26,32]),
-('2003-04-23', 'hu7a', ARRAY[7,16,24,26,30,32,35]),
-('2003-04-16', 'hu7a', ARRAY[6,7,11,12,13,23,30]),
-('2003-04-09', 'hu7a', ARRAY[6,9,22,24,32,33,34]),
-('2003-04-02', 'hu7a', ARRAY[3,17,18,21,23,29,31]),
-('2003-03-26', 'hu7a', ARRAY[2,4,7,12,28,31,35]),
-('2003-03-19', 'hu7a', ARRAY[9,13,15,17,19,28,31]),
-('2003-03-12', 'hu7a', ARRAY[6,7,10,12,24,25,29]),
-('2003-03-05', 'hu7a', ARRAY[2,9,10,11,12,21,27]),
-('2003-02-26', 'hu7a', ARRAY[4,6,13,14,16,29,35]),
-('2003-02-19', 'hu7a', ARRAY[7,10,14,18,19,25,31]),
-('2003-02-12', 'hu7a', ARRAY[4,10,19,23,24,25,35]),
-('2003-02-05', 'hu7a', ARRAY[1,7,12,20,29,30,31]),
-('2003-01-29', 'hu7a', ARRAY[4,7,11,15,25,33,34]),
-('2003-01-22', 'hu7a', ARRAY[6,16,17,21,23,32,35]),
-('2003-01-15', 'hu7a', ARRAY[3,10,12,13,18,21,27]),
-('2003-01-08', 'hu7a', ARRAY[1,7,8,9,14,20,31]),
-('2003-01-01', 'hu7a', ARRAY[4,13,23,24,25,27,30]),
-('2002-12-25', 'hu7a', ARRAY[7,8,19,22,23,32,33]),
-('2002-12-18', 'hu7a', ARRAY[4,9,12,24,25,30,35]),
-('2002-12-11', 'hu7a', ARRAY[3,13,19,20,25,26,30]),
-('2002-12-04', 'hu7a', ARRAY[9,17,18,20,30,31,34]),
-('2002-11-27', 'hu7a', ARRAY[2,3,16,23,24,30,34]),
-('2002-11-20', 'hu7a', ARRAY[1,8,10,15,21,22,29]),
-('2002-11-13', 'hu7a', ARRAY[2,5,9,15,16,22,24]),
-('2002-11-06', 'hu7a', ARRAY[5,7,14,21,26,27,31]),
-('2002-10-30', 'hu7a', ARRAY[1,2,7,16,17,22,24]),
-('2002-10-23', 'hu7a', ARRAY[5,10,18,20,24,25,28]),
-('2002-10-16', 'hu7a', ARRAY[8,18,20,23,27,28,32]),
-('2002-10-09', 'hu7a', ARRAY[2,3,10,14,18,23,24]),
-('2002-10-02', 'hu7a', ARRAY[7,11,18,19,20,22,26]),
-('2002-09-25', 'hu7a', ARRAY[1,2,10,11,12,25,33]),
-('2002-09-18', 'hu7a', ARRAY[1,4,6,14,19,27,31]),
-('2002-09-11', 'hu7a', ARRAY[12,14,16,22,30,32,34]),
-('2002-09-04', 'hu7a', ARRAY[6,9,15,20,23,32,33]),
-('2002-08-28', 'hu7a', ARRAY[7,9,12,13,15,20,23]),
-('2002-08-21', 'hu7a', ARRAY[1,4,7,17,20,24,25]),
-('2002-08-14', 'hu7a', ARRAY[1,15,26,27,32,33,35]),
-('2002-08-07', 'hu7a', ARRAY[1,2,12,13,22,24,28]),
-('2002-07-31', 'hu7a', ARRAY[5,9,20,23,26,34,35]),
-('2002-07-24', 'hu7a', ARRAY[6,12,13,16,19,32,34]),
-('2002-07-17', 'hu7a', ARRAY[5,12,20,25,29,31,35]),
-('2002-07-10', 'hu7a', ARRAY[1,4,6,11,12,13,17]),
-('2002-07-03', 'hu7a', ARRAY[6,10,12,18,23,26,35]),
-('2002-06-26', 'hu7a', ARRAY[6,8,9,12,18,33,34]),
-('2002-06-19', 'hu7a', ARRAY[10,13,20,21,24,29,31]),
-('2002-06-12', 'hu7a', ARRAY[1,3,7,13,16,30,35]),
-('2002-06-05', 'hu7a', ARRAY[3,9,10,11,20,30,35]),
-('2002-05-29', 'hu7a', ARRAY[1,4,12,14,20,23,25]),
-('2002-05-22', 'hu7a', ARRAY[2,5,13,28,29,32,35]),
-('2002-05-15', 'hu7a', ARRAY[3,5,8,10,20,23,27]),
-('2002-05-08', 'hu7a', ARRAY[6,8,13,14,23,24,34]),
-('2002-05-01', 'hu7a', ARRAY[4,16,22,23,32,34,35]),
-('2002-04-24', 'hu7a', ARRAY[3,10,13,26,32,33,35]),
-('2002-04-17', 'hu7a', ARRAY[17,18,22,23,29,32,35]),
-('2002-04-10', 'hu7a', ARRAY[8,9,15,17,27,28,35]),
-('2002-04-03', 'hu7a', ARRAY[1,12,14,23,29,30,31]),
-('2002-03-27', 'hu7a', ARRAY[1,3,4,5,23,29,31]),
-('2002-03-20', 'hu7a', ARRAY[2,8,9,13,23,25,28]),
-('2002-03-13', 'hu7a', ARRAY[2,6,9,20,24,30,34]),
-('2002-03-06', 'hu7a', ARRAY[1,2,4,15,18,22,28]),
-('2002-02-27', 'hu7a', ARRAY[1,2,4,16,19,30,34]),
-('2002-02-20', 'hu7a', ARRAY[4,6,17,19,25,26,35]),
-('2002-02-13', 'hu7a', ARRAY[5,6,9,11,15,29,31]),
-('2002-02-06', 'hu7a', ARRAY[1,2,6,12,13,25,31]),
-('2002-01-30', 'hu7a', ARRAY[9,11,13,14,19,21,26]),
-('2002-01-23', 'hu7a', ARRAY[5,15,17,21,27,30,34]),
-('2002-01-16', 'hu7a', ARRAY[1,6,7,8,14,22,29]),
-('2002-01-09', 'hu7a', ARRAY[6,11,17,19,20,29,30]),
-('2002-01-02', 'hu7a', ARRAY[4,11,15,26,29,32,35]),
-('2001-12-26', 'hu7a', ARRAY[7,8,16,18,31,34,35]),
-('2001-12-19', 'hu7a', ARRAY[16,18,22,24,32,33,35]),
-('2001-12-12', 'hu7a', ARRAY[2,7,12,14,20,21,24]),
-('2001-12-05', 'hu7a', ARRAY[2,3,10,18,23,27,33]),
-('2001-11-28', 'hu7a', ARRAY[3,4,6,7,9,17,32]),
-('2001-11-21', 'hu7a', ARRAY[1,6,7,13,25,30,31]),
-('2001-11-14', 'hu7a', ARRAY[7,10,12,15,16,30,32]),
-('2001-11-07', 'hu7a', ARRAY[1,11,19,23,25,28,31]),
-('2001-10-31', 'hu7a', ARRAY[1,9,10,14,20,34,35]),
-('2001-10-24', 'hu7a', ARRAY[6,17,18,19,28,34,35]),
-('2001-10-17', 'hu7a', ARRAY[5,7,12,23,26,27,33]),
-('2001-10-10', 'hu7a', ARRAY[2,6,8,14,21,27,30]),
-('2001-10-03', 'hu7a', ARRAY[3,11,17,18,20,21,24]),
-('2001-09-26', 'hu7a', ARRAY[1,3,4,19,23,24,34]),
-('2001-09-19', 'hu7a', ARRAY[11,12,14,17,18,26,35]),
-('2001-09-12', 'hu7a', ARRAY[7,11,20,22,31,32,33]),
-('2001-09-05', 'hu7a', ARRAY[2,11,13,14,17,22,28]),
-('2001-08-29', 'hu7a', ARRAY[7,9,13,31,32,34,35]),
-('2001-08-22', 'hu7a', ARRAY[6,10,21,24,31,33,35]),
-('2001-08-15', 'hu7a', ARRAY[4,5,11,14,22,27,34]),
-('2001-08-08', 'hu7a', ARRAY[3,6,14,18,19,28,35]),
-('2001-08-01', 'hu7a', ARRAY[2,24,25,29,31,32,34]),
-('2001-07-25', 'hu7a', ARRAY[1,13,15,18,23,27,28]),
-('2001-07-18', 'hu7a', ARRAY[3,5,10,22,30,31,34]),
-('2001-07-11', 'hu7a', ARRAY[2,4,6,8,9,14,15]),
-('2001-07-04', 'hu7a', ARRAY[2,11,14,23,26,29,34]),
-('2001-06-27', 'hu7a', ARRAY[6,8,17,21,28,32,33]),
-('2001-06-20', 'hu7a', ARRAY[2,7,19,23,24,26,33]),
-('2001-06-13', 'hu7a', ARRAY[15,20,21,25,26,31,32]),
-('2001-06-06', 'hu7a', ARRAY[2,3,4,10,11,15,33]),
-('2001-05-30', 'hu7a', ARRAY[2,6,8,24,27,28,33]),
-('2001-05-23', 'hu7a', ARRAY[2,5,23,24,25,28,33]),
-('2001-05-16', 'hu7a', ARRAY[1,5,11,15,18,22,34]),
-('2001-05-09', 'hu7a', ARRAY[1,6,15,17,21,27,31]),
-('2001-05-02', 'hu7a', ARRAY[3,8,19,20,23,26,32]),
-('2001-04-25', 'hu7a', ARRAY[1,2,8,15,24,26,35]),
-('2001-04-18', 'hu7a', ARRAY[3,15,18,19,22,26,31]),
-('2001-04-11', 'hu7a', ARRAY[2,3,5,7,15,25,34]),
-('2001-04-04', 'hu7a', ARRAY[1,3,9,11,13,24,25]),
-('2001-03-28', 'hu7a', ARRAY[7,8,9,16,25,31,32]),
-('2001-03-21', 'hu7a', ARRAY[2,5,9,12,14,16,19]),
-('2001-03-14', 'hu7a', ARRAY[3,5,9,11,12,22,23]),
-('2001-03-07', 'hu7a', ARRAY[2,13,23,26,27,30,34]),
-('2001-02-28', 'hu7a', ARRAY[3,8,10,20,24,28,33]),
-('2001-02-21', 'hu7a', ARRAY[4,10,15,23,24,32,35]),
-('2001-02-14', 'hu7a', ARRAY[6,7,12,20,23,25,31]),
-('2001-02-07', 'hu7a', ARRAY[6,7,9,13,30,31,32]),
-('2001-01-31', 'hu7a', ARRAY[1,4,18,23,25,26,28]),
-('2001-01-24', 'hu7a', ARRAY[1,4,8,10,16,18,27]),
-('2001-01-17', 'hu7a', ARRAY[3,11,14,16,21,31,35]),
-('2001-01-10', 'hu7a', ARRAY[11,14,21,24,25,28,34]),
-('2001-01-03', 'hu7a', ARRAY[1,2,6,9,10,15,20]),
-('2000-12-27', 'hu7a', ARRAY[3,7,8,17,23,26,29]),
-('2000-12-20', 'hu7a', ARRAY[2,3,15,17,21,29,35]),
-('2000-12-13', 'hu7a', ARRAY[10,17,18,19,23,27,34]),
-('2000-12-06', 'hu7a', ARRAY[2,4,9,11,23,26,28]),
-('2000-11-29', 'hu7a', ARRAY[2,8,29,30,31,32,35]),
-('2000-11-22', 'hu7a', ARRAY[3,8,13,17,23,32,33]),
-('2000-11-15', 'hu7a', ARRAY[6,8,23,27,28,31,35]),
-('2000-11-08', 'hu7a', ARRAY[1,12,15,17,25,28,35]),
-('2000-11-01', 'hu7a', ARRAY[2,9,14,17,20,30,34]),
-('2000-10-25', 'hu7a', ARRAY[4,10,17,25,27,29,33]),
-('2000-10-18', 'hu7a', ARRAY[1,6,10,13,22,25,33]),
-('2000-10-11', 'hu7a', ARRAY[2,12,13,14,19,28,32]),
-('2000-10-04', 'hu7a', ARRAY[9,15,19,24,31,33,34]),
-('2000-09-27', 'hu7a', ARRAY[1,3,8,10,21,23,26]),
-('2000-09-20', 'hu7a', ARRAY[3,5,9,10,18,19,34]),
-('2000-09-13', 'hu7a', ARRAY[6,7,11,14,19,29,34]),
-('2000-09-06', 'hu7a', ARRAY[5,8,13,15,20,26,29]),
-('2000-08-30', 'hu7a', ARRAY[2,3,14,26,27,34,35]),
-('2000-08-23', 'hu7a', ARRAY[6,10,19,22,24,25,32]),
-('2000-08-16', 'hu7a', ARRAY[3,13,16,18,25,26,27]),
-('2000-08-09', 'hu7a', ARRAY[7,22,27,29,30,32,33]),
-('2000-08-02', 'hu7a', ARRAY[5,7,14,19,24,30,31]),
-('2000-07-26', 'hu7a', ARRAY[5,7,19,20,30,31,34]),
-('2000-07-19', 'hu7a', ARRAY[1,3,11,14,17,22,31]),
-('2000-07-12', 'hu7a', ARRAY[5,6,8,11,16,19,25]),
-('2000-07-05', 'hu7a', ARRAY[10,12,17,19,25,30,32]),
-('2000-06-28', 'hu7a', ARRAY[8,13,14,15,25,30,32]),
-('2000-06-21', 'hu7a', ARRAY[9,14,15,19,21,32,34]),
-('2000-06-14', 'hu7a', ARRAY[3,5,20,23,29,34,35]),
-('2000-06-07', 'hu7a', ARRAY[3,8,13,14,15,18,31]),
-('2000-05-31', 'hu7a', ARRAY[7,10,11,21,25,28,34]),
-('2000-05-24', 'hu7a', ARRAY[3,4,19,20,23,26,35]),
-('2000-05-17', 'hu7a', ARRAY[14,24,25,27,28,29,34]),
-('2000-05-10', 'hu7a', ARRAY[5,6,8,19,30,32,34]),
-('2000-05-03', 'hu7a', ARRAY[3,12,19,21,23,26,33]),
-('2000-04-26', 'hu7a', ARRAY[2,3,5,11,17,19,20]),
-('2000-04-19', 'hu7a', ARRAY[6,7,11,18,25,29,30]),
-('2000-04-12', 'hu7a', ARRAY[4,10,11,26,27,31,33]),
-('2000-04-05', 'hu7a', ARRAY[1,2,4,7,8,22,23]),
-('2000-03-29', 'hu7a', ARRAY[2,11,16,30,31,33,35]),
-('2000-03-22', 'hu7a', ARRAY[12,27,29,31,32,33,35]),
-('2000-03-15', 'hu7a', ARRAY[6,14,16,17,22,25,26]),
-('2000-03-08', 'hu7a', ARRAY[3,7,13,14,16,17,25]),
-('2000-03-01', 'hu7a', ARRAY[12,16,18,20,29,30,31]),
-('2000-02-23', 'hu7a', ARRAY[2,3,5,20,24,31,32]),
-('2000-02-16', 'hu7a', ARRAY[11,14,17,23,25,30,35]),
-('2000-02-09', 'hu7a', ARRAY[7,12,14,15,19,20,29]),
-('2000-02-02', 'hu7a', ARRAY[4,10,19,22,25,26,30]),
-('2000-01-26', 'hu7a', ARRAY[1,3,18,29,31,34,35]),
-('2000-01-19', 'hu7a', ARRAY[1,3,9,11,19,23,30]),
-('2000-01-12', 'hu7a', ARRAY[8,13,21,22,26,28,30]),
-('2000-01-05', 'hu7a', ARRAY[9,12,16,18,22,23,28]),
-('1999-12-29', 'hu7a', ARRAY[6,7,19,25,30,32,34]),
-('1999-12-22', 'hu7a', ARRAY[6,13,14,16,19,33,35]),
-('1999-12-15', 'hu7a', ARRAY[1,3,28,31,32,33,34]),
-('1999-12-08', 'hu7a', ARRAY[1,9,13,18,21,26,34]),
-('1999-12-01', 'hu7a', ARRAY[4,9,11,20,22,28,32]),
-('1999-11-24', 'hu7a', ARRAY[1,2,3,4,10,17,19]),
-('1999-11-17', 'hu7a', ARRAY[1,4,13,15,17,20,24]),
-('1999-11-10', 'hu7a', ARRAY[4,5,6,26,27,29,30]),
-('1999-11-03', 'hu7a', ARRAY[1,2,6,10,11,20,34]),
-('1999-10-27', 'hu7a', ARRAY[7,11,12,19,21,33,35]),
-('1999-10-20', 'hu7a', ARRAY[4,5,8,16,27,29,30]),
-('1999-10-13', 'hu7a', ARRAY[7,8,13,16,20,2]);
-
-INSERT INTO draw (draw_date, lottery_id, numbers) VALUES
-('2025-10-29', 'hu7b', ARRAY[4,15,18,20,21,29,32]),
-('2025-10-22', 'hu7b', ARRAY[2,3,5,6,25,34,35]),
-('2025-10-15', 'hu7b', ARRAY[3,8,14,15,19,24,31]),
-('2025-10-08', 'hu7b', ARRAY[7,10,12,14,23,34,35]),
-('2025-10-01', 'hu7b', ARRAY[4,6,11,19,27,29,31]),
-('2025-09-24', 'hu7b', ARRAY[11,19,20,24,25,30,34]),
-('2025-09-17', 'hu7b', ARRAY[2,5,6,10,17,18,25]),
-('2025-09-10', 'hu7b', ARRAY[3,4,8,16,17,29,31]),
-('2025-09-03', 'hu7b', ARRAY[8,13,18,19,22,23,34]),
-('2025-08-27', 'hu7b', ARRAY[12,13,18,19,24,27,31]),
-('2025-08-20', 'hu7b', ARRAY[4,14,16,20,24,30,31]),
-('2025-08-13', 'hu7b', ARRAY[3,12,15,23,27,31,33]),
-('2025-08-06', 'hu7b', ARRAY[6,9,12,13,28,33,34]),
-('2025-07-30', 'hu7b', ARRAY[3,4,10,20,23,25,27]),
-('2025-07-23', 'hu7b', ARRAY[10,12,16,17,22,24,28]),
-('2025-07-16', 'hu7b', ARRAY[2,7,11,15,22,32,35]),
-('2025-07-09', 'hu7b', ARRAY[7,13,18,19,21,30,33]),
-('2025-07-02', 'hu7b', ARRAY[3,18,19,23,24,29,35]),
-('2025-06-25', 'hu7b', ARRAY[3,5,15,19,30,31,34]),
-('2025-06-18', 'hu7b', ARRAY[9,16,17,22,30,33,34]),
-('2025-06-11', 'hu7b', ARRAY[21,24,26,28,30,31,34]),
-('2025-06-04', 'hu7b', ARRAY[1,8,15,18,25,27,35]),
-('2025-05-28', 'hu7b', ARRAY[4,5,6,22,26,33,34]),
-('2025-05-21', 'hu7b', ARRAY[4,15,19,22,24,25,31]),
-('2025-05-14', 'hu7b', ARRAY[11,12,15,19,24,25,35]),
-('2025-05-07', 'hu7b', ARRAY[11,13,18,19,20,26,29]),
-('2025-04-30', 'hu7b', ARRAY[3,6,14,16,24,27,34]),
-('2025-04-23', 'hu7b', ARRAY[4,15,16,21,24,28,29]),
-('2025-04-16', 'hu7b', ARRAY[3,5,6,9,18,29,34]),
-('2025-04-09', 'hu7b', ARRAY[15,16,18,24,27,31,35]),
-('2025-04-02', 'hu7b', ARRAY[5,6,9,24,25,32,35]),
-('2025-03-26', 'hu7b', ARRAY[4,19,24,29,32,33,35]),
-('2025-03-19', 'hu7b', ARRAY[3,7,10,11,25,27,29]),
-('2025-03-12', 'hu7b', ARRAY[5,7,9,10,11,13,35]),
-('2025-03-05', 'hu7b', ARRAY[11,12,14,16,21,27,30]),
-('2025-02-26', 'hu7b', ARRAY[8,11,18,22,27,29,35]),
-('2025-02-19', 'hu7b', ARRAY[10,15,17,18,26,30,33]),
-('2025-02-12', 'hu7b', ARRAY[4,5,15,17,21,29,34]),
-('2025-02-05', 'hu7b', ARRAY[1,3,4,7,16,20,35]),
-('2025-01-29', 'hu7b', ARRAY[14,16,17,19,23,32,35]),
-('2025-01-22', 'hu7b', ARRAY[6,7,8,17,18,22,25]),
-('2025-01-15', 'hu7b', ARRAY[7,8,15,25,26,31,33]),
-('2025-01-08', 'hu7b', ARRAY[1,2,9,10,14,21,25]),
-('2025-01-01', 'hu7b', ARRAY[2,6,9,11,20,29,34]),
-('2024-12-27', 'hu7b', ARRAY[5,11,12,16,21,25,35]),
-('2024-12-18', 'hu7b', ARRAY[1,2,11,13,17,24,31]),
-('2024-12-11', 'hu7b', ARRAY[1,8,11,14,22,25,33]),
-('2024-12-04', 'hu7b', ARRAY[6,9,18,24,26,28,35]),
-('2024-11-27', 'hu7b', ARRAY[14,15,17,24,25,29,33]),
-('2024-11-20', 'hu7b', ARRAY[1,15,16,18,26,28,35]),
-('2024-11-13', 'hu7b', ARRAY[3,10,16,20,21,28,30]),
-('2024-11-06', 'hu7b', ARRAY[4,7,17,26,27,32,35]),
-('2024-10-30', 'hu7b', ARRAY[10,14,15,16,17,29,32]),
-('2024-10-23', 'hu7b', ARRAY[1,4,5,16,20,26,33]),
-('2024-10-16', 'hu7b', ARRAY[5,12,13,18,22,31,32]),
-('2024-10-09', 'hu7b', ARRAY[3,7,15,16,20,21,32]),
-('2024-10-02', 'hu7b', ARRAY[4,11,14,19,26,27,33]),
-('2024-09-25', 'hu7b', ARRAY[10,14,17,23,24,25,30]),
-('2024-09-18', 'hu7b', ARRAY[2,3,4,15,18,23,32]),
-('2024-09-11', 'hu7b', ARRAY[2,6,14,16,21,22,29]),
-('2024-09-04', 'hu7b', ARRAY[3,13,16,18,23,24,28]),
-('2024-08-28', 'hu7b', ARRAY[2,13,24,25,26,27,29]),
-('2024-08-21', 'hu7b', ARRAY[3,4,5,6,16,19,25]),
-('2024-08-14', 'hu7b', ARRAY[1,5,14,22,27,28,34]),
-('2024-08-07', 'hu7b', ARRAY[1,3,9,14,17,24,32]),
-('2024-07-31', 'hu7b', ARRAY[6,9,25,28,29,32,34]),
-('2024-07-24', 'hu7b', ARRAY[2,4,6,19,22,24,27]),
-('2024-07-17', 'hu7b', ARRAY[11,14,17,18,25,28,29]),
-('2024-07-10', 'hu7b', ARRAY[6,19,20,29,30,32,35]),
-('2024-07-03', 'hu7b', ARRAY[8,10,16,17,26,30,35]),
-('2024-06-26', 'hu7b', ARRAY[1,2,14,18,21,26,29]),
-('2024-06-19', 'hu7b', ARRAY[8,15,17,20,22,30,31]),
-('2024-06-12', 'hu7b', ARRAY[4,5,11,14,20,26,34]),
-('2024-06-05', 'hu7b', ARRAY[4,12,15,16,25,28,33]),
-('2024-05-29', 'hu7b', ARRAY[10,14,15,22,25,30,34]),
-('2024-05-22', 'hu7b', ARRAY[3,4,10,11,18,29,34]),
-('2024-05-15', 'hu7b', ARRAY[4,6,12,19,27,30,34]),
-('2024-05-08', 'hu7b', ARRAY[1,16,17,20,30,32,33]),
-('2024-05-01', 'hu7b', ARRAY[3,8,12,23,31,32,35]),
-('2024-04-24', 'hu7b', ARRAY[2,12,13,14,19,22,33]),
-('2024-04-17', 'hu7b', ARRAY[6,7,8,14,19,24,25]),
-('2024-04-10', 'hu7b', ARRAY[5,7,9,17,18,21,27]),
-('2024-04-03', 'hu7b', ARRAY[3,8,13,20,25,26,32]),
-('2024-03-27', 'hu7b', ARRAY[5,14,21,24,25,28,32]),
-('2024-03-20', 'hu7b', ARRAY[3,6,12,17,21,24,30]),
-('2024-03-13', 'hu7b', ARRAY[5,20,23,26,27,32,34]),
-('2024-03-06', 'hu7b', ARRAY[7,11,12,17,18,24,30]),
-('2024-02-28', 'hu7b', ARRAY[2,4,7,8,9,11,18]),
-('2024-02-21', 'hu7b', ARRAY[1,12,13,14,23,26,29]),
-('2024-02-14', 'hu7b', ARRAY[1,2,7,11,20,27,32]),
-('2024-02-07', 'hu7b', ARRAY[3,4,5,6,9,20,21]),
-('2024-01-31', 'hu7b', ARRAY[10,13,14,18,22,26,30]),
-('2024-01-24', 'hu7b', ARRAY[1,5,11,15,18,27,29]),
-('2024-01-17', 'hu7b', ARRAY[3,5,10,19,25,28,32]),
-('2024-01-10', 'hu7b', ARRAY[4,12,14,19,22,27,29]),
-('2024-01-03', 'hu7b', ARRAY[7,8,11,15,19,23,35]),
-('2023-12-27', 'hu7b', ARRAY[1,7,9,13,25,32,33]),
-('2023-12-20', 'hu7b', ARRAY[6,10,11,16,20,24,26]),
-('2023-12-13', 'hu7b', ARRAY[10,14,20,29,31,32,35]),
-('2023-12-06', 'hu7b', ARRAY[2,7,9,10,14,32,33]),
-('2023-11-29', 'hu7b', ARRAY[4,8,14,17,19,21,28]),
-('2023-11-22', 'hu7b', ARRAY[9,11,21,22,26,31,33]),
-('2023-11-15', 'hu7b', ARRAY[1,6,8,11,16,17,18]),
-('2023-11-08', 'hu7b', ARRAY[11,20,21,22,23,24,34]),
-('2023-11-01', 'hu7b', ARRAY[6,9,14,16,24,29,33]),
-('2023-10-25', 'hu7b', ARRAY[9,18,19,23,25,26,31]),
-('2023-10-18', 'hu7b', ARRAY[4,5,15,19,27,32,34]),
-('2023-10-11', 'hu7b', ARRAY[8,16,17,20,22,26,33]),
-('2023-10-04', 'hu7b', ARRAY[10,11,16,17,18,21,26]),
-('2023-09-27', 'hu7b', ARRAY[5,6,15,19,26,28,31]),
-('2023-09-20', 'hu7b', ARRAY[3,7,11,21,23,24,27]),
-('2023-09-13', 'hu7b', ARRAY[1,2,3,14,20,23,31]),
-('2023-09-06', 'hu7b', ARRAY[8,10,18,24,30,33,34]),
-('2023-08-30', 'hu7b', ARRAY[10,11,14,25,32,34,35]),
-('2023-08-23', 'hu7b', ARRAY[1,7,10,17,19,26,35]),
-('2023-08-16', 'hu7b', ARRAY[14,17,18,25,27,28,29]),
-('2023-08-09', 'hu7b', ARRAY[4,10,17,18,29,31,33]),
-('2023-08-02', 'hu7b', ARRAY[17,19,20,24,27,32,35]),
-('2023-07-26', 'hu7b', ARRAY[3,5,8,10,11,14,17]),
-('2023-07-19', 'hu7b', ARRAY[15,20,24,25,26,28,33]),
-('2023-07-12', 'hu7b', ARRAY[2,10,11,12,18,19,30]),
-('2023-07-05', 'hu7b', ARRAY[13,14,16,19,20,27,35]),
-('2023-06-28', 'hu7b', ARRAY[13,18,19,22,30,32,35]),
-('2023-06-21', 'hu7b', ARRAY[7,12,18,22,23,27,30]),
-('2023-06-14', 'hu7b', ARRAY[9,12,16,20,26,28,34]),
-('2023-06-07', 'hu7b', ARRAY[1,3,5,6,7,10,25]),
-('2023-05-31', 'hu7b', ARRAY[3,9,13,20,21,31,34]),
-('2023-05-24', 'hu7b', ARRAY[1,5,13,14,19,27,35]),
-('2023-05-17', 'hu7b', ARRAY[1,2,3,4,7,27,30]),
-('2023-05-10', 'hu7b', ARRAY[10,11,17,20,21,25,26]),
-('2023-05-03', 'hu7b', ARRAY[2,3,4,8,19,31,35]),
-('2023-04-26', 'hu7b', ARRAY[4,6,10,15,17,29,35]),
-('2023-04-19', 'hu7b', ARRAY[1,13,16,18,25,26,33]),
-('2023-04-12', 'hu7b', ARRAY[1,4,10,14,17,32,35]),
-('2023-04-05', 'hu7b', ARRAY[2,4,11,15,18,20,21]),
-('2023-03-29', 'hu7b', ARRAY[2,5,15,22,29,31,32]),
-('2023-03-22', 'hu7b', ARRAY[6,13,14,18,25,29,30]),
-('2023-03-15', 'hu7b', ARRAY[2,3,6,11,12,22,25]),
-('2023-03-08', 'hu7b', ARRAY[6,10,24,28,31,32,35]),
-('2023-03-01', 'hu7b', ARRAY[4,5,19,21,27,30,32]),
-('2023-02-22', 'hu7b', ARRAY[3,10,12,13,23,25,26]),
-('2023-02-15', 'hu7b', ARRAY[5,15,16,21,25,31,34]),
-('2023-02-08', 'hu7b', ARRAY[4,10,11,21,26,29,32]),
-('2023-02-01', 'hu7b', ARRAY[11,13,16,23,29,31,34]),
-('2023-01-25', 'hu7b', ARRAY[6,11,12,14,31,33,35]),
-('2023-01-18', 'hu7b', ARRAY[2,10,19,20,25,30,31]),
-('2023-01-11', 'hu7b', ARRAY[3,5,14,21,28,30,31]),
-('2023-01-04', 'hu7b', ARRAY[5,6,14,17,19,25,30]),
-('2022-12-28', 'hu7b', ARRAY[12,13,14,16,21,22,25]),
-('2022-12-21', 'hu7b', ARRAY[4,9,16,27,30,34,35]),
-('2022-12-14', 'hu7b', ARRAY[1,2,4,12,15,21,26]),
-('2022-12-07', 'hu7b', ARRAY[7,12,13,14,21,22,30]),
-('2022-11-30', 'hu7b', ARRAY[1,4,20,24,30,32,33]),
-('2022-11-23', 'hu7b', ARRAY[7,15,16,17,18,23,30]),
-('2022-11-16', 'hu7b', ARRAY[6,7,21,28,31,33,35]),
-('2022-11-09', 'hu7b', ARRAY[8,11,12,14,15,16,22]),
-('2022-11-02', 'hu7b', ARRAY[8,10,12,28,29,30,32]),
-('2022-10-26', 'hu7b', ARRAY[5,7,8,9,17,23,30]),
-('2022-10-19', 'hu7b', ARRAY[1,5,8,13,21,23,24]),
-('2022-10-12', 'hu7b', ARRAY[3,15,19,21,26,27,28]),
-('2022-10-05', 'hu7b', ARRAY[6,11,13,15,22,23,32]),
-('2022-09-28', 'hu7b', ARRAY[1,9,11,13,23,27,32]),
-('2022-09-21', 'hu7b', ARRAY[4,15,18,22,26,29,31]),
-('2022-09-14', 'hu7b', ARRAY[5,6,13,22,28,33,35]),
-('2022-09-07', 'hu7b', ARRAY[1,3,4,17,19,22,34]),
-('2022-08-31', 'hu7b', ARRAY[5,12,18,21,22,30,34]),
-('2022-08-24', 'hu7b', ARRAY[6,20,23,27,29,31,32]),
-('2022-08-17', 'hu7b', ARRAY[7,14,15,18,26,31,34]),
-('2022-08-10', 'hu7b', ARRAY[4,7,12,18,22,27,34]),
-('2022-08-03', 'hu7b', ARRAY[9,14,15,21,26,27,29]),
-('2022-07-27', 'hu7b', ARRAY[1,5,17,18,22,25,26]),
-('2022-07-20', 'hu7b', ARRAY[1,16,21,22,23,28,33]),
-('2022-07-13', 'hu7b', ARRAY[2,6,12,16,23,26,29]),
-('2022-07-06', 'hu7b', ARRAY[3,10,15,23,25,27,34]),
-('2022-06-29', 'hu7b', ARRAY[1,2,3,5,6,7,20]),
-('2022-06-22', 'hu7b', ARRAY[3,4,8,9,18,19,25]),
-('2022-06-15', 'hu7b', ARRAY[1,7,11,17,19,32,35]),
-('2022-06-08', 'hu7b', ARRAY[4,15,17,22,27,30,35]),
-('2022-06-01', 'hu7b', ARRAY[11,20,22,25,26,30,33]),
-('2022-05-25', 'hu7b', ARRAY[1,2,22,29,30,32,33]),
-('2022-05-18', 'hu7b', ARRAY[2,4,15,17,26,27,33]),
-('2022-05-11', 'hu7b', ARRAY[4,9,19,23,32,33,34]),
-('2022-05-04', 'hu7b', ARRAY[10,15,21,32,33,34,35]),
-('2022-04-27', 'hu7b', ARRAY[1,18,19,20,22,23,24]),
-('2022-04-20', 'hu7b', ARRAY[1,5,15,18,21,24,31]),
-('2022-04-13', 'hu7b', ARRAY[5,11,18,20,22,31,32]),
-('2022-04-06', 'hu7b', ARRAY[12,15,16,18,21,25,26]),
-('2022-03-30', 'hu7b', ARRAY[1,3,4,6,7,18,26]),
-('2022-03-23', 'hu7b', ARRAY[1,3,5,14,21,25,27]),
-('2022-03-16', 'hu7b', ARRAY[14,18,19,21,22,25,27]),
-('2022-03-09', 'hu7b', ARRAY[4,14,15,16,32,33,35]),
-('2022-03-02', 'hu7b', ARRAY[4,5,9,16,21,34,35]),
-('2022-02-23', 'hu7b', ARRAY[9,11,13,14,17,19,32]),
-('2022-02-16', 'hu7b', ARRAY[2,8,12,13,25,29,34]),
-('2022-02-09', 'hu7b', ARRAY[1,12,18,19,20,25,35]),
-('2022-02-02', 'hu7b', ARRAY[7,8,17,21,30,33,35]),
-('2022-01-26', 'hu7b', ARRAY[3,5,6,16,28,30,31]),
-('2022-01-19', 'hu7b', ARRAY[1,7,11,23,27,31,35]),
-('2022-01-12', 'hu7b', ARRAY[11,13,19,22,29,32,34]),
-('2022-01-05', 'hu7b', ARRAY[1,5,24,27,28,31,33]),
-('2021-12-29', 'hu7b', ARRAY[1,11,14,17,19,22,27]),
-('2021-12-22', 'hu7b', ARRAY[5,13,14,15,19,28,34]),
-('2021-12-15', 'hu7b', ARRAY[1,9,10,11,22,28,35]),
-('2021-12-08', 'hu7b', ARRAY[1,2,11,25,29,33,34]),
-('2021-12-01', 'hu7b', ARRAY[1,2,6,7,13,18,29]),
-('2021-11-24', 'hu7b', ARRAY[2,4,9,14,17,19,34]),
-('2021-11-17', 'hu7b', ARRAY[1,9,15,19,26,30,31]),
-('2021-11-10', 'hu7b', ARRAY[4,16,24,29,31,34,35]),
-('2021-11-03', 'hu7b', ARRAY[2,5,17,18,24,27,29]),
-('2021-10-27', 'hu7b', ARRAY[1,2,11,14,18,27,32]),
-('2021-10-20', 'hu7b', ARRAY[1,5,19,20,23,26,34]),
-('2021-10-13', 'hu7b', ARRAY[3,4,6,8,24,25,30]),
-('2021-10-06', 'hu7b', ARRAY[13,14,23,28,29,30,33]),
-('2021-09-29', 'hu7b', ARRAY[4,6,13,18,19,22,24]),
-('2021-09-22', 'hu7b', ARRAY[3,11,13,19,24,25,29]),
-('2021-09-15', 'hu7b', ARRAY[6,8,15,29,32,34,35]),
-('2021-09-08', 'hu7b', ARRAY[1,4,5,9,20,22,34]),
-('2021-09-01', 'hu7b', ARRAY[2,6,8,9,26,29,30]),
-('2021-08-25', 'hu7b', ARRAY[2,3,7,12,23,28,34]),
-('2021-08-18', 'hu7b', ARRAY[3,4,13,15,17,19,35]),
-('2021-08-11', 'hu7b', ARRAY[1,6,13,17,18,22,25]),
-('2021-08-04', 'hu7b', ARRAY[4,10,16,17,24,26,30]),
-('2021-07-28', 'hu7b', ARRAY[13,14,21,27,28,34,35]),
-('2021-07-21', 'hu7b', ARRAY[3,4,5,22,32,34,35]),
-('2021-07-14', 'hu7b', ARRAY[6,7,11,21,23,28,34]),
-('2021-07-07', 'hu7b', ARRAY[2,4,5,11,16,28,32]),
-('2021-06-30', 'hu7b', ARRAY[2,14,16,17,21,22,26]),
-('2021-06-23', 'hu7b', ARRAY[4,5,7,15,16,25,26]),
-('2021-06-16', 'hu7b', ARRAY[1,6,16,18,19,31,34]),
-('2021-06-09', 'hu7b', ARRAY[3,5,6,18,19,22,35]),
-('2021-06-02', 'hu7b', ARRAY[4,10,13,14,22,28,30]),
-('2021-05-26', 'hu7b', ARRAY[3,10,11,16,21,23,31]),
-('2021-05-19', 'hu7b', ARRAY[3,9,13,17,19,29,32]),
-('2021-05-12', 'hu7b', ARRAY[1,4,7,14,25,27,28]),
-('2021-05-05', 'hu7b', ARRAY[7,16,17,18,21,25,30]),
-('2021-04-28', 'hu7b', ARRAY[2,8,11,15,16,18,33]),
-('2021-04-21', 'hu7b', ARRAY[9,10,24,25,26,28,33]),
-('2021-04-14', 'hu7b', ARRAY[3,7,14,18,27,28,35]),
-('2021-04-07', 'hu7b', ARRAY[5,8,15,16,17,29,31]),
-('2021-03-31', 'hu7b', ARRAY[5,10,13,15,20,27,29]),
-('2021-03-24', 'hu7b', ARRAY[9,11,15,19,22,23,33]),
-('2021-03-17', 'hu7b', ARRAY[15,19,23,25,26,33,34]),
-('2021-03-10', 'hu7b', ARRAY[4,6,11,21,24,27,28]),
-('2021-03-03', 'hu7b', ARRAY[4,10,28,29,31,32,34]),
-('2021-02-24', 'hu7b', ARRAY[7,9,18,22,25,27,34]),
-('2021-02-17', 'hu7b', ARRAY[11,25,27,31,32,33,35]),
-('2021-02-10', 'hu7b', ARRAY[12,16,20,21,28,33,35]),
-('2021-02-03', 'hu7b', ARRAY[5,13,15,16,18,20,26]),
-('2021-01-27', 'hu7b', ARRAY[5,9,18,23,25,30,33]),
-('2021-01-20', 'hu7b', ARRAY[1,8,17,18,19,20,33]),
-('2021-01-13', 'hu7b', ARRAY[1,2,5,14,24,25,28]),
-('2021-01-06', 'hu7b', ARRAY[2,13,21,28,29,30,33]),
-('2020-12-30', 'hu7b', ARRAY[6,7,11,14,24,26,31]),
-('2020-12-23', 'hu7b', ARRAY[4,6,7,8,17,27,29]),
-('2020-12-16', 'hu7b', ARRAY[8,9,13,16,23,30,32]),
-('2020-12-09', 'hu7b', ARRAY[5,6,9,11,17,19,27]),
-('2020-12-02', 'hu7b', ARRAY[14,17,20,31,33,34,35]),
-('2020-11-25', 'hu7b', ARRAY[1,6,12,17,21,32,34]),
-('2020-11-18', 'hu7b', ARRAY[8,10,11,23,25,28,30]),
-('2020-11-11', 'hu7b', ARRAY[3,6,13,21,22,23,25]),
-('2020-11-04', 'hu7b', ARRAY[9,10,12,14,22,28,29]),
-('2020-10-28', 'hu7b', ARRAY[10,15,17,21,24,29,35]),
-('2020-10-21', 'hu7b', ARRAY[2,7,8,11,17,18,22]),
-('2020-10-14', 'hu7b', ARRAY[14,15,16,18,19,25,29]),
-('2020-10-07', 'hu7b', ARRAY[10,13,14,17,19,25,33]),
-('2020-09-30', 'hu7b', ARRAY[4,5,7,23,24,25,33]),
-('2020-09-23', 'hu7b', ARRAY[5,6,17,23,24,26,27]),
-('2020-09-16', 'hu7b', ARRAY[4,9,10,20,22,31,34]),
-('2020-09-09', 'hu7b', ARRAY[6,7,10,12,15,16,23]),
-('2020-09-02', 'hu7b', ARRAY[7,11,17,18,27,30,34]),
-('2020-08-26', 'hu7b', ARRAY[2,7,12,16,18,26,33]),
-('2020-08-19', 'hu7b', ARRAY[2,17,22,29,31,33,34]),
-('2020-08-12', 'hu7b', ARRAY[2,22,25,26,27,33,34]),
-('2020-08-05', 'hu7b', ARRAY[2,11,14,20,24,30,31]),
-('2020-07-29', 'hu7b', ARRAY[7,12,15,20,22,25,27]),
-('2020-07-22', 'hu7b', ARRAY[2,8,11,18,26,29,34]),
-('2020-07-15', 'hu7b', ARRAY[5,11,14,22,23,25,31]),
-('2020-07-08', 'hu7b', ARRAY[1,9,15,18,21,31,33]),
-('2020-07-01', 'hu7b', ARRAY[4,8,10,23,25,27,31]),
-('2020-06-24', 'hu7b', ARRAY[5,9,10,15,20,29,30]),
-('2020-06-17', 'hu7b', ARRAY[2,11,12,20,21,28,31]),
-('2020-06-10', 'hu7b', ARRAY[3,6,11,25,29,30,32]),
-('2020-06-03', 'hu7b', ARRAY[4,5,7,12,16,25,33]),
-('2020-05-27', 'hu7b', ARRAY[6,8,10,11,13,19,34]),
-('2020-05-20', 'hu7b', ARRAY[2,6,12,13,19,21,26]),
-('2020-05-13', 'hu7b', ARRAY[2,7,10,12,13,21,34]),
-('2020-05-06', 'hu7b', ARRAY[3,6,10,24,27,32,35]),
-('2020-04-29', 'hu7b', ARRAY[1,3,5,15,19,26,30]),
-('2020-04-22', 'hu7b', ARRAY[2,3,5,11,15,16,28]),
-('2020-04-15', 'hu7b', ARRAY[1,15,16,20,29,31,32]),
-('2020-04-08', 'hu7b', ARRAY[14,22,24,28,29,31,33]),
-('2020-04-01', 'hu7b', ARRAY[4,5,7,25,28,33,35]),
-('2020-03-25', 'hu7b', ARRAY[2,11,18,19,20,27,33]),
-('2020-03-18', 'hu7b', ARRAY[2,8,13,17,27,30,34]),
-('2020-03-11', 'hu7b', ARRAY[2,8,11,12,20,28,29]),
-('2020-03-04', 'hu7b', ARRAY[5,7,9,22,23,26,29]),
-('2020-02-26', 'hu7b', ARRAY[2,3,10,11,15,16,25]),
-('2020-02-19', 'hu7b', ARRAY[8,11,13,18,25,26,35]),
-('2020-02-12', 'hu7b', ARRAY[1,5,6,7,13,23,24]),
-('2020-02-05', 'hu7b', ARRAY[2,3,9,11,12,16,22]),
-('2020-01-29', 'hu7b', ARRAY[1,6,9,11,17,32,35]),
-('2020-01-22', 'hu7b', ARRAY[3,12,14,17,18,24,28]),
-('2020-01-15', 'hu7b', ARRAY[2,16,17,22,25,28,29]),
-('2020-01-08', 'hu7b', ARRAY[10,11,14,22,23,28,31]),
-('2020-01-01', 'hu7b', ARRAY[6,17,18,20,23,28,31]),
-('2019-12-25', 'hu7b', ARRAY[2,10,12,22,27,29,33]),
-('2019-12-18', 'hu7b', ARRAY[1,6,10,11,17,25,27]),
-('2019-12-11', 'hu7b', ARRAY[2,10,20,28,30,32,35]),
-('2019-12-04', 'hu7b', ARRAY[6,10,15,19,23,27,33]),
-('2019-11-27', 'hu7b', ARRAY[5,12,13,18,21,22,24]),
-('2019-11-20', 'hu7b', ARRAY[1,4,6,20,23,27,29]),
-('2019-11-13', 'hu7b', ARRAY[2,4,6,12,19,25,28]),
-('2019-11-06', 'hu7b', ARRAY[5,9,10,14,17,21,28]),
-('2019-10-30', 'hu7b', ARRAY[5,14,20,28,29,30,35]),
-('2019-10-23', 'hu7b', ARRAY[3,6,8,9,12,15,22]),
-('2019-10-16', 'hu7b', ARRAY[6,16,26,29,30,31,32]),
-('2019-10-09', 'hu7b', ARRAY[6,10,16,25,26,29,35]),
-('2019-10-02', 'hu7b', ARRAY[5,17,18,23,26,31,35]),
-('2019-09-25', 'hu7b', ARRAY[5,10,13,22,30,33,35]),
-('2019-09-18', 'hu7b', ARRAY[4,5,12,14,17,21,27]),
-('2019-09-11', 'hu7b', ARRAY[7,8,11,14,20,29,32]),
-('2019-09-04', 'hu7b', ARRAY[3,4,10,13,15,28,31]),
-('2019-08-28', 'hu7b', ARRAY[7,19,24,29,31,32,35]),
-('2019-08-21', 'hu7b', ARRAY[4,22,23,24,28,31,35]),
-('2019-08-14', 'hu7b', ARRAY[1,2,5,13,31,32,33]),
-('2019-08-07', 'hu7b', ARRAY[6,18,20,23,24,27,34]),
-('2019-07-31', 'hu7b', ARRAY[17,18,21,25,30,31,35]),
-('2019-07-24', 'hu7b', ARRAY[7,8,10,12,26,28,33]),
-('2019-07-17', 'hu7b', ARRAY[11,26,27,30,31,32,35]),
-('2019-07-10', 'hu7b', ARRAY[5,12,15,19,23,24,26]),
-('2019-07-03', 'hu7b', ARRAY[5,9,15,17,24,27,30]),
-('2019-06-26', 'hu7b', ARRAY[1,11,19,21,23,26,27]),
-('2019-06-19', 'hu7b', ARRAY[10,15,24,25,30,32,34]),
-('2019-06-12', 'hu7b', ARRAY[3,4,17,22,26,27,33]),
-('2019-06-05', 'hu7b', ARRAY[3,6,13,14,18,23,35]),
-('2019-05-29', 'hu7b', ARRAY[2,5,11,12,17,21,22]),
-('2019-05-22', 'hu7b', ARRAY[4,10,11,12,20,30,35]),
-('2019-05-15', 'hu7b', ARRAY[2,5,6,14,17,21,29]),
-('2019-05-08', 'hu7b', ARRAY[5,12,16,18,23,26,30]),
-('2019-05-01', 'hu7b', ARRAY[3,5,15,18,21,26,27]),
-('2019-04-24', 'hu7b', ARRAY[1,11,19,22,24,29,34]),
-('2019-04-17', 'hu7b', ARRAY[1,3,14,16,17,23,24]),
-('2019-04-10', 'hu7b', ARRAY[2,9,11,18,23,25,28]),
-('2019-04-03', 'hu7b', ARRAY[6,13,17,18,19,23,24]),
-('2019-03-27', 'hu7b', ARRAY[9,10,11,12,16,20,26]),
-('2019-03-20', 'hu7b', ARRAY[1,8,19,20,22,24,31]),
-('2019-03-13', 'hu7b', ARRAY[3,8,11,13,21,32,35]),
-('2019-03-06', 'hu7b', ARRAY[4,12,15,23,26,30,33]),
-('2019-02-27', 'hu7b', ARRAY[7,11,15,21,23,24,30]),
-('2019-02-20', 'hu7b', ARRAY[2,14,19,25,29,30,32]),
-('2019-02-13', 'hu7b', ARRAY[4,5,7,18,23,24,34]),
-('2019-02-06', 'hu7b', ARRAY[4,5,6,13,17,20,28]),
-('2019-01-30', 'hu7b', ARRAY[7,14,17,21,28,32,33]),
-('2019-01-23', 'hu7b', ARRAY[3,4,8,9,12,13,25]),
-('2019-01-16', 'hu7b', ARRAY[6,9,10,18,30,33,35]),
-('2019-01-09', 'hu7b', ARRAY[2,4,9,13,18,23,24]),
-('2019-01-02', 'hu7b', ARRAY[5,11,12,19,28,32,33]),
-('2018-12-26', 'hu7b', ARRAY[9,11,12,16,19,22,33]),
-('2018-12-19', 'hu7b', ARRAY[13,14,16,20,26,28,31]),
-('2018-12-12', 'hu7b', ARRAY[5,21,25,28,29,33,34]),
-('2018-12-05', 'hu7b', ARRAY[3,7,9,23,24,25,35]),
-('2018-11-28', 'hu7b', ARRAY[2,5,17,19,29,33,34]),
-('2018-11-21', 'hu7b', ARRAY[6,11,22,23,24,30,32]),
-('2018-11-14', 'hu7b', ARRAY[1,2,5,6,17,24,27]),
-('2018-11-07', 'hu7b', ARRAY[1,4,11,19,22,29,32]),
-('2018-10-31', 'hu7b', ARRAY[2,4,7,13,19,33,34]),
-('2018-10-24', 'hu7b', ARRAY[6,7,12,27,28,31,35]),
-('2018-10-17', 'hu7b', ARRAY[2,5,18,21,28,29,30]),
-('2018-10-10', 'hu7b', ARRAY[2,3,23,27,28,29,31]),
-('2018-10-03', 'hu7b', ARRAY[19,21,26,27,30,33,35]),
-('2018-09-26', 'hu7b', ARRAY[1,16,18,19,24,32,34]),
-('2018-09-19', 'hu7b', ARRAY[1,7,10,15,21,22,30]),
-('2018-09-12', 'hu7b', ARRAY[4,7,9,20,22,28,31]),
-('2018-09-05', 'hu7b', ARRAY[6,8,13,16,29,31,34]),
-('2018-08-29', 'hu7b', ARRAY[1,4,9,17,21,24,25]),
-('2018-08-22', 'hu7b', ARRAY[1,3,15,17,18,28,29]),
-('2018-08-15', 'hu7b', ARRAY[4,5,11,13,23,25,29]),
-('2018-08-08', 'hu7b', ARRAY[3,7,11,12,16,26,33]),
-('2018-08-01', 'hu7b', ARRAY[7,15,20,22,25,28,31]),
-('2018-07-25', 'hu7b', ARRAY[10,19,22,23,26,28,29]),
-('2018-07-18', 'hu7b', ARRAY[7,15,20,30,31,32,34]),
-('2018-07-11', 'hu7b', ARRAY[2,6,9,10,20,21,28]),
-('2018-07-04', 'hu7b', ARRAY[5,6,11,18,27,30,34]),
-('2018-06-27', 'hu7b', ARRAY[2,5,11,13,17,26,32]),
-('2018-06-20', 'hu7b', ARRAY[1,5,8,12,22,23,26]),
-('2018-06-13', 'hu7b', ARRAY[6,7,13,20,23,26,28]),
-('2018-06-06', 'hu7b', ARRAY[1,11,12,16,19,33,35]),
-('2018-05-30', 'hu7b', ARRAY[4,8,9,10,24,26,34]),
-('2018-05-23', 'hu7b', ARRAY[3,4,5,29,31,33,35]),
-('2018-05-16', 'hu7b', ARRAY[3,9,11,12,18,23,27]),
-('2018-05-09', 'hu7b', ARRAY[7,8,11,18,21,23,24]),
-('2018-05-02', 'hu7b', ARRAY[4,5,10,14,23,26,28]),
-('2018-04-25', 'hu7b', ARRAY[9,10,11,12,14,30,34]),
-('2018-04-18', 'hu7b', ARRAY[1,3,17,18,23,27,32]),
-('2018-04-11', 'hu7b', ARRAY[2,11,16,17,18,20,23]),
-('2018-04-04', 'hu7b', ARRAY[2,5,6,7,11,14,19]),
-('2018-03-28', 'hu7b', ARRAY[1,6,7,31,33,34,35]),
-('2018-03-21', 'hu7b', ARRAY[1,6,7,9,19,23,32]),
-('2018-03-14', 'hu7b', ARRAY[2,3,21,23,24,25,27]),
-('2018-03-07', 'hu7b', ARRAY[13,14,24,25,31,33,35]),
-('2018-02-28', 'hu7b', ARRAY[7,11,13,15,16,30,35]),
-('2018-02-21', 'hu7b', ARRAY[2,6,7,18,19,28,32]),
-('2018-02-14', 'hu7b', ARRAY[4,9,15,18,19,21,35]),
-('2018-02-07', 'hu7b', ARRAY[3,13,24,26,29,30,33]),
-('2018-01-31', 'hu7b', ARRAY[11,18,21,23,29,31,33]),
-('2018-01-24', 'hu7b', ARRAY[7,9,11,20,21,32,33]),
-('2018-01-17', 'hu7b', ARRAY[2,6,8,9,16,18,24]),
-('2018-01-10', 'hu7b', ARRAY[2,12,13,16,21,25,28]),
-('2018-01-03', 'hu7b', ARRAY[1,9,18,24,30,31,34]),
-('2017-12-27', 'hu7b', ARRAY[5,8,15,17,18,20,27]),
-('2017-12-20', 'hu7b', ARRAY[5,6,10,20,22,26,29]),
-('2017-12-13', 'hu7b', ARRAY[14,16,19,22,28,29,31]),
-('2017-12-06', 'hu7b', ARRAY[12,15,16,25,26,27,28]),
-('2017-11-29', 'hu7b', ARRAY[10,14,22,24,25,29,33]),
-('2017-11-22', 'hu7b', ARRAY[7,9,11,15,16,26,28]),
-('2017-11-15', 'hu7b', ARRAY[2,12,14,15,20,34,35]),
-('2017-11-08', 'hu7b', ARRAY[14,16,18,24,27,33,35]),
-('2017-11-01', 'hu7b', ARRAY[2,9,12,23,26,32,34]),
-('2017-10-25', 'hu7b', ARRAY[1,4,9,16,20,31,35]),
-('2017-10-18', 'hu7b', ARRAY[1,5,9,13,16,30,34]),
-('2017-10-11', 'hu7b', ARRAY[9,14,15,21,30,33,35]),
-('2017-10-04', 'hu7b', ARRAY[1,2,8,13,18,26,33]),
-('2017-09-27', 'hu7b', ARRAY[1,11,12,13,14,24,25]),
-('2017-09-20', 'hu7b', ARRAY[8,9,12,15,16,30,35]),
-('2017-09-13', 'hu7b', ARRAY[4,10,15,17,24,25,29]),
-('2017-09-06', 'hu7b', ARRAY[1,4,7,20,26,27,34]),
-('2017-08-30', 'hu7b', ARRAY[5,11,25,29,32,33,34]),
-('2017-08-23', 'hu7b', ARRAY[2,13,15,22,25,26,35]),
-('2017-08-16', 'hu7b', ARRAY[1,23,24,26,30,32,33]),
-('2017-08-09', 'hu7b', ARRAY[2,4,9,18,19,33,35]),
-('2017-08-02', 'hu7b', ARRAY[2,5,10,20,26,30,35]),
-('2017-07-26', 'hu7b', ARRAY[3,11,24,25,26,28,29]),
-('2017-07-19', 'hu7b', ARRAY[2,8,10,12,14,19,35]),
-('2017-07-12', 'hu7b', ARRAY[3,5,10,25,27,31,34]),
-('2017-07-05', 'hu7b', ARRAY[7,13,17,18,22,23,34]),
-('2017-06-28', 'hu7b', ARRAY[4,11,12,16,17,21,22]),
-('2017-06-21', 'hu7b', ARRAY[3,6,9,16,23,32,33]),
-('2017-06-14', 'hu7b', ARRAY[1,4,10,28,30,32,34]),
-('2017-06-07', 'hu7b', ARRAY[8,12,13,16,21,28,31]),
-('2017-05-31', 'hu7b', ARRAY[2,6,8,20,21,25,34]),
-('2017-05-24', 'hu7b', ARRAY[11,13,17,21,25,31,35]),
-('2017-05-17', 'hu7b', ARRAY[1,3,5,11,13,14,28]),
-('2017-05-10', 'hu7b', ARRAY[8,9,12,20,25,28,33]),
-('2017-05-03', 'hu7b', ARRAY[3,7,9,11,18,21,33]),
-('2017-04-26', 'hu7b', ARRAY[1,9,10,13,18,21,27]),
-('2017-04-19', 'hu7b', ARRAY[10,11,12,13,16,29,32]),
-('2017-04-12', 'hu7b', ARRAY[5,9,11,19,22,28,35]),
-('2017-04-05', 'hu7b', ARRAY[13,15,23,25,27,28,29]),
-('2017-03-29', 'hu7b', ARRAY[5,8,11,18,20,21,34]),
-('2017-03-22', 'hu7b', ARRAY[1,4,5,8,20,21,34]),
-('2017-03-15', 'hu7b', ARRAY[1,4,10,17,19,20,31]),
-('2017-03-08', 'hu7b', ARRAY[3,4,8,14,19,27,31]),
-('2017-03-01', 'hu7b', ARRAY[8,10,13,18,19,21,26]),
-('2017-02-22', 'hu7b', ARRAY[1,12,19,26,27,29,35]),
-('2017-02-15', 'hu7b', ARRAY[2,4,16,17,20,22,30]),
-('2017-02-08', 'hu7b', ARRAY[2,5,9,19,25,30,31]),
-('2017-02-01', 'hu7b', ARRAY[6,8,10,16,21,22,23]),
-('2017-01-25', 'hu7b', ARRAY[6,8,10,14,15,17,29]),
-('2017-01-18', 'hu7b', ARRAY[4,6,10,21,23,24,28]),
-('2017-01-11', 'hu7b', ARRAY[7,11,16,17,22,23,34]),
-('2017-01-04', 'hu7b', ARRAY[2,9,11,14,16,19,26]),
-('2016-12-28', 'hu7b', ARRAY[5,22,23,24,26,27,34]),
-('2016-12-21', 'hu7b', ARRAY[8,10,16,19,24,31,33]),
-('2016-12-14', 'hu7b', ARRAY[5,16,21,22,23,28,32]),
-('2016-12-07', 'hu7b', ARRAY[3,5,7,17,18,24,32]),
-('2016-11-30', 'hu7b', ARRAY[3,14,15,20,22,23,29]),
-('2016-11-23', 'hu7b', ARRAY[5,6,14,19,23,26,29]),
-('2016-11-16', 'hu7b', ARRAY[2,4,11,21,23,25,30]),
-('2016-11-09', 'hu7b', ARRAY[6,11,19,20,22,23,32]),
-('2016-11-02', 'hu7b', ARRAY[1,5,7,9,19,23,34]),
-('2016-10-26', 'hu7b', ARRAY[1,3,5,10,21,24,35]),
-('2016-10-19', 'hu7b', ARRAY[6,13,17,25,26,33,34]),
-('2016-10-12', 'hu7b', ARRAY[4,8,14,21,23,28,33]),
-('2016-10-05', 'hu7b', ARRAY[6,8,10,31,32,34,35]),
-('2016-09-28', 'hu7b', ARRAY[2,6,18,20,21,25,28]),
-('2016-09-21', 'hu7b', ARRAY[1,4,12,18,22,23,30]),
-('2016-09-14', 'hu7b', ARRAY[7,10,16,23,26,27,33]),
-('2016-09-07', 'hu7b', ARRAY[11,13,18,24,25,30,33]),
-('2016-08-31', 'hu7b', ARRAY[8,19,23,24,26,28,32]),
-('2016-08-24', 'hu7b', ARRAY[3,8,9,19,23,25,33]),
-('2016-08-17', 'hu7b', ARRAY[1,7,14,21,22,30,32]),
-('2016-08-10', 'hu7b', ARRAY[2,4,5,7,29,31,32]),
-('2016-08-03', 'hu7b', ARRAY[2,3,5,19,29,30,33]),
-('2016-07-27', 'hu7b', ARRAY[5,7,11,13,18,23,27]),
-('2016-07-20', 'hu7b', ARRAY[2,8,16,24,26,33,35]),
-('2016-07-13', 'hu7b', ARRAY[2,3,9,19,25,28,29]),
-('2016-07-06', 'hu7b', ARRAY[10,11,15,22,27,30,35]),
-('2016-06-29', 'hu7b', ARRAY[4,12,17,19,22,27,30]),
-('2016-06-22', 'hu7b', ARRAY[3,4,6,11,14,25,30]),
-('2016-06-15', 'hu7b', ARRAY[5,9,10,18,28,29,34]),
-('2016-06-08', 'hu7b', ARRAY[2,7,14,18,21,23,26]),
-('2016-06-01', 'hu7b', ARRAY[3,8,10,17,21,28,34]),
-('2016-05-25', 'hu7b', ARRAY[2,7,13,20,21,23,32]),
-('2016-05-18', 'hu7b', ARRAY[7,10,16,24,25,30,31]),
-('2016-05-11', 'hu7b', ARRAY[1,10,16,21,23,27,30]),
-('2016-05-04', 'hu7b', ARRAY[3,9,11,19,23,24,33]),
-('2016-04-27', 'hu7b', ARRAY[7,13,26,28,33,34,35]),
-('2016-04-20', 'hu7b', ARRAY[1,7,11,14,21,30,32]),
-('2016-04-13', 'hu7b', ARRAY[4,6,14,23,29,32,34]),
-('2016-04-06', 'hu7b', ARRAY[9,10,11,13,25,30,33]),
-('2016-03-30', 'hu7b', ARRAY[2,7,8,9,10,23,24]),
-('2016-03-23', 'hu7b', ARRAY[1,5,14,21,24,26,31]),
-('2016-03-16', 'hu7b', ARRAY[7,8,16,19,21,22,24]),
-('2016-03-09', 'hu7b', ARRAY[15,16,18,19,20,31,33]),
-('2016-03-02', 'hu7b', ARRAY[7,8,11,15,16,21,27]),
-('2016-02-24', 'hu7b', ARRAY[1,17,18,24,25,29,30]),
-('2016-02-17', 'hu7b', ARRAY[1,6,13,28,31,33,35]),
-('2016-02-10', 'hu7b', ARRAY[1,5,20,23,26,28,32]),
-('2016-02-03', 'hu7b', ARRAY[8,12,18,26,28,31,35]),
-('2016-01-27', 'hu7b', ARRAY[9,10,13,24,26,28,32]),
-('2016-01-20', 'hu7b', ARRAY[2,12,15,17,22,28,32]),
-('2016-01-13', 'hu7b', ARRAY[2,7,9,15,22,32,35]),
-('2016-01-06', 'hu7b', ARRAY[1,9,11,24,29,30,34]),
-('2015-12-30', 'hu7b', ARRAY[2,14,18,26,29,32,34]),
-('2015-12-23', 'hu7b', ARRAY[2,5,11,18,26,28,29]),
-('2015-12-16', 'hu7b', ARRAY[6,12,17,19,23,29,30]),
-('2015-12-09', 'hu7b', ARRAY[3,10,12,22,23,32,33]),
-('2015-12-02', 'hu7b', ARRAY[9,10,12,17,18,30,32]),
-('2015-11-25', 'hu7b', ARRAY[1,18,19,22,24,26,30]),
-('2015-11-18', 'hu7b', ARRAY[2,4,5,16,20,24,31]),
-('2015-11-11', 'hu7b', ARRAY[1,8,10,14,16,22,32]),
-('2015-11-04', 'hu7b', ARRAY[1,8,14,21,28,29,30]),
-('2015-10-28', 'hu7b', ARRAY[4,5,9,10,22,28,34]),
-('2015-10-21', 'hu7b', ARRAY[2,10,14,21,22,29,30]),
-('2015-10-14', 'hu7b', ARRAY[1,12,17,21,23,26,27]),
-('2015-10-07', 'hu7b', ARRAY[1,7,16,28,31,34,35]),
-('2015-09-30', 'hu7b', ARRAY[1,10,11,16,24,26,27]),
-('2015-09-23', 'hu7b', ARRAY[3,8,12,16,25,27,30]),
-('2015-09-16', 'hu7b', ARRAY[3,8,19,20,25,26,30]),
-('2015-09-09', 'hu7b', ARRAY[1,4,9,13,18,21,25]),
-('2015-09-02', 'hu7b', ARRAY[1,6,8,21,25,28,34]),
-('2015-08-26', 'hu7b', ARRAY[6,7,8,24,26,29,34]),
-('2015-08-19', 'hu7b', ARRAY[5,8,9,13,19,25,31]),
-('2015-08-12', 'hu7b', ARRAY[5,18,19,22,24,26,35]),
-('2015-08-05', 'hu7b', ARRAY[4,8,12,14,18,20,30]),
-('2015-07-29', 'hu7b', ARRAY[1,4,16,19,22,31,35]),
-('2015-07-22', 'hu7b', ARRAY[3,11,16,18,20,24,31]),
-('2015-07-15', 'hu7b', ARRAY[1,9,20,24,31,32,34]),
-('2015-07-08', 'hu7b', ARRAY[10,18,20,27,28,33,34]),
-('2015-07-01', 'hu7b', ARRAY[8,13,14,15,16,24,25]),
-('2015-06-24', 'hu7b', ARRAY[7,8,11,12,18,23,30]),
-('2015-06-17', 'hu7b', ARRAY[3,10,13,20,23,25,26]),
-('2015-06-10', 'hu7b', ARRAY[5,7,8,10,11,15,22]),
-('2015-06-03', 'hu7b', ARRAY[12,13,19,24,26,28,30]),
-('2015-05-27', 'hu7b', ARRAY[10,14,17,20,22,23,27]),
-('2015-05-20', 'hu7b', ARRAY[1,8,15,19,26,28,33]),
-('2015-05-13', 'hu7b', ARRAY[4,5,12,13,14,24,33]),
-('2015-05-06', 'hu7b', ARRAY[6,11,13,21,22,24,33]),
-('2015-04-29', 'hu7b', ARRAY[5,6,9,10,30,34,35]),
-('2015-04-22', 'hu7b', ARRAY[9,16,19,24,25,32,34]),
-('2015-04-15', 'hu7b', ARRAY[3,5,11,14,16,25,32]),
-('2015-04-08', 'hu7b', ARRAY[5,6,8,12,16,17,24]),
-('2015-04-01', 'hu7b', ARRAY[7,12,16,20,22,34,35]),
-('2015-03-25', 'hu7b', ARRAY[7,10,16,18,26,31,32]),
-('2015-03-18', 'hu7b', ARRAY[1,5,8,11,14,15,17]),
-('2015-03-11', 'hu7b', ARRAY[3,6,8,9,20,27,34]),
-('2015-03-04', 'hu7b', ARRAY[3,9,11,18,23,26,34]),
-('2015-02-25', 'hu7b', ARRAY[5,6,8,17,31,33,35]),
-('2015-02-18', 'hu7b', ARRAY[9,22,24,28,30,31,35]),
-('2015-02-11', 'hu7b', ARRAY[3,6,11,17,18,26,30]),
-('2015-02-04', 'hu7b', ARRAY[1,2,3,15,27,29,32]),
-('2015-01-28', 'hu7b', ARRAY[10,13,22,24,26,30,34]),
-('2015-01-21', 'hu7b', ARRAY[11,16,18,23,26,27,31]),
-('2015-01-14', 'hu7b', ARRAY[2,5,12,14,16,26,29]),
-('2015-01-07', 'hu7b', ARRAY[1,9,10,15,22,30,34]),
-('2015-01-01', 'hu7b', ARRAY[17,21,27,29,32,34,35]),
-('2014-12-24', 'hu7b', ARRAY[4,6,9,21,23,27,28]),
-('2014-12-17', 'hu7b', ARRAY[6,7,10,21,23,31,35]),
-('2014-12-10', 'hu7b', ARRAY[4,9,12,15,19,21,25]),
-('2014-12-03', 'hu7b', ARRAY[8,13,22,28,29,34,35]),
-('2014-11-26', 'hu7b', ARRAY[11,16,18,19,26,31,32]),
-('2014-11-19', 'hu7b', ARRAY[2,6,7,9,19,24,35]),
-('2014-11-12', 'hu7b', ARRAY[1,5,16,21,22,29,31]),
-('2014-11-05', 'hu7b', ARRAY[7,12,15,20,22,24,27]),
-('2014-10-29', 'hu7b', ARRAY[2,3,12,14,15,28,31]),
-('2014-10-22', 'hu7b', ARRAY[14,15,20,22,30,31,32]),
-('2014-10-15', 'hu7b', ARRAY[12,15,23,24,28,31,34]),
-('2014-10-08', 'hu7b', ARRAY[3,5,8,13,14,16,33]),
-('2014-10-01', 'hu7b', ARRAY[5,8,9,22,23,25,26]),
-('2014-09-24', 'hu7b', ARRAY[6,10,11,12,15,21,23]),
-('2014-09-17', 'hu7b', ARRAY[4,6,13,16,21,22,33]),
-('2014-09-10', 'hu7b', ARRAY[6,11,13,23,29,30,34]),
-('2014-09-03', 'hu7b', ARRAY[2,3,5,13,14,16,24]),
-('2014-08-27', 'hu7b', ARRAY[1,15,16,20,25,29,31]),
-('2014-08-20', 'hu7b', ARRAY[7,14,21,23,25,30,32]),
-('2014-08-13', 'hu7b', ARRAY[2,4,9,16,29,31,35]),
-('2014-08-06', 'hu7b', ARRAY[4,11,15,17,25,26,34]),
-('2014-07-30', 'hu7b', ARRAY[1,8,9,13,25,26,29]),
-('2014-07-23', 'hu7b', ARRAY[1,7,20,22,23,28,34]),
-('2014-07-16', 'hu7b', ARRAY[1,8,9,14,22,30,34]),
-('2014-07-09', 'hu7b', ARRAY[2,6,12,16,19,25,34]),
-('2014-07-02', 'hu7b', ARRAY[10,15,27,30,32,33,35]),
-('2014-06-25', 'hu7b', ARRAY[19,21,23,25,29,30,31]),
-('2014-06-18', 'hu7b', ARRAY[3,5,18,29,31,34,35]),
-('2014-06-11', 'hu7b', ARRAY[1,3,15,16,18,25,31]),
-('2014-06-04', 'hu7b', ARRAY[2,7,8,14,18,24,28]),
-('2014-05-28', 'hu7b', ARRAY[3,9,10,14,21,25,33]),
-('2014-05-21', 'hu7b', ARRAY[2,22,23,28,29,31,34]),
-('2014-05-14', 'hu7b', ARRAY[2,4,9,14,17,22,34]),
-('2014-05-07', 'hu7b', ARRAY[4,7,12,16,24,26,28]),
-('2014-04-30', 'hu7b', ARRAY[9,11,15,19,22,25,34]),
-('2014-04-23', 'hu7b', ARRAY[4,7,10,14,21,22,24]),
-('2014-04-16', 'hu7b', ARRAY[4,20,22,26,28,30,35]),
-('2014-04-09', 'hu7b', ARRAY[2,5,7,12,22,28,34]),
-('2014-04-02', 'hu7b', ARRAY[2,4,24,28,29,30,31]),
-('2014-03-26', 'hu7b', ARRAY[9,12,15,26,31,34,35]),
-('2014-03-19', 'hu7b', ARRAY[4,9,10,19,22,24,26]),
-('2014-03-12', 'hu7b', ARRAY[4,9,16,17,19,21,30]),
-('2014-03-05', 'hu7b', ARRAY[10,11,12,17,22,28,29]),
-('2014-02-26', 'hu7b', ARRAY[1,3,15,16,19,22,31]),
-('2014-02-19', 'hu7b', ARRAY[1,7,9,13,21,22,30]),
-('2014-02-12', 'hu7b', ARRAY[12,14,19,25,30,32,33]),
-('2014-02-05', 'hu7b', ARRAY[11,13,18,25,29,32,34]),
-('2014-01-29', 'hu7b', ARRAY[8,12,19,22,24,26,28]),
-('2014-01-22', 'hu7b', ARRAY[4,5,6,10,21,28,29]),
-('2014-01-15', 'hu7b', ARRAY[3,6,19,25,27,29,30]),
-('2014-01-08', 'hu7b', ARRAY[3,11,15,16,23,25,29]),
-('2014-01-01', 'hu7b', ARRAY[1,7,9,18,22,23,24]),
-('2013-12-25', 'hu7b', ARRAY[8,9,17,24,25,32,35]),
-('2013-12-18', 'hu7b', ARRAY[1,6,13,16,17,21,31]),
-('2013-12-11', 'hu7b', ARRAY[7,10,16,20,23,27,28]),
-('2013-12-04', 'hu7b', ARRAY[4,5,12,13,17,22,30]),
-('2013-11-27', 'hu7b', ARRAY[16,19,21,23,24,27,29]),
-('2013-11-20', 'hu7b', ARRAY[15,17,21,26,29,33,35]),
-('2013-11-13', 'hu7b', ARRAY[7,19,22,23,25,31,32]),
-('2013-11-06', 'hu7b', ARRAY[2,6,15,22,28,30,33]),
-('2013-10-30', 'hu7b', ARRAY[16,20,23,28,30,32,33]),
-('2013-10-23', 'hu7b', ARRAY[2,3,13,16,19,27,32]),
-('2013-10-16', 'hu7b', ARRAY[1,4,9,28,30,32,35]),
-('2013-10-09', 'hu7b', ARRAY[2,9,14,15,18,25,35]),
-('2013-10-02', 'hu7b', ARRAY[4,7,15,17,25,30,33]),
-('2013-09-25', 'hu7b', ARRAY[3,7,8,16,17,21,24]),
-('2013-09-18', 'hu7b', ARRAY[2,5,11,16,23,26,31]),
-('2013-09-11', 'hu7b', ARRAY[6,14,18,27,30,32,35]),
-('2013-09-04', 'hu7b', ARRAY[5,9,10,21,22,24,28]),
-('2013-08-28', 'hu7b', ARRAY[3,6,13,14,23,26,28]),
-('2013-08-21', 'hu7b', ARRAY[6,11,16,19,28,30,35]),
-('2013-08-14', 'hu7b', ARRAY[6,10,17,23,29,30,35]),
-('2013-08-07', 'hu7b', ARRAY[1,8,13,15,17,25,35]),
-('2013-07-31', 'hu7b', ARRAY[1,9,12,17,21,24,29]),
-('2013-07-24', 'hu7b', ARRAY[12,14,15,16,18,27,34]),
-('2013-07-17', 'hu7b', ARRAY[1,9,16,17,19,27,35]),
-('2013-07-10', 'hu7b', ARRAY[4,6,8,14,20,21,28]),
-('2013-07-03', 'hu7b', ARRAY[3,6,11,15,19,28,35]),
-('2013-06-26', 'hu7b', ARRAY[1,4,6,14,24,29,34]),
-('2013-06-19', 'hu7b', ARRAY[7,15,16,21,22,23,31]),
-('2013-06-12', 'hu7b', ARRAY[7,8,19,20,26,27,31]),
-('2013-06-05', 'hu7b', ARRAY[6,8,9,10,12,22,28]),
-('2013-05-29', 'hu7b', ARRAY[4,7,11,19,25,28,33]),
-('2013-05-22', 'hu7b', ARRAY[5,9,18,20,23,31,34]),
-('2013-05-15', 'hu7b', ARRAY[2,11,15,18,19,24,30]),
-('2013-05-08', 'hu7b', ARRAY[10,11,13,19,26,27,29]),
-('2013-05-02', 'hu7b', ARRAY[1,3,15,19,24,29,30]),
-('2013-04-24', 'hu7b', ARRAY[2,4,10,20,27,29,35]),
-('2013-04-17', 'hu7b', ARRAY[2,4,5,6,7,16,31]),
-('2013-04-10', 'hu7b', ARRAY[2,4,6,8,22,25,32]),
-('2013-04-03', 'hu7b', ARRAY[6,8,16,19,28,29,32]),
-('2013-03-27', 'hu7b', ARRAY[2,3,11,20,25,27,28]),
-('2013-03-20', 'hu7b', ARRAY[4,15,16,18,23,24,27]),
-('2013-03-13', 'hu7b', ARRAY[8,10,13,16,26,33,35]),
-('2013-03-06', 'hu7b', ARRAY[1,6,9,14,16,22,35]),
-('2013-02-27', 'hu7b', ARRAY[14,17,25,28,29,32,34]),
-('2013-02-20', 'hu7b', ARRAY[1,8,11,12,20,23,35]),
-('2013-02-13', 'hu7b', ARRAY[1,6,11,12,23,28,30]),
-('2013-02-06', 'hu7b', ARRAY[5,10,11,14,16,24,35]),
-('2013-01-30', 'hu7b', ARRAY[1,2,13,16,29,30,32]),
-('2013-01-23', 'hu7b', ARRAY[8,15,17,18,19,29,34]),
-('2013-01-16', 'hu7b', ARRAY[5,6,20,24,28,33,34]),
-('2013-01-09', 'hu7b', ARRAY[6,9,17,23,25,32,34]),
-('2013-01-02', 'hu7b', ARRAY[8,12,16,20,22,28,35]),
-('2012-12-26', 'hu7b', ARRAY[2,5,9,19,22,30,34]),
-('2012-12-19', 'hu7b', ARRAY[5,14,15,21,23,33,35]),
-('2012-12-12', 'hu7b', ARRAY[3,9,15,26,28,33,35]),
-('2012-12-05', 'hu7b', ARRAY[6,7,11,19,22,26,28]),
-('2012-11-28', 'hu7b', ARRAY[3,6,16,20,21,24,31]),
-('2012-11-21', 'hu7b', ARRAY[5,16,20,22,25,27,30]),
-('2012-11-14', 'hu7b', ARRAY[1,2,4,8,27,30,33]),
-('2012-11-07', 'hu7b', ARRAY[3,5,6,11,14,15,19]),
-('2012-10-31', 'hu7b', ARRAY[4,9,13,15,16,22,23]),
-('2012-10-24', 'hu7b', ARRAY[6,8,12,13,19,30,35]),
-('2012-10-17', 'hu7b', ARRAY[2,3,8,14,17,19,21]),
-('2012-10-10', 'hu7b', ARRAY[5,7,14,17,27,32,34]),
-('2012-10-03', 'hu7b', ARRAY[1,7,21,23,28,31,32]),
-('2012-09-26', 'hu7b', ARRAY[4,10,15,22,23,26,34]),
-('2012-09-19', 'hu7b', ARRAY[6,18,24,25,28,29,30]),
-('2012-09-12', 'hu7b', ARRAY[7,14,15,29,31,33,34]),
-('2012-09-05', 'hu7b', ARRAY[3,15,16,18,24,26,33]),
-('2012-08-29', 'hu7b', ARRAY[8,13,23,24,25,26,29]),
-('2012-08-22', 'hu7b', ARRAY[2,3,8,11,13,20,24]),
-('2012-08-15', 'hu7b', ARRAY[9,11,12,23,25,30,33]),
-('2012-08-08', 'hu7b', ARRAY[7,15,16,21,23,26,31]),
-('2012-08-01', 'hu7b', ARRAY[2,5,6,13,15,27,34]),
-('2012-07-25', 'hu7b', ARRAY[4,6,9,16,20,27,32]),
-('2012-07-18', 'hu7b', ARRAY[5,12,13,14,21,27,29]),
-('2012-07-11', 'hu7b', ARRAY[7,11,12,15,16,17,25]),
-('2012-07-04', 'hu7b', ARRAY[1,5,12,15,18,21,35]),
-('2012-06-27', 'hu7b', ARRAY[1,5,6,9,19,31,32]),
-('2012-06-20', 'hu7b', ARRAY[2,8,9,18,25,26,32]),
-('2012-06-13', 'hu7b', ARRAY[4,12,15,17,26,32,33]),
-('2012-06-06', 'hu7b', ARRAY[2,3,5,6,11,32,33]),
-('2012-05-30', 'hu7b', ARRAY[3,10,14,16,25,32,33]),
-('2012-05-23', 'hu7b', ARRAY[4,9,14,17,19,25,26]),
-('2012-05-16', 'hu7b', ARRAY[3,8,10,16,29,30,32]),
-('2012-05-09', 'hu7b', ARRAY[14,18,20,21,22,31,35]),
-('2012-05-02', 'hu7b', ARRAY[11,19,23,27,30,32,34]),
-('2012-04-25', 'hu7b', ARRAY[1,8,11,13,24,25,26]),
-('2012-04-18', 'hu7b', ARRAY[3,17,22,26,27,29,35]),
-('2012-04-11', 'hu7b', ARRAY[12,17,20,28,32,33,35]),
-('2012-04-04', 'hu7b', ARRAY[1,7,8,13,24,32,35]),
-('2012-03-28', 'hu7b', ARRAY[1,3,6,8,16,21,28]),
-('2012-03-21', 'hu7b', ARRAY[14,20,22,23,24,27,32]),
-('2012-03-14', 'hu7b', ARRAY[5,10,14,15,16,26,28]),
-('2012-03-07', 'hu7b', ARRAY[2,3,8,15,18,19,21]),
-('2012-02-29', 'hu7b', ARRAY[4,5,7,13,19,33,34]),
-('2012-02-22', 'hu7b', ARRAY[12,15,16,20,23,24,33]),
-('2012-02-15', 'hu7b', ARRAY[1,9,15,24,25,31,32]),
-('2012-02-08', 'hu7b', ARRAY[1,7,14,26,27,31,33]),
-('2012-02-01', 'hu7b', ARRAY[2,19,20,26,29,30,35]),
-('2012-01-25', 'hu7b', ARRAY[2,3,4,8,16,25,29]),
-('2012-01-18', 'hu7b', ARRAY[13,14,25,31,32,33,34]),
-('2012-01-11', 'hu7b', ARRAY[8,9,10,13,19,23,25]),
-('2012-01-04', 'hu7b', ARRAY[4,8,11,13,24,30,34]),
-('2011-12-28', 'hu7b', ARRAY[1,15,20,30,31,32,35]),
-('2011-12-21', 'hu7b', ARRAY[2,5,9,20,23,31,32]),
-('2011-12-14', 'hu7b', ARRAY[4,5,7,13,16,20,26]),
-('2011-12-07', 'hu7b', ARRAY[3,14,16,20,21,24,28]),
-('2011-11-30', 'hu7b', ARRAY[5,7,14,19,22,28,29]),
-('2011-11-23', 'hu7b', ARRAY[4,8,9,14,20,23,31]),
-('2011-11-16', 'hu7b', ARRAY[3,6,23,24,31,32,33]),
-('2011-11-09', 'hu7b', ARRAY[3,11,12,14,28,31,32]),
-('2011-11-02', 'hu7b', ARRAY[1,15,20,23,24,27,29]),
-('2011-10-26', 'hu7b', ARRAY[5,7,8,12,13,17,20]),
-('2011-10-19', 'hu7b', ARRAY[6,7,13,18,25,27,29]),
-('2011-10-12', 'hu7b', ARRAY[3,8,14,23,27,28,34]),
-('2011-10-05', 'hu7b', ARRAY[7,23,24,29,30,31,33]),
-('2011-09-28', 'hu7b', ARRAY[11,18,22,24,25,27,31]),
-('2011-09-21', 'hu7b', ARRAY[7,8,16,19,21,22,30]),
-('2011-09-14', 'hu7b', ARRAY[1,3,9,13,23,34,35]),
-('2011-09-07', 'hu7b', ARRAY[10,18,23,24,28,29,32]),
-('2011-08-31', 'hu7b', ARRAY[9,11,13,15,23,27,28]),
-('2011-08-24', 'hu7b', ARRAY[16,18,21,26,29,30,33]),
-('2011-08-17', 'hu7b', ARRAY[1,4,9,14,23,24,30]),
-('2011-08-10', 'hu7b', ARRAY[5,7,9,11,12,21,30]),
-('2011-08-03', 'hu7b', ARRAY[5,17,20,24,25,30,32]),
-('2011-07-27', 'hu7b', ARRAY[4,6,8,11,23,29,31]),
-('2011-07-20', 'hu7b', ARRAY[7,13,14,25,28,32,35]),
-('2011-07-13', 'hu7b', ARRAY[7,16,21,22,26,31,33]),
-('2011-07-06', 'hu7b', ARRAY[17,18,22,25,27,30,33]),
-('2011-06-29', 'hu7b', ARRAY[2,4,10,20,27,32,33]),
-('2011-06-22', 'hu7b', ARRAY[7,9,16,18,22,27,35]),
-('2011-06-15', 'hu7b', ARRAY[3,4,9,26,30,32,34]),
-('2011-06-08', 'hu7b', ARRAY[7,11,12,14,22,27,29]),
-('2011-06-01', 'hu7b', ARRAY[2,7,8,16,23,25,33]),
-('2011-05-25', 'hu7b', ARRAY[9,14,15,16,30,34,35]),
-('2011-05-18', 'hu7b', ARRAY[4,7,10,11,20,23,29]),
-('2011-05-11', 'hu7b', ARRAY[2,4,6,9,19,25,27]),
-('2011-05-04', 'hu7b', ARRAY[3,4,10,15,20,25,28]),
-('2011-04-27', 'hu7b', ARRAY[2,4,15,21,28,31,35]),
-('2011-04-20', 'hu7b', ARRAY[6,18,25,28,30,33,34]),
-('2011-04-13', 'hu7b', ARRAY[1,13,17,22,29,31,34]),
-('2011-04-06', 'hu7b', ARRAY[3,12,15,19,21,25,30]),
-('2011-03-30', 'hu7b', ARRAY[2,6,11,13,19,22,23]),
-('2011-03-23', 'hu7b', ARRAY[2,10,21,23,24,30,33]),
-('2011-03-16', 'hu7b', ARRAY[3,10,11,23,25,27,31]),
-('2011-03-09', 'hu7b', ARRAY[4,14,17,23,24,26,35]),
-('2011-03-02', 'hu7b', ARRAY[4,13,14,19,23,28,31]),
-('2011-02-23', 'hu7b', ARRAY[3,6,7,8,18,29,33]),
-('2011-02-16', 'hu7b', ARRAY[4,6,9,12,20,27,32]),
-('2011-02-09', 'hu7b', ARRAY[6,11,21,26,28,31,32]),
-('2011-02-02', 'hu7b', ARRAY[12,15,17,18,19,21,24]),
-('2011-01-26', 'hu7b', ARRAY[12,20,22,26,30,32,35]),
-('2011-01-19', 'hu7b', ARRAY[4,10,12,22,23,24,35]),
-('2011-01-12', 'hu7b', ARRAY[2,10,22,27,30,34,35]),
-('2011-01-05', 'hu7b', ARRAY[2,5,17,21,23,27,35]),
-('2010-12-29', 'hu7b', ARRAY[1,12,15,17,19,23,29]),
-('2010-12-22', 'hu7b', ARRAY[3,12,13,18,26,30,32]),
-('2010-12-15', 'hu7b', ARRAY[6,8,10,25,29,32,33]),
-('2010-12-08', 'hu7b', ARRAY[14,15,20,21,24,25,28]),
-('2010-12-01', 'hu7b', ARRAY[1,18,20,25,27,33,35]),
-('2010-11-24', 'hu7b', ARRAY[1,2,8,9,12,14,34]),
-('2010-11-17', 'hu7b', ARRAY[4,8,13,18,20,27,30]),
-('2010-11-10', 'hu7b', ARRAY[3,7,13,20,21,27,32]),
-('2010-11-03', 'hu7b', ARRAY[7,11,12,19,23,26,29]),
-('2010-10-27', 'hu7b', ARRAY[6,8,13,14,18,28,34]),
-('2010-10-20', 'hu7b', ARRAY[14,16,18,20,21,30,31]),
-('2010-10-13', 'hu7b', ARRAY[6,7,17,21,22,30,31]),
-('2010-10-06', 'hu7b', ARRAY[3,4,13,16,21,25,33]),
-('2010-09-29', 'hu7b', ARRAY[7,10,15,18,19,31,35]),
-('2010-09-22', 'hu7b', ARRAY[9,11,13,15,20,27,35]),
-('2010-09-15', 'hu7b', ARRAY[3,7,9,19,20,21,28]),
-('2010-09-08', 'hu7b', ARRAY[1,6,12,20,23,26,30]),
-('2010-09-01', 'hu7b', ARRAY[1,10,17,20,23,32,33]),
-('2010-08-25', 'hu7b', ARRAY[4,13,14,25,26,29,31]),
-('2010-08-18', 'hu7b', ARRAY[10,11,13,19,20,21,30]),
-('2010-08-11', 'hu7b', ARRAY[3,12,14,15,16,22,34]),
-('2010-08-04', 'hu7b', ARRAY[1,6,7,11,25,26,31]),
-('2010-07-28', 'hu7b', ARRAY[1,5,16,22,28,30,31]),
-('2010-07-21', 'hu7b', ARRAY[2,5,7,10,13,19,27]),
-('2010-07-14', 'hu7b', ARRAY[1,4,9,11,22,31,32]),
-('2010-07-07', 'hu7b', ARRAY[5,8,10,16,18,29,34]),
-('2010-06-30', 'hu7b', ARRAY[1,5,6,14,23,24,35]),
-('2010-06-23', 'hu7b', ARRAY[1,2,3,26,28,34,35]),
-('2010-06-16', 'hu7b', ARRAY[6,10,12,15,23,26,29]),
-('2010-06-09', 'hu7b', ARRAY[11,14,19,21,30,31,32]),
-('2010-06-02', 'hu7b', ARRAY[2,7,12,17,18,29,32]),
-('2010-05-26', 'hu7b', ARRAY[1,5,7,10,22,33,34]),
-('2010-05-19', 'hu7b', ARRAY[1,20,23,24,28,30,35]),
-('2010-05-12', 'hu7b', ARRAY[4,6,7,16,18,25,34]),
-('2010-05-05', 'hu7b', ARRAY[4,8,19,23,27,32,33]),
-('2010-04-28', 'hu7b', ARRAY[17,21,24,26,28,30,33]),
-('2010-04-21', 'hu7b', ARRAY[1,3,6,10,11,22,32]),
-('2010-04-14', 'hu7b', ARRAY[13,23,25,30,31,33,34]),
-('2010-04-07', 'hu7b', ARRAY[6,8,10,12,14,30,33]),
-('2010-03-31', 'hu7b', ARRAY[4,13,18,27,31,33,35]),
-('2010-03-24', 'hu7b', ARRAY[1,4,12,17,28,31,34]),
-('2010-03-17', 'hu7b', ARRAY[5,8,16,24,27,32,34]),
-('2010-03-10', 'hu7b', ARRAY[1,5,6,12,13,20,31]),
-('2010-03-03', 'hu7b', ARRAY[4,7,11,13,14,26,33]),
-('2010-02-24', 'hu7b', ARRAY[12,14,17,19,26,31,34]),
-('2010-02-17', 'hu7b', ARRAY[8,10,13,21,22,29,32]),
-('2010-02-10', 'hu7b', ARRAY[6,17,20,24,25,28,31]),
-('2010-02-03', 'hu7b', ARRAY[2,14,20,21,22,26,32]),
-('2010-01-27', 'hu7b', ARRAY[1,4,14,19,22,29,31]),
-('2010-01-20', 'hu7b', ARRAY[5,10,12,21,23,25,26]),
-('2010-01-13', 'hu7b', ARRAY[2,10,11,23,27,31,34]),
-('2010-01-06', 'hu7b', ARRAY[4,5,7,18,21,24,25]),
-('2009-12-30', 'hu7b', ARRAY[5,12,14,22,26,28,34]),
-('2009-12-23', 'hu7b', ARRAY[3,6,9,11,15,18,25]),
-('2009-12-16', 'hu7b', ARRAY[5,7,8,12,26,30,32]),
-('2009-12-09', 'hu7b', ARRAY[2,3,6,18,24,33,34]),
-('2009-12-02', 'hu7b', ARRAY[9,12,13,14,23,28,35]),
-('2009-11-25', 'hu7b', ARRAY[12,13,14,16,25,27,28]),
-('2009-11-18', 'hu7b', ARRAY[13,18,20,22,32,33,34]),
-('2009-11-11', 'hu7b', ARRAY[7,11,16,20,22,24,34]),
-('2009-11-04', 'hu7b', ARRAY[4,10,17,19,24,28,35]),
-('2009-10-28', 'hu7b', ARRAY[3,6,7,8,9,17,32]),
-('2009-10-21', 'hu7b', ARRAY[7,8,19,21,22,25,33]),
-('2009-10-14', 'hu7b', ARRAY[11,18,19,21,23,31,34]),
-('2009-10-07', 'hu7b', ARRAY[3,4,7,8,29,30,35]),
-('2009-09-30', 'hu7b', ARRAY[1,5,6,7,9,10,19]),
-('2009-09-23', 'hu7b', ARRAY[10,11,26,27,32,34,35]),
-('2009-09-16', 'hu7b', ARRAY[1,4,8,18,22,24,26]),
-('2009-09-09', 'hu7b', ARRAY[4,8,9,13,18,23,28]),
-('2009-09-02', 'hu7b', ARRAY[6,11,12,13,20,33,35]),
-('2009-08-26', 'hu7b', ARRAY[2,5,8,9,12,15,27]),
-('2009-08-19', 'hu7b', ARRAY[2,9,25,29,31,32,34]),
-('2009-08-12', 'hu7b', ARRAY[2,10,11,19,25,28,34]),
-('2009-08-05', 'hu7b', ARRAY[1,18,19,20,32,33,35]),
-('2009-07-29', 'hu7b', ARRAY[3,4,18,22,25,29,32]),
-('2009-07-22', 'hu7b', ARRAY[4,5,8,10,13,22,24]),
-('2009-07-15', 'hu7b', ARRAY[1,13,19,23,26,28,31]),
-('2009-07-08', 'hu7b', ARRAY[1,5,11,18,26,27,29]),
-('2009-07-01', 'hu7b', ARRAY[4,14,21,27,28,29,35]),
-('2009-06-24', 'hu7b', ARRAY[10,13,19,24,26,28,30]),
-('2009-06-17', 'hu7b', ARRAY[10,12,13,19,21,25,30]),
-('2009-06-10', 'hu7b', ARRAY[1,9,22,24,26,30,35]),
-('2009-06-03', 'hu7b', ARRAY[4,7,8,14,16,28,34]),
-('2009-05-27', 'hu7b', ARRAY[6,8,10,11,18,20,25]),
-('2009-05-20', 'hu7b', ARRAY[3,7,13,16,17,18,33]),
-('2009-05-13', 'hu7b', ARRAY[5,6,13,18,28,30,31]),
-('2009-05-06', 'hu7b', ARRAY[7,16,17,24,29,34,35]),
-('2009-04-29', 'hu7b', ARRAY[2,7,10,15,25,26,32]),
-('2009-04-22', 'hu7b', ARRAY[4,8,9,10,13,23,31]),
-('2009-04-15', 'hu7b', ARRAY[3,7,9,12,15,17,35]),
-('2009-04-08', 'hu7b', ARRAY[5,15,28,32,33,34,35]),
-('2009-04-01', 'hu7b', ARRAY[12,15,19,20,21,24,31]),
-('2009-03-25', 'hu7b', ARRAY[5,8,11,13,21,22,23]),
-('2009-03-18', 'hu7b', ARRAY[14,18,19,21,22,34,35]),
-('2009-03-11', 'hu7b', ARRAY[8,9,11,14,15,21,33]),
-('2009-03-04', 'hu7b', ARRAY[6,20,23,24,25,29,33]),
-('2009-02-25', 'hu7b', ARRAY[6,13,16,21,24,26,34]),
-('2009-02-18', 'hu7b', ARRAY[1,2,4,14,16,23,29]),
-('2009-02-11', 'hu7b', ARRAY[1,5,11,13,17,26,28]),
-('2009-02-04', 'hu7b', ARRAY[1,4,6,10,12,30,31]),
-('2009-01-28', 'hu7b', ARRAY[3,7,9,10,15,17,18]),
-('2009-01-21', 'hu7b', ARRAY[7,10,11,14,15,20,25]),
-('2009-01-14', 'hu7b', ARRAY[4,9,14,16,32,33,34]),
-('2009-01-07', 'hu7b', ARRAY[1,9,13,14,18,24,34]),
-('2008-12-31', 'hu7b', ARRAY[2,3,6,16,27,28,29]),
-('2008-12-24', 'hu7b', ARRAY[3,5,15,20,24,27,35]),
-('2008-12-17', 'hu7b', ARRAY[5,13,14,17,21,24,25]),
-('2008-12-10', 'hu7b', ARRAY[2,4,6,8,12,18,32]),
-('2008-12-03', 'hu7b', ARRAY[6,10,16,18,21,28,31]),
-('2008-11-26', 'hu7b', ARRAY[1,3,4,15,23,26,28]),
-('2008-11-19', 'hu7b', ARRAY[2,3,9,10,12,14,18]),
-('2008-11-12', 'hu7b', ARRAY[2,5,8,11,13,18,20]),
-('2008-11-05', 'hu7b', ARRAY[1,4,6,14,18,25,28]),
-('2008-10-29', 'hu7b', ARRAY[5,6,11,14,19,20,29]),
-('2008-10-22', 'hu7b', ARRAY[9,10,13,14,17,24,29]),
-('2008-10-15', 'hu7b', ARRAY[7,8,9,11,22,29,35]),
-('2008-10-08', 'hu7b', ARRAY[4,11,13,22,28,29,33]),
-('2008-10-01', 'hu7b', ARRAY[3,5,14,16,18,24,27]),
-('2008-09-24', 'hu7b', ARRAY[4,6,9,13,25,32,33]),
-('2008-09-17', 'hu7b', ARRAY[7,10,13,16,31,32,33]),
-('2008-09-10', 'hu7b', ARRAY[1,5,8,10,15,17,26]),
-('2008-09-03', 'hu7b', ARRAY[1,5,9,19,23,26,34]),
-('2008-08-27', 'hu7b', ARRAY[9,14,16,18,20,25,30]),
-('2008-08-21', 'hu7b', ARRAY[5,8,13,23,25,26,27]),
-('2008-08-13', 'hu7b', ARRAY[4,9,12,17,19,22,31]),
-('2008-08-06', 'hu7b', ARRAY[9,14,17,18,26,31,35]),
-('2008-07-30', 'hu7b', ARRAY[8,13,24,26,31,33,34]),
-('2008-07-23', 'hu7b', ARRAY[6,8,12,16,21,29,31]),
-('2008-07-16', 'hu7b', ARRAY[6,7,15,20,22,29,32]),
-('2008-07-09', 'hu7b', ARRAY[5,10,12,19,21,34,35]),
-('2008-07-02', 'hu7b', ARRAY[8,9,10,14,22,24,30]),
-('2008-06-25', 'hu7b', ARRAY[2,4,10,12,13,14,21]),
-('2008-06-18', 'hu7b', ARRAY[3,4,15,17,20,23,24]),
-('2008-06-11', 'hu7b', ARRAY[6,13,16,19,22,30,31]),
-('2008-06-04', 'hu7b', ARRAY[3,10,14,18,30,33,35]),
-('2008-05-28', 'hu7b', ARRAY[4,6,15,18,25,28,33]),
-('2008-05-21', 'hu7b', ARRAY[3,7,12,17,23,28,29]),
-('2008-05-14', 'hu7b', ARRAY[1,13,18,19,23,28,29]),
-('2008-05-07', 'hu7b', ARRAY[5,6,7,15,21,30,33]),
-('2008-04-30', 'hu7b', ARRAY[2,4,13,15,22,32,33]),
-('2008-04-23', 'hu7b', ARRAY[1,5,8,11,17,23,35]),
-('2008-04-16', 'hu7b', ARRAY[9,12,17,19,30,32,34]),
-('2008-04-09', 'hu7b', ARRAY[4,9,11,17,19,25,31]),
-('2008-04-02', 'hu7b', ARRAY[6,9,11,16,23,25,28]),
-('2008-03-26', 'hu7b', ARRAY[8,11,15,16,20,33,34]),
-('2008-03-19', 'hu7b', ARRAY[1,7,11,17,26,29,31]),
-('2008-03-12', 'hu7b', ARRAY[8,11,19,20,23,28,33]),
-('2008-03-05', 'hu7b', ARRAY[3,5,6,13,16,27,30]),
-('2008-02-27', 'hu7b', ARRAY[4,5,7,8,9,24,32]),
-('2008-02-20', 'hu7b', ARRAY[8,18,20,21,25,33,34]),
-('2008-02-13', 'hu7b', ARRAY[7,9,11,16,18,26,32]),
-('2008-02-06', 'hu7b', ARRAY[2,8,15,23,29,34,35]),
-('2008-01-30', 'hu7b', ARRAY[11,19,21,29,30,33,34]),
-('2008-01-23', 'hu7b', ARRAY[7,12,21,24,29,33,35]),
-('2008-01-16', 'hu7b', ARRAY[2,9,23,29,30,33,34]),
-('2008-01-09', 'hu7b', ARRAY[1,4,11,17,26,29,33]),
-('2008-01-02', 'hu7b', ARRAY[10,13,16,20,24,25,33]),
-('2007-12-27', 'hu7b', ARRAY[6,10,12,20,23,24,28]),
-('2007-12-19', 'hu7b', ARRAY[2,3,15,17,22,25,29]),
-('2007-12-12', 'hu7b', ARRAY[4,15,19,21,25,27,35]),
-('2007-12-05', 'hu7b', ARRAY[9,11,14,22,26,31,35]),
-('2007-11-28', 'hu7b', ARRAY[3,8,10,17,19,31,32]),
-('2007-11-21', 'hu7b', ARRAY[4,5,7,13,18,19,29]),
-('2007-11-14', 'hu7b', ARRAY[3,4,5,7,18,26,30]),
-('2007-11-07', 'hu7b', ARRAY[4,7,8,12,20,26,33]),
-('2007-10-31', 'hu7b', ARRAY[2,5,11,15,19,21,33]),
-('2007-10-24', 'hu7b', ARRAY[3,8,10,19,28,29,34]),
-('2007-10-17', 'hu7b', ARRAY[9,20,22,24,27,29,35]),
-('2007-10-10', 'hu7b', ARRAY[8,9,17,21,24,30,31]),
-('2007-10-03', 'hu7b', ARRAY[1,3,4,10,14,26,29]),
-('2007-09-26', 'hu7b', ARRAY[1,13,19,25,28,32,33]),
-('2007-09-19', 'hu7b', ARRAY[8,9,16,23,26,28,33]),
-('2007-09-12', 'hu7b', ARRAY[5,6,7,8,24,27,28]),
-('2007-09-05', 'hu7b', ARRAY[6,7,16,21,22,24,34]),
-('2007-08-29', 'hu7b', ARRAY[2,10,13,17,20,29,31]),
-('2007-08-22', 'hu7b', ARRAY[1,3,6,7,10,17,27]),
-('2007-08-15', 'hu7b', ARRAY[4,6,8,19,20,21,30]),
-('2007-08-08', 'hu7b', ARRAY[4,5,7,11,12,16,30]),
-('2007-08-01', 'hu7b', ARRAY[2,11,14,19,28,32,33]),
-('2007-07-25', 'hu7b', ARRAY[6,8,12,14,18,21,34]),
-('2007-07-18', 'hu7b', ARRAY[6,9,21,25,26,31,35]),
-('2007-07-11', 'hu7b', ARRAY[4,12,14,27,32,33,35]),
-('2007-07-04', 'hu7b', ARRAY[2,8,11,14,15,19,22]),
-('2007-06-27', 'hu7b', ARRAY[1,5,9,11,13,14,33]),
-('2007-06-20', 'hu7b', ARRAY[3,7,9,16,28,29,33]),
-('2007-06-13', 'hu7b', ARRAY[3,8,9,15,25,31,35]),
-('2007-06-06', 'hu7b', ARRAY[7,8,21,22,27,28,32]),
-('2007-05-30', 'hu7b', ARRAY[3,16,20,22,26,27,28]),
-('2007-05-23', 'hu7b', ARRAY[4,9,14,22,26,28,35]),
-('2007-05-16', 'hu7b', ARRAY[7,11,20,26,27,28,32]),
-('2007-05-09', 'hu7b', ARRAY[3,13,20,24,27,30,33]),
-('2007-05-02', 'hu7b', ARRAY[3,16,21,24,25,32,33]),
-('2007-04-25', 'hu7b', ARRAY[4,8,12,22,26,28,33]),
-('2007-04-18', 'hu7b', ARRAY[1,3,4,5,7,11,35]),
-('2007-04-11', 'hu7b', ARRAY[5,8,19,24,25,31,33]),
-('2007-04-04', 'hu7b', ARRAY[1,3,5,6,13,25,28]),
-('2007-03-28', 'hu7b', ARRAY[1,8,9,11,23,24,28]),
-('2007-03-21', 'hu7b', ARRAY[1,18,24,31,32,33,34]),
-('2007-03-14', 'hu7b', ARRAY[1,3,16,17,18,26,32]),
-('2007-03-07', 'hu7b', ARRAY[15,23,24,28,29,32,35]),
-('2007-02-28', 'hu7b', ARRAY[1,2,7,15,16,19,20]),
-('2007-02-21', 'hu7b', ARRAY[6,9,12,16,17,28,32]),
-('2007-02-14', 'hu7b', ARRAY[1,8,11,14,17,25,28]),
-('2007-02-07', 'hu7b', ARRAY[7,9,18,22,24,29,34]),
-('2007-01-31', 'hu7b', ARRAY[3,11,14,16,22,30,35]),
-('2007-01-24', 'hu7b', ARRAY[13,18,19,22,24,31,34]),
-('2007-01-17', 'hu7b', ARRAY[1,17,25,27,30,31,34]),
-('2007-01-10', 'hu7b', ARRAY[5,6,7,10,11,15,25]),
-('2007-01-03', 'hu7b', ARRAY[5,6,8,20,27,33,35]),
-('2006-12-27', 'hu7b', ARRAY[3,11,12,13,19,26,28]),
-('2006-12-20', 'hu7b', ARRAY[8,12,20,26,28,29,35]),
-('2006-12-13', 'hu7b', ARRAY[1,8,11,14,18,26,30]),
-('2006-12-06', 'hu7b', ARRAY[3,7,8,9,15,23,32]),
-('2006-11-29', 'hu7b', ARRAY[1,3,8,16,26,27,33]),
-('2006-11-22', 'hu7b', ARRAY[3,7,10,11,21,29,34]),
-('2006-11-15', 'hu7b', ARRAY[5,8,17,25,26,27,32]),
-('2006-11-08', 'hu7b', ARRAY[9,14,17,19,29,33,35]),
-('2006-11-02', 'hu7b', ARRAY[18,20,22,23,28,32,33]),
-('2006-10-25', 'hu7b', ARRAY[3,9,23,25,26,30,35]),
-('2006-10-18', 'hu7b', ARRAY[4,5,14,18,20,21,34]),
-('2006-10-11', 'hu7b', ARRAY[12,13,14,17,22,30,34]),
-('2006-10-04', 'hu7b', ARRAY[1,3,8,17,18,22,31]),
-('2006-09-27', 'hu7b', ARRAY[3,6,13,19,21,23,27]),
-('2006-09-20', 'hu7b', ARRAY[11,13,20,22,24,31,33]),
-('2006-09-13', 'hu7b', ARRAY[4,5,11,19,20,25,31]),
-('2006-09-06', 'hu7b', ARRAY[1,9,10,15,18,27,34]),
-('2006-08-30', 'hu7b', ARRAY[4,6,14,18,20,27,34]),
-('2006-08-23', 'hu7b', ARRAY[2,7,9,15,21,29,33]),
-('2006-08-16', 'hu7b', ARRAY[13,19,20,22,24,27,35]),
-('2006-08-09', 'hu7b', ARRAY[6,12,14,16,18,20,21]),
-('2006-08-02', 'hu7b', ARRAY[2,8,9,13,16,20,31]),
-('2006-07-26', 'hu7b', ARRAY[13,14,15,18,28,29,31]),
-('2006-07-19', 'hu7b', ARRAY[5,7,9,13,32,33,35]),
-('2006-07-12', 'hu7b', ARRAY[5,8,10,12,16,34,35]),
-('2006-07-05', 'hu7b', ARRAY[6,10,15,18,20,29,31]),
-('2006-06-28', 'hu7b', ARRAY[8,9,19,24,26,27,28]),
-('2006-06-21', 'hu7b', ARRAY[14,16,22,23,26,30,34]),
-('2006-06-14', 'hu7b', ARRAY[2,8,11,14,18,20,21]),
-('2006-06-07', 'hu7b', ARRAY[5,13,16,17,19,27,29]),
-('2006-05-31', 'hu7b', ARRAY[1,5,10,13,18,22,25]),
-('2006-05-24', 'hu7b', ARRAY[7,15,19,22,23,25,29]),
-('2006-05-17', 'hu7b', ARRAY[2,7,8,15,16,30,31]),
-('2006-05-10', 'hu7b', ARRAY[3,6,10,19,25,29,32]),
-('2006-05-03', 'hu7b', ARRAY[2,6,13,14,21,28,34]),
-('2006-04-26', 'hu7b', ARRAY[3,14,17,20,22,28,30]),
-('2006-04-19', 'hu7b', ARRAY[6,12,18,19,20,25,30]),
-('2006-04-12', 'hu7b', ARRAY[1,7,14,15,16,28,33]),
-('2006-04-05', 'hu7b', ARRAY[1,6,7,9,17,21,23]),
-('2006-03-29', 'hu7b', ARRAY[5,11,15,23,25,31,32]),
-('2006-03-22', 'hu7b', ARRAY[3,9,12,25,27,32,33]),
-('2006-03-16', 'hu7b', ARRAY[13,15,17,26,29,33,35]),
-('2006-03-08', 'hu7b', ARRAY[6,8,10,15,23,26,33]),
-('2006-03-01', 'hu7b', ARRAY[2,5,12,13,28,34,35]),
-('2006-02-22', 'hu7b', ARRAY[1,2,9,17,30,33,34]),
-('2006-02-15', 'hu7b', ARRAY[7,9,15,20,23,26,31]),
-('2006-02-08', 'hu7b', ARRAY[1,7,18,24,26,28,30]),
-('2006-02-01', 'hu7b', ARRAY[4,7,8,20,25,32,34]),
-('2006-01-25', 'hu7b', ARRAY[1,4,6,7,12,23,31]),
-('2006-01-18', 'hu7b', ARRAY[6,10,11,17,19,29,31]),
-('2006-01-11', 'hu7b', ARRAY[2,4,11,13,15,16,31]),
-('2006-01-04', 'hu7b', ARRAY[2,12,13,15,17,20,21]),
-('2005-12-28', 'hu7b', ARRAY[1,8,10,16,19,23,35]),
-('2005-12-21', 'hu7b', ARRAY[2,3,11,23,27,28,30]),
-('2005-12-14', 'hu7b', ARRAY[18,19,20,26,27,32,35]),
-('2005-12-07', 'hu7b', ARRAY[6,14,15,23,26,33,35]),
-('2005-11-30', 'hu7b', ARRAY[3,8,15,16,20,24,32]),
-('2005-11-23', 'hu7b', ARRAY[2,6,8,17,19,23,33]),
-('2005-11-16', 'hu7b', ARRAY[5,11,22,24,25,28,30]),
-('2005-11-09', 'hu7b', ARRAY[1,2,5,7,8,14,30]),
-('2005-11-02', 'hu7b', ARRAY[6,10,11,14,24,29,34]),
-('2005-10-26', 'hu7b', ARRAY[9,14,16,22,23,29,35]),
-('2005-10-19', 'hu7b', ARRAY[1,13,15,22,33,34,35]),
-('2005-10-12', 'hu7b', ARRAY[1,14,16,19,33,34,35]),
-('2005-10-05', 'hu7b', ARRAY[2,3,5,14,18,22,33]),
-('2005-09-28', 'hu7b', ARRAY[17,19,20,30,32,33,34]),
-('2005-09-21', 'hu7b', ARRAY[4,6,9,11,18,24,27]),
-('2005-09-14', 'hu7b', ARRAY[4,5,11,18,20,28,35]),
-('2005-09-07', 'hu7b', ARRAY[14,15,18,22,25,32,33]),
-('2005-08-31', 'hu7b', ARRAY[3,10,13,15,23,29,30]),
-('2005-08-24', 'hu7b', ARRAY[1,2,4,5,18,31,33]),
-('2005-08-17', 'hu7b', ARRAY[3,5,11,22,29,32,33]),
-('2005-08-10', 'hu7b', ARRAY[8,12,13,15,19,25,35]),
-('2005-08-03', 'hu7b', ARRAY[1,2,12,18,19,23,29]),
-('2005-07-27', 'hu7b', ARRAY[6,7,13,16,19,29,32]),
-('2005-07-20', 'hu7b', ARRAY[5,6,16,20,21,32,35]),
-('2005-07-13', 'hu7b', ARRAY[6,8,14,26,28,32,35]),
-('2005-07-06', 'hu7b', ARRAY[5,9,15,20,25,30,32]),
-('2005-06-29', 'hu7b', ARRAY[3,9,10,17,18,31,35]),
-('2005-06-22', 'hu7b', ARRAY[1,3,5,8,23,28,32]),
-('2005-06-15', 'hu7b', ARRAY[1,5,14,15,22,34,35]),
-('2005-06-08', 'hu7b', ARRAY[5,6,18,19,28,31,35]),
-('2005-06-01', 'hu7b', ARRAY[2,5,9,20,27,29,33]),
-('2005-05-25', 'hu7b', ARRAY[6,7,13,16,18,26,32]),
-('2005-05-18', 'hu7b', ARRAY[2,7,13,14,16,19,21]),
-('2005-05-11', 'hu7b', ARRAY[3,6,10,16,17,20,22]),
-('2005-05-04', 'hu7b', ARRAY[3,7,12,13,22,30,33]),
-('2005-04-27', 'hu7b', ARRAY[7,10,14,15,27,32,35]),
-('2005-04-20', 'hu7b', ARRAY[15,21,22,24,27,28,30]),
-('2005-04-13', 'hu7b', ARRAY[4,10,11,13,14,18,27]),
-('2005-04-06', 'hu7b', ARRAY[1,8,19,24,26,28,31]),
-('2005-03-30', 'hu7b', ARRAY[7,9,11,18,19,22,30]),
-('2005-03-23', 'hu7b', ARRAY[6,8,12,16,29,34,35]),
-('2005-03-16', 'hu7b', ARRAY[2,6,8,13,24,28,31]),
-('2005-03-09', 'hu7b', ARRAY[14,21,25,26,28,29,33]),
-('2005-03-02', 'hu7b', ARRAY[6,10,17,23,28,29,30]),
-('2005-02-23', 'hu7b', ARRAY[8,14,17,18,19,30,31]),
-('2005-02-16', 'hu7b', ARRAY[2,5,10,17,24,30,32]),
-('2005-02-09', 'hu7b', ARRAY[1,2,6,16,24,26,31]),
-('2005-02-02', 'hu7b', ARRAY[2,4,6,26,29,30,34]),
-('2005-01-26', 'hu7b', ARRAY[4,6,7,8,26,28,30]),
-('2005-01-19', 'hu7b', ARRAY[4,6,8,18,24,26,34]),
-('2005-01-12', 'hu7b', ARRAY[6,7,13,16,17,27,34]),
-('2005-01-05', 'hu7b', ARRAY[2,7,9,17,23,24,29]),
-('2004-12-29', 'hu7b', ARRAY[3,5,11,22,26,27,32]),
-('2004-12-22', 'hu7b', ARRAY[6,8,18,19,29,30,34]),
-('2004-12-15', 'hu7b', ARRAY[6,14,19,22,23,25,33]),
-('2004-12-08', 'hu7b', ARRAY[1,4,5,11,18,26,32]),
-('2004-12-01', 'hu7b', ARRAY[4,7,15,19,23,33,35]),
-('2004-11-24', 'hu7b', ARRAY[2,3,9,14,19,27,34]),
-('2004-11-17', 'hu7b', ARRAY[1,2,8,14,19,22,35]),
-('2004-11-10', 'hu7b', ARRAY[12,13,27,30,31,33,34]),
-('2004-11-03', 'hu7b', ARRAY[13,20,23,26,29,30,35]),
-('2004-10-27', 'hu7b', ARRAY[9,17,18,21,27,28,31]),
-('2004-10-20', 'hu7b', ARRAY[5,6,9,10,22,24,34]),
-('2004-10-13', 'hu7b', ARRAY[1,11,12,13,15,28,31]),
-('2004-10-06', 'hu7b', ARRAY[4,6,18,25,27,32,34]),
-('2004-09-29', 'hu7b', ARRAY[3,5,8,14,15,20,25]),
-('2004-09-22', 'hu7b', ARRAY[1,7,9,13,17,22,31]),
-('2004-09-15', 'hu7b', ARRAY[14,16,18,20,22,27,35]),
-('2004-09-08', 'hu7b', ARRAY[16,19,20,23,29,34,35]),
-('2004-09-01', 'hu7b', ARRAY[6,7,9,11,16,25,33]),
-('2004-08-25', 'hu7b', ARRAY[5,7,8,16,22,31,32]),
-('2004-08-18', 'hu7b', ARRAY[6,7,14,25,26,29,32]),
-('2004-08-11', 'hu7b', ARRAY[10,12,15,17,18,20,35]),
-('2004-08-04', 'hu7b', ARRAY[10,11,14,20,21,27,35]),
-('2004-07-28', 'hu7b', ARRAY[4,7,8,11,12,31,32]),
-('2004-07-21', 'hu7b', ARRAY[5,9,10,13,14,33,35]),
-('2004-07-14', 'hu7b', ARRAY[3,6,13,14,26,30,31]),
-('2004-07-07', 'hu7b', ARRAY[7,9,13,20,21,22,27]),
-('2004-06-30', 'hu7b', ARRAY[5,14,15,20,22,23,24]),
-('2004-06-23', 'hu7b', ARRAY[8,17,19,20,28,29,30]),
-('2004-06-16', 'hu7b', ARRAY[3,4,16,21,25,27,35]),
-('2004-06-09', 'hu7b', ARRAY[3,9,11,12,14,18,20]),
-('2004-06-02', 'hu7b', ARRAY[9,18,19,27,30,34,35]),
-('2004-05-26', 'hu7b', ARRAY[2,6,10,17,30,31,35]),
-('2004-05-19', 'hu7b', ARRAY[6,10,19,20,21,27,29]),
-('2004-05-12', 'hu7b', ARRAY[1,3,8,14,21,24,25]),
-('2004-05-05', 'hu7b', ARRAY[5,6,21,22,28,29,31]),
-('2004-04-28', 'hu7b', ARRAY[2,15,16,26,28,32,35]),
-('2004-04-21', 'hu7b', ARRAY[1,16,17,21,27,31,32]),
-('2004-04-14', 'hu7b', ARRAY[1,8,11,14,16,21,30]),
-('2004-04-07', 'hu7b', ARRAY[4,14,21,25,30,31,33]),
-('2004-03-31', 'hu7b', ARRAY[4,7,21,24,28,32,33]),
-('2004-03-24', 'hu7b', ARRAY[3,7,8,10,12,14,17]),
-('2004-03-17', 'hu7b', ARRAY[1,4,6,11,13,30,33]),
-('2004-03-10', 'hu7b', ARRAY[2,4,17,20,22,28,35]),
-('2004-03-03', 'hu7b', ARRAY[2,7,14,23,24,31,32]),
-('2004-02-25', 'hu7b', ARRAY[4,19,23,24,27,32,35]),
-('2004-02-18', 'hu7b', ARRAY[1,2,11,24,30,32,34]),
-('2004-02-11', 'hu7b', ARRAY[5,12,17,22,27,30,31]),
-('2004-02-04', 'hu7b', ARRAY[1,11,14,24,26,27,30]),
-('2004-01-28', 'hu7b', ARRAY[1,2,3,4,16,18,32]),
-('2004-01-21', 'hu7b', ARRAY[3,7,23,25,30,31,33]),
-('2004-01-14', 'hu7b', ARRAY[7,9,10,15,20,28,30]),
-('2004-01-07', 'hu7b', ARRAY[3,12,13,14,20,21,31]),
-('2003-12-31', 'hu7b', ARRAY[7,9,18,21,24,29,32]),
-('2003-12-24', 'hu7b', ARRAY[4,15,18,20,21,25,32]),
-('2003-12-17', 'hu7b', ARRAY[1,6,9,12,14,19,31]),
-('2003-12-10', 'hu7b', ARRAY[7,16,25,29,30,31,35]),
-('2003-12-03', 'hu7b', ARRAY[2,11,14,15,21,23,26]),
-('2003-11-26', 'hu7b', ARRAY[6,9,17,19,21,29,34]),
-('2003-11-19', 'hu7b', ARRAY[1,4,5,6,10,17,30]),
-('2003-11-12', 'hu7b', ARRAY[5,6,9,10,11,13,25]),
-('2003-11-05', 'hu7b', ARRAY[2,4,10,12,23,28,32]),
-('2003-10-29', 'hu7b', ARRAY[6,13,18,25,26,32,33]),
-('2003-10-22', 'hu7b', ARRAY[2,3,9,12,23,25,27]),
-('2003-10-15', 'hu7b', ARRAY[1,2,8,9,10,16,23]),
-('2003-10-08', 'hu7b', ARRAY[2,4,9,11,16,19,29]),
-('2003-10-01', 'hu7b', ARRAY[8,9,13,15,16,26,35]),
-('2003-09-24', 'hu7b', ARRAY[3,6,21,27,28,30,33]),
-('2003-09-17', 'hu7b', ARRAY[3,7,8,20,21,26,35]),
-('2003-09-10', 'hu7b', ARRAY[4,8,10,19,28,33,34]),
-('2003-09-03', 'hu7b', ARRAY[3,4,14,24,30,34,35]),
-('2003-08-27', 'hu7b', ARRAY[1,7,9,12,21,26,30]),
-('2003-08-20', 'hu7b', ARRAY[10,14,23,30,31,33,35]),
-('2003-08-13', 'hu7b', ARRAY[2,3,5,12,22,26,35]),
-('2003-08-06', 'hu7b', ARRAY[6,13,16,18,19,20,34]),
-('2003-07-30', 'hu7b', ARRAY[1,10,17,21,25,27,29]),
-('2003-07-23', 'hu7b', ARRAY[9,15,16,21,25,31,34]),
-('2003-07-16', 'hu7b', ARRAY[3,11,12,17,24,29,33]),
-('2003-07-09', 'hu7b', ARRAY[10,17,19,22,25,30,34]),
-('2003-07-02', 'hu7b', ARRAY[4,7,15,17,18,26,27]),
-('2003-06-25', 'hu7b', ARRAY[1,6,7,14,20,21,33]),
-('2003-06-18', 'hu7b', ARRAY[3,8,9,13,17,22,23]),
-('2003-06-11', 'hu7b', ARRAY[1,7,17,18,29,30,33]),
-('2003-06-04', 'hu7b', ARRAY[4,10,12,13,17,18,34]),
-('2003-05-28', 'hu7b', ARRAY[2,5,10,15,19,28,32]),
-('2003-05-21', 'hu7b', ARRAY[5,10,13,17,20,26,32]),
-('2003-05-14', 'hu7b', ARRAY[3,13,16,18,22,28,35]),
-('2003-05-07', 'hu7b', ARRAY[10,12,14,25,27,31,34]),
-('2003-04-30', 'hu7b', ARRAY[3,4,7,13,20,32,33]),
-('2003-04-23', 'hu7b', ARRAY[1,2,8,9,11,29,33]),
-('2003-04-16', 'hu7b', ARRAY[11,12,15,22,28,29,34]),
-('2003-04-09', 'hu7b', ARRAY[1,10,15,17,26,29,31]),
-('2003-04-02', 'hu7b', ARRAY[4,5,10,14,22,31,33]),
-('2003-03-26', 'hu7b', ARRAY[1,4,10,19,25,30,35]),
-('2003-03-19', 'hu7b', ARRAY[2,5,7,15,18,33,35]),
-('2003-03-12', 'hu7b', ARRAY[3,9,10,11,16,22,26]),
-('2003-03-05', 'hu7b', ARRAY[1,20,22,25,27,28,32]),
-('2003-02-26', 'hu7b', ARRAY[5,14,15,18,20,22,25]),
-('2003-02-19', 'hu7b', ARRAY[10,13,14,17,18,27,32]),
-('2003-02-12', 'hu7b', ARRAY[2,12,13,14,16,20,21]),
-('2003-02-05', 'hu7b', ARRAY[2,12,22,23,28,29,31]),
-('2003-01-29', 'hu7b', ARRAY[3,9,17,19,22,28,34]),
-('2003-01-22', 'hu7b', ARRAY[14,16,17,21,27,29,31]),
-('2003-01-15', 'hu7b', ARRAY[1,2,9,16,20,25,32]),
-('2003-01-08', 'hu7b', ARRAY[1,3,7,20,28,32,33]),
-('2003-01-01', 'hu7b', ARRAY[1,8,12,18,21,28,30]),
-('2002-12-25', 'hu7b', ARRAY[6,12,19,20,22,24,25]),
-('2002-12-18', 'hu7b', ARRAY[6,8,11,13,14,21,23]),
-('2002-12-11', 'hu7b', ARRAY[1,3,12,15,27,30,34]),
-('2002-12-04', 'hu7b', ARRAY[2,11,14,15,18,25,27]),
-('2002-11-27', 'hu7b', ARRAY[4,10,14,19,21,31,34]),
-('2002-11-20', 'hu7b', ARRAY[14,15,17,21,27,31,34]),
-('2002-11-13', 'hu7b', ARRAY[4,6,14,25,26,27,29]),
-('2002-11-06', 'hu7b', ARRAY[3,5,8,10,14,24,26]),
-('2002-10-30', 'hu7b', ARRAY[1,8,11,20,26,32,33]),
-('2002-10-23', 'hu7b', ARRAY[2,3,12,15,17,22,26]),
-('2002-10-16', 'hu7b', ARRAY[5,18,24,26,28,30,35]),
-('2002-10-09', 'hu7b', ARRAY[2,7,8,21,22,30,31]),
-('2002-10-02', 'hu7b', ARRAY[8,12,15,16,21,31,33]),
-('2002-09-25', 'hu7b', ARRAY[2,5,10,21,22,32,35]),
-('2002-09-18', 'hu7b', ARRAY[1,2,6,8,15,25,31]),
-('2002-09-11', 'hu7b', ARRAY[7,10,11,22,25,27,29]),
-('2002-09-04', 'hu7b', ARRAY[19,20,22,27,30,34,35]),
-('2002-08-28', 'hu7b', ARRAY[4,5,8,15,18,24,26]),
-('2002-08-21', 'hu7b', ARRAY[2,5,7,9,10,21,25]),
-('2002-08-14', 'hu7b', ARRAY[1,5,7,9,26,30,33]),
-('2002-08-07', 'hu7b', ARRAY[8,19,21,22,25,33,35]),
-('2002-07-31', 'hu7b', ARRAY[1,4,21,25,27,30,35]),
-('2002-07-24', 'hu7b', ARRAY[3,4,6,11,25,28,33]),
-('2002-07-17', 'hu7b', ARRAY[7,8,16,28,30,31,32]),
-('2002-07-10', 'hu7b', ARRAY[3,5,7,10,18,19,30]),
-('2002-07-03', 'hu7b', ARRAY[3,5,11,22,26,27,31]),
-('2002-06-26', 'hu7b', ARRAY[1,14,16,21,23,28,29]),
-('2002-06-19', 'hu7b', ARRAY[1,12,17,18,23,28,35]),
-('2002-06-12', 'hu7b', ARRAY[1,6,7,15,27,28,29]),
-('2002-06-05', 'hu7b', ARRAY[1,5,9,11,16,21,25]),
-('2002-05-29', 'hu7b', ARRAY[1,3,8,22,25,26,32]),
-('2002-05-22', 'hu7b', ARRAY[2,3,10,16,24,25,31]),
-('2002-05-15', 'hu7b', ARRAY[5,6,7,14,17,24,35]),
-('2002-05-08', 'hu7b', ARRAY[4,5,8,11,15,17,35]),
-('2002-05-01', 'hu7b', ARRAY[7,10,12,19,20,28,32]),
-('2002-04-24', 'hu7b', ARRAY[5,8,10,14,17,24,28]),
-('2002-04-17', 'hu7b', ARRAY[6,7,10,15,17,22,34]),
-('2002-04-10', 'hu7b', ARRAY[5,15,18,21,24,32,34]),
-('2002-04-03', 'hu7b', ARRAY[6,7,8,12,21,26,27]),
-('2002-03-27', 'hu7b', ARRAY[2,3,5,6,11,20,31]),
-('2002-03-20', 'hu7b', ARRAY[1,8,9,11,12,15,25]),
-('2002-03-13', 'hu7b', ARRAY[2,8,11,14,18,20,33]),
-('2002-03-06', 'hu7b', ARRAY[1,7,10,13,14,31,34]),
-('2002-02-27', 'hu7b', ARRAY[4,5,7,13,25,28,33]),
-('2002-02-20', 'hu7b', ARRAY[1,2,3,15,16,22,24]),
-('2002-02-13', 'hu7b', ARRAY[9,20,21,23,24,34,35]),
-('2002-02-06', 'hu7b', ARRAY[3,6,15,17,20,22,31]),
-('2002-01-30', 'hu7b', ARRAY[3,6,14,17,18,22,27]),
-('2002-01-23', 'hu7b', ARRAY[2,8,9,13,21,25,34]),
-('2002-01-16', 'hu7b', ARRAY[1,3,6,20,23,25,35]),
-('2002-01-09', 'hu7b', ARRAY[3,9,14,15,17,26,30]),
-('2002-01-02', 'hu7b', ARRAY[3,5,7,13,18,19,24]),
-('2001-12-26', 'hu7b', ARRAY[2,7,8,21,29,34,35]),
-('2001-12-19', 'hu7b', ARRAY[9,15,17,18,19,24,25]),
-('2001-12-12', 'hu7b', ARRAY[7,8,9,10,17,23,30]),
-('2001-12-05', 'hu7b', ARRAY[1,5,10,11,12,15,28]),
-('2001-11-28', 'hu7b', ARRAY[4,8,9,15,16,22,26]),
-('2001-11-21', 'hu7b', ARRAY[4,10,15,18,26,27,35]),
-('2001-11-14', 'hu7b', ARRAY[9,21,23,26,29,31,34]),
-('2001-11-07', 'hu7b', ARRAY[3,5,11,12,17,25,29]),
-('2001-10-31', 'hu7b', ARRAY[2,3,7,11,16,24,30]),
-('2001-10-24', 'hu7b', ARRAY[1,2,7,14,18,25,30]),
-('2001-10-17', 'hu7b', ARRAY[4,8,10,12,18,22,24]),
-('2001-10-10', 'hu7b', ARRAY[8,9,22,26,30,31,35]),
-('2001-10-03', 'hu7b', ARRAY[3,6,16,19,26,28,32]),
-('2001-09-26', 'hu7b', ARRAY[5,10,13,15,22,32,35]),
-('2001-09-19', 'hu7b', ARRAY[2,6,8,13,17,23,34]),
-('2001-09-12', 'hu7b', ARRAY[4,9,14,16,22,26,27]),
-('2001-09-05', 'hu7b', ARRAY[3,4,5,6,22,24,34]),
-('2001-08-29', 'hu7b', ARRAY[2,3,4,13,19,26,28]),
-('2001-08-22', 'hu7b', ARRAY[3,4,6,8,9,11,17]),
-('2001-08-15', 'hu7b', ARRAY[1,8,16,18,19,23,31]),
-('2001-08-08', 'hu7b', ARRAY[7,14,15,17,19,26,30]),
-('2001-08-01', 'hu7b', ARRAY[8,11,15,24,26,29,31]),
-('2001-07-25', 'hu7b', ARRAY[5,18,23,24,25,29,32]),
-('2001-07-18', 'hu7b', ARRAY[4,12,18,21,24,25,29]),
-('2001-07-11', 'hu7b', ARRAY[3,5,7,12,14,29,32]),
-('2001-07-04', 'hu7b', ARRAY[13,14,18,20,26,33,35]),
-('2001-06-27', 'hu7b', ARRAY[10,12,14,20,25,31,35]),
-('2001-06-20', 'hu7b', ARRAY[15,18,21,25,28,31,34]),
-('2001-06-13', 'hu7b', ARRAY[5,6,14,15,25,26,27]),
-('2001-06-06', 'hu7b', ARRAY[2,6,7,22,27,30,34]),
-('2001-05-30', 'hu7b', ARRAY[2,10,11,15,16,23,35]),
-('2001-05-23', 'hu7b', ARRAY[2,10,16,18,20,21,23]),
-('2001-05-16', 'hu7b', ARRAY[5,6,18,21,25,28,31]),
-('2001-05-09', 'hu7b', ARRAY[3,4,11,13,15,20,33]),
-('2001-05-02', 'hu7b', ARRAY[4,10,12,13,15,23,32]),
-('2001-04-25', 'hu7b', ARRAY[8,9,11,15,20,26,34]),
-('2001-04-18', 'hu7b', ARRAY[1,5,11,13,14,17,33]),
-('2001-04-11', 'hu7b', ARRAY[5,6,8,13,24,31,32]),
-('2001-04-04', 'hu7b', ARRAY[4,6,16,17,20,21,35]),
-('2001-03-28', 'hu7b', ARRAY[1,2,16,25,26,30,34]),
-('2001-03-21', 'hu7b', ARRAY[1,8,9,24,27,30,34]),
-('2001-03-14', 'hu7b', ARRAY[15,22,24,27,29,34,35]),
-('2001-03-07', 'hu7b', ARRAY[1,14,16,17,26,28,34]),
-('2001-02-28', 'hu7b', ARRAY[3,7,19,24,26,29,31]),
-('2001-02-21', 'hu7b', ARRAY[4,5,7,8,16,22,28]),
-('2001-02-14', 'hu7b', ARRAY[5,7,8,14,15,25,28]),
-('2001-02-07', 'hu7b', ARRAY[4,7,13,16,30,33,34]),
-('2001-01-31', 'hu7b', ARRAY[6,9,13,17,19,32,33]),
-('2001-01-24', 'hu7b', ARRAY[1,9,18,21,23,24,31]),
-('2001-01-17', 'hu7b', ARRAY[3,4,11,22,25,28,33]),
-('2001-01-10', 'hu7b', ARRAY[3,5,15,23,24,25,34]),
-('2001-01-03', 'hu7b', ARRAY[16,17,18,25,26,28,29]),
-('2000-12-27', 'hu7b', ARRAY[1,7,13,19,20,22,29]),
-('2000-12-20', 'hu7b', ARRAY[16,18,19,24,25,26,30]),
-('2000-12-13', 'hu7b', ARRAY[1,9,12,16,19,21,22]),
-('2000-12-06', 'hu7b', ARRAY[6,11,12,16,18,26,31]),
-('2000-11-29', 'hu7b', ARRAY[3,7,8,13,25,27,31]),
-('2000-11-22', 'hu7b', ARRAY[5,7,10,11,15,25,31]),
-('2000-11-15', 'hu7b', ARRAY[2,11,16,18,19,22,28]),
-('2000-11-08', 'hu7b', ARRAY[1,3,7,10,18,21,27]),
-('2000-11-01', 'hu7b', ARRAY[6,11,13,15,19,29,30]),
-('2000-10-25', 'hu7b', ARRAY[5,9,18,21,27,28,31]),
-('2000-10-18', 'hu7b', ARRAY[3,13,20,23,24,30,32]),
-('2000-10-11', 'hu7b', ARRAY[5,18,23,26,28,29,33]),
-('2000-10-04', 'hu7b', ARRAY[3,5,13,21,28,32,33]),
-('2000-09-27', 'hu7b', ARRAY[1,11,12,15,16,24,28]),
-('2000-09-20', 'hu7b', ARRAY[5,18,21,25,26,28,29]),
-('2000-09-13', 'hu7b', ARRAY[2,6,11,13,21,32,35]),
-('2000-09-06', 'hu7b', ARRAY[3,9,11,16,17,20,30]),
-('2000-08-30', 'hu7b', ARRAY[4,7,20,31,32,33,35]),
-('2000-08-23', 'hu7b', ARRAY[1,8,9,21,25,33,35]),
-('2000-08-16', 'hu7b', ARRAY[4,8,9,12,18,19,33]),
-('2000-08-09', 'hu7b', ARRAY[4,5,19,23,25,29,32]),
-('2000-08-02', 'hu7b', ARRAY[1,5,8,19,32,34,35]),
-('2000-07-26', 'hu7b', ARRAY[8,16,17,20,26,32,33]),
-('2000-07-19', 'hu7b', ARRAY[10,19,22,23,30,31,33]),
-('2000-07-12', 'hu7b', ARRAY[7,13,14,18,20,21,26]),
-('2000-07-05', 'hu7b', ARRAY[1,8,10,18,28,34,35]),
-('2000-06-28', 'hu7b', ARRAY[3,7,13,24,29,30,33]),
-('2000-06-21', 'hu7b', ARRAY[6,10,24,25,27,30,33]),
-('2000-06-14', 'hu7b', ARRAY[1,13,17,19,23,29,32]),
-('2000-06-07', 'hu7b', ARRAY[10,15,18,20,27,32,34]),
-('2000-05-31', 'hu7b', ARRAY[1,3,12,26,27,34,35]),
-('2000-05-24', 'hu7b', ARRAY[1,5,7,8,14,30,34]),
-('2000-05-17', 'hu7b', ARRAY[4,5,6,9,13,21,33]),
-('2000-05-10', 'hu7b', ARRAY[11,16,23,24,28,31,34]),
-('2000-05-03', 'hu7b', ARRAY[2,5,11,12,16,27,30]),
-('2000-04-26', 'hu7b', ARRAY[1,7,13,15,18,21,30]),
-('2000-04-19', 'hu7b', ARRAY[7,10,13,18,23,29,30]),
-('2000-04-12', 'hu7b', ARRAY[2,4,8,11,12,19,22]),
-('2000-04-05', 'hu7b', ARRAY[3,6,7,9,12,30,31]),
-('2000-03-29', 'hu7b', ARRAY[6,8,17,19,22,32,33]),
-('2000-03-22', 'hu7b', ARRAY[1,2,8,11,21,26,35]),
-('2000-03-15', 'hu7b', ARRAY[3,4,13,20,22,23,29]),
-('2000-03-08', 'hu7b', ARRAY[21,24,25,27,30,32,35]),
-('2000-03-01', 'hu7b', ARRAY[7,8,9,10,14,24,28]),
-('2000-02-23', 'hu7b', ARRAY[11,24,26,27,28,31,33]),
-('2000-02-16', 'hu7b', ARRAY[2,3,7,18,26,27,32]),
-('2000-02-09', 'hu7b', ARRAY[1,9,10,12,14,21,28]),
-('2000-02-02', 'hu7b', ARRAY[1,10,11,12,14,29,31]),
-('2000-01-26', 'hu7b', ARRAY[1,6,11,22,24,29,31]),
-('2000-01-19', 'hu7b', ARRAY[12,13,26,28,29,31,33]),
-('2000-01-12', 'hu7b', ARRAY[9,12,17,22,24,27,35]),
-('2000-01-05', 'hu7b', ARRAY[6,12,13,18,20,26,28]),
-('1999-12-29', 'hu7b', ARRAY[12,18,20,24,28,31,34]),
-('1999-12-22', 'hu7b', ARRAY[3,10,14,15,24,30,34]),
-('1999-12-15', 'hu7b', ARRAY[9,12,13,14,15,18,34]),
-('1999-12-08', 'hu7b', ARRAY[9,12,16,23,28,31,35]),
-('1999-12-01', 'hu7b', ARRAY[11,13,16,17,20,31,35]),
-('1999-11-24', 'hu7b', ARRAY[2,4,6,11,14,25,33]),
-('1999-11-17', 'hu7b', ARRAY[1,19,22,26,29,31,35]),
-('1999-11-10', 'hu7b', ARRAY[4,16,17,21,24,26,32]),
-('1999-11-03', 'hu7b', ARRAY[11,16,18,27,30,33,35]),
-('1999-10-27', 'hu7b', ARRAY[2,3,6,12,13,14,31]),
-('1999-10-20', 'hu7b', ARRAY[4,6,7,22,24,26,28]),
-('1999-10-13', 'hu7b', ARRAY[12,14,18,24,31,34,35]);
\ No newline at end of file
+INSERT INTO draw_hu7 (draw_date, numbers_a, numbers_b) VALUES
+('2025-10-29', ARRAY[4,6,9,10,20,29,30], ARRAY[4,15,18,20,21,29,32]),
+('2025-10-22', ARRAY[1,2,4,7,9,16,23], ARRAY[2,3,5,6,25,34,35]),
+('2025-10-15', ARRAY[8,10,11,15,18,22,28], ARRAY[3,8,14,15,19,24,31]),
+('2025-10-08', ARRAY[10,12,17,21,23,27,28], ARRAY[7,10,12,14,23,34,35]),
+('2025-10-01', ARRAY[6,7,8,13,17,23,31], ARRAY[4,6,11,19,27,29,31]),
+('2025-09-24', ARRAY[2,6,8,10,16,17,26], ARRAY[11,19,20,24,25,30,34]),
+('2025-09-17', ARRAY[1,9,11,13,15,18,19], ARRAY[2,5,6,10,17,18,25]),
+('2025-09-10', ARRAY[9,16,17,20,27,31,32], ARRAY[3,4,8,16,17,29,31]),
+('2025-09-03', ARRAY[5,9,18,23,27,28,33], ARRAY[8,13,18,19,22,23,34]),
+('2025-08-27', ARRAY[1,5,12,14,23,31,35], ARRAY[12,13,18,19,24,27,31]),
+('2025-08-20', ARRAY[1,2,4,12,15,16,35], ARRAY[4,14,16,20,24,30,31]),
+('2025-08-13', ARRAY[3,13,15,24,25,30,35], ARRAY[3,12,15,23,27,31,33]),
+('2025-08-06', ARRAY[1,3,7,12,17,19,21], ARRAY[6,9,12,13,28,33,34]),
+('2025-07-30', ARRAY[6,8,13,21,26,30,35], ARRAY[3,4,10,20,23,25,27]),
+('2025-07-23', ARRAY[11,12,16,26,28,31,33], ARRAY[10,12,16,17,22,24,28]),
+('2025-07-16', ARRAY[1,12,14,26,31,32,34], ARRAY[2,7,11,15,22,32,35]),
+('2025-07-09', ARRAY[9,14,17,20,27,30,31], ARRAY[7,13,18,19,21,30,33]),
+('2025-07-02', ARRAY[1,4,11,12,18,27,35], ARRAY[3,18,19,23,24,29,35]),
+('2025-06-25', ARRAY[4,7,10,20,21,24,28], ARRAY[3,5,15,19,30,31,34]),
+('2025-06-18', ARRAY[2,8,17,21,23,28,30], ARRAY[9,16,17,22,30,33,34]),
+('2025-06-11', ARRAY[1,6,7,12,15,17,31], ARRAY[21,24,26,28,30,31,34]),
+('2025-06-04', ARRAY[2,12,16,20,23,28,31], ARRAY[1,8,15,18,25,27,35]),
+('2025-05-28', ARRAY[2,7,16,18,23,30,34], ARRAY[4,5,6,22,26,33,34]),
+('2025-05-21', ARRAY[2,6,18,20,24,27,35], ARRAY[4,15,19,22,24,25,31]),
+('2025-05-14', ARRAY[5,10,11,16,19,20,22], ARRAY[11,12,15,19,24,25,35]),
+('2025-05-07', ARRAY[5,6,10,26,33,34,35], ARRAY[11,13,18,19,20,26,29]),
+('2025-04-30', ARRAY[9,11,12,14,27,30,34], ARRAY[3,6,14,16,24,27,34]),
+('2025-04-23', ARRAY[7,9,13,22,25,30,31], ARRAY[4,15,16,21,24,28,29]),
+('2025-04-16', ARRAY[1,9,13,17,23,24,31], ARRAY[3,5,6,9,18,29,34]),
+('2025-04-09', ARRAY[7,9,12,13,15,17,26], ARRAY[15,16,18,24,27,31,35]),
+('2025-04-02', ARRAY[1,5,16,27,28,31,34], ARRAY[5,6,9,24,25,32,35]),
+('2025-03-26', ARRAY[3,12,19,23,24,31,34], ARRAY[4,19,24,29,32,33,35]),
+('2025-03-19', ARRAY[1,2,7,10,28,29,30], ARRAY[3,7,10,11,25,27,29]),
+('2025-03-12', ARRAY[2,6,17,21,24,30,33], ARRAY[5,7,9,10,11,13,35]),
+('2025-03-05', ARRAY[6,9,12,22,26,32,33], ARRAY[11,12,14,16,21,27,30]),
+('2025-02-26', ARRAY[6,8,16,22,25,26,34], ARRAY[8,11,18,22,27,29,35]),
+('2025-02-19', ARRAY[2,9,10,14,23,24,31], ARRAY[10,15,17,18,26,30,33]),
+('2025-02-12', ARRAY[2,4,11,18,19,26,27], ARRAY[4,5,15,17,21,29,34]),
+('2025-02-05', ARRAY[1,4,9,14,28,32,35], ARRAY[1,3,4,7,16,20,35]),
+('2025-01-29', ARRAY[3,5,15,17,20,30,33], ARRAY[14,16,17,19,23,32,35]),
+('2025-01-22', ARRAY[3,6,9,12,16,27,30], ARRAY[6,7,8,17,18,22,25]),
+('2025-01-15', ARRAY[12,16,18,24,28,32,34], ARRAY[7,8,15,25,26,31,33]),
+('2025-01-08', ARRAY[3,8,9,13,17,19,27], ARRAY[1,2,9,10,14,21,25]),
+('2025-01-01', ARRAY[1,3,4,6,12,16,30], ARRAY[2,6,9,11,20,29,34]),
+('2024-12-27', ARRAY[2,6,10,11,13,17,31], ARRAY[5,11,12,16,21,25,35]),
+('2024-12-18', ARRAY[3,8,9,10,16,23,27], ARRAY[1,2,11,13,17,24,31]),
+('2024-12-11', ARRAY[8,11,15,23,25,27,31], ARRAY[1,8,11,14,22,25,33]),
+('2024-12-04', ARRAY[8,12,14,24,26,28,31], ARRAY[6,9,18,24,26,28,35]),
+('2024-11-27', ARRAY[6,8,10,14,30,31,35], ARRAY[14,15,17,24,25,29,33]),
+('2024-11-20', ARRAY[5,6,8,13,20,27,35], ARRAY[1,15,16,18,26,28,35]),
+('2024-11-13', ARRAY[1,5,11,22,23,25,31], ARRAY[3,10,16,20,21,28,30]),
+('2024-11-06', ARRAY[6,13,14,15,19,25,31], ARRAY[4,7,17,26,27,32,35]),
+('2024-10-30', ARRAY[5,14,16,17,26,34,35], ARRAY[10,14,15,16,17,29,32]),
+('2024-10-23', ARRAY[1,9,20,25,27,31,32], ARRAY[1,4,5,16,20,26,33]),
+('2024-10-16', ARRAY[3,6,8,10,16,26,35], ARRAY[5,12,13,18,22,31,32]),
+('2024-10-09', ARRAY[4,8,9,18,22,25,34], ARRAY[3,7,15,16,20,21,32]),
+('2024-10-02', ARRAY[5,9,13,14,17,20,30], ARRAY[4,11,14,19,26,27,33]),
+('2024-09-25', ARRAY[4,12,13,15,26,28,35], ARRAY[10,14,17,23,24,25,30]),
+('2024-09-18', ARRAY[1,6,11,17,28,29,31], ARRAY[2,3,4,15,18,23,32]),
+('2024-09-11', ARRAY[8,10,11,14,15,18,27], ARRAY[2,6,14,16,21,22,29]),
+('2024-09-04', ARRAY[4,6,11,12,14,18,19], ARRAY[3,13,16,18,23,24,28]),
+('2024-08-28', ARRAY[8,10,15,17,24,29,31], ARRAY[2,13,24,25,26,27,29]),
+('2024-08-21', ARRAY[1,12,13,15,23,32,34], ARRAY[3,4,5,6,16,19,25]),
+('2024-08-14', ARRAY[4,7,14,15,23,30,35], ARRAY[1,5,14,22,27,28,34]),
+('2024-08-07', ARRAY[2,11,18,24,29,32,34], ARRAY[1,3,9,14,17,24,32]),
+('2024-07-31', ARRAY[2,8,18,22,27,31,32], ARRAY[6,9,25,28,29,32,34]),
+('2024-07-24', ARRAY[6,20,21,24,25,26,33], ARRAY[2,4,6,19,22,24,27]),
+('2024-07-17', ARRAY[3,7,22,27,29,30,34], ARRAY[11,14,17,18,25,28,29]),
+('2024-07-10', ARRAY[1,15,16,17,19,30,34], ARRAY[6,19,20,29,30,32,35]),
+('2024-07-03', ARRAY[11,13,14,16,20,23,28], ARRAY[8,10,16,17,26,30,35]),
+('2024-06-26', ARRAY[4,5,14,17,21,28,33], ARRAY[1,2,14,18,21,26,29]),
+('2024-06-19', ARRAY[13,19,20,25,28,30,34], ARRAY[8,15,17,20,22,30,31]),
+('2024-06-12', ARRAY[1,5,10,23,31,32,34], ARRAY[4,5,11,14,20,26,34]),
+('2024-06-05', ARRAY[3,4,7,10,14,16,17], ARRAY[4,12,15,16,25,28,33]),
+('2024-05-29', ARRAY[1,4,10,11,17,24,25], ARRAY[10,14,15,22,25,30,34]),
+('2024-05-22', ARRAY[8,14,15,19,29,34,35], ARRAY[3,4,10,11,18,29,34]),
+('2024-05-15', ARRAY[3,7,8,9,10,23,24], ARRAY[4,6,12,19,27,30,34]),
+('2024-05-08', ARRAY[2,4,11,12,26,27,31], ARRAY[1,16,17,20,30,32,33]),
+('2024-05-01', ARRAY[1,11,14,20,21,30,33], ARRAY[3,8,12,23,31,32,35]),
+('2024-04-24', ARRAY[1,2,4,9,20,23,25], ARRAY[2,12,13,14,19,22,33]),
+('2024-04-17', ARRAY[8,10,12,22,24,30,34], ARRAY[6,7,8,14,19,24,25]),
+('2024-04-10', ARRAY[4,13,17,20,28,30,35], ARRAY[5,7,9,17,18,21,27]),
+('2024-04-03', ARRAY[1,2,6,9,11,13,31], ARRAY[3,8,13,20,25,26,32]),
+('2024-03-27', ARRAY[6,8,13,14,22,23,35], ARRAY[5,14,21,24,25,28,32]),
+('2024-03-20', ARRAY[7,9,23,26,29,31,33], ARRAY[3,6,12,17,21,24,30]),
+('2024-03-13', ARRAY[3,4,7,18,19,22,26], ARRAY[5,20,23,26,27,32,34]),
+('2024-03-06', ARRAY[9,11,13,18,23,24,26], ARRAY[7,11,12,17,18,24,30]),
+('2024-02-28', ARRAY[1,6,9,12,16,20,27], ARRAY[2,4,7,8,9,11,18]),
+('2024-02-21', ARRAY[8,10,14,20,23,24,35], ARRAY[1,12,13,14,23,26,29]),
+('2024-02-14', ARRAY[5,10,15,20,21,28,30], ARRAY[1,2,7,11,20,27,32]),
+('2024-02-07', ARRAY[1,6,18,19,24,27,32], ARRAY[3,4,5,6,9,20,21]),
+('2024-01-31', ARRAY[1,18,20,21,25,28,35], ARRAY[10,13,14,18,22,26,30]),
+('2024-01-24', ARRAY[6,12,14,27,30,33,35], ARRAY[1,5,11,15,18,27,29]),
+('2024-01-17', ARRAY[3,9,11,19,22,25,32], ARRAY[3,5,10,19,25,28,32]),
+('2024-01-10', ARRAY[1,9,12,15,20,30,34], ARRAY[4,12,14,19,22,27,29]),
+('2024-01-03', ARRAY[3,8,10,11,30,31,35], ARRAY[7,8,11,15,19,23,35]),
+('2023-12-27', ARRAY[8,10,12,19,21,26,32], ARRAY[1,7,9,13,25,32,33]),
+('2023-12-20', ARRAY[8,12,13,15,20,22,34], ARRAY[6,10,11,16,20,24,26]),
+('2023-12-13', ARRAY[4,5,7,13,21,23,32], ARRAY[10,14,20,29,31,32,35]),
+('2023-12-06', ARRAY[1,4,13,24,28,30,35], ARRAY[2,7,9,10,14,32,33]),
+('2023-11-29', ARRAY[1,5,8,11,16,22,34], ARRAY[4,8,14,17,19,21,28]),
+('2023-11-22', ARRAY[3,6,11,15,22,25,27], ARRAY[9,11,21,22,26,31,33]),
+('2023-11-15', ARRAY[2,4,13,21,22,32,34], ARRAY[1,6,8,11,16,17,18]),
+('2023-11-08', ARRAY[14,17,20,29,32,34,35], ARRAY[11,20,21,22,23,24,34]),
+('2023-11-01', ARRAY[4,9,12,19,24,29,35], ARRAY[6,9,14,16,24,29,33]),
+('2023-10-25', ARRAY[4,5,11,14,18,22,29], ARRAY[9,18,19,23,25,26,31]),
+('2023-10-18', ARRAY[4,6,8,12,17,27,30], ARRAY[4,5,15,19,27,32,34]),
+('2023-10-11', ARRAY[2,15,20,28,29,31,33], ARRAY[8,16,17,20,22,26,33]),
+('2023-10-04', ARRAY[6,11,12,20,26,30,34], ARRAY[10,11,16,17,18,21,26]),
+('2023-09-27', ARRAY[7,11,15,19,22,26,33], ARRAY[5,6,15,19,26,28,31]),
+('2023-09-20', ARRAY[7,12,20,21,22,29,34], ARRAY[3,7,11,21,23,24,27]),
+('2023-09-13', ARRAY[1,10,16,22,32,34,35], ARRAY[1,2,3,14,20,23,31]),
+('2023-09-06', ARRAY[5,6,10,14,18,26,28], ARRAY[8,10,18,24,30,33,34]),
+('2023-08-30', ARRAY[2,10,11,15,16,20,33], ARRAY[10,11,14,25,32,34,35]),
+('2023-08-23', ARRAY[3,4,5,6,9,12,25], ARRAY[1,7,10,17,19,26,35]),
+('2023-08-16', ARRAY[3,5,15,16,23,25,29], ARRAY[14,17,18,25,27,28,29]),
+('2023-08-09', ARRAY[3,4,10,17,29,31,33], ARRAY[4,10,17,18,29,31,33]),
+('2023-08-02', ARRAY[2,3,4,11,14,19,35], ARRAY[17,19,20,24,27,32,35]),
+('2023-07-26', ARRAY[1,3,8,17,20,27,32], ARRAY[3,5,8,10,11,14,17]),
+('2023-07-19', ARRAY[2,3,6,19,22,27,30], ARRAY[15,20,24,25,26,28,33]),
+('2023-07-12', ARRAY[5,11,17,19,25,26,30], ARRAY[2,10,11,12,18,19,30]),
+('2023-07-05', ARRAY[7,20,21,22,23,25,26], ARRAY[13,14,16,19,20,27,35]),
+('2023-06-28', ARRAY[2,4,16,24,25,26,32], ARRAY[13,18,19,22,30,32,35]),
+('2023-06-21', ARRAY[3,5,9,12,13,26,29], ARRAY[7,12,18,22,23,27,30]),
+('2023-06-14', ARRAY[7,8,15,26,30,31,34], ARRAY[9,12,16,20,26,28,34]),
+('2023-06-07', ARRAY[6,7,10,14,17,25,26], ARRAY[1,3,5,6,7,10,25]),
+('2023-05-31', ARRAY[1,2,5,11,12,19,20], ARRAY[3,9,13,20,21,31,34]),
+('2023-05-24', ARRAY[3,7,14,16,19,29,32], ARRAY[1,5,13,14,19,27,35]),
+('2023-05-17', ARRAY[3,7,22,23,27,31,33], ARRAY[1,2,3,4,7,27,30]),
+('2023-05-10', ARRAY[8,12,16,18,29,30,35], ARRAY[10,11,17,20,21,25,26]),
+('2023-05-03', ARRAY[12,16,19,24,29,31,32], ARRAY[2,3,4,8,19,31,35]),
+('2023-04-26', ARRAY[6,22,23,27,29,30,31], ARRAY[4,6,10,15,17,29,35]),
+('2023-04-19', ARRAY[7,12,16,20,21,22,24], ARRAY[1,13,16,18,25,26,33]),
+('2023-04-12', ARRAY[3,11,15,17,23,30,35], ARRAY[1,4,10,14,17,32,35]),
+('2023-04-05', ARRAY[1,4,8,19,33,34,35], ARRAY[2,4,11,15,18,20,21]),
+('2023-03-29', ARRAY[2,3,9,20,21,29,33], ARRAY[2,5,15,22,29,31,32]),
+('2023-03-22', ARRAY[1,2,3,8,21,22,23], ARRAY[6,13,14,18,25,29,30]),
+('2023-03-15', ARRAY[1,3,7,12,15,30,33], ARRAY[2,3,6,11,12,22,25]),
+('2023-03-08', ARRAY[8,10,22,27,28,29,35], ARRAY[6,10,24,28,31,32,35]),
+('2023-03-01', ARRAY[1,15,16,30,32,33,35], ARRAY[4,5,19,21,27,30,32]),
+('2023-02-22', ARRAY[3,8,11,17,21,33,34], ARRAY[3,10,12,13,23,25,26]),
+('2023-02-15', ARRAY[19,23,24,27,30,32,34], ARRAY[5,15,16,21,25,31,34]),
+('2023-02-08', ARRAY[2,6,9,13,14,19,26], ARRAY[4,10,11,21,26,29,32]),
+('2023-02-01', ARRAY[3,5,7,13,19,26,31], ARRAY[11,13,16,23,29,31,34]),
+('2023-01-25', ARRAY[2,6,19,25,29,32,33], ARRAY[6,11,12,14,31,33,35]),
+('2023-01-18', ARRAY[5,6,8,9,27,28,34], ARRAY[2,10,19,20,25,30,31]),
+('2023-01-11', ARRAY[2,6,14,16,17,27,34], ARRAY[3,5,14,21,28,30,31]),
+('2023-01-04', ARRAY[3,4,13,16,24,27,32], ARRAY[5,6,14,17,19,25,30]),
+('2022-12-28', ARRAY[3,5,14,19,20,29,31], ARRAY[12,13,14,16,21,22,25]),
+('2022-12-21', ARRAY[4,5,7,8,10,26,28], ARRAY[4,9,16,27,30,34,35]),
+('2022-12-14', ARRAY[8,12,13,16,21,24,33], ARRAY[1,2,4,12,15,21,26]),
+('2022-12-07', ARRAY[9,19,21,23,26,27,29], ARRAY[7,12,13,14,21,22,30]),
+('2022-11-30', ARRAY[3,5,8,10,17,30,32], ARRAY[1,4,20,24,30,32,33]),
+('2022-11-23', ARRAY[3,4,16,19,32,34,35], ARRAY[7,15,16,17,18,23,30]),
+('2022-11-16', ARRAY[7,8,11,12,16,25,31], ARRAY[6,7,21,28,31,33,35]),
+('2022-11-09', ARRAY[8,9,12,13,14,29,32], ARRAY[8,11,12,14,15,16,22]),
+('2022-11-02', ARRAY[19,22,25,26,29,31,35], ARRAY[8,10,12,28,29,30,32]),
+('2022-10-26', ARRAY[3,17,18,19,25,26,28], ARRAY[5,7,8,9,17,23,30]),
+('2022-10-19', ARRAY[2,3,10,25,26,30,32], ARRAY[1,5,8,13,21,23,24]),
+('2022-10-12', ARRAY[3,8,12,14,16,21,33], ARRAY[3,15,19,21,26,27,28]),
+('2022-10-05', ARRAY[4,9,13,22,24,31,35], ARRAY[6,11,13,15,22,23,32]),
+('2022-09-28', ARRAY[10,11,12,14,19,23,31], ARRAY[1,9,11,13,23,27,32]),
+('2022-09-21', ARRAY[1,2,4,7,11,20,32], ARRAY[4,15,18,22,26,29,31]),
+('2022-09-14', ARRAY[4,13,18,19,23,31,34], ARRAY[5,6,13,22,28,33,35]),
+('2022-09-07', ARRAY[1,4,11,14,17,19,20], ARRAY[1,3,4,17,19,22,34]),
+('2022-08-31', ARRAY[1,20,25,29,30,33,34], ARRAY[5,12,18,21,22,30,34]),
+('2022-08-24', ARRAY[5,11,15,20,23,30,31], ARRAY[6,20,23,27,29,31,32]),
+('2022-08-17', ARRAY[1,3,8,13,15,17,18], ARRAY[7,14,15,18,26,31,34]),
+('2022-08-10', ARRAY[7,12,14,16,20,34,35], ARRAY[4,7,12,18,22,27,34]),
+('2022-08-03', ARRAY[3,4,5,7,12,18,21], ARRAY[9,14,15,21,26,27,29]),
+('2022-07-27', ARRAY[2,14,16,18,21,29,33], ARRAY[1,5,17,18,22,25,26]),
+('2022-07-20', ARRAY[3,6,7,11,16,18,23], ARRAY[1,16,21,22,23,28,33]),
+('2022-07-13', ARRAY[10,14,22,24,25,31,32], ARRAY[2,6,12,16,23,26,29]),
+('2022-07-06', ARRAY[14,19,20,21,22,26,32], ARRAY[3,10,15,23,25,27,34]),
+('2022-06-29', ARRAY[5,17,24,25,27,28,34], ARRAY[1,2,3,5,6,7,20]),
+('2022-06-22', ARRAY[6,15,21,23,25,27,28], ARRAY[3,4,8,9,18,19,25]),
+('2022-06-15', ARRAY[5,8,16,23,30,32,34], ARRAY[1,7,11,17,19,32,35]),
+('2022-06-08', ARRAY[8,9,12,15,19,25,30], ARRAY[4,15,17,22,27,30,35]),
+('2022-06-01', ARRAY[5,13,15,20,27,28,31], ARRAY[11,20,22,25,26,30,33]),
+('2022-05-25', ARRAY[1,6,11,12,18,24,33], ARRAY[1,2,22,29,30,32,33]),
+('2022-05-18', ARRAY[7,18,19,23,25,29,35], ARRAY[2,4,15,17,26,27,33]),
+('2022-05-11', ARRAY[1,3,8,18,19,24,28], ARRAY[4,9,19,23,32,33,34]),
+('2022-05-04', ARRAY[1,5,11,12,14,27,35], ARRAY[10,15,21,32,33,34,35]),
+('2022-04-27', ARRAY[6,7,19,21,25,31,33], ARRAY[1,18,19,20,22,23,24]),
+('2022-04-20', ARRAY[10,12,18,19,20,25,30], ARRAY[1,5,15,18,21,24,31]),
+('2022-04-13', ARRAY[5,6,8,10,16,17,32], ARRAY[5,11,18,20,22,31,32]),
+('2022-04-06', ARRAY[5,8,17,18,31,32,33], ARRAY[12,15,16,18,21,25,26]),
+('2022-03-30', ARRAY[5,7,17,18,19,23,32], ARRAY[1,3,4,6,7,18,26]),
+('2022-03-23', ARRAY[1,8,10,20,22,26,30], ARRAY[1,3,5,14,21,25,27]),
+('2022-03-16', ARRAY[1,2,10,12,13,22,32], ARRAY[14,18,19,21,22,25,27]),
+('2022-03-09', ARRAY[1,4,6,7,8,19,32], ARRAY[4,14,15,16,32,33,35]),
+('2022-03-02', ARRAY[14,18,19,22,23,27,35], ARRAY[4,5,9,16,21,34,35]),
+('2022-02-23', ARRAY[4,8,10,12,18,21,22], ARRAY[9,11,13,14,17,19,32]),
+('2022-02-16', ARRAY[4,9,10,14,19,27,34], ARRAY[2,8,12,13,25,29,34]),
+('2022-02-09', ARRAY[4,14,15,20,21,22,28], ARRAY[1,12,18,19,20,25,35]),
+('2022-02-02', ARRAY[3,6,8,15,25,27,31], ARRAY[7,8,17,21,30,33,35]),
+('2022-01-26', ARRAY[2,18,24,30,31,32,34], ARRAY[3,5,6,16,28,30,31]),
+('2022-01-19', ARRAY[2,6,11,16,27,32,35], ARRAY[1,7,11,23,27,31,35]),
+('2022-01-12', ARRAY[2,7,20,22,25,27,32], ARRAY[11,13,19,22,29,32,34]),
+('2022-01-05', ARRAY[1,2,16,17,25,27,29], ARRAY[1,5,24,27,28,31,33]),
+('2021-12-29', ARRAY[2,7,18,30,31,34,35], ARRAY[1,11,14,17,19,22,27]),
+('2021-12-22', ARRAY[13,18,22,23,24,26,31], ARRAY[5,13,14,15,19,28,34]),
+('2021-12-15', ARRAY[5,12,19,25,28,29,35], ARRAY[1,9,10,11,22,28,35]),
+('2021-12-08', ARRAY[2,4,25,29,30,33,35], ARRAY[1,2,11,25,29,33,34]),
+('2021-12-01', ARRAY[4,18,19,21,22,26,30], ARRAY[1,2,6,7,13,18,29]),
+('2021-11-24', ARRAY[4,5,11,15,19,20,32], ARRAY[2,4,9,14,17,19,34]),
+('2021-11-17', ARRAY[3,10,13,16,17,18,19], ARRAY[1,9,15,19,26,30,31]),
+('2021-11-10', ARRAY[2,13,19,25,28,29,33], ARRAY[4,16,24,29,31,34,35]),
+('2021-11-03', ARRAY[9,15,23,25,29,30,32], ARRAY[2,5,17,18,24,27,29]),
+('2021-10-27', ARRAY[5,8,16,21,23,24,32], ARRAY[1,2,11,14,18,27,32]),
+('2021-10-20', ARRAY[9,12,19,22,28,31,33], ARRAY[1,5,19,20,23,26,34]),
+('2021-10-13', ARRAY[3,19,23,25,28,34,35], ARRAY[3,4,6,8,24,25,30]),
+('2021-10-06', ARRAY[7,11,17,21,23,28,34], ARRAY[13,14,23,28,29,30,33]),
+('2021-09-29', ARRAY[4,6,9,12,23,25,31], ARRAY[4,6,13,18,19,22,24]),
+('2021-09-22', ARRAY[4,7,9,10,15,25,27], ARRAY[3,11,13,19,24,25,29]),
+('2021-09-15', ARRAY[1,7,20,22,27,28,30], ARRAY[6,8,15,29,32,34,35]),
+('2021-09-08', ARRAY[1,11,16,18,24,26,33], ARRAY[1,4,5,9,20,22,34]),
+('2021-09-01', ARRAY[16,17,21,24,29,34,35], ARRAY[2,6,8,9,26,29,30]),
+('2021-08-25', ARRAY[4,16,19,20,23,34,35], ARRAY[2,3,7,12,23,28,34]),
+('2021-08-18', ARRAY[7,19,22,28,30,31,32], ARRAY[3,4,13,15,17,19,35]),
+('2021-08-11', ARRAY[3,4,14,15,25,26,27], ARRAY[1,6,13,17,18,22,25]),
+('2021-08-04', ARRAY[2,5,6,16,24,28,29], ARRAY[4,10,16,17,24,26,30]),
+('2021-07-28', ARRAY[3,6,9,15,26,30,35], ARRAY[13,14,21,27,28,34,35]),
+('2021-07-21', ARRAY[9,13,17,24,26,28,35], ARRAY[3,4,5,22,32,34,35]),
+('2021-07-14', ARRAY[1,7,8,14,15,17,25], ARRAY[6,7,11,21,23,28,34]),
+('2021-07-07', ARRAY[1,6,13,24,25,27,35], ARRAY[2,4,5,11,16,28,32]),
+('2021-06-30', ARRAY[4,5,7,17,20,30,35], ARRAY[2,14,16,17,21,22,26]),
+('2021-06-23', ARRAY[2,6,8,12,14,18,23], ARRAY[4,5,7,15,16,25,26]),
+('2021-06-16', ARRAY[5,6,14,15,20,28,34], ARRAY[1,6,16,18,19,31,34]),
+('2021-06-09', ARRAY[4,9,10,15,16,19,29], ARRAY[3,5,6,18,19,22,35]),
+('2021-06-02', ARRAY[5,7,24,25,28,29,35], ARRAY[4,10,13,14,22,28,30]),
+('2021-05-26', ARRAY[3,7,16,18,19,22,32], ARRAY[3,10,11,16,21,23,31]),
+('2021-05-19', ARRAY[9,15,17,21,24,27,33], ARRAY[3,9,13,17,19,29,32]),
+('2021-05-12', ARRAY[2,3,12,21,25,29,34], ARRAY[1,4,7,14,25,27,28]),
+('2021-05-05', ARRAY[4,5,12,19,22,23,27], ARRAY[7,16,17,18,21,25,30]),
+('2021-04-28', ARRAY[2,9,11,12,24,26,34], ARRAY[2,8,11,15,16,18,33]),
+('2021-04-21', ARRAY[10,12,13,14,20,27,29], ARRAY[9,10,24,25,26,28,33]),
+('2021-04-14', ARRAY[4,8,10,16,17,20,27], ARRAY[3,7,14,18,27,28,35]),
+('2021-04-07', ARRAY[5,9,10,13,14,16,30], ARRAY[5,8,15,16,17,29,31]),
+('2021-03-31', ARRAY[2,4,10,14,25,33,34], ARRAY[5,10,13,15,20,27,29]),
+('2021-03-24', ARRAY[4,8,13,15,22,34,35], ARRAY[9,11,15,19,22,23,33]),
+('2021-03-17', ARRAY[1,6,9,10,13,16,23], ARRAY[15,19,23,25,26,33,34]),
+('2021-03-10', ARRAY[2,5,12,13,15,32,34], ARRAY[4,6,11,21,24,27,28]),
+('2021-03-03', ARRAY[3,5,21,24,26,30,35], ARRAY[4,10,28,29,31,32,34]),
+('2021-02-24', ARRAY[1,5,14,18,26,27,28], ARRAY[7,9,18,22,25,27,34]),
+('2021-02-17', ARRAY[11,14,18,23,25,28,34], ARRAY[11,25,27,31,32,33,35]),
+('2021-02-10', ARRAY[1,3,4,9,14,16,31], ARRAY[12,16,20,21,28,33,35]),
+('2021-02-03', ARRAY[5,10,19,22,23,32,34], ARRAY[5,13,15,16,18,20,26]),
+('2021-01-27', ARRAY[1,12,16,22,25,29,34], ARRAY[5,9,18,23,25,30,33]),
+('2021-01-20', ARRAY[7,8,11,12,13,23,27], ARRAY[1,8,17,18,19,20,33]),
+('2021-01-13', ARRAY[4,12,15,18,24,28,34], ARRAY[1,2,5,14,24,25,28]),
+('2021-01-06', ARRAY[4,6,13,20,30,31,35], ARRAY[2,13,21,28,29,30,33]),
+('2020-12-30', ARRAY[3,4,5,7,16,18,28], ARRAY[6,7,11,14,24,26,31]),
+('2020-12-23', ARRAY[6,8,10,13,17,18,20], ARRAY[4,6,7,8,17,27,29]),
+('2020-12-16', ARRAY[9,10,18,20,22,24,33], ARRAY[8,9,13,16,23,30,32]),
+('2020-12-09', ARRAY[3,16,17,21,26,28,29], ARRAY[5,6,9,11,17,19,27]),
+('2020-12-02', ARRAY[5,16,17,20,22,29,32], ARRAY[14,17,20,31,33,34,35]),
+('2020-11-25', ARRAY[1,4,23,25,27,33,34], ARRAY[1,6,12,17,21,32,34]),
+('2020-11-18', ARRAY[4,10,20,25,26,29,34], ARRAY[8,10,11,23,25,28,30]),
+('2020-11-11', ARRAY[20,22,26,27,29,30,33], ARRAY[3,6,13,21,22,23,25]),
+('2020-11-04', ARRAY[4,11,19,20,22,25,26], ARRAY[9,10,12,14,22,28,29]),
+('2020-10-28', ARRAY[2,9,23,24,26,28,30], ARRAY[10,15,17,21,24,29,35]),
+('2020-10-21', ARRAY[1,3,9,14,19,20,31], ARRAY[2,7,8,11,17,18,22]),
+('2020-10-14', ARRAY[19,20,21,26,31,33,34], ARRAY[14,15,16,18,19,25,29]),
+('2020-10-07', ARRAY[9,12,13,14,20,27,35], ARRAY[10,13,14,17,19,25,33]),
+('2020-09-30', ARRAY[3,6,7,8,10,14,28], ARRAY[4,5,7,23,24,25,33]),
+('2020-09-23', ARRAY[7,12,13,22,24,28,32], ARRAY[5,6,17,23,24,26,27]),
+('2020-09-16', ARRAY[1,5,7,22,23,30,33], ARRAY[4,9,10,20,22,31,34]),
+('2020-09-09', ARRAY[1,6,9,18,20,23,35], ARRAY[6,7,10,12,15,16,23]),
+('2020-09-02', ARRAY[2,11,14,16,20,22,31], ARRAY[7,11,17,18,27,30,34]),
+('2020-08-26', ARRAY[2,3,8,11,13,20,31], ARRAY[2,7,12,16,18,26,33]),
+('2020-08-19', ARRAY[5,14,15,22,24,31,33], ARRAY[2,17,22,29,31,33,34]),
+('2020-08-12', ARRAY[5,7,11,14,16,19,25], ARRAY[2,22,25,26,27,33,34]),
+('2020-08-05', ARRAY[2,21,23,25,27,28,30], ARRAY[2,11,14,20,24,30,31]),
+('2020-07-29', ARRAY[3,4,5,6,13,15,20], ARRAY[7,12,15,20,22,25,27]),
+('2020-07-22', ARRAY[5,12,13,15,22,26,34], ARRAY[2,8,11,18,26,29,34]),
+('2020-07-15', ARRAY[10,18,19,21,22,32,33], ARRAY[5,11,14,22,23,25,31]),
+('2020-07-08', ARRAY[6,11,12,15,23,29,32], ARRAY[1,9,15,18,21,31,33]),
+('2020-07-01', ARRAY[6,12,15,16,19,22,34], ARRAY[4,8,10,23,25,27,31]),
+('2020-06-24', ARRAY[4,5,6,7,8,12,16], ARRAY[5,9,10,15,20,29,30]),
+('2020-06-17', ARRAY[5,6,11,16,22,24,32], ARRAY[2,11,12,20,21,28,31]),
+('2020-06-10', ARRAY[1,7,13,14,22,24,33], ARRAY[3,6,11,25,29,30,32]),
+('2020-06-03', ARRAY[3,4,11,15,22,31,34], ARRAY[4,5,7,12,16,25,33]),
+('2020-05-27', ARRAY[2,4,18,19,21,29,33], ARRAY[6,8,10,11,13,19,34]),
+('2020-05-20', ARRAY[6,8,12,14,24,28,33], ARRAY[2,6,12,13,19,21,26]),
+('2020-05-13', ARRAY[2,6,17,19,22,25,27], ARRAY[2,7,10,12,13,21,34]),
+('2020-05-06', ARRAY[3,8,9,19,20,27,31], ARRAY[3,6,10,24,27,32,35]),
+('2020-04-29', ARRAY[9,11,18,24,27,29,31], ARRAY[1,3,5,15,19,26,30]),
+('2020-04-22', ARRAY[5,10,13,16,20,33,35], ARRAY[2,3,5,11,15,16,28]),
+('2020-04-15', ARRAY[9,10,14,23,24,26,32], ARRAY[1,15,16,20,29,31,32]),
+('2020-04-08', ARRAY[8,15,16,25,28,31,32], ARRAY[14,22,24,28,29,31,33]),
+('2020-04-01', ARRAY[9,15,17,20,22,26,29], ARRAY[4,5,7,25,28,33,35]),
+('2020-03-25', ARRAY[1,3,15,17,26,33,34], ARRAY[2,11,18,19,20,27,33]),
+('2020-03-18', ARRAY[1,8,9,11,19,20,21], ARRAY[2,8,13,17,27,30,34]),
+('2020-03-11', ARRAY[1,3,5,7,12,14,21], ARRAY[2,8,11,12,20,28,29]),
+('2020-03-04', ARRAY[1,2,4,9,10,13,27], ARRAY[5,7,9,22,23,26,29]),
+('2020-02-26', ARRAY[1,10,13,17,19,22,30], ARRAY[2,3,10,11,15,16,25]),
+('2020-02-19', ARRAY[12,23,26,30,31,32,35], ARRAY[8,11,13,18,25,26,35]),
+('2020-02-12', ARRAY[1,4,5,9,11,27,31], ARRAY[1,5,6,7,13,23,24]),
+('2020-02-05', ARRAY[9,12,14,17,20,21,32], ARRAY[2,3,9,11,12,16,22]),
+('2020-01-29', ARRAY[8,10,22,26,28,32,34], ARRAY[1,6,9,11,17,32,35]),
+('2020-01-22', ARRAY[3,10,13,30,31,33,34], ARRAY[3,12,14,17,18,24,28]),
+('2020-01-15', ARRAY[3,4,16,17,18,27,32], ARRAY[2,16,17,22,25,28,29]),
+('2020-01-08', ARRAY[3,11,19,22,25,26,30], ARRAY[10,11,14,22,23,28,31]),
+('2020-01-01', ARRAY[3,18,19,26,28,29,33], ARRAY[6,17,18,20,23,28,31]),
+('2019-12-25', ARRAY[5,12,13,18,21,26,32], ARRAY[2,10,12,22,27,29,33]),
+('2019-12-18', ARRAY[2,8,9,11,14,23,33], ARRAY[1,6,10,11,17,25,27]),
+('2019-12-11', ARRAY[8,12,15,16,20,29,35], ARRAY[2,10,20,28,30,32,35]),
+('2019-12-04', ARRAY[10,15,19,20,29,32,35], ARRAY[6,10,15,19,23,27,33]),
+('2019-11-27', ARRAY[1,8,11,13,21,23,34], ARRAY[5,12,13,18,21,22,24]),
+('2019-11-20', ARRAY[4,10,12,15,28,29,34], ARRAY[1,4,6,20,23,27,29]),
+('2019-11-13', ARRAY[4,13,16,21,23,27,30], ARRAY[2,4,6,12,19,25,28]),
+('2019-11-06', ARRAY[5,6,11,19,21,26,35], ARRAY[5,9,10,14,17,21,28]),
+('2019-10-30', ARRAY[7,9,13,27,29,34,35], ARRAY[5,14,20,28,29,30,35]),
+('2019-10-23', ARRAY[1,9,13,24,25,29,30], ARRAY[3,6,8,9,12,15,22]),
+('2019-10-16', ARRAY[1,4,6,15,27,29,31], ARRAY[6,16,26,29,30,31,32]),
+('2019-10-09', ARRAY[18,19,20,27,28,29,35], ARRAY[6,10,16,25,26,29,35]),
+('2019-10-02', ARRAY[3,4,10,12,26,28,32], ARRAY[5,17,18,23,26,31,35]),
+('2019-09-25', ARRAY[1,7,11,27,28,31,35], ARRAY[5,10,13,22,30,33,35]),
+('2019-09-18', ARRAY[7,16,18,20,21,22,27], ARRAY[4,5,12,14,17,21,27]),
+('2019-09-11', ARRAY[1,14,16,17,20,30,32], ARRAY[7,8,11,14,20,29,32]),
+('2019-09-04', ARRAY[4,6,8,13,22,32,34], ARRAY[3,4,10,13,15,28,31]),
+('2019-08-28', ARRAY[1,4,6,12,21,22,32], ARRAY[7,19,24,29,31,32,35]),
+('2019-08-21', ARRAY[5,7,11,19,20,24,34], ARRAY[4,22,23,24,28,31,35]),
+('2019-08-14', ARRAY[3,15,20,23,30,32,35], ARRAY[1,2,5,13,31,32,33]),
+('2019-08-07', ARRAY[2,5,12,14,23,28,35], ARRAY[6,18,20,23,24,27,34]),
+('2019-07-31', ARRAY[4,6,12,15,26,29,35], ARRAY[17,18,21,25,30,31,35]),
+('2019-07-24', ARRAY[1,4,9,22,24,33,34], ARRAY[7,8,10,12,26,28,33]),
+('2019-07-17', ARRAY[2,3,6,8,12,17,31], ARRAY[11,26,27,30,31,32,35]),
+('2019-07-10', ARRAY[1,12,13,21,22,27,28], ARRAY[5,12,15,19,23,24,26]),
+('2019-07-03', ARRAY[8,16,18,19,20,24,33], ARRAY[5,9,15,17,24,27,30]),
+('2019-06-26', ARRAY[3,12,16,21,27,31,33], ARRAY[1,11,19,21,23,26,27]),
+('2019-06-19', ARRAY[6,10,12,19,22,25,26], ARRAY[10,15,24,25,30,32,34]),
+('2019-06-12', ARRAY[3,5,9,21,22,25,27], ARRAY[3,4,17,22,26,27,33]),
+('2019-06-05', ARRAY[1,6,9,11,20,32,35], ARRAY[3,6,13,14,18,23,35]),
+('2019-05-29', ARRAY[6,10,14,18,25,31,32], ARRAY[2,5,11,12,17,21,22]),
+('2019-05-22', ARRAY[1,9,13,17,26,34,35], ARRAY[4,10,11,12,20,30,35]),
+('2019-05-15', ARRAY[3,13,23,29,30,31,33], ARRAY[2,5,6,14,17,21,29]),
+('2019-05-08', ARRAY[4,9,14,17,23,26,35], ARRAY[5,12,16,18,23,26,30]),
+('2019-05-01', ARRAY[5,8,17,19,20,21,35], ARRAY[3,5,15,18,21,26,27]),
+('2019-04-24', ARRAY[1,2,6,21,24,28,32], ARRAY[1,11,19,22,24,29,34]),
+('2019-04-17', ARRAY[3,16,19,24,30,32,33], ARRAY[1,3,14,16,17,23,24]),
+('2019-04-10', ARRAY[3,4,7,10,14,17,23], ARRAY[2,9,11,18,23,25,28]),
+('2019-04-03', ARRAY[5,10,12,13,20,26,27], ARRAY[6,13,17,18,19,23,24]),
+('2019-03-27', ARRAY[2,3,10,12,13,14,23], ARRAY[9,10,11,12,16,20,26]),
+('2019-03-20', ARRAY[1,3,5,15,17,23,30], ARRAY[1,8,19,20,22,24,31]),
+('2019-03-13', ARRAY[5,10,18,22,25,32,35], ARRAY[3,8,11,13,21,32,35]),
+('2019-03-06', ARRAY[15,17,19,24,26,33,34], ARRAY[4,12,15,23,26,30,33]),
+('2019-02-27', ARRAY[1,4,7,11,16,18,20], ARRAY[7,11,15,21,23,24,30]),
+('2019-02-20', ARRAY[8,10,13,14,16,20,31], ARRAY[2,14,19,25,29,30,32]),
+('2019-02-13', ARRAY[1,5,8,9,25,26,31], ARRAY[4,5,7,18,23,24,34]),
+('2019-02-06', ARRAY[2,6,8,21,25,29,31], ARRAY[4,5,6,13,17,20,28]),
+('2019-01-30', ARRAY[1,12,17,19,22,30,32], ARRAY[7,14,17,21,28,32,33]),
+('2019-01-23', ARRAY[1,2,8,15,24,30,34], ARRAY[3,4,8,9,12,13,25]),
+('2019-01-16', ARRAY[3,5,6,7,18,23,32], ARRAY[6,9,10,18,30,33,35]),
+('2019-01-09', ARRAY[10,16,17,20,22,29,31], ARRAY[2,4,9,13,18,23,24]),
+('2019-01-02', ARRAY[2,11,19,26,27,29,34], ARRAY[5,11,12,19,28,32,33]),
+('2018-12-26', ARRAY[4,7,8,18,19,23,33], ARRAY[9,11,12,16,19,22,33]),
+('2018-12-19', ARRAY[4,8,18,19,20,23,30], ARRAY[13,14,16,20,26,28,31]),
+('2018-12-12', ARRAY[4,7,8,13,16,23,35], ARRAY[5,21,25,28,29,33,34]),
+('2018-12-05', ARRAY[6,11,15,17,18,27,31], ARRAY[3,7,9,23,24,25,35]),
+('2018-11-28', ARRAY[3,6,7,10,23,28,29], ARRAY[2,5,17,19,29,33,34]),
+('2018-11-21', ARRAY[4,7,8,14,15,20,35], ARRAY[6,11,22,23,24,30,32]),
+('2018-11-14', ARRAY[5,11,17,25,26,29,31], ARRAY[1,2,5,6,17,24,27]),
+('2018-11-07', ARRAY[9,12,14,20,30,31,33], ARRAY[1,4,11,19,22,29,32]),
+('2018-10-31', ARRAY[2,14,18,20,26,28,32], ARRAY[2,4,7,13,19,33,34]),
+('2018-10-24', ARRAY[8,11,16,22,25,32,33], ARRAY[6,7,12,27,28,31,35]),
+('2018-10-17', ARRAY[6,8,10,16,18,21,33], ARRAY[2,5,18,21,28,29,30]),
+('2018-10-10', ARRAY[1,3,7,9,12,17,29], ARRAY[2,3,23,27,28,29,31]),
+('2018-10-03', ARRAY[8,9,10,15,16,20,26], ARRAY[19,21,26,27,30,33,35]),
+('2018-09-26', ARRAY[3,8,11,12,14,29,35], ARRAY[1,16,18,19,24,32,34]),
+('2018-09-19', ARRAY[1,8,15,18,24,27,31], ARRAY[1,7,10,15,21,22,30]),
+('2018-09-12', ARRAY[2,10,11,18,20,26,34], ARRAY[4,7,9,20,22,28,31]),
+('2018-09-05', ARRAY[1,8,10,21,24,34,35], ARRAY[6,8,13,16,29,31,34]),
+('2018-08-29', ARRAY[5,12,19,22,24,29,31], ARRAY[1,4,9,17,21,24,25]),
+('2018-08-22', ARRAY[3,11,16,24,25,27,29], ARRAY[1,3,15,17,18,28,29]),
+('2018-08-15', ARRAY[2,9,17,21,23,25,31], ARRAY[4,5,11,13,23,25,29]),
+('2018-08-08', ARRAY[2,5,10,25,26,34,35], ARRAY[3,7,11,12,16,26,33]),
+('2018-08-01', ARRAY[2,13,17,19,20,21,34], ARRAY[7,15,20,22,25,28,31]),
+('2018-07-25', ARRAY[3,5,12,15,18,24,25], ARRAY[10,19,22,23,26,28,29]),
+('2018-07-18', ARRAY[6,11,13,16,17,21,23], ARRAY[7,15,20,30,31,32,34]),
+('2018-07-11', ARRAY[5,12,13,16,20,21,32], ARRAY[2,6,9,10,20,21,28]),
+('2018-07-04', ARRAY[2,6,10,12,27,28,33], ARRAY[5,6,11,18,27,30,34]),
+('2018-06-27', ARRAY[1,6,11,13,16,20,25], ARRAY[2,5,11,13,17,26,32]),
+('2018-06-20', ARRAY[1,8,23,25,28,29,34], ARRAY[1,5,8,12,22,23,26]),
+('2018-06-13', ARRAY[2,8,18,19,20,24,25], ARRAY[6,7,13,20,23,26,28]),
+('2018-06-06', ARRAY[2,6,8,15,16,22,29], ARRAY[1,11,12,16,19,33,35]),
+('2018-05-30', ARRAY[3,6,13,23,27,31,32], ARRAY[4,8,9,10,24,26,34]),
+('2018-05-23', ARRAY[2,6,13,16,23,31,33], ARRAY[3,4,5,29,31,33,35]),
+('2018-05-16', ARRAY[2,4,6,8,10,18,34], ARRAY[3,9,11,12,18,23,27]),
+('2018-05-09', ARRAY[4,9,15,20,24,32,34], ARRAY[7,8,11,18,21,23,24]),
+('2018-05-02', ARRAY[5,6,25,27,29,32,34], ARRAY[4,5,10,14,23,26,28]),
+('2018-04-25', ARRAY[1,4,5,6,22,23,32], ARRAY[9,10,11,12,14,30,34]),
+('2018-04-18', ARRAY[4,9,10,14,24,27,35], ARRAY[1,3,17,18,23,27,32]),
+('2018-04-11', ARRAY[6,9,10,13,17,27,29], ARRAY[2,11,16,17,18,20,23]),
+('2018-04-04', ARRAY[1,7,15,19,26,28,33], ARRAY[2,5,6,7,11,14,19]),
+('2018-03-28', ARRAY[3,4,22,23,29,31,32], ARRAY[1,6,7,31,33,34,35]),
+('2018-03-21', ARRAY[3,13,16,20,26,27,35], ARRAY[1,6,7,9,19,23,32]),
+('2018-03-14', ARRAY[8,19,20,21,24,30,33], ARRAY[2,3,21,23,24,25,27]),
+('2018-03-07', ARRAY[2,3,4,12,19,23,32], ARRAY[13,14,24,25,31,33,35]),
+('2018-02-28', ARRAY[2,3,17,20,22,26,32], ARRAY[7,11,13,15,16,30,35]),
+('2018-02-21', ARRAY[5,8,21,23,24,34,35], ARRAY[2,6,7,18,19,28,32]),
+('2018-02-14', ARRAY[7,10,17,18,28,29,31], ARRAY[4,9,15,18,19,21,35]),
+('2018-02-07', ARRAY[4,11,12,17,21,23,34], ARRAY[3,13,24,26,29,30,33]),
+('2018-01-31', ARRAY[2,3,6,12,17,31,35], ARRAY[11,18,21,23,29,31,33]),
+('2018-01-24', ARRAY[1,6,14,16,22,28,33], ARRAY[7,9,11,20,21,32,33]),
+('2018-01-17', ARRAY[2,6,11,13,15,29,33], ARRAY[2,6,8,9,16,18,24]),
+('2018-01-10', ARRAY[5,6,13,16,19,26,31], ARRAY[2,12,13,16,21,25,28]),
+('2018-01-03', ARRAY[3,6,12,20,22,30,35], ARRAY[1,9,18,24,30,31,34]),
+('2017-12-27', ARRAY[9,11,17,18,25,27,35], ARRAY[5,8,15,17,18,20,27]),
+('2017-12-20', ARRAY[11,19,22,24,25,26,31], ARRAY[5,6,10,20,22,26,29]),
+('2017-12-13', ARRAY[3,14,19,21,22,23,30], ARRAY[14,16,19,22,28,29,31]),
+('2017-12-06', ARRAY[6,9,12,15,17,22,24], ARRAY[12,15,16,25,26,27,28]),
+('2017-11-29', ARRAY[2,3,5,16,17,27,32], ARRAY[10,14,22,24,25,29,33]),
+('2017-11-22', ARRAY[7,14,18,22,25,26,29], ARRAY[7,9,11,15,16,26,28]),
+('2017-11-15', ARRAY[5,10,21,27,28,31,33], ARRAY[2,12,14,15,20,34,35]),
+('2017-11-08', ARRAY[2,7,17,19,24,30,33], ARRAY[14,16,18,24,27,33,35]),
+('2017-11-01', ARRAY[15,16,24,25,28,30,35], ARRAY[2,9,12,23,26,32,34]),
+('2017-10-25', ARRAY[11,18,20,26,27,28,35], ARRAY[1,4,9,16,20,31,35]),
+('2017-10-18', ARRAY[1,6,13,19,24,33,35], ARRAY[1,5,9,13,16,30,34]),
+('2017-10-11', ARRAY[1,3,5,7,14,23,28], ARRAY[9,14,15,21,30,33,35]),
+('2017-10-04', ARRAY[13,15,16,19,21,23,28], ARRAY[1,2,8,13,18,26,33]),
+('2017-09-27', ARRAY[10,14,21,24,33,34,35], ARRAY[1,11,12,13,14,24,25]),
+('2017-09-20', ARRAY[1,3,5,12,15,25,33], ARRAY[8,9,12,15,16,30,35]),
+('2017-09-13', ARRAY[3,4,12,17,22,24,34], ARRAY[4,10,15,17,24,25,29]),
+('2017-09-06', ARRAY[6,11,17,28,30,32,34], ARRAY[1,4,7,20,26,27,34]),
+('2017-08-30', ARRAY[3,9,11,12,13,24,27], ARRAY[5,11,25,29,32,33,34]),
+('2017-08-23', ARRAY[8,10,14,20,27,29,30], ARRAY[2,13,15,22,25,26,35]),
+('2017-08-16', ARRAY[1,3,7,21,23,32,33], ARRAY[1,23,24,26,30,32,33]),
+('2017-08-09', ARRAY[5,7,13,14,19,23,29], ARRAY[2,4,9,18,19,33,35]),
+('2017-08-02', ARRAY[5,9,11,17,25,32,34], ARRAY[2,5,10,20,26,30,35]),
+('2017-07-26', ARRAY[1,3,6,13,17,20,33], ARRAY[3,11,24,25,26,28,29]),
+('2017-07-19', ARRAY[12,19,21,28,29,31,34], ARRAY[2,8,10,12,14,19,35]),
+('2017-07-12', ARRAY[1,2,3,10,25,30,31], ARRAY[3,5,10,25,27,31,34]),
+('2017-07-05', ARRAY[3,10,13,22,24,26,35], ARRAY[7,13,17,18,22,23,34]),
+('2017-06-28', ARRAY[5,16,19,26,27,30,34], ARRAY[4,11,12,16,17,21,22]),
+('2017-06-21', ARRAY[9,11,13,20,24,25,32], ARRAY[3,6,9,16,23,32,33]),
+('2017-06-14', ARRAY[14,15,18,21,23,25,34], ARRAY[1,4,10,28,30,32,34]),
+('2017-06-07', ARRAY[2,7,15,21,27,28,31], ARRAY[8,12,13,16,21,28,31]),
+('2017-05-31', ARRAY[4,12,14,25,29,31,34], ARRAY[2,6,8,20,21,25,34]),
+('2017-05-24', ARRAY[2,3,4,14,18,22,26], ARRAY[11,13,17,21,25,31,35]),
+('2017-05-17', ARRAY[5,11,14,15,26,27,35], ARRAY[1,3,5,11,13,14,28]),
+('2017-05-10', ARRAY[1,11,15,17,23,26,34], ARRAY[8,9,12,20,25,28,33]),
+('2017-05-03', ARRAY[4,8,17,23,31,32,34], ARRAY[3,7,9,11,18,21,33]),
+('2017-04-26', ARRAY[2,4,5,20,24,26,28], ARRAY[1,9,10,13,18,21,27]),
+('2017-04-19', ARRAY[2,3,14,15,17,19,31], ARRAY[10,11,12,13,16,29,32]),
+('2017-04-12', ARRAY[18,19,21,22,25,31,35], ARRAY[5,9,11,19,22,28,35]),
+('2017-04-05', ARRAY[4,8,11,13,26,27,30], ARRAY[13,15,23,25,27,28,29]),
+('2017-03-29', ARRAY[4,7,11,16,28,30,32], ARRAY[5,8,11,18,20,21,34]),
+('2017-03-22', ARRAY[1,6,7,12,18,25,35], ARRAY[1,4,5,8,20,21,34]),
+('2017-03-15', ARRAY[14,17,27,29,30,31,33], ARRAY[1,4,10,17,19,20,31]),
+('2017-03-08', ARRAY[7,8,11,12,29,32,33], ARRAY[3,4,8,14,19,27,31]),
+('2017-03-01', ARRAY[3,4,5,18,19,24,29], ARRAY[8,10,13,18,19,21,26]),
+('2017-02-22', ARRAY[4,17,21,22,25,26,27], ARRAY[1,12,19,26,27,29,35]),
+('2017-02-15', ARRAY[3,7,10,26,27,32,34], ARRAY[2,4,16,17,20,22,30]),
+('2017-02-08', ARRAY[3,8,14,17,20,28,32], ARRAY[2,5,9,19,25,30,31]),
+('2017-02-01', ARRAY[7,18,22,24,25,32,33], ARRAY[6,8,10,16,21,22,23]),
+('2017-01-25', ARRAY[4,12,14,23,25,30,34], ARRAY[6,8,10,14,15,17,29]),
+('2017-01-18', ARRAY[1,9,15,16,20,28,33], ARRAY[4,6,10,21,23,24,28]),
+('2017-01-11', ARRAY[2,3,5,8,15,23,33], ARRAY[7,11,16,17,22,23,34]),
+('2017-01-04', ARRAY[1,6,8,12,22,25,31], ARRAY[2,9,11,14,16,19,26]),
+('2016-12-28', ARRAY[12,16,22,25,29,30,32], ARRAY[5,22,23,24,26,27,34]),
+('2016-12-21', ARRAY[3,4,7,10,12,22,33], ARRAY[8,10,16,19,24,31,33]),
+('2016-12-14', ARRAY[1,4,7,13,20,23,29], ARRAY[5,16,21,22,23,28,32]),
+('2016-12-07', ARRAY[4,8,15,21,27,30,34], ARRAY[3,5,7,17,18,24,32]),
+('2016-11-30', ARRAY[3,4,8,13,14,17,30], ARRAY[3,14,15,20,22,23,29]),
+('2016-11-23', ARRAY[2,3,10,13,14,20,27], ARRAY[5,6,14,19,23,26,29]),
+('2016-11-16', ARRAY[2,21,22,26,30,32,35], ARRAY[2,4,11,21,23,25,30]),
+('2016-11-09', ARRAY[2,5,6,15,20,21,34], ARRAY[6,11,19,20,22,23,32]),
+('2016-11-02', ARRAY[2,3,7,16,21,26,29], ARRAY[1,5,7,9,19,23,34]),
+('2016-10-26', ARRAY[10,16,17,19,26,30,33], ARRAY[1,3,5,10,21,24,35]),
+('2016-10-19', ARRAY[5,17,19,22,28,31,35], ARRAY[6,13,17,25,26,33,34]),
+('2016-10-12', ARRAY[7,17,18,19,25,28,35], ARRAY[4,8,14,21,23,28,33]),
+('2016-10-05', ARRAY[1,3,4,5,9,19,35], ARRAY[6,8,10,31,32,34,35]),
+('2016-09-28', ARRAY[3,17,24,25,28,31,34], ARRAY[2,6,18,20,21,25,28]),
+('2016-09-21', ARRAY[5,8,19,20,23,31,34], ARRAY[1,4,12,18,22,23,30]),
+('2016-09-14', ARRAY[9,17,19,22,23,26,30], ARRAY[7,10,16,23,26,27,33]),
+('2016-09-07', ARRAY[3,9,13,14,15,26,27], ARRAY[11,13,18,24,25,30,33]),
+('2016-08-31', ARRAY[5,12,18,21,29,30,31], ARRAY[8,19,23,24,26,28,32]),
+('2016-08-24', ARRAY[1,2,20,26,30,31,34], ARRAY[3,8,9,19,23,25,33]),
+('2016-08-17', ARRAY[6,11,24,30,32,33,34], ARRAY[1,7,14,21,22,30,32]),
+('2016-08-10', ARRAY[5,7,10,18,19,21,23], ARRAY[2,4,5,7,29,31,32]),
+('2016-08-03', ARRAY[6,8,14,20,21,24,35], ARRAY[2,3,5,19,29,30,33]),
+('2016-07-27', ARRAY[13,16,18,25,26,32,35], ARRAY[5,7,11,13,18,23,27]),
+('2016-07-20', ARRAY[6,8,10,18,31,32,34], ARRAY[2,8,16,24,26,33,35]),
+('2016-07-13', ARRAY[2,6,9,10,15,17,31], ARRAY[2,3,9,19,25,28,29]),
+('2016-07-06', ARRAY[1,4,9,12,15,16,34], ARRAY[10,11,15,22,27,30,35]),
+('2016-06-29', ARRAY[13,15,16,20,22,32,34], ARRAY[4,12,17,19,22,27,30]),
+('2016-06-22', ARRAY[4,5,11,18,20,31,35], ARRAY[3,4,6,11,14,25,30]),
+('2016-06-15', ARRAY[14,15,17,20,24,26,33], ARRAY[5,9,10,18,28,29,34]),
+('2016-06-08', ARRAY[2,5,23,28,31,32,34], ARRAY[2,7,14,18,21,23,26]),
+('2016-06-01', ARRAY[3,4,6,8,31,33,35], ARRAY[3,8,10,17,21,28,34]),
+('2016-05-25', ARRAY[6,10,12,13,21,33,35], ARRAY[2,7,13,20,21,23,32]),
+('2016-05-18', ARRAY[10,13,14,15,19,25,28], ARRAY[7,10,16,24,25,30,31]),
+('2016-05-11', ARRAY[18,19,23,29,30,32,33], ARRAY[1,10,16,21,23,27,30]),
+('2016-05-04', ARRAY[1,11,13,14,16,19,31], ARRAY[3,9,11,19,23,24,33]),
+('2016-04-27', ARRAY[4,8,18,20,22,27,32], ARRAY[7,13,26,28,33,34,35]),
+('2016-04-20', ARRAY[5,7,8,12,25,26,30], ARRAY[1,7,11,14,21,30,32]),
+('2016-04-13', ARRAY[2,13,15,16,20,28,30], ARRAY[4,6,14,23,29,32,34]),
+('2016-04-06', ARRAY[5,11,16,22,28,30,33], ARRAY[9,10,11,13,25,30,33]),
+('2016-03-30', ARRAY[5,13,15,19,25,29,34], ARRAY[2,7,8,9,10,23,24]),
+('2016-03-23', ARRAY[6,8,10,15,22,26,33], ARRAY[1,5,14,21,24,26,31]),
+('2016-03-16', ARRAY[3,5,10,25,28,32,35], ARRAY[7,8,16,19,21,22,24]),
+('2016-03-09', ARRAY[4,10,17,20,24,29,35], ARRAY[15,16,18,19,20,31,33]),
+('2016-03-02', ARRAY[4,5,7,14,25,30,31], ARRAY[7,8,11,15,16,21,27]),
+('2016-02-24', ARRAY[7,12,21,23,26,28,30], ARRAY[1,17,18,24,25,29,30]),
+('2016-02-17', ARRAY[5,7,12,15,23,26,31], ARRAY[1,6,13,28,31,33,35]),
+('2016-02-10', ARRAY[11,12,16,20,27,30,31], ARRAY[1,5,20,23,26,28,32]),
+('2016-02-03', ARRAY[4,6,13,26,29,31,33], ARRAY[8,12,18,26,28,31,35]),
+('2016-01-27', ARRAY[4,6,9,15,19,20,28], ARRAY[9,10,13,24,26,28,32]),
+('2016-01-20', ARRAY[2,11,13,21,25,33,35], ARRAY[2,12,15,17,22,28,32]),
+('2016-01-13', ARRAY[2,13,25,27,28,29,35], ARRAY[2,7,9,15,22,32,35]),
+('2016-01-06', ARRAY[6,22,23,24,26,27,35], ARRAY[1,9,11,24,29,30,34]),
+('2015-12-30', ARRAY[6,8,11,17,25,29,32], ARRAY[2,14,18,26,29,32,34]),
+('2015-12-23', ARRAY[14,19,22,23,24,28,29], ARRAY[2,5,11,18,26,28,29]),
+('2015-12-16', ARRAY[1,8,9,11,16,17,31], ARRAY[6,12,17,19,23,29,30]),
+('2015-12-09', ARRAY[1,6,9,13,21,32,33], ARRAY[3,10,12,22,23,32,33]),
+('2015-12-02', ARRAY[3,8,12,14,20,31,32], ARRAY[9,10,12,17,18,30,32]),
+('2015-11-25', ARRAY[1,4,7,9,16,20,25], ARRAY[1,18,19,22,24,26,30]),
+('2015-11-18', ARRAY[3,8,19,24,28,31,34], ARRAY[2,4,5,16,20,24,31]),
+('2015-11-11', ARRAY[1,2,3,6,16,28,35], ARRAY[1,8,10,14,16,22,32]),
+('2015-11-04', ARRAY[8,11,21,27,29,31,35], ARRAY[1,8,14,21,28,29,30]),
+('2015-10-28', ARRAY[2,5,8,16,25,29,34], ARRAY[4,5,9,10,22,28,34]),
+('2015-10-21', ARRAY[2,3,16,20,29,34,35], ARRAY[2,10,14,21,22,29,30]),
+('2015-10-14', ARRAY[1,15,16,19,21,24,33], ARRAY[1,12,17,21,23,26,27]),
+('2015-10-07', ARRAY[4,8,9,17,21,23,32], ARRAY[1,7,16,28,31,34,35]),
+('2015-09-30', ARRAY[2,4,17,23,32,33,35], ARRAY[1,10,11,16,24,26,27]),
+('2015-09-23', ARRAY[1,3,18,19,22,28,31], ARRAY[3,8,12,16,25,27,30]),
+('2015-09-16', ARRAY[2,4,15,25,26,29,31], ARRAY[3,8,19,20,25,26,30]),
+('2015-09-09', ARRAY[1,3,7,14,20,26,35], ARRAY[1,4,9,13,18,21,25]),
+('2015-09-02', ARRAY[1,8,9,12,15,22,29], ARRAY[1,6,8,21,25,28,34]),
+('2015-08-26', ARRAY[4,7,11,16,18,25,28], ARRAY[6,7,8,24,26,29,34]),
+('2015-08-19', ARRAY[4,12,17,29,32,33,35], ARRAY[5,8,9,13,19,25,31]),
+('2015-08-12', ARRAY[3,17,28,29,31,33,34], ARRAY[5,18,19,22,24,26,35]),
+('2015-08-05', ARRAY[5,8,20,21,23,25,33], ARRAY[4,8,12,14,18,20,30]),
+('2015-07-29', ARRAY[10,15,19,22,30,33,34], ARRAY[1,4,16,19,22,31,35]),
+('2015-07-22', ARRAY[5,7,17,20,24,32,34], ARRAY[3,11,16,18,20,24,31]),
+('2015-07-15', ARRAY[5,10,11,13,23,34,35], ARRAY[1,9,20,24,31,32,34]),
+('2015-07-08', ARRAY[3,11,12,18,25,26,30], ARRAY[10,18,20,27,28,33,34]),
+('2015-07-01', ARRAY[3,5,8,12,25,30,34], ARRAY[8,13,14,15,16,24,25]),
+('2015-06-24', ARRAY[2,3,4,12,24,28,29], ARRAY[7,8,11,12,18,23,30]),
+('2015-06-17', ARRAY[2,5,20,24,28,34,35], ARRAY[3,10,13,20,23,25,26]),
+('2015-06-10', ARRAY[5,16,19,24,27,28,31], ARRAY[5,7,8,10,11,15,22]),
+('2015-06-03', ARRAY[5,18,19,26,27,34,35], ARRAY[12,13,19,24,26,28,30]),
+('2015-05-27', ARRAY[3,13,25,27,29,30,32], ARRAY[10,14,17,20,22,23,27]),
+('2015-05-20', ARRAY[1,8,10,18,22,32,33], ARRAY[1,8,15,19,26,28,33]),
+('2015-05-13', ARRAY[4,18,19,21,24,26,31], ARRAY[4,5,12,13,14,24,33]),
+('2015-05-06', ARRAY[3,5,17,18,19,20,26], ARRAY[6,11,13,21,22,24,33]),
+('2015-04-29', ARRAY[1,5,13,15,19,24,33], ARRAY[5,6,9,10,30,34,35]),
+('2015-04-22', ARRAY[2,6,16,18,19,26,35], ARRAY[9,16,19,24,25,32,34]),
+('2015-04-15', ARRAY[5,9,10,12,14,24,25], ARRAY[3,5,11,14,16,25,32]),
+('2015-04-08', ARRAY[3,4,12,17,20,23,33], ARRAY[5,6,8,12,16,17,24]),
+('2015-04-01', ARRAY[5,6,7,9,13,14,31], ARRAY[7,12,16,20,22,34,35]),
+('2015-03-25', ARRAY[1,4,9,11,21,22,25], ARRAY[7,10,16,18,26,31,32]),
+('2015-03-18', ARRAY[3,12,15,18,19,26,31], ARRAY[1,5,8,11,14,15,17]),
+('2015-03-11', ARRAY[3,11,12,22,30,31,35], ARRAY[3,6,8,9,20,27,34]),
+('2015-03-04', ARRAY[1,15,16,18,19,25,31], ARRAY[3,9,11,18,23,26,34]),
+('2015-02-25', ARRAY[3,14,24,25,27,29,32], ARRAY[5,6,8,17,31,33,35]),
+('2015-02-18', ARRAY[6,7,16,30,32,33,34], ARRAY[9,22,24,28,30,31,35]),
+('2015-02-11', ARRAY[18,20,22,25,27,28,33], ARRAY[3,6,11,17,18,26,30]),
+('2015-02-04', ARRAY[8,12,16,19,21,23,29], ARRAY[1,2,3,15,27,29,32]),
+('2015-01-28', ARRAY[4,5,12,14,18,26,30], ARRAY[10,13,22,24,26,30,34]),
+('2015-01-21', ARRAY[4,11,13,14,19,26,28], ARRAY[11,16,18,23,26,27,31]),
+('2015-01-14', ARRAY[5,9,13,14,24,26,34], ARRAY[2,5,12,14,16,26,29]),
+('2015-01-07', ARRAY[1,3,10,14,17,18,28], ARRAY[1,9,10,15,22,30,34]),
+('2015-01-01', ARRAY[9,13,15,19,24,27,33], ARRAY[17,21,27,29,32,34,35]),
+('2014-12-24', ARRAY[3,6,12,17,21,24,25], ARRAY[4,6,9,21,23,27,28]),
+('2014-12-17', ARRAY[3,5,13,24,31,32,35], ARRAY[6,7,10,21,23,31,35]),
+('2014-12-10', ARRAY[8,10,12,19,26,30,31], ARRAY[4,9,12,15,19,21,25]),
+('2014-12-03', ARRAY[7,10,15,21,23,26,30], ARRAY[8,13,22,28,29,34,35]),
+('2014-11-26', ARRAY[1,6,7,12,24,29,31], ARRAY[11,16,18,19,26,31,32]),
+('2014-11-19', ARRAY[1,13,17,20,27,28,33], ARRAY[2,6,7,9,19,24,35]),
+('2014-11-12', ARRAY[4,10,12,24,27,30,32], ARRAY[1,5,16,21,22,29,31]),
+('2014-11-05', ARRAY[6,13,15,16,21,28,32], ARRAY[7,12,15,20,22,24,27]),
+('2014-10-29', ARRAY[2,11,20,23,24,28,33], ARRAY[2,3,12,14,15,28,31]),
+('2014-10-22', ARRAY[5,7,11,15,18,27,28], ARRAY[14,15,20,22,30,31,32]),
+('2014-10-15', ARRAY[1,6,9,13,16,21,23], ARRAY[12,15,23,24,28,31,34]),
+('2014-10-08', ARRAY[2,3,7,15,16,31,34], ARRAY[3,5,8,13,14,16,33]),
+('2014-10-01', ARRAY[8,10,13,21,22,34,35], ARRAY[5,8,9,22,23,25,26]),
+('2014-09-24', ARRAY[1,3,11,19,21,24,25], ARRAY[6,10,11,12,15,21,23]),
+('2014-09-17', ARRAY[9,14,21,23,25,27,33], ARRAY[4,6,13,16,21,22,33]),
+('2014-09-10', ARRAY[2,5,15,18,21,27,34], ARRAY[6,11,13,23,29,30,34]),
+('2014-09-03', ARRAY[9,11,13,24,26,33,34], ARRAY[2,3,5,13,14,16,24]),
+('2014-08-27', ARRAY[2,5,9,14,28,30,33], ARRAY[1,15,16,20,25,29,31]),
+('2014-08-20', ARRAY[5,8,20,21,22,32,35], ARRAY[7,14,21,23,25,30,32]),
+('2014-08-13', ARRAY[1,5,6,18,20,25,35], ARRAY[2,4,9,16,29,31,35]),
+('2014-08-06', ARRAY[2,8,15,21,23,31,34], ARRAY[4,11,15,17,25,26,34]),
+('2014-07-30', ARRAY[4,13,16,17,27,28,32], ARRAY[1,8,9,13,25,26,29]),
+('2014-07-23', ARRAY[9,12,17,20,21,26,27], ARRAY[1,7,20,22,23,28,34]),
+('2014-07-16', ARRAY[2,5,10,16,17,26,34], ARRAY[1,8,9,14,22,30,34]),
+('2014-07-09', ARRAY[2,7,8,9,13,16,27], ARRAY[2,6,12,16,19,25,34]),
+('2014-07-02', ARRAY[7,9,18,20,21,22,25], ARRAY[10,15,27,30,32,33,35]),
+('2014-06-25', ARRAY[7,12,13,16,19,24,27], ARRAY[19,21,23,25,29,30,31]),
+('2014-06-18', ARRAY[2,4,19,22,23,24,28], ARRAY[3,5,18,29,31,34,35]),
+('2014-06-11', ARRAY[12,17,19,21,23,29,30], ARRAY[1,3,15,16,18,25,31]),
+('2014-06-04', ARRAY[7,8,14,23,27,28,29], ARRAY[2,7,8,14,18,24,28]),
+('2014-05-28', ARRAY[6,11,12,18,23,29,34], ARRAY[3,9,10,14,21,25,33]),
+('2014-05-21', ARRAY[2,3,10,16,20,22,35], ARRAY[2,22,23,28,29,31,34]),
+('2014-05-14', ARRAY[7,19,21,29,30,31,34], ARRAY[2,4,9,14,17,22,34]),
+('2014-05-07', ARRAY[2,4,11,13,14,26,28], ARRAY[4,7,12,16,24,26,28]),
+('2014-04-30', ARRAY[1,3,12,21,22,25,35], ARRAY[9,11,15,19,22,25,34]),
+('2014-04-23', ARRAY[1,2,15,19,21,30,35], ARRAY[4,7,10,14,21,22,24]),
+('2014-04-16', ARRAY[1,3,8,12,14,18,23], ARRAY[4,20,22,26,28,30,35]),
+('2014-04-09', ARRAY[1,7,9,16,25,26,30], ARRAY[2,5,7,12,22,28,34]),
+('2014-04-02', ARRAY[3,7,14,22,28,31,32], ARRAY[2,4,24,28,29,30,31]),
+('2014-03-26', ARRAY[3,10,15,16,19,20,30], ARRAY[9,12,15,26,31,34,35]),
+('2014-03-19', ARRAY[1,8,11,19,23,29,31], ARRAY[4,9,10,19,22,24,26]),
+('2014-03-12', ARRAY[3,6,7,10,20,23,32], ARRAY[4,9,16,17,19,21,30]),
+('2014-03-05', ARRAY[1,7,12,15,23,25,34], ARRAY[10,11,12,17,22,28,29]),
+('2014-02-26', ARRAY[1,9,11,12,16,20,32], ARRAY[1,3,15,16,19,22,31]),
+('2014-02-19', ARRAY[7,11,14,15,19,23,25], ARRAY[1,7,9,13,21,22,30]),
+('2014-02-12', ARRAY[7,20,21,24,29,34,35], ARRAY[12,14,19,25,30,32,33]),
+('2014-02-05', ARRAY[8,16,19,22,29,30,33], ARRAY[11,13,18,25,29,32,34]),
+('2014-01-29', ARRAY[7,19,25,29,31,32,34], ARRAY[8,12,19,22,24,26,28]),
+('2014-01-22', ARRAY[4,6,17,19,24,28,30], ARRAY[4,5,6,10,21,28,29]),
+('2014-01-15', ARRAY[12,13,17,19,28,30,35], ARRAY[3,6,19,25,27,29,30]),
+('2014-01-08', ARRAY[3,14,15,16,20,23,33], ARRAY[3,11,15,16,23,25,29]),
+('2014-01-01', ARRAY[4,6,10,18,20,25,30], ARRAY[1,7,9,18,22,23,24]),
+('2013-12-25', ARRAY[5,8,11,17,24,30,35], ARRAY[8,9,17,24,25,32,35]),
+('2013-12-18', ARRAY[1,2,7,18,21,29,30], ARRAY[1,6,13,16,17,21,31]),
+('2013-12-11', ARRAY[4,6,7,13,14,26,29], ARRAY[7,10,16,20,23,27,28]),
+('2013-12-04', ARRAY[1,2,5,23,24,28,32], ARRAY[4,5,12,13,17,22,30]),
+('2013-11-27', ARRAY[3,9,15,17,19,21,25], ARRAY[16,19,21,23,24,27,29]),
+('2013-11-20', ARRAY[5,8,10,17,21,31,32], ARRAY[15,17,21,26,29,33,35]),
+('2013-11-13', ARRAY[1,8,10,11,18,25,35], ARRAY[7,19,22,23,25,31,32]),
+('2013-11-06', ARRAY[2,4,5,14,20,31,35], ARRAY[2,6,15,22,28,30,33]),
+('2013-10-30', ARRAY[3,5,6,7,10,17,28], ARRAY[16,20,23,28,30,32,33]),
+('2013-10-23', ARRAY[2,5,11,16,24,25,28], ARRAY[2,3,13,16,19,27,32]),
+('2013-10-16', ARRAY[1,5,8,17,28,29,35], ARRAY[1,4,9,28,30,32,35]),
+('2013-10-09', ARRAY[1,3,11,12,15,27,31], ARRAY[2,9,14,15,18,25,35]),
+('2013-10-02', ARRAY[11,16,19,21,22,24,31], ARRAY[4,7,15,17,25,30,33]),
+('2013-09-25', ARRAY[5,6,14,18,21,29,35], ARRAY[3,7,8,16,17,21,24]),
+('2013-09-18', ARRAY[6,10,11,24,26,29,32], ARRAY[2,5,11,16,23,26,31]),
+('2013-09-11', ARRAY[10,16,24,25,26,28,31], ARRAY[6,14,18,27,30,32,35]),
+('2013-09-04', ARRAY[9,14,16,22,24,25,27], ARRAY[5,9,10,21,22,24,28]),
+('2013-08-28', ARRAY[2,5,6,14,19,30,33], ARRAY[3,6,13,14,23,26,28]),
+('2013-08-21', ARRAY[1,7,15,28,31,32,33], ARRAY[6,11,16,19,28,30,35]),
+('2013-08-14', ARRAY[2,5,13,15,16,21,34], ARRAY[6,10,17,23,29,30,35]),
+('2013-08-07', ARRAY[5,7,13,14,15,27,34], ARRAY[1,8,13,15,17,25,35]),
+('2013-07-31', ARRAY[1,8,18,19,20,23,31], ARRAY[1,9,12,17,21,24,29]),
+('2013-07-24', ARRAY[3,16,23,24,26,30,33], ARRAY[12,14,15,16,18,27,34]),
+('2013-07-17', ARRAY[1,10,12,15,19,28,33], ARRAY[1,9,16,17,19,27,35]),
+('2013-07-10', ARRAY[3,6,10,13,18,20,25], ARRAY[4,6,8,14,20,21,28]),
+('2013-07-03', ARRAY[5,8,13,21,22,27,30], ARRAY[3,6,11,15,19,28,35]),
+('2013-06-26', ARRAY[15,17,20,22,24,26,29], ARRAY[1,4,6,14,24,29,34]),
+('2013-06-19', ARRAY[2,6,9,11,14,30,31], ARRAY[7,15,16,21,22,23,31]),
+('2013-06-12', ARRAY[1,9,11,14,31,33,34], ARRAY[7,8,19,20,26,27,31]),
+('2013-06-05', ARRAY[4,7,10,22,26,31,34], ARRAY[6,8,9,10,12,22,28]),
+('2013-05-29', ARRAY[12,21,24,25,27,28,32], ARRAY[4,7,11,19,25,28,33]),
+('2013-05-22', ARRAY[6,9,10,16,24,31,32], ARRAY[5,9,18,20,23,31,34]),
+('2013-05-15', ARRAY[5,17,19,24,25,27,33], ARRAY[2,11,15,18,19,24,30]),
+('2013-05-08', ARRAY[4,10,14,20,26,31,34], ARRAY[10,11,13,19,26,27,29]),
+('2013-05-02', ARRAY[8,12,16,17,20,23,24], ARRAY[1,3,15,19,24,29,30]),
+('2013-04-24', ARRAY[2,14,15,16,24,27,29], ARRAY[2,4,10,20,27,29,35]),
+('2013-04-17', ARRAY[8,10,12,21,23,33,35], ARRAY[2,4,5,6,7,16,31]),
+('2013-04-10', ARRAY[1,2,17,19,21,22,26], ARRAY[2,4,6,8,22,25,32]),
+('2013-04-03', ARRAY[2,7,8,13,22,28,35], ARRAY[6,8,16,19,28,29,32]),
+('2013-03-27', ARRAY[5,12,13,19,26,33,35], ARRAY[2,3,11,20,25,27,28]),
+('2013-03-20', ARRAY[8,11,19,22,23,25,30], ARRAY[4,15,16,18,23,24,27]),
+('2013-03-13', ARRAY[5,12,16,19,21,27,35], ARRAY[8,10,13,16,26,33,35]),
+('2013-03-06', ARRAY[2,5,6,8,13,22,26], ARRAY[1,6,9,14,16,22,35]),
+('2013-02-27', ARRAY[3,6,15,17,20,27,33], ARRAY[14,17,25,28,29,32,34]),
+('2013-02-20', ARRAY[6,17,18,19,23,31,33], ARRAY[1,8,11,12,20,23,35]),
+('2013-02-13', ARRAY[4,12,13,24,29,33,34], ARRAY[1,6,11,12,23,28,30]),
+('2013-02-06', ARRAY[3,7,16,19,21,33,35], ARRAY[5,10,11,14,16,24,35]),
+('2013-01-30', ARRAY[1,4,13,21,23,24,35], ARRAY[1,2,13,16,29,30,32]),
+('2013-01-23', ARRAY[2,3,9,22,26,28,30], ARRAY[8,15,17,18,19,29,34]),
+('2013-01-16', ARRAY[4,17,23,24,29,30,35], ARRAY[5,6,20,24,28,33,34]),
+('2013-01-09', ARRAY[1,6,9,15,22,25,31], ARRAY[6,9,17,23,25,32,34]),
+('2013-01-02', ARRAY[5,8,12,14,16,19,29], ARRAY[8,12,16,20,22,28,35]),
+('2012-12-26', ARRAY[1,7,15,22,24,28,30], ARRAY[2,5,9,19,22,30,34]),
+('2012-12-19', ARRAY[5,10,14,23,28,33,34], ARRAY[5,14,15,21,23,33,35]),
+('2012-12-12', ARRAY[4,5,8,9,23,26,34], ARRAY[3,9,15,26,28,33,35]),
+('2012-12-05', ARRAY[8,14,17,27,28,29,30], ARRAY[6,7,11,19,22,26,28]),
+('2012-11-28', ARRAY[6,7,13,25,32,33,34], ARRAY[3,6,16,20,21,24,31]),
+('2012-11-21', ARRAY[9,11,14,21,24,27,33], ARRAY[5,16,20,22,25,27,30]),
+('2012-11-14', ARRAY[1,4,9,13,16,21,23], ARRAY[1,2,4,8,27,30,33]),
+('2012-11-07', ARRAY[5,10,11,13,17,25,32], ARRAY[3,5,6,11,14,15,19]),
+('2012-10-31', ARRAY[2,7,21,22,24,28,32], ARRAY[4,9,13,15,16,22,23]),
+('2012-10-24', ARRAY[4,9,10,13,15,19,35], ARRAY[6,8,12,13,19,30,35]),
+('2012-10-17', ARRAY[10,13,14,16,19,25,27], ARRAY[2,3,8,14,17,19,21]),
+('2012-10-10', ARRAY[6,13,15,17,18,19,23], ARRAY[5,7,14,17,27,32,34]),
+('2012-10-03', ARRAY[2,7,12,21,25,29,32], ARRAY[1,7,21,23,28,31,32]),
+('2012-09-26', ARRAY[13,18,22,24,29,30,33], ARRAY[4,10,15,22,23,26,34]),
+('2012-09-19', ARRAY[15,20,21,26,29,32,34], ARRAY[6,18,24,25,28,29,30]),
+('2012-09-12', ARRAY[2,11,12,15,21,24,29], ARRAY[7,14,15,29,31,33,34]),
+('2012-09-05', ARRAY[2,3,12,16,20,30,32], ARRAY[3,15,16,18,24,26,33]),
+('2012-08-29', ARRAY[5,9,14,17,18,19,34], ARRAY[8,13,23,24,25,26,29]),
+('2012-08-22', ARRAY[4,6,8,11,27,28,30], ARRAY[2,3,8,11,13,20,24]),
+('2012-08-15', ARRAY[2,5,15,17,24,27,30], ARRAY[9,11,12,23,25,30,33]),
+('2012-08-08', ARRAY[2,5,9,11,16,22,25], ARRAY[7,15,16,21,23,26,31]),
+('2012-08-01', ARRAY[9,13,18,21,25,26,32], ARRAY[2,5,6,13,15,27,34]),
+('2012-07-25', ARRAY[5,6,9,10,14,17,28], ARRAY[4,6,9,16,20,27,32]),
+('2012-07-18', ARRAY[13,16,22,26,29,32,34], ARRAY[5,12,13,14,21,27,29]),
+('2012-07-11', ARRAY[1,5,8,10,14,18,19], ARRAY[7,11,12,15,16,17,25]),
+('2012-07-04', ARRAY[5,10,14,21,23,25,35], ARRAY[1,5,12,15,18,21,35]),
+('2012-06-27', ARRAY[4,11,15,21,22,23,26], ARRAY[1,5,6,9,19,31,32]),
+('2012-06-20', ARRAY[10,11,15,18,24,29,32], ARRAY[2,8,9,18,25,26,32]),
+('2012-06-13', ARRAY[1,5,17,19,26,29,34], ARRAY[4,12,15,17,26,32,33]),
+('2012-06-06', ARRAY[2,6,7,9,25,30,32], ARRAY[2,3,5,6,11,32,33]),
+('2012-05-30', ARRAY[6,9,19,20,28,30,35], ARRAY[3,10,14,16,25,32,33]),
+('2012-05-23', ARRAY[8,16,21,22,31,33,35], ARRAY[4,9,14,17,19,25,26]),
+('2012-05-16', ARRAY[15,16,17,21,27,29,33], ARRAY[3,8,10,16,29,30,32]),
+('2012-05-09', ARRAY[4,11,12,22,25,26,28], ARRAY[14,18,20,21,22,31,35]),
+('2012-05-02', ARRAY[1,4,8,25,26,28,33], ARRAY[11,19,23,27,30,32,34]),
+('2012-04-25', ARRAY[4,7,17,18,19,27,30], ARRAY[1,8,11,13,24,25,26]),
+('2012-04-18', ARRAY[10,11,12,14,19,34,35], ARRAY[3,17,22,26,27,29,35]),
+('2012-04-11', ARRAY[3,10,14,17,22,25,31], ARRAY[12,17,20,28,32,33,35]),
+('2012-04-04', ARRAY[7,10,15,16,19,28,32], ARRAY[1,7,8,13,24,32,35]),
+('2012-03-28', ARRAY[2,5,15,19,27,29,34], ARRAY[1,3,6,8,16,21,28]),
+('2012-03-21', ARRAY[5,7,12,19,23,31,32], ARRAY[14,20,22,23,24,27,32]),
+('2012-03-14', ARRAY[4,6,13,20,25,28,35], ARRAY[5,10,14,15,16,26,28]),
+('2012-03-07', ARRAY[6,8,10,18,29,30,32], ARRAY[2,3,8,15,18,19,21]),
+('2012-02-29', ARRAY[2,5,9,10,16,21,24], ARRAY[4,5,7,13,19,33,34]),
+('2012-02-22', ARRAY[4,5,9,14,25,27,33], ARRAY[12,15,16,20,23,24,33]),
+('2012-02-15', ARRAY[3,4,12,14,18,23,33], ARRAY[1,9,15,24,25,31,32]),
+('2012-02-08', ARRAY[4,5,11,13,21,28,30], ARRAY[1,7,14,26,27,31,33]),
+('2012-02-01', ARRAY[2,6,13,14,15,27,34], ARRAY[2,19,20,26,29,30,35]),
+('2012-01-25', ARRAY[1,12,14,17,22,27,33], ARRAY[2,3,4,8,16,25,29]),
+('2012-01-18', ARRAY[5,6,17,22,27,31,32], ARRAY[13,14,25,31,32,33,34]),
+('2012-01-11', ARRAY[3,10,14,16,21,25,29], ARRAY[8,9,10,13,19,23,25]),
+('2012-01-04', ARRAY[12,21,22,23,24,29,35], ARRAY[4,8,11,13,24,30,34]),
+('2011-12-28', ARRAY[1,3,4,10,16,18,33], ARRAY[1,15,20,30,31,32,35]),
+('2011-12-21', ARRAY[2,3,8,13,15,20,35], ARRAY[2,5,9,20,23,31,32]),
+('2011-12-14', ARRAY[4,5,12,14,16,18,33], ARRAY[4,5,7,13,16,20,26]),
+('2011-12-07', ARRAY[13,19,23,25,27,32,34], ARRAY[3,14,16,20,21,24,28]),
+('2011-11-30', ARRAY[4,7,11,22,31,32,33], ARRAY[5,7,14,19,22,28,29]),
+('2011-11-23', ARRAY[1,7,11,12,17,25,27], ARRAY[4,8,9,14,20,23,31]),
+('2011-11-16', ARRAY[1,4,8,11,15,23,35], ARRAY[3,6,23,24,31,32,33]),
+('2011-11-09', ARRAY[1,8,18,23,24,34,35], ARRAY[3,11,12,14,28,31,32]),
+('2011-11-02', ARRAY[5,6,9,14,20,22,30], ARRAY[1,15,20,23,24,27,29]),
+('2011-10-26', ARRAY[2,9,12,15,21,32,34], ARRAY[5,7,8,12,13,17,20]),
+('2011-10-19', ARRAY[10,13,18,19,21,25,29], ARRAY[6,7,13,18,25,27,29]),
+('2011-10-12', ARRAY[1,11,14,16,24,26,28], ARRAY[3,8,14,23,27,28,34]),
+('2011-10-05', ARRAY[2,4,19,21,25,34,35], ARRAY[7,23,24,29,30,31,33]),
+('2011-09-28', ARRAY[3,10,18,20,26,29,35], ARRAY[11,18,22,24,25,27,31]),
+('2011-09-21', ARRAY[2,5,11,12,18,26,34], ARRAY[7,8,16,19,21,22,30]),
+('2011-09-14', ARRAY[4,5,8,20,21,26,33], ARRAY[1,3,9,13,23,34,35]),
+('2011-09-07', ARRAY[1,2,4,10,12,17,28], ARRAY[10,18,23,24,28,29,32]),
+('2011-08-31', ARRAY[13,16,18,19,24,31,34], ARRAY[9,11,13,15,23,27,28]),
+('2011-08-24', ARRAY[2,3,12,14,24,29,32], ARRAY[16,18,21,26,29,30,33]),
+('2011-08-17', ARRAY[2,3,4,10,27,28,35], ARRAY[1,4,9,14,23,24,30]),
+('2011-08-10', ARRAY[4,5,10,13,16,18,31], ARRAY[5,7,9,11,12,21,30]),
+('2011-08-03', ARRAY[1,5,6,7,14,17,23], ARRAY[5,17,20,24,25,30,32]),
+('2011-07-27', ARRAY[7,9,16,20,21,23,24], ARRAY[4,6,8,11,23,29,31]),
+('2011-07-20', ARRAY[2,5,13,14,19,20,26], ARRAY[7,13,14,25,28,32,35]),
+('2011-07-13', ARRAY[20,21,29,31,32,33,34], ARRAY[7,16,21,22,26,31,33]),
+('2011-07-06', ARRAY[1,5,12,18,19,21,31], ARRAY[17,18,22,25,27,30,33]),
+('2011-06-29', ARRAY[7,11,15,16,21,22,34], ARRAY[2,4,10,20,27,32,33]),
+('2011-06-22', ARRAY[2,7,18,19,28,31,33], ARRAY[7,9,16,18,22,27,35]),
+('2011-06-15', ARRAY[1,3,13,17,20,30,31], ARRAY[3,4,9,26,30,32,34]),
+('2011-06-08', ARRAY[7,12,15,16,17,27,28], ARRAY[7,11,12,14,22,27,29]),
+('2011-06-01', ARRAY[8,12,15,24,26,34,35], ARRAY[2,7,8,16,23,25,33]),
+('2011-05-25', ARRAY[8,10,12,22,28,32,34], ARRAY[9,14,15,16,30,34,35]),
+('2011-05-18', ARRAY[2,15,16,19,26,30,35], ARRAY[4,7,10,11,20,23,29]),
+('2011-05-11', ARRAY[2,4,9,22,23,26,29], ARRAY[2,4,6,9,19,25,27]),
+('2011-05-04', ARRAY[4,6,9,14,17,27,28], ARRAY[3,4,10,15,20,25,28]),
+('2011-04-27', ARRAY[3,13,17,18,23,24,28], ARRAY[2,4,15,21,28,31,35]),
+('2011-04-20', ARRAY[3,6,7,20,21,25,33], ARRAY[6,18,25,28,30,33,34]),
+('2011-04-13', ARRAY[8,16,24,29,30,31,32], ARRAY[1,13,17,22,29,31,34]),
+('2011-04-06', ARRAY[6,8,12,27,28,32,35], ARRAY[3,12,15,19,21,25,30]),
+('2011-03-30', ARRAY[1,7,9,11,27,29,32], ARRAY[2,6,11,13,19,22,23]),
+('2011-03-23', ARRAY[6,7,12,17,24,29,30], ARRAY[2,10,21,23,24,30,33]),
+('2011-03-16', ARRAY[4,9,21,23,25,28,29], ARRAY[3,10,11,23,25,27,31]),
+('2011-03-09', ARRAY[3,9,15,21,24,28,29], ARRAY[4,14,17,23,24,26,35]),
+('2011-03-02', ARRAY[4,7,8,9,15,24,28], ARRAY[4,13,14,19,23,28,31]),
+('2011-02-23', ARRAY[3,5,8,9,20,22,30], ARRAY[3,6,7,8,18,29,33]),
+('2011-02-16', ARRAY[10,12,19,25,28,29,35], ARRAY[4,6,9,12,20,27,32]),
+('2011-02-09', ARRAY[7,10,15,17,24,28,34], ARRAY[6,11,21,26,28,31,32]),
+('2011-02-02', ARRAY[2,4,13,20,21,25,34], ARRAY[12,15,17,18,19,21,24]),
+('2011-01-26', ARRAY[6,7,10,14,18,22,23], ARRAY[12,20,22,26,30,32,35]),
+('2011-01-19', ARRAY[1,2,8,9,22,31,32], ARRAY[4,10,12,22,23,24,35]),
+('2011-01-12', ARRAY[3,11,20,30,32,34,35], ARRAY[2,10,22,27,30,34,35]),
+('2011-01-05', ARRAY[5,8,14,17,31,32,34], ARRAY[2,5,17,21,23,27,35]),
+('2010-12-29', ARRAY[4,6,10,13,14,15,24], ARRAY[1,12,15,17,19,23,29]),
+('2010-12-22', ARRAY[13,15,16,17,20,26,33], ARRAY[3,12,13,18,26,30,32]),
+('2010-12-15', ARRAY[2,4,7,10,15,24,26], ARRAY[6,8,10,25,29,32,33]),
+('2010-12-08', ARRAY[9,17,20,23,32,33,34], ARRAY[14,15,20,21,24,25,28]),
+('2010-12-01', ARRAY[8,9,12,19,21,29,33], ARRAY[1,18,20,25,27,33,35]),
+('2010-11-24', ARRAY[5,15,17,25,27,32,33], ARRAY[1,2,8,9,12,14,34]),
+('2010-11-17', ARRAY[4,10,14,16,17,25,28], ARRAY[4,8,13,18,20,27,30]),
+('2010-11-10', ARRAY[2,3,13,24,25,27,32], ARRAY[3,7,13,20,21,27,32]),
+('2010-11-03', ARRAY[16,24,25,26,27,34,35], ARRAY[7,11,12,19,23,26,29]),
+('2010-10-27', ARRAY[1,3,6,10,19,28,34], ARRAY[6,8,13,14,18,28,34]),
+('2010-10-20', ARRAY[6,12,13,20,21,27,29], ARRAY[14,16,18,20,21,30,31]),
+('2010-10-13', ARRAY[3,5,8,10,12,27,34], ARRAY[6,7,17,21,22,30,31]),
+('2010-10-06', ARRAY[2,3,4,15,16,22,25], ARRAY[3,4,13,16,21,25,33]),
+('2010-09-29', ARRAY[11,12,16,19,27,32,34], ARRAY[7,10,15,18,19,31,35]),
+('2010-09-22', ARRAY[8,17,18,23,26,28,32], ARRAY[9,11,13,15,20,27,35]),
+('2010-09-15', ARRAY[6,19,25,26,28,31,34], ARRAY[3,7,9,19,20,21,28]),
+('2010-09-08', ARRAY[1,4,5,8,10,21,28], ARRAY[1,6,12,20,23,26,30]),
+('2010-09-01', ARRAY[9,13,18,21,24,30,33], ARRAY[1,10,17,20,23,32,33]),
+('2010-08-25', ARRAY[4,5,12,13,18,30,33], ARRAY[4,13,14,25,26,29,31]),
+('2010-08-18', ARRAY[1,8,13,18,20,22,24], ARRAY[10,11,13,19,20,21,30]),
+('2010-08-11', ARRAY[6,10,13,14,21,31,35], ARRAY[3,12,14,15,16,22,34]),
+('2010-08-04', ARRAY[2,6,9,11,24,26,27], ARRAY[1,6,7,11,25,26,31]),
+('2010-07-28', ARRAY[5,6,8,19,30,33,35], ARRAY[1,5,16,22,28,30,31]),
+('2010-07-21', ARRAY[10,11,12,14,25,31,32], ARRAY[2,5,7,10,13,19,27]),
+('2010-07-14', ARRAY[5,7,16,21,26,32,35], ARRAY[1,4,9,11,22,31,32]),
+('2010-07-07', ARRAY[2,5,8,17,20,23,32], ARRAY[5,8,10,16,18,29,34]),
+('2010-06-30', ARRAY[12,14,15,16,18,30,32], ARRAY[1,5,6,14,23,24,35]),
+('2010-06-23', ARRAY[11,12,15,20,22,30,34], ARRAY[1,2,3,26,28,34,35]),
+('2010-06-16', ARRAY[1,2,5,11,14,26,27], ARRAY[6,10,12,15,23,26,29]),
+('2010-06-09', ARRAY[3,9,12,15,19,21,32], ARRAY[11,14,19,21,30,31,32]),
+('2010-06-02', ARRAY[16,19,20,25,26,30,32], ARRAY[2,7,12,17,18,29,32]),
+('2010-05-26', ARRAY[4,5,6,8,10,26,27], ARRAY[1,5,7,10,22,33,34]),
+('2010-05-19', ARRAY[1,3,8,13,20,22,26], ARRAY[1,20,23,24,28,30,35]),
+('2010-05-12', ARRAY[5,9,11,14,19,24,28], ARRAY[4,6,7,16,18,25,34]),
+('2010-05-05', ARRAY[1,4,13,18,20,24,27], ARRAY[4,8,19,23,27,32,33]),
+('2010-04-28', ARRAY[3,11,12,27,29,30,32], ARRAY[17,21,24,26,28,30,33]),
+('2010-04-21', ARRAY[2,4,9,18,19,32,34], ARRAY[1,3,6,10,11,22,32]),
+('2010-04-14', ARRAY[14,16,19,25,30,32,34], ARRAY[13,23,25,30,31,33,34]),
+('2010-04-07', ARRAY[2,8,15,21,23,28,32], ARRAY[6,8,10,12,14,30,33]),
+('2010-03-31', ARRAY[3,7,12,13,22,26,31], ARRAY[4,13,18,27,31,33,35]),
+('2010-03-24', ARRAY[1,4,15,24,29,30,35], ARRAY[1,4,12,17,28,31,34]),
+('2010-03-17', ARRAY[3,4,9,16,21,22,27], ARRAY[5,8,16,24,27,32,34]),
+('2010-03-10', ARRAY[3,8,11,16,24,28,31], ARRAY[1,5,6,12,13,20,31]),
+('2010-03-03', ARRAY[2,8,14,17,18,26,30], ARRAY[4,7,11,13,14,26,33]),
+('2010-02-24', ARRAY[2,7,11,14,15,26,34], ARRAY[12,14,17,19,26,31,34]),
+('2010-02-17', ARRAY[8,15,21,29,31,34,35], ARRAY[8,10,13,21,22,29,32]),
+('2010-02-10', ARRAY[6,13,15,17,23,27,28], ARRAY[6,17,20,24,25,28,31]),
+('2010-02-03', ARRAY[1,11,18,27,28,29,32], ARRAY[2,14,20,21,22,26,32]),
+('2010-01-27', ARRAY[2,4,8,14,20,23,24], ARRAY[1,4,14,19,22,29,31]),
+('2010-01-20', ARRAY[10,13,14,16,22,26,32], ARRAY[5,10,12,21,23,25,26]),
+('2010-01-13', ARRAY[1,16,17,20,22,29,33], ARRAY[2,10,11,23,27,31,34]),
+('2010-01-06', ARRAY[3,8,9,11,12,13,31], ARRAY[4,5,7,18,21,24,25]),
+('2009-12-30', ARRAY[6,14,18,19,26,28,30], ARRAY[5,12,14,22,26,28,34]),
+('2009-12-23', ARRAY[4,6,7,25,27,29,32], ARRAY[3,6,9,11,15,18,25]),
+('2009-12-16', ARRAY[5,9,10,18,22,25,26], ARRAY[5,7,8,12,26,30,32]),
+('2009-12-09', ARRAY[5,9,15,24,26,30,35], ARRAY[2,3,6,18,24,33,34]),
+('2009-12-02', ARRAY[8,9,11,24,25,30,34], ARRAY[9,12,13,14,23,28,35]),
+('2009-11-25', ARRAY[1,2,4,9,15,26,29], ARRAY[12,13,14,16,25,27,28]),
+('2009-11-18', ARRAY[4,10,11,12,13,15,19], ARRAY[13,18,20,22,32,33,34]),
+('2009-11-11', ARRAY[4,12,23,24,28,33,34], ARRAY[7,11,16,20,22,24,34]),
+('2009-11-04', ARRAY[6,15,20,24,29,32,33], ARRAY[4,10,17,19,24,28,35]),
+('2009-10-28', ARRAY[6,8,17,18,22,24,26], ARRAY[3,6,7,8,9,17,32]),
+('2009-10-21', ARRAY[3,4,6,18,27,32,34], ARRAY[7,8,19,21,22,25,33]),
+('2009-10-14', ARRAY[2,12,13,15,21,32,33], ARRAY[11,18,19,21,23,31,34]),
+('2009-10-07', ARRAY[2,5,7,18,31,33,34], ARRAY[3,4,7,8,29,30,35]),
+('2009-09-30', ARRAY[1,5,13,18,19,20,31], ARRAY[1,5,6,7,9,10,19]),
+('2009-09-23', ARRAY[3,5,7,10,15,20,32], ARRAY[10,11,26,27,32,34,35]),
+('2009-09-16', ARRAY[3,5,14,15,18,28,31], ARRAY[1,4,8,18,22,24,26]),
+('2009-09-09', ARRAY[2,4,5,27,29,30,32], ARRAY[4,8,9,13,18,23,28]),
+('2009-09-02', ARRAY[2,19,25,27,28,30,31], ARRAY[6,11,12,13,20,33,35]),
+('2009-08-26', ARRAY[2,6,8,11,20,29,33], ARRAY[2,5,8,9,12,15,27]),
+('2009-08-19', ARRAY[10,13,17,19,23,28,33], ARRAY[2,9,25,29,31,32,34]),
+('2009-08-12', ARRAY[3,7,8,12,15,17,29], ARRAY[2,10,11,19,25,28,34]),
+('2009-08-05', ARRAY[4,8,10,11,19,30,33], ARRAY[1,18,19,20,32,33,35]),
+('2009-07-29', ARRAY[4,14,16,27,28,30,31], ARRAY[3,4,18,22,25,29,32]),
+('2009-07-22', ARRAY[4,8,9,24,28,30,33], ARRAY[4,5,8,10,13,22,24]),
+('2009-07-15', ARRAY[2,6,7,9,12,23,29], ARRAY[1,13,19,23,26,28,31]),
+('2009-07-08', ARRAY[5,15,18,20,27,31,33], ARRAY[1,5,11,18,26,27,29]),
+('2009-07-01', ARRAY[7,9,10,15,19,25,32], ARRAY[4,14,21,27,28,29,35]),
+('2009-06-24', ARRAY[1,2,7,17,20,30,31], ARRAY[10,13,19,24,26,28,30]),
+('2009-06-17', ARRAY[2,9,14,16,21,25,28], ARRAY[10,12,13,19,21,25,30]),
+('2009-06-10', ARRAY[2,6,21,26,28,30,32], ARRAY[1,9,22,24,26,30,35]),
+('2009-06-03', ARRAY[13,16,21,31,33,34,35], ARRAY[4,7,8,14,16,28,34]),
+('2009-05-27', ARRAY[4,7,11,20,22,27,31], ARRAY[6,8,10,11,18,20,25]),
+('2009-05-20', ARRAY[1,2,14,20,24,30,31], ARRAY[3,7,13,16,17,18,33]),
+('2009-05-13', ARRAY[1,5,9,15,19,26,27], ARRAY[5,6,13,18,28,30,31]),
+('2009-05-06', ARRAY[4,11,12,30,31,33,35], ARRAY[7,16,17,24,29,34,35]),
+('2009-04-29', ARRAY[18,24,27,29,32,33,35], ARRAY[2,7,10,15,25,26,32]),
+('2009-04-22', ARRAY[1,4,9,14,23,24,29], ARRAY[4,8,9,10,13,23,31]),
+('2009-04-15', ARRAY[1,8,16,18,20,24,26], ARRAY[3,7,9,12,15,17,35]),
+('2009-04-08', ARRAY[2,4,6,7,20,22,35], ARRAY[5,15,28,32,33,34,35]),
+('2009-04-01', ARRAY[9,10,11,13,14,20,22], ARRAY[12,15,19,20,21,24,31]),
+('2009-03-25', ARRAY[1,9,19,25,27,32,35], ARRAY[5,8,11,13,21,22,23]),
+('2009-03-18', ARRAY[2,16,21,22,23,27,29], ARRAY[14,18,19,21,22,34,35]),
+('2009-03-11', ARRAY[2,13,14,16,17,19,25], ARRAY[8,9,11,14,15,21,33]),
+('2009-03-04', ARRAY[1,3,7,11,16,29,35], ARRAY[6,20,23,24,25,29,33]),
+('2009-02-25', ARRAY[6,7,8,13,27,31,34], ARRAY[6,13,16,21,24,26,34]),
+('2009-02-18', ARRAY[5,10,13,19,25,26,34], ARRAY[1,2,4,14,16,23,29]),
+('2009-02-11', ARRAY[2,5,18,23,26,34,35], ARRAY[1,5,11,13,17,26,28]),
+('2009-02-04', ARRAY[6,7,12,14,25,26,29], ARRAY[1,4,6,10,12,30,31]),
+('2009-01-28', ARRAY[3,4,8,12,14,18,24], ARRAY[3,7,9,10,15,17,18]),
+('2009-01-21', ARRAY[1,3,4,7,14,15,29], ARRAY[7,10,11,14,15,20,25]),
+('2009-01-14', ARRAY[19,20,26,27,30,31,35], ARRAY[4,9,14,16,32,33,34]),
+('2009-01-07', ARRAY[7,9,11,17,18,27,35], ARRAY[1,9,13,14,18,24,34]),
+('2008-12-31', ARRAY[4,7,12,19,25,29,30], ARRAY[2,3,6,16,27,28,29]),
+('2008-12-24', ARRAY[11,15,16,19,21,26,34], ARRAY[3,5,15,20,24,27,35]),
+('2008-12-17', ARRAY[3,13,15,16,19,30,31], ARRAY[5,13,14,17,21,24,25]),
+('2008-12-10', ARRAY[3,4,5,8,13,23,31], ARRAY[2,4,6,8,12,18,32]),
+('2008-12-03', ARRAY[6,14,15,16,17,21,24], ARRAY[6,10,16,18,21,28,31]),
+('2008-11-26', ARRAY[5,6,10,18,22,27,30], ARRAY[1,3,4,15,23,26,28]),
+('2008-11-19', ARRAY[4,5,14,19,28,29,32], ARRAY[2,3,9,10,12,14,18]),
+('2008-11-12', ARRAY[2,6,14,19,21,32,33], ARRAY[2,5,8,11,13,18,20]),
+('2008-11-05', ARRAY[7,8,9,11,21,25,28], ARRAY[1,4,6,14,18,25,28]),
+('2008-10-29', ARRAY[11,19,20,23,25,27,34], ARRAY[5,6,11,14,19,20,29]),
+('2008-10-22', ARRAY[5,10,13,20,26,27,30], ARRAY[9,10,13,14,17,24,29]),
+('2008-10-15', ARRAY[6,7,14,17,21,23,32], ARRAY[7,8,9,11,22,29,35]),
+('2008-10-08', ARRAY[3,13,19,22,30,31,35], ARRAY[4,11,13,22,28,29,33]),
+('2008-10-01', ARRAY[1,3,6,12,18,22,30], ARRAY[3,5,14,16,18,24,27]),
+('2008-09-24', ARRAY[1,11,12,14,19,20,23], ARRAY[4,6,9,13,25,32,33]),
+('2008-09-17', ARRAY[10,11,12,14,23,24,27], ARRAY[7,10,13,16,31,32,33]),
+('2008-09-10', ARRAY[5,8,14,21,26,32,34], ARRAY[1,5,8,10,15,17,26]),
+('2008-09-03', ARRAY[2,3,4,18,19,25,26], ARRAY[1,5,9,19,23,26,34]),
+('2008-08-27', ARRAY[17,22,24,27,30,31,34], ARRAY[9,14,16,18,20,25,30]),
+('2008-08-21', ARRAY[1,6,19,23,27,28,32], ARRAY[5,8,13,23,25,26,27]),
+('2008-08-13', ARRAY[11,14,16,19,28,29,34], ARRAY[4,9,12,17,19,22,31]),
+('2008-08-06', ARRAY[4,6,15,19,24,31,34], ARRAY[9,14,17,18,26,31,35]),
+('2008-07-30', ARRAY[2,11,21,26,28,34,35], ARRAY[8,13,24,26,31,33,34]),
+('2008-07-23', ARRAY[11,18,21,22,27,29,32], ARRAY[6,8,12,16,21,29,31]),
+('2008-07-16', ARRAY[5,8,15,16,22,30,31], ARRAY[6,7,15,20,22,29,32]),
+('2008-07-09', ARRAY[2,4,10,12,24,32,34], ARRAY[5,10,12,19,21,34,35]),
+('2008-07-02', ARRAY[8,14,18,19,23,29,35], ARRAY[8,9,10,14,22,24,30]),
+('2008-06-25', ARRAY[6,9,14,16,19,22,26], ARRAY[2,4,10,12,13,14,21]),
+('2008-06-18', ARRAY[1,5,14,15,20,23,34], ARRAY[3,4,15,17,20,23,24]),
+('2008-06-11', ARRAY[2,9,10,11,13,21,32], ARRAY[6,13,16,19,22,30,31]),
+('2008-06-04', ARRAY[10,19,20,25,29,31,33], ARRAY[3,10,14,18,30,33,35]),
+('2008-05-28', ARRAY[10,11,19,25,27,30,33], ARRAY[4,6,15,18,25,28,33]),
+('2008-05-21', ARRAY[12,16,25,28,29,30,32], ARRAY[3,7,12,17,23,28,29]),
+('2008-05-14', ARRAY[2,8,19,22,23,27,32], ARRAY[1,13,18,19,23,28,29]),
+('2008-05-07', ARRAY[2,8,11,16,18,19,27], ARRAY[5,6,7,15,21,30,33]),
+('2008-04-30', ARRAY[2,6,14,20,23,25,34], ARRAY[2,4,13,15,22,32,33]),
+('2008-04-23', ARRAY[1,4,8,12,22,28,35], ARRAY[1,5,8,11,17,23,35]),
+('2008-04-16', ARRAY[4,10,16,21,24,28,32], ARRAY[9,12,17,19,30,32,34]),
+('2008-04-09', ARRAY[6,15,18,24,25,26,33], ARRAY[4,9,11,17,19,25,31]),
+('2008-04-02', ARRAY[11,13,15,16,20,21,31], ARRAY[6,9,11,16,23,25,28]),
+('2008-03-26', ARRAY[1,2,7,9,29,30,35], ARRAY[8,11,15,16,20,33,34]),
+('2008-03-19', ARRAY[2,7,10,13,19,20,25], ARRAY[1,7,11,17,26,29,31]),
+('2008-03-12', ARRAY[5,10,19,23,24,25,27], ARRAY[8,11,19,20,23,28,33]),
+('2008-03-05', ARRAY[3,6,16,19,24,29,30], ARRAY[3,5,6,13,16,27,30]),
+('2008-02-27', ARRAY[7,8,10,11,12,32,34], ARRAY[4,5,7,8,9,24,32]),
+('2008-02-20', ARRAY[1,11,13,14,17,18,35], ARRAY[8,18,20,21,25,33,34]),
+('2008-02-13', ARRAY[1,5,6,16,17,29,32], ARRAY[7,9,11,16,18,26,32]),
+('2008-02-06', ARRAY[2,5,9,23,26,28,30], ARRAY[2,8,15,23,29,34,35]),
+('2008-01-30', ARRAY[6,9,13,22,25,29,31], ARRAY[11,19,21,29,30,33,34]),
+('2008-01-23', ARRAY[7,8,13,14,17,21,29], ARRAY[7,12,21,24,29,33,35]),
+('2008-01-16', ARRAY[4,5,13,20,27,31,33], ARRAY[2,9,23,29,30,33,34]),
+('2008-01-09', ARRAY[8,9,10,23,24,26,27], ARRAY[1,4,11,17,26,29,33]),
+('2008-01-02', ARRAY[9,19,22,25,27,29,30], ARRAY[10,13,16,20,24,25,33]),
+('2007-12-27', ARRAY[2,12,13,18,20,25,30], ARRAY[6,10,12,20,23,24,28]),
+('2007-12-19', ARRAY[18,22,24,27,29,30,32], ARRAY[2,3,15,17,22,25,29]),
+('2007-12-12', ARRAY[2,4,8,16,18,19,32], ARRAY[4,15,19,21,25,27,35]),
+('2007-12-05', ARRAY[9,11,16,17,19,22,31], ARRAY[9,11,14,22,26,31,35]),
+('2007-11-28', ARRAY[9,13,25,27,28,29,35], ARRAY[3,8,10,17,19,31,32]),
+('2007-11-21', ARRAY[11,12,15,20,23,25,31], ARRAY[4,5,7,13,18,19,29]),
+('2007-11-14', ARRAY[1,3,4,10,15,21,27], ARRAY[3,4,5,7,18,26,30]),
+('2007-11-07', ARRAY[3,10,13,19,23,28,31], ARRAY[4,7,8,12,20,26,33]),
+('2007-10-31', ARRAY[2,10,13,17,20,21,35], ARRAY[2,5,11,15,19,21,33]),
+('2007-10-24', ARRAY[2,3,19,21,22,30,35], ARRAY[3,8,10,19,28,29,34]),
+('2007-10-17', ARRAY[13,17,18,25,30,32,35], ARRAY[9,20,22,24,27,29,35]),
+('2007-10-10', ARRAY[1,3,4,11,14,21,29], ARRAY[8,9,17,21,24,30,31]),
+('2007-10-03', ARRAY[4,7,8,12,16,27,31], ARRAY[1,3,4,10,14,26,29]),
+('2007-09-26', ARRAY[5,12,14,26,29,30,34], ARRAY[1,13,19,25,28,32,33]),
+('2007-09-19', ARRAY[4,8,9,11,13,17,30], ARRAY[8,9,16,23,26,28,33]),
+('2007-09-12', ARRAY[5,10,11,13,15,24,32], ARRAY[5,6,7,8,24,27,28]),
+('2007-09-05', ARRAY[4,6,7,21,22,28,35], ARRAY[6,7,16,21,22,24,34]),
+('2007-08-29', ARRAY[2,5,16,25,32,34,35], ARRAY[2,10,13,17,20,29,31]),
+('2007-08-22', ARRAY[3,10,14,17,20,26,27], ARRAY[1,3,6,7,10,17,27]),
+('2007-08-15', ARRAY[3,5,9,17,27,29,34], ARRAY[4,6,8,19,20,21,30]),
+('2007-08-08', ARRAY[9,14,20,25,26,27,35], ARRAY[4,5,7,11,12,16,30]),
+('2007-08-01', ARRAY[5,14,19,20,27,28,34], ARRAY[2,11,14,19,28,32,33]),
+('2007-07-25', ARRAY[1,3,11,24,26,31,35], ARRAY[6,8,12,14,18,21,34]),
+('2007-07-18', ARRAY[16,17,18,20,21,25,29], ARRAY[6,9,21,25,26,31,35]),
+('2007-07-11', ARRAY[1,2,7,12,15,24,33], ARRAY[4,12,14,27,32,33,35]),
+('2007-07-04', ARRAY[6,10,11,16,22,26,31], ARRAY[2,8,11,14,15,19,22]),
+('2007-06-27', ARRAY[3,10,14,15,18,24,35], ARRAY[1,5,9,11,13,14,33]),
+('2007-06-20', ARRAY[11,16,18,25,27,29,30], ARRAY[3,7,9,16,28,29,33]),
+('2007-06-13', ARRAY[6,11,13,16,21,31,34], ARRAY[3,8,9,15,25,31,35]),
+('2007-06-06', ARRAY[5,7,10,19,20,27,33], ARRAY[7,8,21,22,27,28,32]),
+('2007-05-30', ARRAY[1,6,8,15,18,26,32], ARRAY[3,16,20,22,26,27,28]),
+('2007-05-23', ARRAY[5,7,8,9,15,33,34], ARRAY[4,9,14,22,26,28,35]),
+('2007-05-16', ARRAY[7,11,14,18,23,28,29], ARRAY[7,11,20,26,27,28,32]),
+('2007-05-09', ARRAY[2,6,8,19,21,25,30], ARRAY[3,13,20,24,27,30,33]),
+('2007-05-02', ARRAY[1,8,18,22,24,32,34], ARRAY[3,16,21,24,25,32,33]),
+('2007-04-25', ARRAY[1,11,20,21,23,31,33], ARRAY[4,8,12,22,26,28,33]),
+('2007-04-18', ARRAY[4,20,21,29,31,32,34], ARRAY[1,3,4,5,7,11,35]),
+('2007-04-11', ARRAY[4,10,27,29,30,31,33], ARRAY[5,8,19,24,25,31,33]),
+('2007-04-04', ARRAY[1,2,17,21,23,27,33], ARRAY[1,3,5,6,13,25,28]),
+('2007-03-28', ARRAY[2,7,13,20,22,28,30], ARRAY[1,8,9,11,23,24,28]),
+('2007-03-21', ARRAY[1,3,5,16,18,24,28], ARRAY[1,18,24,31,32,33,34]),
+('2007-03-14', ARRAY[2,7,10,19,25,31,35], ARRAY[1,3,16,17,18,26,32]),
+('2007-03-07', ARRAY[1,3,5,11,14,19,27], ARRAY[15,23,24,28,29,32,35]),
+('2007-02-28', ARRAY[3,6,21,23,24,33,34], ARRAY[1,2,7,15,16,19,20]),
+('2007-02-21', ARRAY[5,10,12,14,19,21,28], ARRAY[6,9,12,16,17,28,32]),
+('2007-02-14', ARRAY[1,2,15,16,20,28,30], ARRAY[1,8,11,14,17,25,28]),
+('2007-02-07', ARRAY[2,17,19,22,23,31,33], ARRAY[7,9,18,22,24,29,34]),
+('2007-01-31', ARRAY[12,17,19,21,24,28,33], ARRAY[3,11,14,16,22,30,35]),
+('2007-01-24', ARRAY[3,7,16,19,23,28,33], ARRAY[13,18,19,22,24,31,34]),
+('2007-01-17', ARRAY[6,10,11,16,18,19,25], ARRAY[1,17,25,27,30,31,34]),
+('2007-01-10', ARRAY[6,7,10,12,14,15,27], ARRAY[5,6,7,10,11,15,25]),
+('2007-01-03', ARRAY[2,6,9,16,21,26,30], ARRAY[5,6,8,20,27,33,35]),
+('2006-12-27', ARRAY[2,6,8,12,15,23,30], ARRAY[3,11,12,13,19,26,28]),
+('2006-12-20', ARRAY[1,17,19,23,26,28,33], ARRAY[8,12,20,26,28,29,35]),
+('2006-12-13', ARRAY[1,2,14,18,23,29,30], ARRAY[1,8,11,14,18,26,30]),
+('2006-12-06', ARRAY[11,13,14,22,29,31,33], ARRAY[3,7,8,9,15,23,32]),
+('2006-11-29', ARRAY[1,11,12,16,19,27,29], ARRAY[1,3,8,16,26,27,33]),
+('2006-11-22', ARRAY[3,7,9,11,12,18,19], ARRAY[3,7,10,11,21,29,34]),
+('2006-11-15', ARRAY[2,4,17,20,26,27,34], ARRAY[5,8,17,25,26,27,32]),
+('2006-11-08', ARRAY[2,3,11,13,16,22,28], ARRAY[9,14,17,19,29,33,35]),
+('2006-11-02', ARRAY[8,9,12,16,22,28,29], ARRAY[18,20,22,23,28,32,33]),
+('2006-10-25', ARRAY[6,7,8,12,13,21,22], ARRAY[3,9,23,25,26,30,35]),
+('2006-10-18', ARRAY[3,7,14,18,24,25,33], ARRAY[4,5,14,18,20,21,34]),
+('2006-10-11', ARRAY[3,7,9,12,13,30,34], ARRAY[12,13,14,17,22,30,34]),
+('2006-10-04', ARRAY[1,9,11,16,18,27,29], ARRAY[1,3,8,17,18,22,31]),
+('2006-09-27', ARRAY[3,15,16,24,25,29,34], ARRAY[3,6,13,19,21,23,27]),
+('2006-09-20', ARRAY[8,11,16,20,30,32,34], ARRAY[11,13,20,22,24,31,33]),
+('2006-09-13', ARRAY[5,7,9,13,20,24,28], ARRAY[4,5,11,19,20,25,31]),
+('2006-09-06', ARRAY[5,8,11,13,14,23,25], ARRAY[1,9,10,15,18,27,34]),
+('2006-08-30', ARRAY[3,6,14,19,21,34,35], ARRAY[4,6,14,18,20,27,34]),
+('2006-08-23', ARRAY[9,14,22,24,25,30,34], ARRAY[2,7,9,15,21,29,33]),
+('2006-08-16', ARRAY[9,12,18,19,24,27,32], ARRAY[13,19,20,22,24,27,35]),
+('2006-08-09', ARRAY[1,9,12,17,19,20,29], ARRAY[6,12,14,16,18,20,21]),
+('2006-08-02', ARRAY[1,2,5,10,15,16,28], ARRAY[2,8,9,13,16,20,31]),
+('2006-07-26', ARRAY[3,4,10,16,19,24,32], ARRAY[13,14,15,18,28,29,31]),
+('2006-07-19', ARRAY[4,5,12,13,21,26,35], ARRAY[5,7,9,13,32,33,35]),
+('2006-07-12', ARRAY[8,14,17,24,26,31,34], ARRAY[5,8,10,12,16,34,35]),
+('2006-07-05', ARRAY[2,11,12,13,18,29,30], ARRAY[6,10,15,18,20,29,31]),
+('2006-06-28', ARRAY[4,16,19,20,23,27,28], ARRAY[8,9,19,24,26,27,28]),
+('2006-06-21', ARRAY[2,12,17,18,25,28,31], ARRAY[14,16,22,23,26,30,34]),
+('2006-06-14', ARRAY[1,6,9,12,19,28,32], ARRAY[2,8,11,14,18,20,21]),
+('2006-06-07', ARRAY[12,14,15,20,21,27,34], ARRAY[5,13,16,17,19,27,29]),
+('2006-05-31', ARRAY[2,7,11,19,22,23,31], ARRAY[1,5,10,13,18,22,25]),
+('2006-05-24', ARRAY[4,8,11,12,22,31,35], ARRAY[7,15,19,22,23,25,29]),
+('2006-05-17', ARRAY[4,6,10,13,21,33,35], ARRAY[2,7,8,15,16,30,31]),
+('2006-05-10', ARRAY[2,7,8,13,16,23,26], ARRAY[3,6,10,19,25,29,32]),
+('2006-05-03', ARRAY[2,13,16,27,28,29,31], ARRAY[2,6,13,14,21,28,34]),
+('2006-04-26', ARRAY[2,8,10,17,23,30,35], ARRAY[3,14,17,20,22,28,30]),
+('2006-04-19', ARRAY[3,10,12,25,26,28,32], ARRAY[6,12,18,19,20,25,30]),
+('2006-04-12', ARRAY[3,4,12,14,16,26,27], ARRAY[1,7,14,15,16,28,33]),
+('2006-04-05', ARRAY[1,4,11,15,16,27,33], ARRAY[1,6,7,9,17,21,23]),
+('2006-03-29', ARRAY[5,11,17,21,28,31,32], ARRAY[5,11,15,23,25,31,32]),
+('2006-03-22', ARRAY[4,5,7,9,14,26,35], ARRAY[3,9,12,25,27,32,33]),
+('2006-03-16', ARRAY[11,13,14,18,25,27,29], ARRAY[13,15,17,26,29,33,35]),
+('2006-03-08', ARRAY[6,9,13,16,24,33,35], ARRAY[6,8,10,15,23,26,33]),
+('2006-03-01', ARRAY[3,5,9,15,20,28,29], ARRAY[2,5,12,13,28,34,35]),
+('2006-02-22', ARRAY[2,6,11,12,14,29,34], ARRAY[1,2,9,17,30,33,34]),
+('2006-02-15', ARRAY[6,9,11,18,27,28,31], ARRAY[7,9,15,20,23,26,31]),
+('2006-02-08', ARRAY[3,6,12,27,29,31,33], ARRAY[1,7,18,24,26,28,30]),
+('2006-02-01', ARRAY[6,11,16,21,22,28,30], ARRAY[4,7,8,20,25,32,34]),
+('2006-01-25', ARRAY[4,5,18,23,27,29,30], ARRAY[1,4,6,7,12,23,31]),
+('2006-01-18', ARRAY[4,5,7,9,10,27,30], ARRAY[6,10,11,17,19,29,31]),
+('2006-01-11', ARRAY[5,6,9,15,27,33,34], ARRAY[2,4,11,13,15,16,31]),
+('2006-01-04', ARRAY[11,16,24,26,27,32,33], ARRAY[2,12,13,15,17,20,21]),
+('2005-12-28', ARRAY[12,18,21,24,27,28,35], ARRAY[1,8,10,16,19,23,35]),
+('2005-12-21', ARRAY[3,7,16,18,27,33,35], ARRAY[2,3,11,23,27,28,30]),
+('2005-12-14', ARRAY[1,5,7,11,12,26,34], ARRAY[18,19,20,26,27,32,35]),
+('2005-12-07', ARRAY[5,6,9,16,25,30,31], ARRAY[6,14,15,23,26,33,35]),
+('2005-11-30', ARRAY[2,3,13,14,21,24,34], ARRAY[3,8,15,16,20,24,32]),
+('2005-11-23', ARRAY[1,3,12,18,28,30,31], ARRAY[2,6,8,17,19,23,33]),
+('2005-11-16', ARRAY[1,10,13,14,20,23,33], ARRAY[5,11,22,24,25,28,30]),
+('2005-11-09', ARRAY[7,14,16,20,21,24,30], ARRAY[1,2,5,7,8,14,30]),
+('2005-11-02', ARRAY[8,14,19,23,26,27,33], ARRAY[6,10,11,14,24,29,34]),
+('2005-10-26', ARRAY[7,19,22,25,30,32,34], ARRAY[9,14,16,22,23,29,35]),
+('2005-10-19', ARRAY[1,9,15,21,24,27,28], ARRAY[1,13,15,22,33,34,35]),
+('2005-10-12', ARRAY[5,6,8,10,15,30,31], ARRAY[1,14,16,19,33,34,35]),
+('2005-10-05', ARRAY[1,4,5,6,7,24,31], ARRAY[2,3,5,14,18,22,33]),
+('2005-09-28', ARRAY[1,7,14,19,25,30,34], ARRAY[17,19,20,30,32,33,34]),
+('2005-09-21', ARRAY[1,2,6,12,18,28,30], ARRAY[4,6,9,11,18,24,27]),
+('2005-09-14', ARRAY[5,10,11,16,23,24,33], ARRAY[4,5,11,18,20,28,35]),
+('2005-09-07', ARRAY[1,6,10,15,16,22,32], ARRAY[14,15,18,22,25,32,33]),
+('2005-08-31', ARRAY[4,10,14,15,21,27,35], ARRAY[3,10,13,15,23,29,30]),
+('2005-08-24', ARRAY[9,11,21,25,27,33,34], ARRAY[1,2,4,5,18,31,33]),
+('2005-08-17', ARRAY[4,6,17,23,27,28,30], ARRAY[3,5,11,22,29,32,33]),
+('2005-08-10', ARRAY[1,6,15,17,19,21,26], ARRAY[8,12,13,15,19,25,35]),
+('2005-08-03', ARRAY[3,8,9,10,13,17,25], ARRAY[1,2,12,18,19,23,29]),
+('2005-07-27', ARRAY[7,8,10,12,24,27,30], ARRAY[6,7,13,16,19,29,32]),
+('2005-07-20', ARRAY[3,10,12,13,14,19,28], ARRAY[5,6,16,20,21,32,35]),
+('2005-07-13', ARRAY[5,6,10,15,20,23,26], ARRAY[6,8,14,26,28,32,35]),
+('2005-07-06', ARRAY[1,2,3,5,6,9,21], ARRAY[5,9,15,20,25,30,32]),
+('2005-06-29', ARRAY[2,3,6,9,10,12,14], ARRAY[3,9,10,17,18,31,35]),
+('2005-06-22', ARRAY[2,5,9,16,17,18,25], ARRAY[1,3,5,8,23,28,32]),
+('2005-06-15', ARRAY[14,21,24,26,27,29,31], ARRAY[1,5,14,15,22,34,35]),
+('2005-06-08', ARRAY[2,17,19,21,23,27,32], ARRAY[5,6,18,19,28,31,35]),
+('2005-06-01', ARRAY[5,9,12,18,26,30,32], ARRAY[2,5,9,20,27,29,33]),
+('2005-05-25', ARRAY[10,11,14,22,27,32,35], ARRAY[6,7,13,16,18,26,32]),
+('2005-05-18', ARRAY[16,17,18,21,25,29,34], ARRAY[2,7,13,14,16,19,21]),
+('2005-05-11', ARRAY[5,6,8,15,25,29,30], ARRAY[3,6,10,16,17,20,22]),
+('2005-05-04', ARRAY[4,7,10,29,31,32,34], ARRAY[3,7,12,13,22,30,33]),
+('2005-04-27', ARRAY[3,18,19,25,30,32,35], ARRAY[7,10,14,15,27,32,35]),
+('2005-04-20', ARRAY[4,14,16,19,27,28,33], ARRAY[15,21,22,24,27,28,30]),
+('2005-04-13', ARRAY[6,9,11,13,21,26,34], ARRAY[4,10,11,13,14,18,27]),
+('2005-04-06', ARRAY[7,11,14,15,22,26,35], ARRAY[1,8,19,24,26,28,31]),
+('2005-03-30', ARRAY[6,23,24,27,29,32,34], ARRAY[7,9,11,18,19,22,30]),
+('2005-03-23', ARRAY[7,13,25,28,32,33,34], ARRAY[6,8,12,16,29,34,35]),
+('2005-03-16', ARRAY[11,15,16,21,27,30,32], ARRAY[2,6,8,13,24,28,31]),
+('2005-03-09', ARRAY[2,14,19,24,30,33,35], ARRAY[14,21,25,26,28,29,33]),
+('2005-03-02', ARRAY[1,3,7,17,25,26,29], ARRAY[6,10,17,23,28,29,30]),
+('2005-02-23', ARRAY[8,19,24,28,32,34,35], ARRAY[8,14,17,18,19,30,31]),
+('2005-02-16', ARRAY[1,7,11,12,27,29,32], ARRAY[2,5,10,17,24,30,32]),
+('2005-02-09', ARRAY[3,4,11,18,30,32,35], ARRAY[1,2,6,16,24,26,31]),
+('2005-02-02', ARRAY[3,4,12,17,22,23,26], ARRAY[2,4,6,26,29,30,34]),
+('2005-01-26', ARRAY[2,13,24,27,32,33,34], ARRAY[4,6,7,8,26,28,30]),
+('2005-01-19', ARRAY[1,13,17,23,25,29,34], ARRAY[4,6,8,18,24,26,34]),
+('2005-01-12', ARRAY[1,11,12,15,16,17,22], ARRAY[6,7,13,16,17,27,34]),
+('2005-01-05', ARRAY[8,12,16,17,20,21,26], ARRAY[2,7,9,17,23,24,29]),
+('2004-12-29', ARRAY[1,6,10,11,27,31,33], ARRAY[3,5,11,22,26,27,32]),
+('2004-12-22', ARRAY[1,2,19,25,28,29,31], ARRAY[6,8,18,19,29,30,34]),
+('2004-12-15', ARRAY[8,9,16,21,22,24,35], ARRAY[6,14,19,22,23,25,33]),
+('2004-12-08', ARRAY[6,7,15,16,22,24,34], ARRAY[1,4,5,11,18,26,32]),
+('2004-12-01', ARRAY[1,12,13,19,23,26,33], ARRAY[4,7,15,19,23,33,35]),
+('2004-11-24', ARRAY[3,6,11,19,22,25,30], ARRAY[2,3,9,14,19,27,34]),
+('2004-11-17', ARRAY[3,6,11,14,21,22,30], ARRAY[1,2,8,14,19,22,35]),
+('2004-11-10', ARRAY[1,7,11,25,26,32,35], ARRAY[12,13,27,30,31,33,34]),
+('2004-11-03', ARRAY[11,19,23,26,28,30,31], ARRAY[13,20,23,26,29,30,35]),
+('2004-10-27', ARRAY[11,16,21,22,26,27,30], ARRAY[9,17,18,21,27,28,31]),
+('2004-10-20', ARRAY[2,5,9,20,23,25,34], ARRAY[5,6,9,10,22,24,34]),
+('2004-10-13', ARRAY[2,13,14,15,16,23,24], ARRAY[1,11,12,13,15,28,31]),
+('2004-10-06', ARRAY[3,7,23,24,27,31,35], ARRAY[4,6,18,25,27,32,34]),
+('2004-09-29', ARRAY[2,22,27,29,30,31,33], ARRAY[3,5,8,14,15,20,25]),
+('2004-09-22', ARRAY[3,6,7,10,15,20,26], ARRAY[1,7,9,13,17,22,31]),
+('2004-09-15', ARRAY[9,11,13,17,18,28,33], ARRAY[14,16,18,20,22,27,35]),
+('2004-09-08', ARRAY[2,7,9,10,14,24,33], ARRAY[16,19,20,23,29,34,35]),
+('2004-09-01', ARRAY[2,10,14,15,16,24,33], ARRAY[6,7,9,11,16,25,33]),
+('2004-08-25', ARRAY[1,3,6,9,17,22,31], ARRAY[5,7,8,16,22,31,32]),
+('2004-08-18', ARRAY[3,4,13,24,27,32,34], ARRAY[6,7,14,25,26,29,32]),
+('2004-08-11', ARRAY[1,12,14,16,17,22,25], ARRAY[10,12,15,17,18,20,35]),
+('2004-08-04', ARRAY[11,13,17,21,25,30,31], ARRAY[10,11,14,20,21,27,35]),
+('2004-07-28', ARRAY[1,3,15,23,28,34,35], ARRAY[4,7,8,11,12,31,32]),
+('2004-07-21', ARRAY[3,10,16,26,30,32,35], ARRAY[5,9,10,13,14,33,35]),
+('2004-07-14', ARRAY[8,11,14,18,28,34,35], ARRAY[3,6,13,14,26,30,31]),
+('2004-07-07', ARRAY[14,15,19,21,32,34,35], ARRAY[7,9,13,20,21,22,27]),
+('2004-06-30', ARRAY[1,10,20,23,29,31,33], ARRAY[5,14,15,20,22,23,24]),
+('2004-06-23', ARRAY[1,2,13,14,18,26,33], ARRAY[8,17,19,20,28,29,30]),
+('2004-06-16', ARRAY[3,9,13,15,25,28,34], ARRAY[3,4,16,21,25,27,35]),
+('2004-06-09', ARRAY[1,2,16,20,21,27,32], ARRAY[3,9,11,12,14,18,20]),
+('2004-06-02', ARRAY[8,10,11,14,16,19,32], ARRAY[9,18,19,27,30,34,35]),
+('2004-05-26', ARRAY[4,10,11,14,15,21,32], ARRAY[2,6,10,17,30,31,35]),
+('2004-05-19', ARRAY[4,6,10,16,18,31,33], ARRAY[6,10,19,20,21,27,29]),
+('2004-05-12', ARRAY[4,5,10,13,20,21,32], ARRAY[1,3,8,14,21,24,25]),
+('2004-05-05', ARRAY[4,6,13,23,29,34,35], ARRAY[5,6,21,22,28,29,31]),
+('2004-04-28', ARRAY[4,12,17,24,29,31,33], ARRAY[2,15,16,26,28,32,35]),
+('2004-04-21', ARRAY[2,17,18,21,29,31,33], ARRAY[1,16,17,21,27,31,32]),
+('2004-04-14', ARRAY[6,10,23,27,32,33,35], ARRAY[1,8,11,14,16,21,30]),
+('2004-04-07', ARRAY[10,19,20,25,29,31,34], ARRAY[4,14,21,25,30,31,33]),
+('2004-03-31', ARRAY[9,11,15,17,21,26,32], ARRAY[4,7,21,24,28,32,33]),
+('2004-03-24', ARRAY[9,15,17,18,20,21,33], ARRAY[3,7,8,10,12,14,17]),
+('2004-03-17', ARRAY[5,19,21,24,26,28,30], ARRAY[1,4,6,11,13,30,33]),
+('2004-03-10', ARRAY[1,3,7,22,24,26,34], ARRAY[2,4,17,20,22,28,35]),
+('2004-03-03', ARRAY[7,9,21,22,23,24,29], ARRAY[2,7,14,23,24,31,32]),
+('2004-02-25', ARRAY[1,7,19,23,25,27,35], ARRAY[4,19,23,24,27,32,35]),
+('2004-02-18', ARRAY[1,4,5,18,26,27,34], ARRAY[1,2,11,24,30,32,34]),
+('2004-02-11', ARRAY[2,11,12,15,16,23,28], ARRAY[5,12,17,22,27,30,31]),
+('2004-02-04', ARRAY[2,4,14,15,24,28,31], ARRAY[1,11,14,24,26,27,30]),
+('2004-01-28', ARRAY[7,14,16,22,25,26,28], ARRAY[1,2,3,4,16,18,32]),
+('2004-01-21', ARRAY[1,7,15,16,19,20,22], ARRAY[3,7,23,25,30,31,33]),
+('2004-01-14', ARRAY[1,2,4,8,9,28,35], ARRAY[7,9,10,15,20,28,30]),
+('2004-01-07', ARRAY[1,4,8,11,16,25,28], ARRAY[3,12,13,14,20,21,31]),
+('2003-12-31', ARRAY[6,8,9,15,26,28,30], ARRAY[7,9,18,21,24,29,32]),
+('2003-12-24', ARRAY[9,11,21,25,26,27,34], ARRAY[4,15,18,20,21,25,32]),
+('2003-12-17', ARRAY[6,10,16,17,18,30,31], ARRAY[1,6,9,12,14,19,31]),
+('2003-12-10', ARRAY[11,14,16,17,21,27,29], ARRAY[7,16,25,29,30,31,35]),
+('2003-12-03', ARRAY[17,19,20,22,27,28,29], ARRAY[2,11,14,15,21,23,26]),
+('2003-11-26', ARRAY[5,7,14,23,26,27,30], ARRAY[6,9,17,19,21,29,34]),
+('2003-11-19', ARRAY[1,6,13,19,21,24,30], ARRAY[1,4,5,6,10,17,30]),
+('2003-11-12', ARRAY[2,6,12,16,18,24,29], ARRAY[5,6,9,10,11,13,25]),
+('2003-11-05', ARRAY[5,17,18,19,27,34,35], ARRAY[2,4,10,12,23,28,32]),
+('2003-10-29', ARRAY[5,6,12,16,18,29,31], ARRAY[6,13,18,25,26,32,33]),
+('2003-10-22', ARRAY[2,6,10,12,18,28,32], ARRAY[2,3,9,12,23,25,27]),
+('2003-10-15', ARRAY[1,4,18,20,29,32,35], ARRAY[1,2,8,9,10,16,23]),
+('2003-10-08', ARRAY[3,6,14,17,24,29,34], ARRAY[2,4,9,11,16,19,29]),
+('2003-10-01', ARRAY[3,4,10,14,26,28,32], ARRAY[8,9,13,15,16,26,35]),
+('2003-09-24', ARRAY[4,9,21,22,27,33,34], ARRAY[3,6,21,27,28,30,33]),
+('2003-09-17', ARRAY[7,12,14,18,23,33,34], ARRAY[3,7,8,20,21,26,35]),
+('2003-09-10', ARRAY[7,18,19,26,27,28,34], ARRAY[4,8,10,19,28,33,34]),
+('2003-09-03', ARRAY[5,9,12,15,17,22,32], ARRAY[3,4,14,24,30,34,35]),
+('2003-08-27', ARRAY[2,4,8,29,32,33,35], ARRAY[1,7,9,12,21,26,30]),
+('2003-08-20', ARRAY[4,17,19,22,24,26,29], ARRAY[10,14,23,30,31,33,35]),
+('2003-08-13', ARRAY[2,5,10,14,25,26,29], ARRAY[2,3,5,12,22,26,35]),
+('2003-08-06', ARRAY[2,3,9,15,26,27,29], ARRAY[6,13,16,18,19,20,34]),
+('2003-07-30', ARRAY[5,12,14,18,22,24,25], ARRAY[1,10,17,21,25,27,29]),
+('2003-07-23', ARRAY[6,7,12,16,18,32,33], ARRAY[9,15,16,21,25,31,34]),
+('2003-07-16', ARRAY[1,15,16,19,27,31,32], ARRAY[3,11,12,17,24,29,33]),
+('2003-07-09', ARRAY[5,7,17,22,27,29,30], ARRAY[10,17,19,22,25,30,34]),
+('2003-07-02', ARRAY[6,10,14,22,31,33,34], ARRAY[4,7,15,17,18,26,27]),
+('2003-06-25', ARRAY[2,9,12,17,23,30,32], ARRAY[1,6,7,14,20,21,33]),
+('2003-06-18', ARRAY[2,5,9,20,21,22,23], ARRAY[3,8,9,13,17,22,23]),
+('2003-06-11', ARRAY[4,7,13,17,19,25,26], ARRAY[1,7,17,18,29,30,33]),
+('2003-06-04', ARRAY[9,10,13,17,23,28,31], ARRAY[4,10,12,13,17,18,34]),
+('2003-05-28', ARRAY[4,13,18,28,31,34,35], ARRAY[2,5,10,15,19,28,32]),
+('2003-05-21', ARRAY[5,6,9,14,18,20,30], ARRAY[5,10,13,17,20,26,32]),
+('2003-05-14', ARRAY[8,11,19,22,24,29,35], ARRAY[3,13,16,18,22,28,35]),
+('2003-05-07', ARRAY[1,7,18,27,30,33,35], ARRAY[10,12,14,25,27,31,34]),
+('2003-04-30', ARRAY[2,13,15,19,24,26,32], ARRAY[3,4,7,13,20,32,33]),
+('2003-04-23', ARRAY[7,16,24,26,30,32,35], ARRAY[1,2,8,9,11,29,33]),
+('2003-04-16', ARRAY[6,7,11,12,13,23,30], ARRAY[11,12,15,22,28,29,34]),
+('2003-04-09', ARRAY[6,9,22,24,32,33,34], ARRAY[1,10,15,17,26,29,31]),
+('2003-04-02', ARRAY[3,17,18,21,23,29,31], ARRAY[4,5,10,14,22,31,33]),
+('2003-03-26', ARRAY[2,4,7,12,28,31,35], ARRAY[1,4,10,19,25,30,35]),
+('2003-03-19', ARRAY[9,13,15,17,19,28,31], ARRAY[2,5,7,15,18,33,35]),
+('2003-03-12', ARRAY[6,7,10,12,24,25,29], ARRAY[3,9,10,11,16,22,26]),
+('2003-03-05', ARRAY[2,9,10,11,12,21,27], ARRAY[1,20,22,25,27,28,32]),
+('2003-02-26', ARRAY[4,6,13,14,16,29,35], ARRAY[5,14,15,18,20,22,25]),
+('2003-02-19', ARRAY[7,10,14,18,19,25,31], ARRAY[10,13,14,17,18,27,32]),
+('2003-02-12', ARRAY[4,10,19,23,24,25,35], ARRAY[2,12,13,14,16,20,21]),
+('2003-02-05', ARRAY[1,7,12,20,29,30,31], ARRAY[2,12,22,23,28,29,31]),
+('2003-01-29', ARRAY[4,7,11,15,25,33,34], ARRAY[3,9,17,19,22,28,34]),
+('2003-01-22', ARRAY[6,16,17,21,23,32,35], ARRAY[14,16,17,21,27,29,31]),
+('2003-01-15', ARRAY[3,10,12,13,18,21,27], ARRAY[1,2,9,16,20,25,32]),
+('2003-01-08', ARRAY[1,7,8,9,14,20,31], ARRAY[1,3,7,20,28,32,33]),
+('2003-01-01', ARRAY[4,13,23,24,25,27,30], ARRAY[1,8,12,18,21,28,30]),
+('2002-12-25', ARRAY[7,8,19,22,23,32,33], ARRAY[6,12,19,20,22,24,25]),
+('2002-12-18', ARRAY[4,9,12,24,25,30,35], ARRAY[6,8,11,13,14,21,23]),
+('2002-12-11', ARRAY[3,13,19,20,25,26,30], ARRAY[1,3,12,15,27,30,34]),
+('2002-12-04', ARRAY[9,17,18,20,30,31,34], ARRAY[2,11,14,15,18,25,27]),
+('2002-11-27', ARRAY[2,3,16,23,24,30,34], ARRAY[4,10,14,19,21,31,34]),
+('2002-11-20', ARRAY[1,8,10,15,21,22,29], ARRAY[14,15,17,21,27,31,34]),
+('2002-11-13', ARRAY[2,5,9,15,16,22,24], ARRAY[4,6,14,25,26,27,29]),
+('2002-11-06', ARRAY[5,7,14,21,26,27,31], ARRAY[3,5,8,10,14,24,26]),
+('2002-10-30', ARRAY[1,2,7,16,17,22,24], ARRAY[1,8,11,20,26,32,33]),
+('2002-10-23', ARRAY[5,10,18,20,24,25,28], ARRAY[2,3,12,15,17,22,26]),
+('2002-10-16', ARRAY[8,18,20,23,27,28,32], ARRAY[5,18,24,26,28,30,35]),
+('2002-10-09', ARRAY[2,3,10,14,18,23,24], ARRAY[2,7,8,21,22,30,31]),
+('2002-10-02', ARRAY[7,11,18,19,20,22,26], ARRAY[8,12,15,16,21,31,33]),
+('2002-09-25', ARRAY[1,2,10,11,12,25,33], ARRAY[2,5,10,21,22,32,35]),
+('2002-09-18', ARRAY[1,4,6,14,19,27,31], ARRAY[1,2,6,8,15,25,31]),
+('2002-09-11', ARRAY[12,14,16,22,30,32,34], ARRAY[7,10,11,22,25,27,29]),
+('2002-09-04', ARRAY[6,9,15,20,23,32,33], ARRAY[19,20,22,27,30,34,35]),
+('2002-08-28', ARRAY[7,9,12,13,15,20,23], ARRAY[4,5,8,15,18,24,26]),
+('2002-08-21', ARRAY[1,4,7,17,20,24,25], ARRAY[2,5,7,9,10,21,25]),
+('2002-08-14', ARRAY[1,15,26,27,32,33,35], ARRAY[1,5,7,9,26,30,33]),
+('2002-08-07', ARRAY[1,2,12,13,22,24,28], ARRAY[8,19,21,22,25,33,35]),
+('2002-07-31', ARRAY[5,9,20,23,26,34,35], ARRAY[1,4,21,25,27,30,35]),
+('2002-07-24', ARRAY[6,12,13,16,19,32,34], ARRAY[3,4,6,11,25,28,33]),
+('2002-07-17', ARRAY[5,12,20,25,29,31,35], ARRAY[7,8,16,28,30,31,32]),
+('2002-07-10', ARRAY[1,4,6,11,12,13,17], ARRAY[3,5,7,10,18,19,30]),
+('2002-07-03', ARRAY[6,10,12,18,23,26,35], ARRAY[3,5,11,22,26,27,31]),
+('2002-06-26', ARRAY[6,8,9,12,18,33,34], ARRAY[1,14,16,21,23,28,29]),
+('2002-06-19', ARRAY[10,13,20,21,24,29,31], ARRAY[1,12,17,18,23,28,35]),
+('2002-06-12', ARRAY[1,3,7,13,16,30,35], ARRAY[1,6,7,15,27,28,29]),
+('2002-06-05', ARRAY[3,9,10,11,20,30,35], ARRAY[1,5,9,11,16,21,25]),
+('2002-05-29', ARRAY[1,4,12,14,20,23,25], ARRAY[1,3,8,22,25,26,32]),
+('2002-05-22', ARRAY[2,5,13,28,29,32,35], ARRAY[2,3,10,16,24,25,31]),
+('2002-05-15', ARRAY[3,5,8,10,20,23,27], ARRAY[5,6,7,14,17,24,35]),
+('2002-05-08', ARRAY[6,8,13,14,23,24,34], ARRAY[4,5,8,11,15,17,35]),
+('2002-05-01', ARRAY[4,16,22,23,32,34,35], ARRAY[7,10,12,19,20,28,32]),
+('2002-04-24', ARRAY[3,10,13,26,32,33,35], ARRAY[5,8,10,14,17,24,28]),
+('2002-04-17', ARRAY[17,18,22,23,29,32,35], ARRAY[6,7,10,15,17,22,34]),
+('2002-04-10', ARRAY[8,9,15,17,27,28,35], ARRAY[5,15,18,21,24,32,34]),
+('2002-04-03', ARRAY[1,12,14,23,29,30,31], ARRAY[6,7,8,12,21,26,27]),
+('2002-03-27', ARRAY[1,3,4,5,23,29,31], ARRAY[2,3,5,6,11,20,31]),
+('2002-03-20', ARRAY[2,8,9,13,23,25,28], ARRAY[1,8,9,11,12,15,25]),
+('2002-03-13', ARRAY[2,6,9,20,24,30,34], ARRAY[2,8,11,14,18,20,33]),
+('2002-03-06', ARRAY[1,2,4,15,18,22,28], ARRAY[1,7,10,13,14,31,34]),
+('2002-02-27', ARRAY[1,2,4,16,19,30,34], ARRAY[4,5,7,13,25,28,33]),
+('2002-02-20', ARRAY[4,6,17,19,25,26,35], ARRAY[1,2,3,15,16,22,24]),
+('2002-02-13', ARRAY[5,6,9,11,15,29,31], ARRAY[9,20,21,23,24,34,35]),
+('2002-02-06', ARRAY[1,2,6,12,13,25,31], ARRAY[3,6,15,17,20,22,31]),
+('2002-01-30', ARRAY[9,11,13,14,19,21,26], ARRAY[3,6,14,17,18,22,27]),
+('2002-01-23', ARRAY[5,15,17,21,27,30,34], ARRAY[2,8,9,13,21,25,34]),
+('2002-01-16', ARRAY[1,6,7,8,14,22,29], ARRAY[1,3,6,20,23,25,35]),
+('2002-01-09', ARRAY[6,11,17,19,20,29,30], ARRAY[3,9,14,15,17,26,30]),
+('2002-01-02', ARRAY[4,11,15,26,29,32,35], ARRAY[3,5,7,13,18,19,24]),
+('2001-12-26', ARRAY[7,8,16,18,31,34,35], ARRAY[2,7,8,21,29,34,35]),
+('2001-12-19', ARRAY[16,18,22,24,32,33,35], ARRAY[9,15,17,18,19,24,25]),
+('2001-12-12', ARRAY[2,7,12,14,20,21,24], ARRAY[7,8,9,10,17,23,30]),
+('2001-12-05', ARRAY[2,3,10,18,23,27,33], ARRAY[1,5,10,11,12,15,28]),
+('2001-11-28', ARRAY[3,4,6,7,9,17,32], ARRAY[4,8,9,15,16,22,26]),
+('2001-11-21', ARRAY[1,6,7,13,25,30,31], ARRAY[4,10,15,18,26,27,35]),
+('2001-11-14', ARRAY[7,10,12,15,16,30,32], ARRAY[9,21,23,26,29,31,34]),
+('2001-11-07', ARRAY[1,11,19,23,25,28,31], ARRAY[3,5,11,12,17,25,29]),
+('2001-10-31', ARRAY[1,9,10,14,20,34,35], ARRAY[2,3,7,11,16,24,30]),
+('2001-10-24', ARRAY[6,17,18,19,28,34,35], ARRAY[1,2,7,14,18,25,30]),
+('2001-10-17', ARRAY[5,7,12,23,26,27,33], ARRAY[4,8,10,12,18,22,24]),
+('2001-10-10', ARRAY[2,6,8,14,21,27,30], ARRAY[8,9,22,26,30,31,35]),
+('2001-10-03', ARRAY[3,11,17,18,20,21,24], ARRAY[3,6,16,19,26,28,32]),
+('2001-09-26', ARRAY[1,3,4,19,23,24,34], ARRAY[5,10,13,15,22,32,35]),
+('2001-09-19', ARRAY[11,12,14,17,18,26,35], ARRAY[2,6,8,13,17,23,34]),
+('2001-09-12', ARRAY[7,11,20,22,31,32,33], ARRAY[4,9,14,16,22,26,27]),
+('2001-09-05', ARRAY[2,11,13,14,17,22,28], ARRAY[3,4,5,6,22,24,34]),
+('2001-08-29', ARRAY[7,9,13,31,32,34,35], ARRAY[2,3,4,13,19,26,28]),
+('2001-08-22', ARRAY[6,10,21,24,31,33,35], ARRAY[3,4,6,8,9,11,17]),
+('2001-08-15', ARRAY[4,5,11,14,22,27,34], ARRAY[1,8,16,18,19,23,31]),
+('2001-08-08', ARRAY[3,6,14,18,19,28,35], ARRAY[7,14,15,17,19,26,30]),
+('2001-08-01', ARRAY[2,24,25,29,31,32,34], ARRAY[8,11,15,24,26,29,31]),
+('2001-07-25', ARRAY[1,13,15,18,23,27,28], ARRAY[5,18,23,24,25,29,32]),
+('2001-07-18', ARRAY[3,5,10,22,30,31,34], ARRAY[4,12,18,21,24,25,29]),
+('2001-07-11', ARRAY[2,4,6,8,9,14,15], ARRAY[3,5,7,12,14,29,32]),
+('2001-07-04', ARRAY[2,11,14,23,26,29,34], ARRAY[13,14,18,20,26,33,35]),
+('2001-06-27', ARRAY[6,8,17,21,28,32,33], ARRAY[10,12,14,20,25,31,35]),
+('2001-06-20', ARRAY[2,7,19,23,24,26,33], ARRAY[15,18,21,25,28,31,34]),
+('2001-06-13', ARRAY[15,20,21,25,26,31,32], ARRAY[5,6,14,15,25,26,27]),
+('2001-06-06', ARRAY[2,3,4,10,11,15,33], ARRAY[2,6,7,22,27,30,34]),
+('2001-05-30', ARRAY[2,6,8,24,27,28,33], ARRAY[2,10,11,15,16,23,35]),
+('2001-05-23', ARRAY[2,5,23,24,25,28,33], ARRAY[2,10,16,18,20,21,23]),
+('2001-05-16', ARRAY[1,5,11,15,18,22,34], ARRAY[5,6,18,21,25,28,31]),
+('2001-05-09', ARRAY[1,6,15,17,21,27,31], ARRAY[3,4,11,13,15,20,33]),
+('2001-05-02', ARRAY[3,8,19,20,23,26,32], ARRAY[4,10,12,13,15,23,32]),
+('2001-04-25', ARRAY[1,2,8,15,24,26,35], ARRAY[8,9,11,15,20,26,34]),
+('2001-04-18', ARRAY[3,15,18,19,22,26,31], ARRAY[1,5,11,13,14,17,33]),
+('2001-04-11', ARRAY[2,3,5,7,15,25,34], ARRAY[5,6,8,13,24,31,32]),
+('2001-04-04', ARRAY[1,3,9,11,13,24,25], ARRAY[4,6,16,17,20,21,35]),
+('2001-03-28', ARRAY[7,8,9,16,25,31,32], ARRAY[1,2,16,25,26,30,34]),
+('2001-03-21', ARRAY[2,5,9,12,14,16,19], ARRAY[1,8,9,24,27,30,34]),
+('2001-03-14', ARRAY[3,5,9,11,12,22,23], ARRAY[15,22,24,27,29,34,35]),
+('2001-03-07', ARRAY[2,13,23,26,27,30,34], ARRAY[1,14,16,17,26,28,34]),
+('2001-02-28', ARRAY[3,8,10,20,24,28,33], ARRAY[3,7,19,24,26,29,31]),
+('2001-02-21', ARRAY[4,10,15,23,24,32,35], ARRAY[4,5,7,8,16,22,28]),
+('2001-02-14', ARRAY[6,7,12,20,23,25,31], ARRAY[5,7,8,14,15,25,28]),
+('2001-02-07', ARRAY[6,7,9,13,30,31,32], ARRAY[4,7,13,16,30,33,34]),
+('2001-01-31', ARRAY[1,4,18,23,25,26,28], ARRAY[6,9,13,17,19,32,33]),
+('2001-01-24', ARRAY[1,4,8,10,16,18,27], ARRAY[1,9,18,21,23,24,31]),
+('2001-01-17', ARRAY[3,11,14,16,21,31,35], ARRAY[3,4,11,22,25,28,33]),
+('2001-01-10', ARRAY[11,14,21,24,25,28,34], ARRAY[3,5,15,23,24,25,34]),
+('2001-01-03', ARRAY[1,2,6,9,10,15,20], ARRAY[16,17,18,25,26,28,29]),
+('2000-12-27', ARRAY[3,7,8,17,23,26,29], ARRAY[1,7,13,19,20,22,29]),
+('2000-12-20', ARRAY[2,3,15,17,21,29,35], ARRAY[16,18,19,24,25,26,30]),
+('2000-12-13', ARRAY[10,17,18,19,23,27,34], ARRAY[1,9,12,16,19,21,22]),
+('2000-12-06', ARRAY[2,4,9,11,23,26,28], ARRAY[6,11,12,16,18,26,31]),
+('2000-11-29', ARRAY[2,8,29,30,31,32,35], ARRAY[3,7,8,13,25,27,31]),
+('2000-11-22', ARRAY[3,8,13,17,23,32,33], ARRAY[5,7,10,11,15,25,31]),
+('2000-11-15', ARRAY[6,8,23,27,28,31,35], ARRAY[2,11,16,18,19,22,28]),
+('2000-11-08', ARRAY[1,12,15,17,25,28,35], ARRAY[1,3,7,10,18,21,27]),
+('2000-11-01', ARRAY[2,9,14,17,20,30,34], ARRAY[6,11,13,15,19,29,30]),
+('2000-10-25', ARRAY[4,10,17,25,27,29,33], ARRAY[5,9,18,21,27,28,31]),
+('2000-10-18', ARRAY[1,6,10,13,22,25,33], ARRAY[3,13,20,23,24,30,32]),
+('2000-10-11', ARRAY[2,12,13,14,19,28,32], ARRAY[5,18,23,26,28,29,33]),
+('2000-10-04', ARRAY[9,15,19,24,31,33,34], ARRAY[3,5,13,21,28,32,33]),
+('2000-09-27', ARRAY[1,3,8,10,21,23,26], ARRAY[1,11,12,15,16,24,28]),
+('2000-09-20', ARRAY[3,5,9,10,18,19,34], ARRAY[5,18,21,25,26,28,29]),
+('2000-09-13', ARRAY[6,7,11,14,19,29,34], ARRAY[2,6,11,13,21,32,35]),
+('2000-09-06', ARRAY[5,8,13,15,20,26,29], ARRAY[3,9,11,16,17,20,30]),
+('2000-08-30', ARRAY[2,3,14,26,27,34,35], ARRAY[4,7,20,31,32,33,35]),
+('2000-08-23', ARRAY[6,10,19,22,24,25,32], ARRAY[1,8,9,21,25,33,35]),
+('2000-08-16', ARRAY[3,13,16,18,25,26,27], ARRAY[4,8,9,12,18,19,33]),
+('2000-08-09', ARRAY[7,22,27,29,30,32,33], ARRAY[4,5,19,23,25,29,32]),
+('2000-08-02', ARRAY[5,7,14,19,24,30,31], ARRAY[1,5,8,19,32,34,35]),
+('2000-07-26', ARRAY[5,7,19,20,30,31,34], ARRAY[8,16,17,20,26,32,33]),
+('2000-07-19', ARRAY[1,3,11,14,17,22,31], ARRAY[10,19,22,23,30,31,33]),
+('2000-07-12', ARRAY[5,6,8,11,16,19,25], ARRAY[7,13,14,18,20,21,26]),
+('2000-07-05', ARRAY[10,12,17,19,25,30,32], ARRAY[1,8,10,18,28,34,35]),
+('2000-06-28', ARRAY[8,13,14,15,25,30,32], ARRAY[3,7,13,24,29,30,33]),
+('2000-06-21', ARRAY[9,14,15,19,21,32,34], ARRAY[6,10,24,25,27,30,33]),
+('2000-06-14', ARRAY[3,5,20,23,29,34,35], ARRAY[1,13,17,19,23,29,32]),
+('2000-06-07', ARRAY[3,8,13,14,15,18,31], ARRAY[10,15,18,20,27,32,34]),
+('2000-05-31', ARRAY[7,10,11,21,25,28,34], ARRAY[1,3,12,26,27,34,35]),
+('2000-05-24', ARRAY[3,4,19,20,23,26,35], ARRAY[1,5,7,8,14,30,34]),
+('2000-05-17', ARRAY[14,24,25,27,28,29,34], ARRAY[4,5,6,9,13,21,33]),
+('2000-05-10', ARRAY[5,6,8,19,30,32,34], ARRAY[11,16,23,24,28,31,34]),
+('2000-05-03', ARRAY[3,12,19,21,23,26,33], ARRAY[2,5,11,12,16,27,30]),
+('2000-04-26', ARRAY[2,3,5,11,17,19,20], ARRAY[1,7,13,15,18,21,30]),
+('2000-04-19', ARRAY[6,7,11,18,25,29,30], ARRAY[7,10,13,18,23,29,30]),
+('2000-04-12', ARRAY[4,10,11,26,27,31,33], ARRAY[2,4,8,11,12,19,22]),
+('2000-04-05', ARRAY[1,2,4,7,8,22,23], ARRAY[3,6,7,9,12,30,31]),
+('2000-03-29', ARRAY[2,11,16,30,31,33,35], ARRAY[6,8,17,19,22,32,33]),
+('2000-03-22', ARRAY[12,27,29,31,32,33,35], ARRAY[1,2,8,11,21,26,35]),
+('2000-03-15', ARRAY[6,14,16,17,22,25,26], ARRAY[3,4,13,20,22,23,29]),
+('2000-03-08', ARRAY[3,7,13,14,16,17,25], ARRAY[21,24,25,27,30,32,35]),
+('2000-03-01', ARRAY[12,16,18,20,29,30,31], ARRAY[7,8,9,10,14,24,28]),
+('2000-02-23', ARRAY[2,3,5,20,24,31,32], ARRAY[11,24,26,27,28,31,33]),
+('2000-02-16', ARRAY[11,14,17,23,25,30,35], ARRAY[2,3,7,18,26,27,32]),
+('2000-02-09', ARRAY[7,12,14,15,19,20,29], ARRAY[1,9,10,12,14,21,28]),
+('2000-02-02', ARRAY[4,10,19,22,25,26,30], ARRAY[1,10,11,12,14,29,31]),
+('2000-01-26', ARRAY[1,3,18,29,31,34,35], ARRAY[1,6,11,22,24,29,31]),
+('2000-01-19', ARRAY[1,3,9,11,19,23,30], ARRAY[12,13,26,28,29,31,33]),
+('2000-01-12', ARRAY[8,13,21,22,26,28,30], ARRAY[9,12,17,22,24,27,35]),
+('2000-01-05', ARRAY[9,12,16,18,22,23,28], ARRAY[6,12,13,18,20,26,28]),
+('1999-12-29', ARRAY[6,7,19,25,30,32,34], ARRAY[12,18,20,24,28,31,34]),
+('1999-12-22', ARRAY[6,13,14,16,19,33,35], ARRAY[3,10,14,15,24,30,34]),
+('1999-12-15', ARRAY[1,3,28,31,32,33,34], ARRAY[9,12,13,14,15,18,34]),
+('1999-12-08', ARRAY[1,9,13,18,21,26,34], ARRAY[9,12,16,23,28,31,35]),
+('1999-12-01', ARRAY[4,9,11,20,22,28,32], ARRAY[11,13,16,17,20,31,35]),
+('1999-11-24', ARRAY[1,2,3,4,10,17,19], ARRAY[2,4,6,11,14,25,33]),
+('1999-11-17', ARRAY[1,4,13,15,17,20,24], ARRAY[1,19,22,26,29,31,35]),
+('1999-11-10', ARRAY[4,5,6,26,27,29,30], ARRAY[4,16,17,21,24,26,32]),
+('1999-11-03', ARRAY[1,2,6,10,11,20,34], ARRAY[11,16,18,27,30,33,35]),
+('1999-10-27', ARRAY[7,11,12,19,21,33,35], ARRAY[2,3,6,12,13,14,31]),
+('1999-10-20', ARRAY[4,5,8,16,27,29,30], ARRAY[4,6,7,22,24,26,28]),
+('1999-10-13', ARRAY[7,8,13,16,20,25,31], ARRAY[12,14,18,24,31,34,35]);
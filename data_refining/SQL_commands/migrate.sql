@@ -0,0 +1,55 @@
+-- Upgrades a database loaded from an older lottery.sql to the current schema without reloading it:
+-- the draw.mask column and its indexes, and the paired draw_hu7 table. Every statement is
+-- idempotent, so running it on an up-to-date database changes nothing.
+--     psql "$DATABASE_URL" -f data_refining/SQL_commands/migrate.sql
+-- Adding the generated column rewrites the draw table under a short exclusive lock (a few thousand rows).
+BEGIN;
+
+-- Packs the numbers of a draw into a bit string, bit n (1-based, from the left) is set for ball n.
+CREATE OR REPLACE FUNCTION numbers_mask(numbers INT[]) RETURNS BIT(90)
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT COALESCE(bit_or(B'1'::BIT(90) >> (n - 1)), B'0'::BIT(90)) FROM UNNEST(numbers) AS n
+$$;
+
+ALTER TABLE draw ADD COLUMN IF NOT EXISTS mask BIT(90) GENERATED ALWAYS AS (numbers_mask(numbers)) STORED;
+
+CREATE INDEX IF NOT EXISTS draw_lottery_date_idx ON draw (lottery_id, draw_date DESC) INCLUDE (mask);
+CREATE INDEX IF NOT EXISTS draw_lottery_mask_idx ON draw (lottery_id, mask);
+CREATE INDEX IF NOT EXISTS draw_numbers_idx ON draw USING GIN (numbers);
+
+CREATE TABLE IF NOT EXISTS draw_hu7 (
+    id SERIAL PRIMARY KEY,
+    draw_date DATE NOT NULL UNIQUE,
+    numbers_a INT[] NOT NULL,  -- Mechanical draw (lottery hu7a)
+    numbers_b INT[] NOT NULL,  -- Manual draw (lottery hu7b)
+    mask_a BIT(90) GENERATED ALWAYS AS (numbers_mask(numbers_a)) STORED,
+    mask_b BIT(90) GENERATED ALWAYS AS (numbers_mask(numbers_b)) STORED
+);
+
+CREATE INDEX IF NOT EXISTS draw_hu7_date_idx ON draw_hu7 (draw_date DESC) INCLUDE (mask_a, mask_b);
+CREATE INDEX IF NOT EXISTS draw_hu7_mask_a_idx ON draw_hu7 (mask_a);
+CREATE INDEX IF NOT EXISTS draw_hu7_mask_b_idx ON draw_hu7 (mask_b);
+CREATE INDEX IF NOT EXISTS draw_hu7_numbers_a_idx ON draw_hu7 USING GIN (numbers_a);
+CREATE INDEX IF NOT EXISTS draw_hu7_numbers_b_idx ON draw_hu7 USING GIN (numbers_b);
+
+-- Pair the hu7a and hu7b rows of the old schema by date and move them out of the draw table, which
+-- holds hu5 and hu6 only. A date with only one of its draws cannot be paired and is dropped, like
+-- refine.py does, ingest.py adds it once both draws are in the CSVs.
+INSERT INTO draw_hu7 (draw_date, numbers_a, numbers_b)
+SELECT a.draw_date, a.numbers, b.numbers
+FROM draw AS a
+INNER JOIN draw AS b ON b.draw_date = a.draw_date AND b.lottery_id = 'hu7b'
+WHERE a.lottery_id = 'hu7a'
+ORDER BY a.draw_date
+ON CONFLICT (draw_date) DO NOTHING;
+
+DELETE FROM draw WHERE lottery_id IN ('hu7a', 'hu7b');
+
+-- The hu7a draw of 1999-10-13 was truncated to 6 numbers by the old lottery.sql.
+UPDATE draw_hu7 SET numbers_a = ARRAY[7,8,13,16,20,25,31]
+WHERE draw_date = '1999-10-13' AND numbers_a = ARRAY[7,8,13,16,20,2];
+
+COMMIT;
+
+ANALYZE draw;
+ANALYZE draw_hu7;
@@ -0,0 +1,193 @@
+# --- Import necessary libraries ---
+from collections import defaultdict
+
+# Shape of every lottery_id stored in the draw table.
+# Mirrors the lottery table in data_refining/SQL_commands/lottery.sql.
+DRAW_RULES = {
+    'hu5': {'length': 5, 'max': 90},
+    'hu6': {'length': 6, 'max': 45},
+    'hu7a': {'length': 7, 'max': 35},  # Mechanical draw
+    'hu7b': {'length': 7, 'max': 35}   # Manual draw
+}
+
+
+def numbers_to_mask(numbers):
+    """Pack ball numbers into an int where bit (n - 1) is set for every number n."""
+    mask = 0
+    for n in numbers:
+        mask |= 1 << (int(n) - 1)
+    return mask
+
+
+def numbers_to_bit_string(numbers, width=90):
+    """
+    Format ball numbers like the draw.mask BIT(90) column of the database:
+    character n - 1 (from the left) is '1' for every number n.
+    """
+    mask = numbers_to_mask(numbers)
+    return ''.join('1' if (mask >> i) & 1 else '0' for i in range(width))
+
+
+def group_draws(rows):
+    """
+    Group (lottery_id, draw_date, numbers) rows by lottery_id.
+    Returns a dict of lottery_id: (dates, numbers), newest draw first (same order as the SQL).
+    """
+    grouped = defaultdict(list)
+    for lottery_id, draw_date, numbers in rows:
+        grouped[lottery_id].append((draw_date, [int(n) for n in numbers]))
+
+    draws = {}
+    for lottery_id, lottery_draws in grouped.items():
+        lottery_draws.sort(key=lambda draw: draw[0], reverse=True)
+        draws[lottery_id] = ([draw[0] for draw in lottery_draws], [draw[1] for draw in lottery_draws])
+    return draws
+
+
+def pair_hu7(dates_a, dates_b):
+    """
+    hu7 has two draws per date, pair them up like the SQL join on draw_date.
+    Returns a list of (index in dates_a, index in dates_b), in the order of dates_a.
+    """
+    index_b = {d: j for j, d in enumerate(dates_b)}
+    return [(i, index_b[d]) for i, d in enumerate(dates_a) if d in index_b]
+
+
+class BitmaskEngine:
+    """
+    In-memory match engine.
+    Every draw is stored as a packed bitmask (90 bits for hu5, 45 for hu6, 35 for hu7a/hu7b),
+    so the match count of a ticket is a single AND plus popcount per draw.
+    """
+
+    def __init__(self, rows):
+        """
+        Build the history from (lottery_id, draw_date, numbers) rows,
+        e.g. the rows of PostgresStorage.draws() (hu7 as separate hu7a and hu7b rows).
+        """
+        # Per lottery_id: dates, numbers and masks, newest draw first (same order as the SQL).
+        self._draws = {}
+        for lottery_id, (dates, numbers) in group_draws(rows).items():
+            self._draws[lottery_id] = {
+                'dates': dates,
+                'numbers': numbers,
+                'masks': [numbers_to_mask(draw) for draw in numbers]
+            }
+
+        # Pair the hu7 draws once instead of on every request.
+        self._hu7_pairs = pair_hu7(self._draws.get('hu7a', {}).get('dates', []),
+                                   self._draws.get('hu7b', {}).get('dates', []))
+
+    def total_draws(self, lottery_id):
+        """Return the number of stored draws for a lottery_id of the draw table."""
+        return len(self._draws.get(lottery_id, {}).get('dates', []))
+
+    def latest_draw_date(self):
+        """Return the date of the newest stored draw, or None without draws."""
+        return max((draws['dates'][0] for draws in self._draws.values() if draws['dates']), default=None)
+
+    def match_counts(self, lottery_id, numbers):
+        """Return the match count of the ticket against every draw, newest draw first."""
+        ticket = numbers_to_mask(numbers)
+        masks = self._draws.get(lottery_id, {}).get('masks', [])
+        return [(mask & ticket).bit_count() for mask in masks]
+
+    def match_series(self, lottery_id, numbers):
+        """
+        Return (ordinals, counts) of every draw of a lottery, newest first: the date ordinals
+        and one list of match counts per draw (two for hu7, paired on the date).
+        """
+        if lottery_id == 'hu7':
+            counts_a = self.match_counts('hu7a', numbers)
+            counts_b = self.match_counts('hu7b', numbers)
+            dates = self._draws.get('hu7a', {}).get('dates', [])
+            return ([dates[i].toordinal() for i, _ in self._hu7_pairs],
+                    [[counts_a[i] for i, _ in self._hu7_pairs], [counts_b[j] for _, j in self._hu7_pairs]])
+
+        dates = self._draws.get(lottery_id, {}).get('dates', [])
+        return [date.toordinal() for date in dates], [self.match_counts(lottery_id, numbers)]
+
+    def check(self, lottery_id, numbers, match_count, limit=20, before=None):
+        """
+        Same contract as WinningNumbers.check_lottery_numbers:
+        returns (formatted_results, total_draws, winning_draws) for already validated input.
+        With a `before` date the results start at the first matching draw older than it.
+        """
+        # --- Logic for 'hu7' (which has two sets of numbers) ---
+        if lottery_id == 'hu7':
+            draws_a, draws_b = self._draws.get('hu7a'), self._draws.get('hu7b')
+            if not draws_a or not draws_b:
+                return [], 0, 0
+
+            counts_a = self.match_counts('hu7a', numbers)
+            counts_b = self.match_counts('hu7b', numbers)
+
+            hits = [(i, j) for i, j in self._hu7_pairs
+                    if counts_a[i] == match_count or counts_b[j] == match_count]
+            page = [(i, j) for i, j in hits if before is None or draws_a['dates'][i] < before]
+
+            # --- Format results for hu7 (Date, Numbers A, Match A, Numbers B, Match B) ---
+            formatted_results = [
+                (draws_a['dates'][i].strftime("%Y-%m-%d"),
+                 draws_a['numbers'][i], counts_a[i],
+                 draws_b['numbers'][j], counts_b[j])
+                for i, j in page[:limit]
+            ]
+            return formatted_results, self.total_draws('hu7a'), len(hits)
+
+        # --- Logic for 'hu5' or 'hu6' (which have one set of numbers) ---
+        draws = self._draws.get(lottery_id)
+        if not draws:
+            return [], 0, 0
+
+        counts = self.match_counts(lottery_id, numbers)
+        hits = [i for i, count in enumerate(counts) if count == match_count]
+        page = [i for i in hits if before is None or draws['dates'][i] < before]
+
+        # --- Format results for hu5/hu6 (Date, Numbers, Match Count) ---
+        formatted_results = [
+            (draws['dates'][i].strftime("%Y-%m-%d"), draws['numbers'][i], counts[i])
+            for i in page[:limit]
+        ]
+        return formatted_results, self.total_draws(lottery_id), len(hits)
+
+    def histogram(self, lottery_id, numbers, limit=20):
+        """
+        Count the draws at every match level 0..k in one pass and keep the latest rows of each level.
+        Returns ({match_count: (winning_draws, formatted_results)}, total_draws) for already validated input.
+        A hu7 date is counted at the level of both its draws (once if they are equal).
+        """
+        histogram = {level: [0, []] for level in range(len(numbers) + 1)}
+
+        # --- Logic for 'hu7' (which has two sets of numbers) ---
+        if lottery_id == 'hu7':
+            draws_a, draws_b = self._draws.get('hu7a'), self._draws.get('hu7b')
+            if not draws_a or not draws_b:
+                return {level: tuple(value) for level, value in histogram.items()}, 0
+
+            counts_a = self.match_counts('hu7a', numbers)
+            counts_b = self.match_counts('hu7b', numbers)
+            for i, j in self._hu7_pairs:
+                for level in {counts_a[i], counts_b[j]}:
+                    histogram[level][0] += 1
+                    if len(histogram[level][1]) < limit:
+                        histogram[level][1].append(
+                            (draws_a['dates'][i].strftime("%Y-%m-%d"),
+                             draws_a['numbers'][i], counts_a[i],
+                             draws_b['numbers'][j], counts_b[j]))
+            total_draws = self.total_draws('hu7a')
+
+        # --- Logic for 'hu5' or 'hu6' (which have one set of numbers) ---
+        else:
+            draws = self._draws.get(lottery_id)
+            if not draws:
+                return {level: tuple(value) for level, value in histogram.items()}, 0
+
+            for i, count in enumerate(self.match_counts(lottery_id, numbers)):
+                histogram[count][0] += 1
+                if len(histogram[count][1]) < limit:
+                    histogram[count][1].append(
+                        (draws['dates'][i].strftime("%Y-%m-%d"), draws['numbers'][i], count))
+            total_draws = self.total_draws(lottery_id)
+
+        return {level: tuple(value) for level, value in histogram.items()}, total_draws
@@ -0,0 +1,261 @@
+"""
+Monte Carlo baseline of "how lucky is my ticket".
+
+Scores random tickets of a lottery against the whole draw history and keeps the distribution of
+their draw counts at every match level 0..k and for any prize ('win'). A ticket's count is then
+ranked as a percentile of the distribution. Random tickets are generated per chunk from
+(seed, chunk index), so a baseline only depends on the seed and the sample size, not on the
+number of worker processes.
+
+Run from the repository root (the history is read from the data_refining CSVs):
+    python luck.py [hu5 hu6 hu7] [--samples 1000000] [--seed 0] [--workers 8]
+
+The baselines are saved as baseline_<lottery_id>.npz in LOTTERY_BASELINE_DIR (default: next to this
+file) together with the version of the history they were computed on. The app reads them until a
+new draw arrives, a missing or stale baseline is computed in a background thread meanwhile.
+"""
+# --- Import necessary libraries ---
+import argparse
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from batch import TICKET_RULES
+from bitmap_index import random_draws
+from search import TicketSearch, WIN_TIER
+
+# Random tickets of a baseline computed by the command line and in the app (where it has no precomputed file).
+SAMPLES = 1_000_000
+APP_SAMPLES = 100_000
+
+# Random tickets scored per task, the unit of the seeding and of the process pool.
+CHUNK_SIZE = 2 ** 16
+
+# Directory of the baseline files, the source directory is often read-only in a deployment.
+BASELINE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def baseline_path(lottery_id):
+    """Return the baseline file of a lottery in LOTTERY_BASELINE_DIR, or BASELINE_DIR if it is not set."""
+    return os.path.join(os.environ.get('LOTTERY_BASELINE_DIR') or BASELINE_DIR, f'baseline_{lottery_id}.npz')
+
+
+def random_tickets(lottery_id, count, rng):
+    """Return a (count, k) int array of uniformly random tickets of a lottery, sorted per row."""
+    rule = TICKET_RULES[lottery_id]
+    return random_draws(count, rule['length'], rule['max'], rng)
+
+
+class MonteCarloBaseline(TicketSearch):
+    """
+    Distribution of the scores (see TicketSearch.score) of random tickets of a lottery.
+    distribution[column, count] is the number of random tickets with `count` draws at a tier,
+    the columns are the match levels 0..k and, last, any prize.
+    """
+
+    def __init__(self, rows, lottery_id, seed=0):
+        """Build the indexes from (lottery_id, draw_date, numbers) rows, no baseline is computed yet."""
+        super().__init__(rows, lottery_id)
+        self.seed = seed
+        self.samples = 0
+        self.distribution = np.zeros((len(self.tiers), self.n_draws + 1), dtype=np.int64)
+
+    def score_chunk(self, index, size):
+        """Return the distribution of the scores of the `size` random tickets of chunk `index`."""
+        rng = np.random.default_rng([self.seed, index])
+        scores = self.score(random_tickets(self.lottery_id, size, rng))
+
+        # Offset every column so one bincount builds the distributions of all tiers.
+        width = self.n_draws + 1
+        offsets = np.arange(len(self.tiers)) * width
+        return np.bincount((scores + offsets).ravel(), minlength=len(self.tiers) * width).reshape(-1, width)
+
+    def run(self, samples=SAMPLES, workers=None):
+        """
+        Score `samples` random tickets in chunks across a pool of `workers` processes
+        (all CPUs by default, 1 runs in this process) and keep their distribution.
+        """
+        chunks = [(index, min(CHUNK_SIZE, samples - start))
+                  for index, start in enumerate(range(0, samples, CHUNK_SIZE))]
+        distribution = np.zeros_like(self.distribution)
+
+        if workers == 1:
+            for index, size in chunks:
+                distribution += self.score_chunk(index, size)
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,)) as executor:
+                for chunk_distribution in executor.map(_score_chunk, chunks):
+                    distribution += chunk_distribution
+
+        self.distribution = distribution
+        self.samples = samples
+        return self
+
+    def percentile(self, tier, count):
+        """
+        Return the share (0..1) of random tickets with fewer draws at a tier than `count`,
+        counting the ties as half (mid-rank), so the median ticket is at 0.5.
+        """
+        if not self.samples:
+            raise ValueError("The baseline has not been computed.")
+        column = self.distribution[self.tiers.index(tier)]
+        count = min(max(int(count), 0), self.n_draws)
+        return float(column[:count].sum() + column[count] / 2) / self.samples
+
+    def mean(self, tier):
+        """Return the mean draw count of the random tickets at a tier."""
+        column = self.distribution[self.tiers.index(tier)]
+        return float(column @ np.arange(len(column))) / self.samples if self.samples else 0.0
+
+    def rank(self, ticket):
+        """
+        Score a ticket and rank it against the baseline.
+        Returns {tier: (count, percentile)} for the match levels 0..k and WIN_TIER.
+        """
+        scores = self.score(np.array([sorted(int(n) for n in ticket)], dtype=np.int64))[0]
+        return {tier: (int(count), self.percentile(tier, count)) for tier, count in zip(self.tiers, scores)}
+
+    def save(self, path):
+        """Write the baseline with its history version and seed, replacing the file at once."""
+        temporary = path + '.tmp'
+        with open(temporary, 'wb') as f:
+            np.savez(f, distribution=self.distribution, version=self.version, seed=self.seed, samples=self.samples)
+        os.replace(temporary, path)
+
+    def load(self, path, samples=0):
+        """
+        Read a saved baseline if it was computed on the same history with the same seed and at least
+        `samples` random tickets. Returns whether it was loaded.
+        """
+        try:
+            with np.load(path) as saved:
+                if (str(saved['version']), int(saved['seed'])) != (self.version, self.seed) \
+                        or int(saved['samples']) < samples:
+                    return False
+                self.distribution = saved['distribution']
+                self.samples = int(saved['samples'])
+                return True
+        except (OSError, KeyError, ValueError):
+            return False
+
+
+def load_baseline(rows, lottery_id, samples=SAMPLES, seed=0, workers=None, path=None):
+    """
+    Return the MonteCarloBaseline of a lottery, read from `path` (baseline_path by default) if it holds
+    one of the same history, else computed and saved there.
+    """
+    path = path or baseline_path(lottery_id)
+    baseline = MonteCarloBaseline(rows, lottery_id, seed)
+    if not baseline.load(path, samples):
+        baseline.run(samples, workers)
+        try:
+            baseline.save(path)
+        except OSError as e:
+            print(f"Baseline {path} could not be saved: {e}")
+    return baseline
+
+
+class BaselineLoader:
+    """
+    The baselines of the app, one per lottery and data version. A baseline file of the same history is
+    read in the request, a missing or stale one is computed and saved in a background thread, so no
+    request waits for the random tickets.
+    """
+
+    def __init__(self, samples=APP_SAMPLES, seed=0):
+        """Create an empty loader computing `samples` random tickets with `seed` where no file fits."""
+        self.samples = samples
+        self.seed = seed
+        self._baselines = {}  # lottery_id: (version, MonteCarloBaseline)
+        self._running = set()  # (lottery_id, version) computed in a thread
+        self._lock = threading.Lock()  # Streamlit runs every session in its own thread
+
+    def get(self, lottery_id, version, load_rows):
+        """
+        Return the baseline of a lottery for the data version (e.g. the latest draw date), or None while
+        it is computed in the background. load_rows() returns the history rows, it is only called when
+        the baseline of the version is not kept yet.
+        """
+        with self._lock:
+            if self._baselines.get(lottery_id, (None,))[0] == version:
+                return self._baselines[lottery_id][1]
+            if (lottery_id, version) in self._running:
+                return None
+
+        baseline = MonteCarloBaseline(load_rows(), lottery_id, self.seed)
+        if baseline.load(baseline_path(lottery_id), self.samples):
+            self._store(lottery_id, version, baseline)
+            return baseline
+
+        with self._lock:
+            if (lottery_id, version) in self._running:
+                return None
+            self._running.add((lottery_id, version))
+        threading.Thread(target=self._compute, args=(lottery_id, version, baseline),
+                         name=f'luck-{lottery_id}', daemon=True).start()
+        return None
+
+    def _store(self, lottery_id, version, baseline):
+        """Keep the baseline of the data version, replacing the one of an older version."""
+        with self._lock:
+            self._baselines[lottery_id] = (version, baseline)
+
+    def _compute(self, lottery_id, version, baseline):
+        """Score the random tickets in this thread, keep the baseline and save it for the other processes."""
+        try:
+            baseline.run(self.samples, workers=1)
+            self._store(lottery_id, version, baseline)
+            try:
+                baseline.save(baseline_path(lottery_id))
+            except OSError as e:
+                print(f"Baseline {baseline_path(lottery_id)} could not be saved: {e}")
+        except Exception as e:
+            print(f"Baseline of {lottery_id} could not be computed: {e}")
+        finally:
+            with self._lock:
+                self._running.discard((lottery_id, version))
+
+
+# The baseline of a worker process, set once by the pool's initializer.
+_worker_baseline = None
+
+
+def _init_worker(baseline):
+    """Keep the baseline (with its indexes) in the worker, so only chunk numbers are sent per task."""
+    global _worker_baseline
+    _worker_baseline = baseline
+
+
+def _score_chunk(chunk):
+    """Score a chunk of random tickets in a worker process."""
+    return _worker_baseline.score_chunk(*chunk)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('lottery_ids', nargs='*', help=f"Lotteries of {list(TICKET_RULES)} (default: all).")
+    parser.add_argument('--samples', type=int, default=SAMPLES, help="Random tickets per lottery.")
+    parser.add_argument('--seed', type=int, default=0, help="Seed of the random tickets.")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: all CPUs).")
+    args = parser.parse_args()
+    for lottery_id in args.lottery_ids:
+        if lottery_id not in TICKET_RULES:
+            parser.error(f"Invalid lottery_id value: {lottery_id}. Must be one of {list(TICKET_RULES)}")
+
+    from storage import EmbeddedStorage
+
+    rows = EmbeddedStorage.from_csv().draws()
+    for lottery_id in args.lottery_ids or list(TICKET_RULES):
+        start = time.perf_counter()
+        baseline = MonteCarloBaseline(rows, lottery_id, args.seed).run(args.samples, args.workers)
+        baseline.save(baseline_path(lottery_id))
+        elapsed = time.perf_counter() - start
+        print(f"{lottery_id}: {args.samples:,} random tickets in {elapsed:.1f} s ({args.samples / elapsed:,.0f} tickets/s),"
+              f" mean wins {baseline.mean(WIN_TIER):.1f} of {baseline.n_draws} draws.")
+
+
+if __name__ == '__main__':
+    main()
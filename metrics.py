@@ -0,0 +1,192 @@
+# No third-party imports: the metrics are recorded by core.py and storage.py, which load without
+# Streamlit or pandas, and are exposed without a Prometheus client library.
+# http.server is imported by serve_metrics only, it would triple the import time of core.py.
+import bisect
+import contextlib
+import os
+import threading
+import time
+
+# Upper bounds in seconds of the stage duration histogram, from a bitmask lookup to a slow query.
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Every metric of the app: name -> (Prometheus type, help text).
+METRICS = {
+    'lottery_stage_seconds': (
+        'histogram', "Duration of a ticket check stage: validation, lookup, query, conversion or formatting."),
+    'lottery_cache_requests_total': ('counter', "Result cache lookups of ticket checks by result (hit or miss)."),
+    'lottery_errors_total': ('counter', "Failed ticket checks by stage (validation, lookup or query)."),
+}
+
+# Label value of a check without a known lottery id, instead of the literal "None".
+UNKNOWN_LOTTERY = 'unknown'
+
+# Content type of the Prometheus text exposition format.
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _escape(value):
+    """Escape a label value for the text exposition format."""
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _format_labels(labels):
+    """Return the {name="value",...} part of a sample, labels is a sorted tuple of (name, value) pairs."""
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels) + '}'
+
+
+class Metrics:
+    """
+    Thread-safe counters and duration histograms of the ticket checks, labelled by lottery and stage.
+    render() returns them in the Prometheus text format, so latency percentiles (histogram_quantile)
+    and error rates can be computed by the scraper.
+    """
+
+    def __init__(self, buckets=BUCKETS):
+        """Create empty metrics with the given histogram bucket bounds in seconds."""
+        self.buckets = tuple(buckets)
+        self._counters = {}  # (name, labels): value
+        self._histograms = {}  # (name, labels): [bucket counts..., +Inf count, sum]
+        self._lock = threading.Lock()  # Streamlit runs every session in its own thread
+
+    @staticmethod
+    def _key(name, labels):
+        """Return the canonical key of a metric and its labels, a lottery of None is UNKNOWN_LOTTERY."""
+        if name not in METRICS:
+            raise KeyError(f"Unknown metric: {name}")
+        if 'lottery' in labels and labels['lottery'] is None:
+            labels = {**labels, 'lottery': UNKNOWN_LOTTERY}
+        return name, tuple(sorted(labels.items()))
+
+    def inc(self, name, amount=1, **labels):
+        """Add amount to a counter, e.g. inc('lottery_errors_total', lottery='hu5', stage='query')."""
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name, seconds, **labels):
+        """Record a duration in a histogram."""
+        key = self._key(name, labels)
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            histogram = self._histograms.setdefault(key, [0] * (len(self.buckets) + 2))
+            histogram[index] += 1
+            histogram[-1] += seconds
+
+    @contextlib.contextmanager
+    def time(self, stage, lottery):
+        """Record the duration of the with block as a stage of a lottery, also when it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe('lottery_stage_seconds', time.perf_counter() - start, stage=stage, lottery=lottery)
+
+    def error(self, stage, lottery):
+        """Count a failed ticket check."""
+        self.inc('lottery_errors_total', stage=stage, lottery=lottery)
+
+    def cache_request(self, hit, lottery):
+        """Count a result cache lookup."""
+        self.inc('lottery_cache_requests_total', result='hit' if hit else 'miss', lottery=lottery)
+
+    def value(self, name, **labels):
+        """Return a counter value, or the (count, sum) of a histogram."""
+        key = self._key(name, labels)
+        with self._lock:
+            if key in self._histograms:
+                histogram = self._histograms[key]
+                return sum(histogram[:-1]), histogram[-1]
+            return self._counters.get(key, 0)
+
+    def render(self):
+        """Return every metric in the Prometheus text exposition format."""
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: list(values) for key, values in self._histograms.items()}
+
+        lines = []
+        for name, (kind, help_text) in METRICS.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            if kind == 'counter':
+                for (_, labels), value in sorted(item for item in counters.items() if item[0][0] == name):
+                    lines.append(f"{name}{_format_labels(labels)} {value}")
+                continue
+
+            for (_, labels), values in sorted(item for item in histograms.items() if item[0][0] == name):
+                # Bucket counts are cumulative, +Inf equals the count.
+                cumulative = 0
+                for bound, count in zip(self.buckets + ('+Inf',), values[:-1]):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_format_labels(labels + (('le', bound),))} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {values[-1]:.6f}")
+                lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+        return '\n'.join(lines) + '\n'
+
+
+class NullMetrics:
+    """Metrics that record nothing, the default of TicketChecker and PostgresStorage."""
+
+    def time(self, stage, lottery):
+        """Return a with block that records nothing."""
+        return contextlib.nullcontext()
+
+    def error(self, stage, lottery):
+        """Count nothing."""
+
+    def cache_request(self, hit, lottery):
+        """Count nothing."""
+
+
+def write_metrics(metrics, path):
+    """
+    Write the metrics to a file, e.g. for the textfile collector of the Prometheus node exporter.
+    The file is replaced at once, so a scrape never reads a half-written file.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(metrics.render())
+    os.replace(tmp_path, path)
+
+
+def export_to_file(metrics, path, interval=15):
+    """Rewrite the metrics file every `interval` seconds in a daemon thread, returns the thread."""
+    def run():
+        while True:
+            try:
+                write_metrics(metrics, path)
+            except OSError as e:
+                print(f"Metrics file {path} could not be written: {e}")
+            time.sleep(interval)
+
+    thread = threading.Thread(target=run, name='metrics-file', daemon=True)
+    thread.start()
+    return thread
+
+
+def serve_metrics(metrics, port, host=''):
+    """Serve the metrics at http://host:port/metrics in a daemon thread, returns the HTTP server."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = metrics.render().encode()
+            self.send_response(200)
+            self.send_header('Content-Type', CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # A scrape every few seconds would flood the app's output
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='metrics-http', daemon=True).start()
+    return server
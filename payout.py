@@ -0,0 +1,99 @@
+# --- Import necessary libraries ---
+import numpy as np
+
+from batch import BatchChecker, TICKET_RULES
+from engine import DRAW_RULES
+
+# Ticket price per draw date in HUF (a hu7 ticket plays both draws of the date for one stake).
+# Example values, pass the current ones to PayoutSimulator.
+STAKES = {'hu5': 400, 'hu6': 400, 'hu7': 400}
+
+# Prize per match count of every draw in HUF. The real prizes are parimutuel and change every week,
+# these are round example amounts of the usual order of magnitude. hu7 has a prize pool per draw,
+# a ticket is paid by the mechanical (hu7a) and the manual (hu7b) pool separately.
+PRIZES = {
+    'hu5': {2: 2_500, 3: 25_000, 4: 1_500_000, 5: 1_000_000_000},
+    'hu6': {3: 2_500, 4: 10_000, 5: 500_000, 6: 400_000_000},
+    'hu7a': {4: 1_500, 5: 20_000, 6: 1_500_000, 7: 100_000_000},
+    'hu7b': {4: 1_500, 5: 20_000, 6: 1_500_000, 7: 100_000_000}
+}
+
+
+def prize_vector(prizes, length):
+    """Convert a {match count: prize} table to an int64 array indexed by the match count 0..length."""
+    vector = np.zeros(length + 1, dtype=np.int64)
+    for match_count, prize in prizes.items():
+        vector[int(match_count)] = prize
+    return vector
+
+
+class PayoutSimulator(BatchChecker):
+    """
+    Prize and ROI simulation of tickets played on every draw of the history.
+    The per-draw match counts come from the BatchChecker matrix product, a prize table lookup turns
+    them into payouts, so a whole history of a ticket is a few array operations and batches of
+    tickets scale linearly (in memory-bounded chunks).
+    """
+
+    def __init__(self, rows, prizes=None, stakes=None):
+        """
+        Build the draw matrices from (lottery_id, draw_date, numbers) rows.
+        prizes ({draw lottery_id: {match count: prize}}) and stakes ({lottery_id: price per draw date})
+        override the PRIZES and STAKES example values per lottery.
+        """
+        super().__init__(rows)
+        self.stakes = {**STAKES, **(stakes or {})}
+        self.prizes = {**PRIZES, **(prizes or {})}
+        self._prize_vectors = {draw_id: prize_vector(self.prizes[draw_id], rule['length'])
+                               for draw_id, rule in DRAW_RULES.items()}
+
+    def simulate(self, lottery_id, tickets, chunk_size=None):
+        """
+        Play M tickets on every draw of a lottery. Returns a dict of
+        - stake: total stake of a ticket (the same for every ticket),
+        - winnings: (M,) int64 total prize per ticket, every pool included,
+        - roi: (M,) float64 (winnings - stake) / stake per ticket,
+        - tiers: {draw lottery_id: (M, k + 1) int64 draws at every match level 0..k},
+        - pool_winnings: {draw lottery_id: (M,) int64 prizes paid by that draw's pool}.
+        Raises ValueError for invalid tickets like BatchChecker.check.
+        """
+        tickets = self._validate_tickets(lottery_id, tickets)
+        draw_ids = TICKET_RULES[lottery_id]['draws']
+        n_levels = TICKET_RULES[lottery_id]['length'] + 1
+        n_tickets = len(tickets)
+
+        tiers = {draw_id: np.zeros((n_tickets, n_levels), dtype=np.int64) for draw_id in draw_ids}
+        for start, stop, counts in self._chunk_counts(lottery_id, tickets, chunk_size):
+            # Offset every row's counts so one bincount builds all level counts of the chunk.
+            offsets = np.arange(stop - start)[:, None] * n_levels
+            for draw_id, draw_counts in zip(draw_ids, counts):
+                levels = np.bincount((draw_counts + offsets).ravel(), minlength=(stop - start) * n_levels)
+                tiers[draw_id][start:stop] = levels.reshape(-1, n_levels)
+
+        # Every draw at a level pays that level's prize, so the winnings are level counts times prizes.
+        pool_winnings = {draw_id: tiers[draw_id] @ self._prize_vectors[draw_id] for draw_id in draw_ids}
+        winnings = sum(pool_winnings.values())
+        stake = self.stakes[lottery_id] * len(self._dates.get(lottery_id, []))
+        roi = (winnings - stake) / stake if stake else np.zeros(n_tickets)
+        return {'stake': stake, 'winnings': winnings, 'roi': roi, 'tiers': tiers, 'pool_winnings': pool_winnings}
+
+    def timeline(self, lottery_id, tickets):
+        """
+        Cumulative stake, winnings and ROI of M tickets after every draw, oldest draw first. Returns a dict of
+        - dates: the n draw dates,
+        - stake: (n,) int64 cumulative stake (the same for every ticket),
+        - winnings: (M, n) int64 cumulative prizes, every pool included,
+        - roi: (M, n) float64 cumulative (winnings - stake) / stake.
+        Holds the (M, n) arrays, use simulate() for the totals of many tickets.
+        """
+        tickets = self._validate_tickets(lottery_id, tickets)
+        dates = self.dates(lottery_id)[::-1]
+        payouts = np.zeros((len(tickets), len(dates)), dtype=np.int64)
+        for start, stop, counts in self._chunk_counts(lottery_id, tickets):
+            for draw_id, draw_counts in zip(TICKET_RULES[lottery_id]['draws'], counts):
+                payouts[start:stop] += self._prize_vectors[draw_id][draw_counts[:, ::-1]]
+
+        stake = self.stakes[lottery_id] * np.arange(1, len(dates) + 1, dtype=np.int64)
+        winnings = np.cumsum(payouts, axis=1)
+        roi = (winnings - stake) / np.maximum(stake, 1)
+        return {'dates': dates, 'stake': stake, 'winnings': winnings, 'roi': roi}
@@ -0,0 +1,64 @@
+# No third-party imports: the plan is chosen by storage.py, which loads without pandas (see core.py).
+import itertools
+from math import comb
+
+from engine import DRAW_RULES
+
+# Full scan: every draw of the lottery is scored with bit_count(mask & ticket_mask).
+SCAN = 'scan'
+# Containment: only the draws holding one of the match_count-subsets of the ticket
+# (numbers @> subset, a bitmap OR over the GIN index on the numbers) are scored.
+CONTAINMENT = 'containment'
+# Equality: a k-of-k match is a draw whose mask equals the ticket's, one B-tree lookup.
+EQUALITY = 'equality'
+
+# Costs per draw relative to scoring it in a scan (1): reading a GIN posting list entry, and fetching
+# and scoring a candidate draw. Fitted to EXPLAIN ANALYZE timings of every (lottery_id, match_count)
+# check on PostgreSQL 16, where they pick the faster plan in every case.
+POSTING_COST = 0.2
+FETCH_COST = 2.0
+
+
+def _draw_rule(lottery_id):
+    """Return the DRAW_RULES entry of a ticket lottery, both hu7 draws have the rule of hu7a."""
+    return DRAW_RULES['hu7a' if lottery_id == 'hu7' else lottery_id]
+
+
+def candidate_share(lottery_id, match_count):
+    """
+    Return the probability that a draw has at least match_count of a ticket's numbers (hypergeometric),
+    for hu7 that either draw of a date has.
+    """
+    rule = _draw_rule(lottery_id)
+    k, n = rule['length'], rule['max']
+    share = sum(comb(k, j) * comb(n - k, k - j) for j in range(match_count, k + 1)) / comb(n, k)
+    if lottery_id == 'hu7':
+        share = 1 - (1 - share) ** 2
+    return share
+
+
+def containment_cost(lottery_id, match_count):
+    """
+    Return the estimated cost per draw of a containment plan, a scan costs 1.
+    Every subset probe reads the posting lists of its match_count numbers, a list holds k / max of the draws,
+    and every candidate draw is fetched and scored. Only the ratio matters, so the cost holds for any history size.
+    """
+    rule = _draw_rule(lottery_id)
+    k, n = rule['length'], rule['max']
+    pools = 2 if lottery_id == 'hu7' else 1
+    postings = pools * comb(k, match_count) * match_count * k / n
+    return POSTING_COST * postings + FETCH_COST * candidate_share(lottery_id, match_count)
+
+
+def choose_strategy(lottery_id, match_count):
+    """Return the SCAN, CONTAINMENT or EQUALITY plan of a check of a (lottery_id, match_count)."""
+    if match_count == _draw_rule(lottery_id)['length']:
+        return EQUALITY
+    if match_count > 0 and containment_cost(lottery_id, match_count) < 1:
+        return CONTAINMENT
+    return SCAN
+
+
+def ticket_subsets(numbers, match_count):
+    """Return the sorted match_count-subsets of a ticket, a draw with match_count matches contains one of them."""
+    return [list(subset) for subset in itertools.combinations(sorted(int(n) for n in numbers), match_count)]
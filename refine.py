@@ -0,0 +1,187 @@
+"""
+Refine pipeline of the data_refining CSVs, one run for every lottery.
+
+Run from the repository root after saving the CSVs (see README):
+    python refine.py [--workers N] [--output-dir data_refining/SQL_commands]
+
+Every CSV is refined in its own process: the dates are fixed with vectorized operations
+(see storage.read_draws_frame), the draws are validated against the lottery table of lottery.sql
+(number count, ball range, no repeated balls, one draw per date) and the rows are written as the
+SQL compatible draw_numbers_<lottery_id>_SQL.txt of the first setup. The hu7a and hu7b CSVs are
+paired on the date into one draw_numbers_hu7_SQL.txt of the draw_hu7 table. A lottery with invalid
+rows is reported and gets no txt.
+"""
+# --- Import necessary libraries ---
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from storage import CSV_FILES, DATA_DIR, read_draws_frame
+
+SQL_DIR = os.path.join(DATA_DIR, 'SQL_commands')
+LOTTERY_SQL = os.path.join(SQL_DIR, 'lottery.sql')
+
+# The mechanical and the manual draw of hu7, stored as one draw_hu7 row per date.
+HU7_DRAWS = ('hu7a', 'hu7b')
+
+
+def read_lottery_rules(path=LOTTERY_SQL):
+    """
+    Return {name: {'length': total_numbers, 'max': range_max}} of the lottery table rows
+    inserted by lottery.sql, the same shape as engine.DRAW_RULES.
+    """
+    with open(path, encoding='utf-8') as f:
+        sql = f.read()
+
+    statement = re.search(r"INSERT INTO lottery\s*\(name, total_numbers, range_max\)\s*VALUES(.*?);", sql, re.S)
+    if statement is None:
+        raise ValueError(f"No INSERT INTO lottery statement in {path}")
+    return {
+        name: {'length': int(total_numbers), 'max': int(range_max)}
+        for name, total_numbers, range_max in re.findall(r"\('(\w+)',\s*(\d+),\s*(\d+)\)", statement.group(1))
+    }
+
+
+def validate_draws(df, lottery_id, rule):
+    """
+    Return the problems of a read_draws_frame DataFrame as 'line <n> (<date>): <reason>' messages,
+    n being the line number in the CSV. Every check is a vectorized mask over all rows.
+    Only the n1..n<total_numbers> columns are checked, a trailing extra column (the bonus number
+    of the old hu6 draws) is not part of the draw table and is left out like in the txt.
+    """
+    raw = df.reindex(columns=[f"n{i}" for i in range(1, rule['length'] + 1)])
+    present = raw.notna().to_numpy()
+    values = raw.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+
+    # Unparsable or fractional values count as present but are not valid numbers.
+    numeric = ~np.isnan(values) & (values == np.round(values))
+    in_range = numeric & (values >= 1) & (values <= rule['max'])
+    balls = np.sort(np.where(numeric, values, np.nan), axis=1)
+
+    problems = {
+        'lottery_id is not ' + lottery_id: (df['lottery_id'] != lottery_id).to_numpy(),
+        'missing date before the first known one': df['draw_date'].isna().to_numpy(),
+        f"not {rule['length']} numbers": present.sum(axis=1) != rule['length'],
+        'not a whole number': (present & ~numeric).any(axis=1),
+        f"number outside 1..{rule['max']}": (numeric & ~in_range).any(axis=1),
+        'repeated number': (np.diff(balls, axis=1) == 0).any(axis=1),
+        'repeated date': df['draw_date'].duplicated(keep=False).to_numpy() & df['draw_date'].notna().to_numpy(),
+    }
+
+    messages = []
+    for reason, mask in problems.items():
+        for i in np.flatnonzero(mask):
+            date = df['draw_date'].iloc[i]
+            messages.append(f"line {i + 2} ({'?' if pd.isnull(date) else date.date()}): {reason}")
+    return messages
+
+
+def to_sql(df, lottery_id, rule):
+    """
+    Return the draws as the lines of an INSERT INTO draw statement,
+    e.g. "('2025-11-01', 'hu5', ARRAY[11,20,29,42,55]),", built column-wise without a row loop.
+    """
+    numbers = [df[f"n{i}"].astype(int).astype(str) for i in range(1, rule['length'] + 1)]
+    lines = ("('" + df['draw_date'].dt.strftime('%Y-%m-%d') + f"', '{lottery_id}', ARRAY["
+             + numbers[0].str.cat(numbers[1:], sep=',') + "]),")
+    return '\n'.join(["INSERT INTO draw (draw_date, lottery_id, numbers) VALUES", *lines])
+
+
+def to_paired_sql(df_a, df_b, rule):
+    """
+    Return the paired hu7 draws as the lines of an INSERT INTO draw_hu7 statement, e.g.
+    "('2025-10-29', ARRAY[4,6,9,10,20,29,30], ARRAY[4,15,18,20,21,29,32]),", in the order of df_a.
+    Both DataFrames must hold the same dates (see unpaired_dates).
+    """
+    def arrays(df):
+        numbers = [df[f"n{i}"].astype(int).astype(str) for i in range(1, rule['length'] + 1)]
+        return "ARRAY[" + numbers[0].str.cat(numbers[1:], sep=',') + "]"
+
+    df_b = df_b.set_index('draw_date').loc[df_a['draw_date']].reset_index()
+    lines = ("('" + df_a['draw_date'].dt.strftime('%Y-%m-%d') + "', "
+             + arrays(df_a) + ", " + arrays(df_b).set_axis(df_a.index) + "),")
+    return '\n'.join(["INSERT INTO draw_hu7 (draw_date, numbers_a, numbers_b) VALUES", *lines])
+
+
+def unpaired_dates(df_a, df_b):
+    """
+    Return the dates with only one of the hu7 draws as '<lottery_id> line <n> (<date>): no <other lottery_id> draw
+    on the date' messages. Missing dates are left to validate_draws.
+    """
+    (id_a, id_b), messages = HU7_DRAWS, []
+    for draw_id, df, other_id, other in ((id_a, df_a, id_b, df_b), (id_b, df_b, id_a, df_a)):
+        dated = df['draw_date'].notna().to_numpy()
+        for i in np.flatnonzero(dated & ~df['draw_date'].isin(other['draw_date']).to_numpy()):
+            messages.append(f"{draw_id} line {i + 2} ({df['draw_date'].iloc[i].date()}): no {other_id} draw on the date")
+    return messages
+
+
+def refine_lottery(lottery_id, csv_path, rule, output_dir=SQL_DIR):
+    """
+    Refine one CSV: read it, validate it and write its draw_numbers_<lottery_id>_SQL.txt.
+    Returns (lottery_id, number of draws, problems), nothing is written if there are problems.
+    """
+    df = read_draws_frame(csv_path)
+    problems = validate_draws(df, lottery_id, rule)
+    if not problems:
+        with open(os.path.join(output_dir, f"draw_numbers_{lottery_id}_SQL.txt"), 'w') as f:
+            f.write(to_sql(df, lottery_id, rule))
+    return lottery_id, len(df), problems
+
+
+def refine_hu7(csv_paths, rules, output_dir=SQL_DIR):
+    """
+    Refine the hu7a and hu7b CSVs (csv_paths in HU7_DRAWS order): validate both against their rules,
+    check every date has both draws and write the paired draw_numbers_hu7_SQL.txt.
+    Returns ('hu7', number of dates, problems prefixed with the CSV's lottery_id), nothing is written if there are problems.
+    """
+    frames = [read_draws_frame(path) for path in csv_paths]
+    problems = [f"{draw_id} {problem}" for draw_id, df in zip(HU7_DRAWS, frames)
+                for problem in validate_draws(df, draw_id, rules[draw_id])]
+    problems += unpaired_dates(*frames)
+    if not problems:
+        with open(os.path.join(output_dir, "draw_numbers_hu7_SQL.txt"), 'w') as f:
+            f.write(to_paired_sql(*frames, rules[HU7_DRAWS[0]]))
+    return 'hu7', len(frames[0]), problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--data-dir', default=DATA_DIR, help="Directory with the Hu5, Hu6 and Hu7 CSV folders.")
+    parser.add_argument('--output-dir', default=SQL_DIR, help="Directory of the SQL compatible txt files.")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: all CPUs).")
+    args = parser.parse_args()
+
+    rules = read_lottery_rules()
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = [
+            executor.submit(refine_lottery, lottery_id, os.path.join(args.data_dir, csv_file),
+                            rules[lottery_id], args.output_dir)
+            for lottery_id, csv_file in CSV_FILES.items() if lottery_id not in HU7_DRAWS
+        ]
+        futures.append(executor.submit(refine_hu7, [os.path.join(args.data_dir, CSV_FILES[draw_id]) for draw_id in HU7_DRAWS],
+                                       rules, args.output_dir))
+        results = [future.result() for future in futures]
+
+    failed = False
+    for lottery_id, draws, problems in results:
+        if problems:
+            failed = True
+            print(f"{lottery_id}: {len(problems)} problems, no txt written")
+            for problem in problems:
+                print(f"  {problem}")
+        else:
+            print(f"{lottery_id}: {draws} draws written")
+    print(f"Refined {len(CSV_FILES)} CSVs in {time.perf_counter() - start:.3f} s.")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,300 @@
+"""
+Exhaustive search of the tickets that would have won most and least often.
+
+Every ticket of a lottery (C(90,5) = 43.9M hu5, C(45,6) = 8.1M hu6, C(35,7) = 6.7M hu7) is
+scored against the whole draw history. For every match level 0..k and for any prize ('win'),
+the top-K most and least frequent tickets are kept. Ties go to the lexicographically
+smaller ticket, so the result does not depend on the order the chunks finish in.
+
+Run from the repository root (the history is read from the data_refining CSVs):
+    python search.py hu7 [--top 10] [--workers 8] [--checkpoint search_hu7.json] [--output result.json]
+
+A run with --checkpoint saves its progress regularly and an interrupted run continues
+from the same file. A checkpoint of another history or top-K starts over.
+"""
+# --- Import necessary libraries ---
+import argparse
+import heapq
+import itertools
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from batch import PRIZE_MIN_MATCHES, TICKET_RULES
+from bitmap_index import BitSlicedIndex, pad_draws
+from engine import DRAW_RULES, group_draws, pair_hu7
+
+# 64-bit words per bit-sliced plane of a block of tickets scored at once (tickets x draws / 64).
+# The planes of a block then stay in the CPU cache, measured fastest between 2**15 and 2**17.
+BLOCK_WORDS = 2 ** 16
+
+# Seconds between two checkpoint saves.
+CHECKPOINT_INTERVAL = 30
+
+# The tier of any prize next to the match levels 0..k.
+WIN_TIER = 'win'
+
+
+def ticket_prefixes(lottery_id):
+    """
+    Return the chunks of the search: every (first, second) number pair a ticket can start with.
+    The tickets of a chunk are the pair followed by every combination of larger numbers.
+    """
+    rule = TICKET_RULES[lottery_id]
+    return [(a, b) for a, b in itertools.combinations(range(1, rule['max'] + 1), 2)
+            if rule['max'] - b >= rule['length'] - 2]
+
+
+def prefix_tickets(lottery_id, prefix):
+    """Return the (M, k) int array of the tickets of a chunk in lexicographic order."""
+    rule = TICKET_RULES[lottery_id]
+    suffixes = np.array(list(itertools.combinations(range(prefix[1] + 1, rule['max'] + 1), rule['length'] - 2)),
+                        dtype=np.int64).reshape(-1, rule['length'] - 2)
+    return np.hstack([np.tile(np.array(prefix, dtype=np.int64), (len(suffixes), 1)), suffixes])
+
+
+def top_k_indices(scores, k):
+    """Return the indices of the k highest scores, ties broken by the lower index."""
+    if len(scores) <= k:
+        return np.lexsort((np.arange(len(scores)), -scores))
+
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    threshold = scores[candidates].min()
+    greater = np.flatnonzero(scores > threshold)
+    ties = np.flatnonzero(scores == threshold)[:k - len(greater)]
+    chosen = np.concatenate([greater, ties])
+    return chosen[np.lexsort((chosen, -scores[chosen]))]
+
+
+def _push(heap, entry, k):
+    """Keep the k largest entries in a min-heap."""
+    if len(heap) < k:
+        heapq.heappush(heap, entry)
+    elif entry > heap[0]:
+        heapq.heapreplace(heap, entry)
+
+
+class TicketSearch:
+    """
+    Scores every ticket of a lottery against its draw history.
+    The history is held in BitSlicedIndex objects (two for hu7, aligned on the paired dates),
+    a block of tickets is scored at once with BitSlicedIndex.level_masks.
+    """
+
+    def __init__(self, rows, lottery_id, top_k=10):
+        """Build the indexes from (lottery_id, draw_date, numbers) rows."""
+        if lottery_id not in TICKET_RULES:
+            raise ValueError(f"Invalid lottery_id value: {lottery_id}. Must be one of {list(TICKET_RULES)}")
+        self.lottery_id = lottery_id
+        self.top_k = top_k
+        self.length = TICKET_RULES[lottery_id]['length']
+        self.tiers = list(range(self.length + 1)) + [WIN_TIER]
+
+        draws = group_draws(rows)
+        draw_ids = TICKET_RULES[lottery_id]['draws']
+        if not all(draw_id in draws for draw_id in draw_ids):
+            raise ValueError(f"The rows have no draws of '{lottery_id}'.")
+
+        if lottery_id == 'hu7':
+            pairs = pair_hu7(draws['hu7a'][0], draws['hu7b'][0])
+            dates = [draws['hu7a'][0][i] for i, _ in pairs]
+            numbers = [[draws['hu7a'][1][i] for i, _ in pairs], [draws['hu7b'][1][j] for _, j in pairs]]
+        else:
+            dates = draws[lottery_id][0]
+            numbers = [draws[lottery_id][1]]
+
+        self.n_draws = len(dates)
+        self.indexes = [BitSlicedIndex(pad_draws(draw_numbers, DRAW_RULES[draw_id]['length']),
+                                       DRAW_RULES[draw_id]['max'])
+                        for draw_id, draw_numbers in zip(draw_ids, numbers)]
+
+        # A checkpoint is only resumed on the same history.
+        self.version = f"{lottery_id}:{self.n_draws}:{max(dates) if dates else None}"
+
+    def score(self, tickets):
+        """
+        Return the (M, k + 2) int64 scores of an (M, k) ticket array:
+        the draws at every match level 0..k (a hu7 date is counted at the level of both of
+        its draws, once if they are equal) and, last, the draws with a prize.
+        """
+        masks = self.indexes[0].level_masks(tickets)
+        for index in self.indexes[1:]:
+            masks |= index.level_masks(tickets)
+
+        level_counts = np.bitwise_count(masks).sum(axis=2, dtype=np.int64)
+        won = np.bitwise_or.reduce(masks[:, PRIZE_MIN_MATCHES[self.lottery_id]:], axis=1)
+        wins = np.bitwise_count(won).sum(axis=1, dtype=np.int64)
+        return np.column_stack([level_counts, wins])
+
+    def score_prefix(self, prefix):
+        """
+        Score every ticket of a chunk and return its candidates:
+        {tier: {'most': [(count, ticket)], 'least': [(count, ticket)]}} with at most top_k of each.
+        """
+        tickets = prefix_tickets(self.lottery_id, prefix)
+        heaps = {tier: {'most': [], 'least': []} for tier in self.tiers}
+        block_size = max(1, BLOCK_WORDS * 64 // max(self.n_draws, 1))
+
+        for start in range(0, len(tickets), block_size):
+            block = tickets[start:start + block_size]
+            scores = self.score(block)
+            for column, tier in enumerate(self.tiers):
+                for direction, sign in (('most', 1), ('least', -1)):
+                    for i in top_k_indices(sign * scores[:, column], self.top_k):
+                        ticket = block[i].tolist()
+                        _push(heaps[tier][direction], self._entry(sign, int(scores[i, column]), ticket), self.top_k)
+
+        return {tier: {direction: [self._unpack(entry) for entry in heap] for direction, heap in directions.items()}
+                for tier, directions in heaps.items()}
+
+    @staticmethod
+    def _entry(sign, count, ticket):
+        """Heap entry of a candidate: higher (sign * count), then the smaller ticket is better."""
+        return sign * count, tuple(-n for n in ticket), sign
+
+    @staticmethod
+    def _unpack(entry):
+        """Return (count, ticket) of a heap entry."""
+        key, negated_ticket, sign = entry
+        return sign * key, [-n for n in negated_ticket]
+
+    def _new_state(self):
+        """Return the state of a search that has not started."""
+        return {
+            'lottery_id': self.lottery_id,
+            'top_k': self.top_k,
+            'version': self.version,
+            'done': [],
+            'candidates': {str(tier): {'most': [], 'least': []} for tier in self.tiers}
+        }
+
+    def _load_state(self, checkpoint):
+        """Return the saved state of checkpoint if it belongs to this search, else a new state."""
+        if checkpoint and os.path.exists(checkpoint):
+            with open(checkpoint) as f:
+                state = json.load(f)
+            if (state.get('lottery_id'), state.get('top_k'), state.get('version')) == \
+                    (self.lottery_id, self.top_k, self.version):
+                return state
+            print(f"Checkpoint {checkpoint} belongs to another search, starting over.")
+        return self._new_state()
+
+    @staticmethod
+    def _save_state(checkpoint, state):
+        """Write the state atomically, an interrupted write keeps the previous checkpoint."""
+        temporary = checkpoint + '.tmp'
+        with open(temporary, 'w') as f:
+            json.dump(state, f)
+        os.replace(temporary, checkpoint)
+
+    def _merge(self, state, candidates):
+        """Merge the candidates of a chunk into the state, keeping the top_k of each tier."""
+        for tier in self.tiers:
+            for direction, sign in (('most', 1), ('least', -1)):
+                heap = [self._entry(sign, count, ticket)
+                        for count, ticket in state['candidates'][str(tier)][direction]]
+                heapq.heapify(heap)
+                for count, ticket in candidates[tier][direction]:
+                    _push(heap, self._entry(sign, count, ticket), self.top_k)
+                state['candidates'][str(tier)][direction] = [self._unpack(entry) for entry in heap]
+
+    def run(self, workers=None, checkpoint=None, prefixes=None):
+        """
+        Score every chunk (or only `prefixes`) across a pool of `workers` processes
+        (all CPUs by default, 1 runs in this process) and return
+        {tier: {'most': [(ticket, count)], 'least': [(ticket, count)]}}, best first.
+        """
+        state = self._load_state(checkpoint)
+        done = {tuple(prefix) for prefix in state['done']}
+        todo = [prefix for prefix in (prefixes or ticket_prefixes(self.lottery_id)) if prefix not in done]
+        print(f"{self.lottery_id}: {len(todo)} of {len(done) + len(todo)} chunks to score"
+              f" against {self.n_draws} draws.")
+
+        start = last_save = time.perf_counter()
+        scored = 0
+
+        def finish(prefix, candidates):
+            nonlocal last_save, scored
+            self._merge(state, candidates)
+            state['done'].append(list(prefix))
+            scored += math.comb(TICKET_RULES[self.lottery_id]['max'] - prefix[1], self.length - 2)
+            if checkpoint and time.perf_counter() - last_save > CHECKPOINT_INTERVAL:
+                self._save_state(checkpoint, state)
+                last_save = time.perf_counter()
+                elapsed = last_save - start
+                print(f"{len(state['done'])} chunks done, {scored:,} tickets in {elapsed:.0f} s"
+                      f" ({scored / elapsed:,.0f} tickets/s)")
+
+        if workers == 1:
+            for prefix in todo:
+                finish(prefix, self.score_prefix(prefix))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,)) as executor:
+                futures = {executor.submit(_score_prefix, prefix): prefix for prefix in todo}
+                for future in as_completed(futures):
+                    finish(futures[future], future.result())
+
+        if checkpoint:
+            self._save_state(checkpoint, state)
+        elapsed = time.perf_counter() - start
+        print(f"Scored {scored:,} tickets in {elapsed:.1f} s.")
+        return self.results(state)
+
+    def results(self, state):
+        """Return the sorted {tier: {'most': [(ticket, count)], 'least': [(ticket, count)]}} of a state."""
+        results = {}
+        for tier in self.tiers:
+            results[tier] = {}
+            for direction, sign in (('most', 1), ('least', -1)):
+                entries = sorted((self._entry(sign, count, ticket)
+                                  for count, ticket in state['candidates'][str(tier)][direction]), reverse=True)
+                results[tier][direction] = [(ticket, count) for count, ticket in map(self._unpack, entries)]
+        return results
+
+
+# The search of a worker process, set once by the pool's initializer.
+_worker_search = None
+
+
+def _init_worker(search):
+    """Keep the search (with its indexes) in the worker, so only prefixes are sent per task."""
+    global _worker_search
+    _worker_search = search
+
+
+def _score_prefix(prefix):
+    """Score a chunk in a worker process."""
+    return _worker_search.score_prefix(prefix)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('lottery_id', choices=list(TICKET_RULES))
+    parser.add_argument('--top', type=int, default=10, help="Tickets kept per tier and direction.")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: all CPUs).")
+    parser.add_argument('--checkpoint', help="JSON file to save progress to and resume from.")
+    parser.add_argument('--output', help="JSON file of the results.")
+    args = parser.parse_args()
+
+    from storage import EmbeddedStorage
+
+    search = TicketSearch(EmbeddedStorage.from_csv().draws(), args.lottery_id, args.top)
+    results = search.run(args.workers, args.checkpoint)
+
+    for tier, directions in results.items():
+        name = "any prize" if tier == WIN_TIER else f"{tier} matches"
+        for direction in ('most', 'least'):
+            best = ', '.join(f"{ticket} {count}x" for ticket, count in directions[direction][:3])
+            print(f"{name:<11} {direction:<5} {best}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({str(tier): directions for tier, directions in results.items()}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,308 @@
+"""
+Memory-mapped binary snapshot of the draw history, for cold starts without a database query.
+
+Write it from the data_refining CSVs, or from the database with DATABASE_URL set:
+    python snapshot.py [--output draws.snapshot] [--from-db]
+and run the app with LOTTERY_STORAGE=snapshot (LOTTERY_SNAPSHOT=<path> if it is elsewhere).
+
+File layout (little-endian, every section 64-byte aligned):
+    header          magic, format version, number of lotteries, data version (latest draw ordinal), total draws
+    lottery table   per lottery_id: name, number of draws, offset of its dates, offset of its masks
+    dates           int32 date ordinals of a lottery_id, newest draw first
+    masks           (n_draws, 2) uint64 number masks, bit (n - 1) of the 128-bit pair is set for ball n
+The arrays are opened with numpy.memmap and used in place, so every app process on the host
+shares the page cache copy of the file instead of building its own history.
+"""
+# --- Import necessary libraries ---
+import argparse
+import datetime
+import os
+import time
+
+import numpy as np
+
+from bitmap_index import pad_draws
+from engine import DRAW_RULES, group_draws
+from storage import CSV_FILES, DATA_DIR, DRAWS_QUERY, Storage, read_draws_csv
+
+MAGIC = b'LOTTOSNP'
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+MASK_WORDS = 2  # 90 balls of hu5 need two 64-bit words
+
+SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'draws.snapshot')
+
+HEADER_DTYPE = np.dtype([
+    ('magic', 'S8'),
+    ('format_version', '<u4'),
+    ('n_lotteries', '<u4'),
+    ('data_version', '<i4'),
+    ('total_draws', '<u4'),
+])
+
+LOTTERY_DTYPE = np.dtype([
+    ('lottery_id', 'S8'),
+    ('n_draws', '<u8'),
+    ('dates_offset', '<u8'),
+    ('masks_offset', '<u8'),
+])
+
+
+def _aligned(offset):
+    """Round an offset up to the next section boundary."""
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def numbers_to_words(draws):
+    """
+    Pack an (n_draws, k) int array of ball numbers, padded with 0, into (n_draws, 2) uint64 masks.
+    """
+    draws = np.asarray(draws, dtype=np.int64)
+    masks = np.zeros((len(draws), MASK_WORDS), dtype=np.uint64)
+    rows, columns = np.nonzero(draws)
+    balls = draws[rows, columns] - 1
+    np.bitwise_or.at(masks, (rows, balls // 64), np.left_shift(np.uint64(1), (balls % 64).astype(np.uint64)))
+    return masks
+
+
+def words_to_numbers(masks):
+    """Unpack (n, 2) uint64 masks into a list of sorted ball number lists."""
+    bits = np.unpackbits(np.ascontiguousarray(masks, dtype='<u8').view(np.uint8), axis=1, bitorder='little')
+    return [(np.flatnonzero(row) + 1).tolist() for row in bits]
+
+
+def write_snapshot(path, rows):
+    """
+    Write (lottery_id, draw_date, numbers) rows as a snapshot file.
+    The file is written next to `path` and moved over it, so processes that have the old
+    snapshot mapped keep reading a complete file.
+    """
+    grouped = group_draws(rows)
+    lotteries = np.zeros(len(grouped), dtype=LOTTERY_DTYPE)
+    sections = []
+
+    offset = _aligned(HEADER_DTYPE.itemsize + LOTTERY_DTYPE.itemsize * len(grouped))
+    for entry, (lottery_id, (dates, numbers)) in zip(lotteries, sorted(grouped.items())):
+        ordinals = np.array([d.toordinal() for d in dates], dtype='<i4')
+        masks = numbers_to_words(pad_draws(numbers, DRAW_RULES[lottery_id]['length'])).astype('<u8')
+
+        entry['lottery_id'] = lottery_id.encode('ascii')
+        entry['n_draws'] = len(dates)
+        entry['dates_offset'] = offset
+        offset = _aligned(offset + ordinals.nbytes)
+        entry['masks_offset'] = offset
+        offset = _aligned(offset + masks.nbytes)
+        sections += [(entry['dates_offset'], ordinals), (entry['masks_offset'], masks)]
+
+    header = np.zeros(1, dtype=HEADER_DTYPE)
+    header['magic'] = MAGIC
+    header['format_version'] = FORMAT_VERSION
+    header['n_lotteries'] = len(grouped)
+    header['data_version'] = max((dates[0].toordinal() for dates, _ in grouped.values()), default=0)
+    header['total_draws'] = int(lotteries['n_draws'].sum())
+
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, 'wb') as f:
+        f.write(header.tobytes())
+        f.write(lotteries.tobytes())
+        for section_offset, array in sections:
+            f.seek(int(section_offset))
+            f.write(array.tobytes())
+        f.truncate(offset)
+    os.replace(temporary_path, path)
+
+
+class SnapshotStorage(Storage):
+    """
+    Storage answering from a memory-mapped snapshot file.
+    Match counts are AND + popcount over the mapped masks, only the returned rows are decoded.
+    """
+
+    def __init__(self, path=SNAPSHOT_PATH):
+        """Map a snapshot file, ValueError if it is not a snapshot of this format version."""
+        self._buffer = np.memmap(path, dtype=np.uint8, mode='r')
+        header = self._buffer[:HEADER_DTYPE.itemsize].view(HEADER_DTYPE)[0]
+        if header['magic'] != MAGIC or header['format_version'] != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} draw snapshot")
+        self.data_version = int(header['data_version'])
+
+        table_end = HEADER_DTYPE.itemsize + LOTTERY_DTYPE.itemsize * int(header['n_lotteries'])
+        # Per lottery_id: (date ordinals, masks), views of the mapped file.
+        self._draws = {}
+        for entry in self._buffer[HEADER_DTYPE.itemsize:table_end].view(LOTTERY_DTYPE):
+            n_draws, dates_offset, masks_offset = (int(entry[name]) for name in ('n_draws', 'dates_offset', 'masks_offset'))
+            self._draws[entry['lottery_id'].decode('ascii')] = (
+                self._buffer[dates_offset:dates_offset + 4 * n_draws].view('<i4'),
+                self._buffer[masks_offset:masks_offset + 8 * MASK_WORDS * n_draws].view('<u8').reshape(n_draws, MASK_WORDS),
+            )
+
+        # Pair the hu7 draws once, like the SQL join on draw_date (the dates are unique and descending).
+        dates_a = self._draws.get('hu7a', (np.empty(0, dtype='<i4'),))[0]
+        dates_b = self._draws.get('hu7b', (np.empty(0, dtype='<i4'),))[0]
+        _, pairs_a, pairs_b = np.intersect1d(dates_a, dates_b, assume_unique=True, return_indices=True)
+        order = np.argsort(pairs_a)
+        self._hu7_pairs = (pairs_a[order], pairs_b[order])
+
+    @classmethod
+    def from_csv(cls, path=SNAPSHOT_PATH, data_dir=DATA_DIR):
+        """Write a snapshot of the data_refining CSVs to `path` and open it."""
+        rows = []
+        for lottery_id, csv_file in CSV_FILES.items():
+            rows.extend(read_draws_csv(os.path.join(data_dir, csv_file), lottery_id))
+        write_snapshot(path, rows)
+        return cls(path)
+
+    def total_draws(self, lottery_id):
+        """Return the number of draws of a lottery_id in the snapshot."""
+        return len(self._draws[lottery_id][0]) if lottery_id in self._draws else 0
+
+    def latest_draw_date(self):
+        """Return the date of the newest draw, stored in the header as the data version."""
+        return datetime.date.fromordinal(self.data_version) if self.data_version else None
+
+    def match_counts(self, lottery_id, numbers):
+        """Return the match count of the ticket against every draw, newest draw first."""
+        if lottery_id not in self._draws:
+            return np.zeros(0, dtype=np.uint8)
+        ticket = numbers_to_words([list(numbers)])[0]
+        return np.bitwise_count(self._draws[lottery_id][1] & ticket).sum(axis=1, dtype=np.uint8)
+
+    def match_series(self, lottery_id, numbers):
+        """
+        Return (ordinals, counts) of every draw of a lottery, newest first: the date ordinals
+        and one match count array per draw (two for hu7, paired on the date).
+        """
+        if lottery_id == 'hu7':
+            if not self.total_draws('hu7a') or not self.total_draws('hu7b'):
+                return np.zeros(0, dtype='<i4'), [np.zeros(0, dtype=np.uint8)] * 2
+            return (self._draws['hu7a'][0][self._hu7_pairs[0]],
+                    [self.match_counts('hu7a', numbers)[self._hu7_pairs[0]],
+                     self.match_counts('hu7b', numbers)[self._hu7_pairs[1]]])
+
+        if lottery_id not in self._draws:
+            return np.zeros(0, dtype='<i4'), [np.zeros(0, dtype=np.uint8)]
+        return self._draws[lottery_id][0], [self.match_counts(lottery_id, numbers)]
+
+    def _row(self, lottery_id, i):
+        """Return the (date, numbers) of the i-th newest draw of a lottery_id."""
+        dates, masks = self._draws[lottery_id]
+        return (datetime.date.fromordinal(int(dates[i])).strftime("%Y-%m-%d"),
+                words_to_numbers(masks[i:i + 1])[0])
+
+    def _hu7_row(self, pair, counts_a, counts_b):
+        """Format a (Date, Numbers A, Match A, Numbers B, Match B) hu7 row of a pair index."""
+        i, j = self._hu7_pairs[0][pair], self._hu7_pairs[1][pair]
+        date, numbers_a = self._row('hu7a', i)
+        return date, numbers_a, int(counts_a[i]), self._row('hu7b', j)[1], int(counts_b[j])
+
+    def _older(self, lottery_id, indices, before):
+        """Return which draw indices of a lottery_id are older than the `before` date (all for None)."""
+        if before is None:
+            return np.ones(len(indices), dtype=bool)
+        return self._draws[lottery_id][0][indices] < before.toordinal()
+
+    def check(self, lottery_id, numbers, match_count, limit=20, before=None):
+        """
+        Same contract as WinningNumbers.check_lottery_numbers:
+        returns (formatted_results, total_draws, winning_draws) for already validated input.
+        With a `before` date the results start at the first matching draw older than it.
+        """
+        # --- Logic for 'hu7' (which has two sets of numbers) ---
+        if lottery_id == 'hu7':
+            if not self.total_draws('hu7a') or not self.total_draws('hu7b'):
+                return [], 0, 0
+
+            counts_a = self.match_counts('hu7a', numbers)
+            counts_b = self.match_counts('hu7b', numbers)
+            hits = np.flatnonzero((counts_a[self._hu7_pairs[0]] == match_count)
+                                  | (counts_b[self._hu7_pairs[1]] == match_count))
+            page = hits[self._older('hu7a', self._hu7_pairs[0][hits], before)]
+            formatted_results = [self._hu7_row(pair, counts_a, counts_b) for pair in page[:limit]]
+            return formatted_results, self.total_draws('hu7a'), len(hits)
+
+        # --- Logic for 'hu5' or 'hu6' (which have one set of numbers) ---
+        if not self.total_draws(lottery_id):
+            return [], 0, 0
+
+        counts = self.match_counts(lottery_id, numbers)
+        hits = np.flatnonzero(counts == match_count)
+        page = hits[self._older(lottery_id, hits, before)]
+        formatted_results = [(*self._row(lottery_id, i), int(counts[i])) for i in page[:limit]]
+        return formatted_results, self.total_draws(lottery_id), len(hits)
+
+    def histogram(self, lottery_id, numbers, limit=20):
+        """
+        Count the draws at every match level 0..k and keep the latest rows of each level.
+        Returns ({match_count: (winning_draws, formatted_results)}, total_draws) for already validated input.
+        A hu7 date is counted at the level of both its draws (once if they are equal).
+        """
+        levels = range(len(numbers) + 1)
+
+        # --- Logic for 'hu7' (which has two sets of numbers) ---
+        if lottery_id == 'hu7':
+            if not self.total_draws('hu7a') or not self.total_draws('hu7b'):
+                return {level: (0, []) for level in levels}, 0
+
+            counts_a = self.match_counts('hu7a', numbers)
+            counts_b = self.match_counts('hu7b', numbers)
+            pair_a, pair_b = counts_a[self._hu7_pairs[0]], counts_b[self._hu7_pairs[1]]
+            histogram = {}
+            for level in levels:
+                hits = np.flatnonzero((pair_a == level) | (pair_b == level))
+                histogram[level] = (len(hits), [self._hu7_row(pair, counts_a, counts_b) for pair in hits[:limit]])
+            return histogram, self.total_draws('hu7a')
+
+        # --- Logic for 'hu5' or 'hu6' (which have one set of numbers) ---
+        if not self.total_draws(lottery_id):
+            return {level: (0, []) for level in levels}, 0
+
+        counts = self.match_counts(lottery_id, numbers)
+        histogram = {}
+        for level in levels:
+            hits = np.flatnonzero(counts == level)
+            histogram[level] = (len(hits), [(*self._row(lottery_id, i), level) for i in hits[:limit]])
+        return histogram, self.total_draws(lottery_id)
+
+    def draws(self):
+        """Return every (lottery_id, draw_date, numbers) row of the snapshot."""
+        return [
+            (lottery_id, datetime.date.fromordinal(int(ordinal)), numbers)
+            for lottery_id, (dates, masks) in self._draws.items()
+            for ordinal, numbers in zip(dates, words_to_numbers(masks))
+        ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', default=SNAPSHOT_PATH, help="Snapshot file to write.")
+    parser.add_argument('--data-dir', default=DATA_DIR, help="Directory with the Hu5, Hu6 and Hu7 CSV folders.")
+    parser.add_argument('--from-db', action='store_true', help="Read the draw tables of DATABASE_URL instead of the CSVs.")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.from_db:
+        database_url = os.environ.get('DATABASE_URL')
+        if not database_url:
+            parser.error("DATABASE_URL is not set.")
+
+        import sqlalchemy
+
+        connection = sqlalchemy.create_engine(database_url).raw_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(DRAWS_QUERY)
+                rows = cursor.fetchall()
+        finally:
+            connection.close()
+        write_snapshot(args.output, rows)
+    else:
+        SnapshotStorage.from_csv(args.output, args.data_dir)
+
+    storage = SnapshotStorage(args.output)
+    print(f"Wrote {sum(storage.total_draws(lottery_id) for lottery_id in DRAW_RULES)} draws "
+          f"up to {storage.latest_draw_date()} to {args.output} "
+          f"({os.path.getsize(args.output):,} bytes) in {time.perf_counter() - start:.3f} s.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+# --- Import necessary libraries ---
+import datetime
+import functools
+import itertools
+import threading
+
+import numpy as np
+
+from bitmap_index import pad_draws
+from engine import DRAW_RULES, group_draws
+
+# Entry sizes kept in the tables: single numbers, pairs and triples.
+SIZES = (1, 2, 3)
+
+
+@functools.lru_cache(maxsize=None)
+def combinations_array(max_number, size):
+    """Return every size-combination of 1..max_number as an (n, size) int array, in lexicographic order."""
+    return np.array(list(itertools.combinations(range(1, max_number + 1), size)), dtype=np.int64)
+
+
+class CoOccurrenceStats:
+    """
+    Frequency tables of every number, pair and triple per lottery_id (hu5, hu6, hu7a, hu7b),
+    with the date each entry was last drawn.
+    Built once from the draw history and updated with the newly ingested draws (add_new_draws),
+    every lookup is answered from memory.
+    The tables are dense arrays indexed by the ball numbers: counts[a], counts[a, b], counts[a, b, c]
+    with a < b < c (index 0 collects the padding of short draws and is never reported).
+    """
+
+    def __init__(self, rows=()):
+        """Build the tables from (lottery_id, draw_date, numbers) rows."""
+        # Per lottery_id and size: (counts, last seen date ordinal, 0 if never drawn).
+        self._tables = {}
+        self._total_draws = {}
+        self._latest_ordinals = {}  # lottery_id: ordinal of its newest draw
+        self._lock = threading.Lock()  # Streamlit runs every session in its own thread
+        self._update_lock = threading.Lock()  # One add_new_draws at a time, so no draw is added twice
+        self.add_rows(rows)
+
+    def add_rows(self, rows):
+        """
+        Add draws to the tables, e.g. the whole history or each newly ingested draw.
+        The counts are summed and the last seen dates kept at their maximum, so the order does not matter.
+        """
+        for lottery_id, (dates, numbers) in group_draws(rows).items():
+            rule = DRAW_RULES[lottery_id]
+            draws = np.sort(pad_draws(numbers, rule['length']), axis=1)
+            ordinals = np.array([d.toordinal() for d in dates], dtype=np.int32)
+
+            with self._lock:
+                if lottery_id not in self._tables:
+                    self._tables[lottery_id] = {
+                        size: (np.zeros((rule['max'] + 1,) * size, dtype=np.int32),
+                               np.zeros((rule['max'] + 1,) * size, dtype=np.int32))
+                        for size in SIZES
+                    }
+                    self._total_draws[lottery_id] = 0
+
+                for size in SIZES:
+                    counts, last_seen = self._tables[lottery_id][size]
+                    for columns in itertools.combinations(range(rule['length']), size):
+                        entries = tuple(draws[:, columns].T)
+                        np.add.at(counts, entries, 1)
+                        np.maximum.at(last_seen, entries, ordinals)
+
+                self._total_draws[lottery_id] += len(dates)
+                self._latest_ordinals[lottery_id] = max(self._latest_ordinals.get(lottery_id, 0),
+                                                        int(ordinals.max(initial=0)))
+
+    def add_new_draws(self, rows):
+        """
+        Add the rows newer than the latest draw of their lottery_id, e.g. the whole history after an
+        ingest, so only the new draws are counted. Returns the number of draws added.
+        """
+        with self._update_lock:
+            new_rows = [row for row in rows if row[1].toordinal() > self._latest_ordinals.get(row[0], 0)]
+            self.add_rows(new_rows)
+            return len(new_rows)
+
+    def total_draws(self, lottery_id):
+        """Return the number of draws of a lottery_id in the tables."""
+        return self._total_draws.get(lottery_id, 0)
+
+    def latest_draw_date(self):
+        """Return the date of the newest draw added, or None."""
+        latest_ordinal = max(self._latest_ordinals.values(), default=0)
+        return datetime.date.fromordinal(latest_ordinal) if latest_ordinal else None
+
+    @staticmethod
+    def _format(entry, count, ordinal):
+        """Return an (entry, count, last seen date or None) result row."""
+        return tuple(int(n) for n in entry), int(count), datetime.date.fromordinal(int(ordinal)) if ordinal else None
+
+    def ticket(self, lottery_id, numbers, size=1):
+        """
+        Return the (entry, count, last_seen) rows of every size-combination of the ticket's numbers,
+        e.g. the pairs of a hu5 ticket, in ticket order. Numbers outside the lottery are left out.
+        """
+        if lottery_id not in self._tables:
+            return []
+
+        max_number = DRAW_RULES[lottery_id]['max']
+        numbers = sorted(int(n) for n in numbers if 1 <= int(n) <= max_number)
+        with self._lock:
+            counts, last_seen = self._tables[lottery_id][size]
+            return [self._format(entry, counts[entry], last_seen[entry])
+                    for entry in itertools.combinations(numbers, size)]
+
+    def top(self, lottery_id, size=1, n=10, cold=False):
+        """
+        Return the (entry, count, last_seen) rows of the n most frequent entries of a size,
+        or with cold=True the n least frequent ones, the longest unseen first on equal counts.
+        Ties are broken by the smaller numbers.
+        """
+        if lottery_id not in self._tables:
+            return []
+
+        entries = combinations_array(DRAW_RULES[lottery_id]['max'], size)
+        with self._lock:
+            counts, last_seen = self._tables[lottery_id][size]
+            entry_counts = counts[tuple(entries.T)]
+            entry_last_seen = last_seen[tuple(entries.T)]
+
+        # np.lexsort sorts by the last key first and keeps the (lexicographic) entry order on ties.
+        if cold:
+            order = np.lexsort((entry_last_seen, entry_counts))[:n]
+        else:
+            order = np.lexsort((-entry_counts,))[:n]
+        return [self._format(entries[i], entry_counts[i], entry_last_seen[i]) for i in order]
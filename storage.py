@@ -0,0 +1,439 @@
+# --- Import necessary libraries ---
+# pandas is imported by the functions that need it, so an EmbeddedStorage built from rows
+# loads without it (see core.py).
+import os
+
+from engine import BitmaskEngine, DRAW_RULES, numbers_to_bit_string
+from metrics import NullMetrics
+from planner import CONTAINMENT, EQUALITY, choose_strategy, ticket_subsets
+
+# The refined CSV of every lottery_id, relative to data_refining/. hu7a and hu7b are stored
+# paired on the date in the draw_hu7 table, hu5 and hu6 in the draw table.
+CSV_FILES = {
+    'hu5': os.path.join('Hu5', 'draw_numbers_hu5.csv'),
+    'hu6': os.path.join('Hu6', 'draw_numbers_hu6.csv'),
+    'hu7a': os.path.join('Hu7', 'draw_numbers_hu7a.csv'),
+    'hu7b': os.path.join('Hu7', 'draw_numbers_hu7b.csv')
+}
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data_refining')
+
+# The newest date of both draw tables (GREATEST skips a NULL MAX of an empty table).
+LATEST_DRAW_DATE_QUERY = "SELECT GREATEST((SELECT MAX(draw_date) FROM draw), (SELECT MAX(draw_date) FROM draw_hu7));"
+
+# Every draw as a (lottery_id, draw_date, numbers) row, a draw_hu7 row gives a hu7a and a hu7b row.
+DRAWS_QUERY = """
+SELECT lottery_id, draw_date, numbers FROM draw
+UNION ALL
+SELECT 'hu7a', draw_date, numbers_a FROM draw_hu7
+UNION ALL
+SELECT 'hu7b', draw_date, numbers_b FROM draw_hu7;
+"""
+
+
+class Storage:
+    """
+    Interface of the draw storages behind WinningNumbers.
+    Every method receives already validated input.
+    """
+
+    def check(self, lottery_id, numbers, match_count, limit=20, before=None):
+        """
+        Return (formatted_results, total_draws, winning_draws) of the latest `limit` matching draws.
+        With a `before` date (the date of the last row of the previous page) only older draws are
+        returned, the counts always cover the whole history.
+        """
+        raise NotImplementedError
+
+    def histogram(self, lottery_id, numbers, limit=20):
+        """Return ({match_count: (winning_draws, formatted_results)}, total_draws) for every match level 0..k."""
+        raise NotImplementedError
+
+    def latest_draw_date(self):
+        """Return the date of the newest draw, the data version results are cached against."""
+        raise NotImplementedError
+
+    def match_series(self, lottery_id, numbers):
+        """
+        Return (ordinals, counts) of every draw of a lottery, newest first: the draw date ordinals
+        (date.toordinal()) and one list of match counts per draw (two for hu7, paired on the date).
+        """
+        raise NotImplementedError
+
+
+class PostgresStorage(Storage):
+    """Answers every request with a query on the PostgreSQL draw (hu5, hu6) or draw_hu7 table."""
+
+    def __init__(self, connect, metrics=None):
+        """
+        Initialize with a function returning a connection that has a query(sql, params=..., ttl=...)
+        method returning a DataFrame, e.g. lambda: st.connection("postgresql", type="sql").
+        The connection is only opened on the first query, so connection errors are handled there.
+        Optional Metrics (see metrics.py) record the query, conversion and formatting durations and the errors.
+        """
+        self._connect = connect
+        self._metrics = metrics or NullMetrics()
+
+    def _run_db_query(self, query, params, lottery_id=None):
+        """Helper method to execute a single query, returns a list of tuples."""
+        try:
+            with self._metrics.time('query', lottery_id):
+                df_rows = self._connect().query(query, params=params, ttl="1m")
+            with self._metrics.time('conversion', lottery_id):
+                return list(df_rows.itertuples(index=False, name=None))
+
+        except Exception as e:
+            # Handle any query or connection errors
+            print(f"Database query error: {e}")
+            self._metrics.error('query', lottery_id)
+            return []
+
+    @staticmethod
+    def _split_totals(rows):
+        """
+        Split the rows of a match query into (draw rows, total_draws, winning_draws).
+        Every row ends with (winning_count, total_count), rows without a draw_date only carry the counts.
+        """
+        import pandas as pd
+
+        if not rows:
+            return [], 0, 0  # Query error
+
+        winning_draws, total_draws = int(rows[0][-2]), int(rows[0][-1])
+        results = [row[:-2] for row in rows if not pd.isnull(row[0])]
+        return results, total_draws, winning_draws
+
+    @staticmethod
+    def _plan_check(lottery_id, numbers, match_count, count_query):
+        """
+        Return the (candidates, total_count, params) SQL fragments of a check, chosen by
+        planner.choose_strategy for the (lottery_id, match_count):
+        - scan: every draw is scored, the total is their COUNT(*),
+        - containment: only the draws containing a match_count-subset of the ticket (GIN index on the numbers),
+        - equality: only the draws equal to the ticket (B-tree index on the mask).
+        The index plans score the candidates only, so the total comes from count_query.
+        """
+        strategy = choose_strategy(lottery_id, match_count)
+        columns = [('mask_a', 'numbers_a'), ('mask_b', 'numbers_b')] if lottery_id == 'hu7' else [('mask', 'numbers')]
+
+        if strategy == EQUALITY:
+            return ' OR '.join(f"{mask} = CAST(:mask AS BIT(90))" for mask, _ in columns), count_query, {}
+        if strategy == CONTAINMENT:
+            subsets = ticket_subsets(numbers, match_count)
+            candidates = ' OR '.join(f"{column} @> CAST(:subset_{i} AS INT[])"
+                                     for _, column in columns for i in range(len(subsets)))
+            return candidates, count_query, {f"subset_{i}": subset for i, subset in enumerate(subsets)}
+        return 'TRUE', 'COUNT(*)', {}
+
+    def latest_draw_date(self):
+        """Return the date of the newest draw, checked at most hourly as new draws arrive weekly."""
+        try:
+            df_latest = self._connect().query(LATEST_DRAW_DATE_QUERY, ttl="1h")
+            return df_latest.iloc[0, 0]
+
+        except Exception as e:
+            print(f"Database query error: {e}")
+            return None
+
+    def match_series(self, lottery_id, numbers):
+        """
+        Return (ordinals, counts) of every draw of a lottery, newest first, with one query
+        (the date ordinal is computed by PostgreSQL, DATE '0001-01-01' is ordinal 1).
+        """
+        ticket_mask = numbers_to_bit_string(numbers)
+
+        if lottery_id == 'hu7':
+            query_series = """
+            SELECT draw_date - DATE '0001-01-01' + 1 AS ordinal,
+                   bit_count(mask_a & CAST(:mask AS BIT(90))) AS match_count_a,
+                   bit_count(mask_b & CAST(:mask AS BIT(90))) AS match_count_b
+            FROM draw_hu7
+            ORDER BY draw_date DESC;
+            """
+        else:
+            query_series = """
+            SELECT draw_date - DATE '0001-01-01' + 1 AS ordinal,
+                   bit_count(mask & CAST(:mask AS BIT(90))) AS match_count
+            FROM draw
+            WHERE lottery_id = :id
+            ORDER BY draw_date DESC;
+            """
+
+        rows = self._run_db_query(query_series, {"mask": ticket_mask, "id": lottery_id}, lottery_id)
+        n_draws = 2 if lottery_id == 'hu7' else 1
+        return [int(row[0]) for row in rows], [[int(row[1 + d]) for row in rows] for d in range(n_draws)]
+
+    def draws(self):
+        """
+        Return every (lottery_id, draw_date, numbers) row, the paired hu7 draws as separate hu7a and hu7b rows,
+        or [] if the database is not reachable.
+        """
+        try:
+            df_draws = self._connect().query(DRAWS_QUERY, ttl=0)
+            return list(df_draws.itertuples(index=False, name=None))
+
+        except Exception as e:
+            print(f"Database query error: {e}")
+            self._metrics.error('query', None)
+            return []
+
+    def check(self, lottery_id, numbers, match_count, limit=20, before=None):
+        """
+        Defines the queries for already validated input, runs them, and formats the output.
+        Returns (formatted_results, total_draws, winning_draws).
+        The page starts after the `before` date (keyset pagination on draw_date, no OFFSET).
+        """
+
+        # Initialize variables
+        formatted_results = []
+        total_draws = 0
+        winning_draws = 0
+
+        # The ticket as a bit string, matched against the precomputed draw.mask column.
+        ticket_mask = numbers_to_bit_string(numbers)
+
+        # Every query returns the latest matching draws together with the winning and the total
+        # draw count in one round trip. LEFT JOIN keeps a single row of counts with NULL
+        # draw columns when nothing matches.
+
+        # --- Logic for 'hu7' (which has two sets of numbers) ---
+        if lottery_id == 'hu7':
+            query_matches = """
+            WITH scored AS (
+                SELECT draw_date,
+                       numbers_a, bit_count(mask_a & CAST(:mask AS BIT(90))) AS match_count_a,
+                       numbers_b, bit_count(mask_b & CAST(:mask AS BIT(90))) AS match_count_b
+                FROM draw_hu7
+                WHERE {candidates}
+            ),
+            totals AS (
+                SELECT
+                    COUNT(*) FILTER (
+                        WHERE match_count_a = :match_count OR match_count_b = :match_count
+                    ) AS winning_count,
+                    {total_count} AS total_count
+                FROM scored
+            ),
+            hits AS (
+                SELECT *
+                FROM scored
+                WHERE
+                    (match_count_a = :match_count OR
+                     match_count_b = :match_count) AND
+                    (CAST(:before AS DATE) IS NULL OR draw_date < CAST(:before AS DATE))
+                ORDER BY draw_date DESC
+                LIMIT :limit
+            )
+            SELECT
+                hits.draw_date, hits.numbers_a, hits.match_count_a, hits.numbers_b, hits.match_count_b,
+                totals.winning_count, totals.total_count
+            FROM totals
+            LEFT JOIN hits ON TRUE
+            ORDER BY hits.draw_date DESC;
+            """
+
+            candidates, total_count, candidate_params = self._plan_check(
+                lottery_id, numbers, match_count, "(SELECT COUNT(*) FROM draw_hu7)")
+            query_matches = query_matches.format(candidates=candidates, total_count=total_count)
+            match_params = {"mask": ticket_mask, "match_count": match_count, "limit": limit, "before": before,
+                            **candidate_params}
+
+            # Get raw data from DB using the helper method
+            raw_results, total_draws, winning_draws = self._split_totals(
+                self._run_db_query(query_matches, match_params, lottery_id)
+            )
+
+            # --- Format results for hu7 (Date, Match A, Match B) ---
+            with self._metrics.time('formatting', lottery_id):
+                formatted_results = [(row[0].strftime("%Y-%m-%d"), row[1], row[2], row[3], row[4]) for row in
+                                     raw_results]
+
+        # --- Logic for 'hu5' or 'hu6' (which have one set of numbers) ---
+        elif lottery_id == 'hu5' or lottery_id == 'hu6':
+            query_matches = """
+            WITH scored AS (
+                SELECT draw_date, numbers,
+                       bit_count(mask & CAST(:mask AS BIT(90))) AS match_count
+                FROM draw
+                WHERE lottery_id = :id AND ({candidates})
+            ),
+            totals AS (
+                SELECT
+                    COUNT(*) FILTER (WHERE match_count = :match_count) AS winning_count,
+                    {total_count} AS total_count
+                FROM scored
+            ),
+            hits AS (
+                SELECT *
+                FROM scored
+                WHERE match_count = :match_count AND
+                      (CAST(:before AS DATE) IS NULL OR draw_date < CAST(:before AS DATE))
+                ORDER BY draw_date DESC
+                LIMIT :limit
+            )
+            SELECT hits.draw_date, hits.numbers, hits.match_count, totals.winning_count, totals.total_count
+            FROM totals
+            LEFT JOIN hits ON TRUE
+            ORDER BY hits.draw_date DESC;
+            """
+
+            candidates, total_count, candidate_params = self._plan_check(
+                lottery_id, numbers, match_count, "(SELECT COUNT(*) FROM draw WHERE lottery_id = :id)")
+            query_matches = query_matches.format(candidates=candidates, total_count=total_count)
+            match_params = {"mask": ticket_mask, "id": lottery_id, 'match_count': match_count, "limit": limit,
+                            "before": before, **candidate_params}
+
+            # Get raw data from DB using the helper method
+            raw_results, total_draws, winning_draws = self._split_totals(
+                self._run_db_query(query_matches, match_params, lottery_id)
+            )
+
+            # --- Format results for hu5/hu6 (Date, Match Count) ---
+            with self._metrics.time('formatting', lottery_id):
+                formatted_results = [(row[0].strftime("%Y-%m-%d"), row[1], row[2]) for row in raw_results]
+
+        # Return the final formatted results and the total draw count
+        return formatted_results, total_draws, winning_draws
+
+    def histogram(self, lottery_id, numbers, limit=20):
+        """
+        Defines the histogram query for already validated input, runs it, and formats the output.
+        Returns ({match_count: (winning_draws, formatted_results)}, total_draws).
+        """
+
+        histogram = {level: (0, []) for level in range(len(numbers) + 1)}
+
+        # The ticket as a bit string, matched against the precomputed draw.mask column.
+        ticket_mask = numbers_to_bit_string(numbers)
+
+        # --- Logic for 'hu7' (which has two sets of numbers) ---
+        if lottery_id == 'hu7':
+            # A date belongs to the level of both of its draws, LATERAL expands it into one row per level.
+            query_histogram = """
+            SELECT draw_date, numbers_a, match_count_a, numbers_b, match_count_b,
+                   level, level_count, total_count
+            FROM (
+                SELECT pairs.*, levels.level,
+                       COUNT(*) OVER (PARTITION BY levels.level) AS level_count,
+                       ROW_NUMBER() OVER (PARTITION BY levels.level ORDER BY pairs.draw_date DESC) AS level_rank
+                FROM (
+                    SELECT draw_date,
+                           numbers_a, bit_count(mask_a & CAST(:mask AS BIT(90))) AS match_count_a,
+                           numbers_b, bit_count(mask_b & CAST(:mask AS BIT(90))) AS match_count_b,
+                           COUNT(*) OVER () AS total_count
+                    FROM draw_hu7
+                ) AS pairs
+                CROSS JOIN LATERAL (
+                    SELECT DISTINCT UNNEST(ARRAY[pairs.match_count_a, pairs.match_count_b]) AS level
+                ) AS levels
+            ) AS ranked
+            WHERE level_rank <= :limit
+            ORDER BY level, draw_date DESC;
+            """
+            raw_results = self._run_db_query(query_histogram, {"mask": ticket_mask, "limit": limit}, lottery_id)
+
+            # --- Format results for hu7 (Date, Numbers A, Match A, Numbers B, Match B) ---
+            with self._metrics.time('formatting', lottery_id):
+                for row in raw_results:
+                    level_rows = histogram[row[5]][1]
+                    level_rows.append((row[0].strftime("%Y-%m-%d"), row[1], row[2], row[3], row[4]))
+                    histogram[row[5]] = (int(row[6]), level_rows)
+
+        # --- Logic for 'hu5' or 'hu6' (which have one set of numbers) ---
+        else:
+            query_histogram = """
+            SELECT draw_date, numbers, match_count, level_count, total_count
+            FROM (
+                SELECT sub.*,
+                       COUNT(*) OVER (PARTITION BY match_count) AS level_count,
+                       COUNT(*) OVER () AS total_count,
+                       ROW_NUMBER() OVER (PARTITION BY match_count ORDER BY draw_date DESC) AS level_rank
+                FROM (
+                    SELECT draw_date, numbers,
+                           bit_count(mask & CAST(:mask AS BIT(90))) AS match_count
+                    FROM draw
+                    WHERE lottery_id = :id
+                ) AS sub
+            ) AS ranked
+            WHERE level_rank <= :limit
+            ORDER BY match_count, draw_date DESC;
+            """
+            raw_results = self._run_db_query(query_histogram,
+                                             {"mask": ticket_mask, "id": lottery_id, "limit": limit}, lottery_id)
+
+            # --- Format results for hu5/hu6 (Date, Numbers, Match Count) ---
+            with self._metrics.time('formatting', lottery_id):
+                for row in raw_results:
+                    level_rows = histogram[row[2]][1]
+                    level_rows.append((row[0].strftime("%Y-%m-%d"), row[1], row[2]))
+                    histogram[row[2]] = (int(row[3]), level_rows)
+
+        total_draws = int(raw_results[0][-1]) if raw_results else 0
+        return histogram, total_draws
+
+
+def read_draws_frame(path):
+    """
+    Read a refined CSV of data_refining into a DataFrame of its raw (string) columns plus draw_date.
+    Dates are fixed with vectorized operations: '2025.11.01.' becomes 2025-11-01
+    and a missing date is the previous row's date minus 7 days.
+    """
+    import pandas as pd
+
+    df = pd.read_csv(path, dtype=str)
+
+    dates = pd.to_datetime(df['date'].str.strip('. ').str.replace('.', '-', regex=False),
+                           format='%Y-%m-%d', errors='coerce')
+
+    # Rows are newest first: a missing date is 7 days before the last known one for every row since.
+    known = dates.notna().cumsum()
+    steps = dates.groupby(known).cumcount()
+    df['draw_date'] = dates.groupby(known).transform('first') - pd.to_timedelta(steps * 7, unit='D')
+    return df
+
+
+def read_draws_csv(path, lottery_id):
+    """
+    Read a refined CSV of data_refining into (lottery_id, draw_date, numbers) rows,
+    with the dates fixed by read_draws_frame.
+    """
+    import pandas as pd
+
+    df = read_draws_frame(path)
+
+    number_columns = [f"n{i}" for i in range(1, DRAW_RULES[lottery_id]['length'] + 1)]
+    numbers = df[number_columns].apply(pd.to_numeric, errors='coerce')
+
+    return [
+        (lottery_id, date.date(), [int(n) for n in row if not pd.isnull(n)])
+        for date, row in zip(df['draw_date'], numbers.itertuples(index=False, name=None))
+    ]
+
+
+class EmbeddedStorage(BitmaskEngine, Storage):
+    """
+    In-process storage, the whole history is held in a BitmaskEngine.
+    Needs no database server, e.g. for edge replicas, tests and benchmarks.
+    """
+
+    def __init__(self, rows):
+        """Build the storage from (lottery_id, draw_date, numbers) rows."""
+        self._rows = list(rows)
+        super().__init__(self._rows)
+
+    @classmethod
+    def from_csv(cls, data_dir=DATA_DIR):
+        """Build the storage from the data_refining Hu5, Hu6 and Hu7 CSVs."""
+        rows = []
+        for lottery_id, csv_file in CSV_FILES.items():
+            rows.extend(read_draws_csv(os.path.join(data_dir, csv_file), lottery_id))
+        return cls(rows)
+
+    @classmethod
+    def from_storage(cls, storage):
+        """Copy the history of another storage (e.g. PostgresStorage) into memory."""
+        return cls(storage.draws())
+
+    def draws(self):
+        """Return every (lottery_id, draw_date, numbers) row."""
+        return list(self._rows)
@@ -1,6 +1,7 @@
 #  Import necessary libraries 
 import streamlit as st
 import backend as sc  # Assumes your backend code is in 'backend.py'
+import datetime
 import os
 
 
@@ -33,6 +34,7 @@ class StreamlitFrontend:
             "results_header": "🎰 Lottery Results",
             "results_lucky": "🍀 Your lucky numbers:",
             "results_match": "🎯 Match count:",
+            "results_tiers": "📊 Draws per match count (click to switch):",
             "date_col": "🗓️ Draw Date",
             "draw_numbers": "🎰 Numbers",
             "matches_col": "⭐ Matches",
@@ -43,7 +45,35 @@ class StreamlitFrontend:
             "success_hu5_hu6": "🎉 You would have won in {wins} draws out of {length} draws since the start of the lottery! 🎉",
             "success_hu7": "🎉 You would have won in {wins} draws out of {length} draws since the start of the lottery! 🎉",
             "last_update": "🔄 Last database update: 02/11/2025",
-            "limit": "*results are limited to 20 rows for efficient display."
+            "limit": "*results are shown 20 rows per page, newest draws first.",
+            "page_info": "Draws {first}-{last} of {wins}",
+            "newer_button": "◀ Newer draws",
+            "older_button": "Older draws ▶",
+            "stats_title": "🔥 Hot and cold numbers",
+            "stats_ticket": "🍀 Your numbers drawn (times, last drawn):",
+            "stats_hot": "🔥 Most drawn numbers:",
+            "stats_cold": "🧊 Least drawn numbers:",
+            "stats_pairs": "👯 Most drawn pairs:",
+            "stats_triples": "🎲 Most drawn triples:",
+            "stats_never": "never",
+            "payout_title": "💰 Prizes and return (example prize amounts)",
+            "payout_summary": "Playing these numbers on all {draws} draws would have cost {stake} Ft and won {winnings} Ft,"
+                              " a return of {roi:+.1%}.",
+            "payout_tiers": "Prizes by match count:",
+            "window_title": "📅 Results in a time window",
+            "window_select": "Time window",
+            "window_options": {"all": "All draws", "since_2010": "Since 2010", "last_5_years": "Last 5 years",
+                               "last_year": "Last year", "custom": "Custom dates"},
+            "window_dates": "From - to",
+            "window_result": "From {start} to {end}: {count} draws with {level} matches and a prize in {wins}"
+                             " of {draws} draws.",
+            "window_chart_level": "{level} matches",
+            "window_chart_wins": "Prize",
+            "luck_title": "🍀 How lucky are your numbers?",
+            "luck_pending": "The comparison with random tickets is being prepared, it shows up on a later check.",
+            "luck_win": "Your numbers won a prize in {count} draws, more than {percentile:.1%} of {samples} random"
+                        " tickets (they won in {mean:.1f} draws on average).",
+            "luck_level": "With {level} matches in {count} draws, they are luckier than {percentile:.1%} of random tickets."
         },
         "hu": {
             "welcome_title": "Válassz nyelvet!",
@@ -65,6 +95,7 @@ class StreamlitFrontend:
             "results_header": "🎰 Eredmények",
             "results_lucky": "🍀 Nyerőszámaid:",
             "results_match": "🎯 Találatok száma:",
+            "results_tiers": "📊 Húzások száma találatonként (kattints a váltáshoz):",
             "date_col": "🗓️ Húzás dátuma",
             "draw_numbers": "🎰 Kihúzott számok",
             "matches_col": "⭐ Találatok száma",
@@ -75,7 +106,35 @@ class StreamlitFrontend:
             "success_hu5_hu6": "🎉 Az eddigi {length} húzásból {wins} húzáson lett volna találatod! 🎉",
             "success_hu7": "🎉 Az eddigi {length} húzásból {wins} húzáson lett volna találatod! 🎉",
             "last_update": "🔄 Adatbázis utolsó frissítése: 2025.11.02.",
-            "limit": "*az eredmények 20 sorra vannak korlátozva."
+            "limit": "*az eredmények oldalanként 20 sorban jelennek meg, a legújabb húzásokkal kezdve.",
+            "page_info": "{first}-{last}. húzás, összesen {wins}",
+            "newer_button": "◀ Újabb húzások",
+            "older_button": "Régebbi húzások ▶",
+            "stats_title": "🔥 Forró és hideg számok",
+            "stats_ticket": "🍀 Számaid húzásai (alkalom, utoljára):",
+            "stats_hot": "🔥 Legtöbbször kihúzott számok:",
+            "stats_cold": "🧊 Legritkábban kihúzott számok:",
+            "stats_pairs": "👯 Legtöbbször kihúzott számpárok:",
+            "stats_triples": "🎲 Legtöbbször kihúzott számhármasok:",
+            "stats_never": "soha",
+            "payout_title": "💰 Nyeremények és megtérülés (példa nyereményösszegekkel)",
+            "payout_summary": "Ha ezeket a számokat mind a {draws} húzáson megjátszottad volna, {stake} Ft-ba került volna,"
+                              " a nyeremény {winnings} Ft, a megtérülés {roi:+.1%}.",
+            "payout_tiers": "Nyeremények találatszám szerint:",
+            "window_title": "📅 Eredmények egy időszakban",
+            "window_select": "Időszak",
+            "window_options": {"all": "Összes húzás", "since_2010": "2010 óta", "last_5_years": "Elmúlt 5 év",
+                               "last_year": "Elmúlt 1 év", "custom": "Egyéni dátumok"},
+            "window_dates": "Kezdete - vége",
+            "window_result": "{start} és {end} között: {draws} húzásból {count} húzáson {level} találat,"
+                             " {wins} húzáson nyeremény.",
+            "window_chart_level": "{level} találat",
+            "window_chart_wins": "Nyeremény",
+            "luck_title": "🍀 Mennyire szerencsések a számaid?",
+            "luck_pending": "Az összevetés véletlen szelvényekkel készül, egy későbbi ellenőrzésnél jelenik meg.",
+            "luck_win": "A számaid {count} húzáson nyertek volna, többször, mint {samples} véletlen szelvény"
+                        " {percentile:.1%}-a (ezek átlagosan {mean:.1f} húzáson nyertek).",
+            "luck_level": "{count} húzáson {level} találattal szerencsésebbek a véletlen szelvények {percentile:.1%}-ánál."
         }
     }
 
@@ -102,6 +161,10 @@ class StreamlitFrontend:
         }
     }
 
+    # Rows shown on one page of results, and the height of a results table row in pixels.
+    PAGE_SIZE = 20
+    ROW_HEIGHT = 35
+
     #  Helper Methods 
 
     def _clear_session_keys(self, keys_to_clear):
@@ -250,10 +313,6 @@ class StreamlitFrontend:
             st.button(txt["back_button"], on_click=self._clear_session_keys, args=(['lottery_id'],))
             return
 
-        limit = rules['limit']
-        max_num = rules['max_num']
-        num_cols = rules['cols']
-
         # Main session key for picked numbers
         session_key = rules['session_key']
 
@@ -262,10 +321,30 @@ class StreamlitFrontend:
 
         #  Initialize/Validate state for match filter
         if (matches_key not in st.session_state or
-                st.session_state[matches_key] > limit):
-            st.session_state[matches_key] = limit
+                st.session_state[matches_key] > rules['limit']):
+            st.session_state[matches_key] = rules['limit']
+
+        # Initialize main number set
+        if session_key not in st.session_state:
+            st.session_state[session_key] = set()
+
+        self._picker_grid(_lottery_id, txt)
+
+    @st.fragment
+    def _picker_grid(self, _lottery_id, txt):
+        """
+        The match filter, the number grid and the submit button of the picker page.
+        As a fragment, a click reruns only this function, not the whole app from run_app,
+        and the buttons update the state in callbacks, so a click is a single run.
+        """
+        rules = self.LOTTERY_RULES[_lottery_id]
+        limit = rules['limit']
+        max_num = rules['max_num']
+        num_cols = rules['cols']
+        session_key = rules['session_key']
+        matches_key = f"matches_{_lottery_id}"
 
-        #  Main number picking logic (unchanged) 
+        #  Main number picking logic 
         def toggle_number(num: int, lim):
             """Helper function to add/remove a number from the set."""
             if num in st.session_state[session_key]:
@@ -291,9 +370,8 @@ class StreamlitFrontend:
                 selected = (j == st.session_state[matches_key])
                 btn_type = "primary" if selected else "secondary"
 
-                if st.button(str(j), key=f"match_{_lottery_id}_{j}", use_container_width=True, type=btn_type):
-                    set_matches(j)
-                    st.rerun()
+                st.button(str(j), key=f"match_{_lottery_id}_{j}", use_container_width=True, type=btn_type,
+                          on_click=set_matches, args=(j,))
 
             if j % num_cols == 0 and j != limit:
                 cols = st.columns(num_cols)
@@ -301,10 +379,6 @@ class StreamlitFrontend:
         #  Main number picker
         st.title(txt[f"picker_title_{_lottery_id}"])
 
-        # Initialize main number set
-        if session_key not in st.session_state:
-            st.session_state[session_key] = set()
-
         #  Draw the number grid dynamically
         cols = st.columns(num_cols)
         for i in range(1, max_num + 1):
@@ -315,34 +389,112 @@ class StreamlitFrontend:
                 selected = i in st.session_state[session_key]
                 btn_type = "primary" if selected else "secondary"
 
-                if st.button(str(i), key=f"num_{_lottery_id}_{i}", use_container_width=True, type=btn_type):
-                    toggle_number(i, limit)
-                    st.rerun()
+                st.button(str(i), key=f"num_{_lottery_id}_{i}", use_container_width=True, type=btn_type,
+                          on_click=toggle_number, args=(i, limit))
 
             # Start a new row
             if i % num_cols == 0 and i != max_num:
                 cols = st.columns(num_cols)
 
         #  Dynamic Submit Button
+        # Leaving the picker changes the page, so it reruns the whole app.
         is_disabled = len(st.session_state[session_key]) != limit
         if st.button(txt["submit_button"], type="primary", use_container_width=True, disabled=is_disabled):
             st.session_state.get_winning_numbers = True
-            st.rerun()
+            st.rerun(scope="app")
+
+    def _results_table(self, _lottery_id, results, txt):
+        """
+        Display the result rows as a single table element.
+        hu7 has 5 columns (Date, Numbers A, Match A, Numbers B, Match B), hu5/hu6 have 3 (Date, Numbers, Match Count).
+        """
+        if _lottery_id == "hu7":
+            labels = {"date": txt["date_col"],
+                      "numbers_mech": txt["numbers_mech_col"], "matches_mech": txt["matches_mech_col"],
+                      "numbers_manual": txt["numbers_manual_col"], "matches_manual": txt["matches_manual_col"]}
+        else:
+            labels = {"date": txt["date_col"], "numbers": txt["draw_numbers"], "matches": txt["matches_col"]}
+
+        # Column-wise data: the numbers columns are joined into text, the others are kept as they are.
+        data = {
+            key: [', '.join(str(s) for s in r[i]) if key.startswith("numbers") else r[i] for r in results]
+            for i, key in enumerate(labels)
+        }
+        st.dataframe(data, hide_index=True, column_config=labels,
+                     height=self.ROW_HEIGHT * (len(results) + 1) + 3)
+
+    def _page_controls(self, _lottery_id, page, results, wins, txt):
+        """
+        Display the position of the shown page and the buttons to the newer and older pages.
+        The page state keeps the cursor (last date) of every page opened before the current one.
+        """
+        first = len(page["cursors"]) * self.PAGE_SIZE
+        if not results:
+            return
+
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            if page["cursors"]:
+                st.button(txt["newer_button"], key=f"newer_{_lottery_id}", use_container_width=True,
+                          on_click=page["cursors"].pop)
+        with col2:
+            st.write(txt["page_info"].format(first=first + 1, last=first + len(results), wins=wins))
+        with col3:
+            if first + len(results) < wins:
+                st.button(txt["older_button"], key=f"older_{_lottery_id}", use_container_width=True,
+                          on_click=page["cursors"].append, args=(results[-1][0],))
 
     def _results_page(self, _language, _lottery_id, _user_input, txt):
         """
         Fetches and displays the results.
         """
 
+        matches_key = f"matches_{_lottery_id}"
+        histogram_key = f"histogram_{_lottery_id}"
+        ticket = sorted(_user_input)
+
         #  Call Backend 
-        # Show a spinner while fetching data
-        with st.spinner("Checking results..."):
+        # Every match count is fetched in one call and kept per ticket,
+        # so switching the match count below needs no new query.
+        if st.session_state.get(histogram_key, {}).get("ticket") != ticket:
+            # Show a spinner while fetching data
+            with st.spinner("Checking results..."):
+                try:
+                    storage = sc.load_storage()
+                    cache = sc.load_result_cache()
+                    histogram, length = sc.WinningNumbers(_lottery_id, _user_input, storage, cache,
+                                                          sc.load_metrics()).check_lottery_histogram(self.PAGE_SIZE)
+                except Exception as e:
+                    st.error(f"An error occurred while fetching results: {e}")
+                    st.button(txt["back_button"], on_click=self._clear_session_keys, args=(['get_winning_numbers'],))
+                    return
+
+            # Keep only successful results, an empty history means a failed query.
+            if length:
+                st.session_state[histogram_key] = {"ticket": ticket, "histogram": histogram, "length": length}
+        else:
+            histogram = st.session_state[histogram_key]["histogram"]
+            length = st.session_state[histogram_key]["length"]
+
+        wins, results = histogram.get(st.session_state[matches_key], (0, []))
+
+        #  Pagination
+        # The first page comes with the histogram, the later ones are fetched by the date of the
+        # last row of the previous page (keyset pagination on draw_date), one page at a time.
+        page_key = f"page_{_lottery_id}"
+        page = st.session_state.get(page_key)
+        if not page or page["ticket"] != ticket or page["matches"] != st.session_state[matches_key]:
+            page = {"ticket": ticket, "matches": st.session_state[matches_key], "cursors": []}
+            st.session_state[page_key] = page
+
+        if page["cursors"]:
             try:
-                results, length, wins = sc.WinningNumbers(_lottery_id, _user_input).check_lottery_numbers()
+                results, _, _ = sc.WinningNumbers(_lottery_id, _user_input, sc.load_storage(), sc.load_result_cache(),
+                                                  sc.load_metrics()).check_lottery_numbers(
+                    self.PAGE_SIZE, page["cursors"][-1])
             except Exception as e:
                 st.error(f"An error occurred while fetching results: {e}")
-                st.button(txt["back_button"], on_click=self._clear_session_keys, args=(['get_winning_numbers'],))
-                return
+                results = []
 
         st.set_page_config(page_title='Would I have won?', page_icon="🎲", layout="wide")
         st.header(txt["results_header"])
@@ -351,71 +503,192 @@ class StreamlitFrontend:
         with col1:
             st.header(txt["results_lucky"]+f" {', '.join([str(s) for s in _user_input])}")
         with col2:
-            st.header(txt["results_match"]+f" {st.session_state[f"matches_{_lottery_id}"]}")
+            st.header(txt["results_match"]+f" {st.session_state[matches_key]}")
+
+        #  Match count selector, showing the number of draws at every match count
+        st.subheader(txt["results_tiers"])
+        limit = self.LOTTERY_RULES[_lottery_id]['limit']
+        cols = st.columns(limit)
+        for j in range(1, limit + 1):
+            with cols[j - 1]:
+                selected = (j == st.session_state[matches_key])
+                btn_type = "primary" if selected else "secondary"
+                label = f"{j} ⭐ {histogram.get(j, (0, []))[0]}"
+
+                # A callback instead of st.rerun(): a stopped run would drop the state of the widgets below.
+                st.button(label, key=f"tier_{_lottery_id}_{j}", use_container_width=True, type=btn_type,
+                          on_click=st.session_state.__setitem__, args=(matches_key, j))
 
         st.write(txt["limit"])
 
 
         #  Display Results
-        if _lottery_id == "hu7":
-            # 5-column layout for hu7
-            col1, col2, col3, col4, col5 = st.columns(5)
-            with col1:
-                st.subheader(txt["date_col"])
-            with col2:
-                st.subheader(txt["numbers_mech_col"])
-            with col3:
-                st.subheader(txt["matches_mech_col"])
-            with col4:
-                st.subheader(txt["numbers_manual_col"])
-            with col5:
-                st.subheader(txt["matches_manual_col"])
-
-            st.divider()
-
-            for r in results:
-                col1, col2, col3, col4, col5 = st.columns(5)
-                with col1:
-                    st.write(r[0])  # Date
-                with col2:
-                    st.write(', '.join([str(s) for s in r[1]]))  # Numbers A
-                with col3:
-                    st.write(r[2])  # Match A
-                with col4:
-                    st.write(', '.join([str(s) for s in r[3]]))  # Numbers A
-                with col5:
-                    st.write(r[4])  # Match B
+        # One table element per page, whatever the number of rows.
+        self._results_table(_lottery_id, results, txt)
+        self._page_controls(_lottery_id, page, results, wins, txt)
 
+        if _lottery_id == "hu7":
             # Complex win calculation for hu7
             st.success(txt["success_hu7"].format(wins=wins, length=length))
 
         elif _lottery_id == "hu5" or _lottery_id == "hu6":
-            # 3-column layout for hu5/hu6
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.subheader(txt["date_col"])
-            with col2:
-                st.subheader(txt["draw_numbers"])
-            with col3:
-                st.subheader(txt["matches_col"])
-
-            st.divider()
-
-            for r in results:
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.write(r[0])  # Date
-                with col2:
-                    st.write(', '.join([str(s) for s in r[1]])) # Numbers
-                with col3:
-                    st.write(r[2])  # Match Count
-
             # Simple win calculation
             st.success(txt["success_hu5_hu6"].format(wins=wins, length=length))
 
+        self._window_section(_lottery_id, _user_input, txt)
+        self._luck_section(_lottery_id, _user_input, txt)
+        self._payout_section(_lottery_id, _user_input, txt)
+        self._statistics_section(_lottery_id, _user_input, txt)
+
         # Back button to return to the number picker
         st.button(txt["back_button"], on_click=self._clear_session_keys, args=(['get_winning_numbers'],))
 
+    @staticmethod
+    def _format_statistics(rows, txt):
+        """Format (entry, count, last_seen) rows as '7 (412×, 2025-10-29), ...'."""
+        return ', '.join(
+            f"{'-'.join(str(n) for n in entry)} ({count}×, "
+            f"{last_seen.strftime('%Y-%m-%d') if last_seen else txt['stats_never']})"
+            for entry, count, last_seen in rows
+        )
+
+    def _statistics_section(self, _lottery_id, _user_input, txt):
+        """
+        Displays the hot and cold numbers, pairs and triples of the lottery and how often the
+        user's numbers were drawn, from the in-memory statistics (no database query).
+        """
+        try:
+            statistics = sc.load_statistics()
+        except Exception as e:
+            print(f"Statistics are not available: {e}")
+            return
+
+        st.subheader(txt["stats_title"])
+        if _lottery_id == "hu7":
+            draws = [("hu7a", txt["numbers_mech_col"]), ("hu7b", txt["numbers_manual_col"])]
+        else:
+            draws = [(_lottery_id, None)]
+
+        for draw_id, label in draws:
+            if label:
+                st.write(f"**{label}**")
+            st.write(txt["stats_ticket"] + " " + self._format_statistics(statistics.ticket(draw_id, _user_input), txt))
+            st.write(txt["stats_hot"] + " " + self._format_statistics(statistics.top(draw_id, 1, 5), txt))
+            st.write(txt["stats_cold"] + " " + self._format_statistics(statistics.top(draw_id, 1, 5, cold=True), txt))
+            st.write(txt["stats_pairs"] + " " + self._format_statistics(statistics.top(draw_id, 2, 3), txt))
+            st.write(txt["stats_triples"] + " " + self._format_statistics(statistics.top(draw_id, 3, 3), txt))
+
+    @staticmethod
+    def _years_before(date, years):
+        """Return the day after the same date `years` earlier (a 29 February becomes the 28th)."""
+        try:
+            earlier = date.replace(year=date.year - years)
+        except ValueError:
+            earlier = date.replace(year=date.year - years, day=28)
+        return earlier + datetime.timedelta(days=1)
+
+    def _window_section(self, _lottery_id, _user_input, txt):
+        """
+        Displays the draw counts of the selected match count and of any prize in a date window and the
+        wins per year as a chart. Both come from the prefix sums of the ticket (see windows.py),
+        fetched once, so changing the window needs no new query.
+        """
+        try:
+            windows, length = sc.WinningNumbers(_lottery_id, _user_input, sc.load_storage(), sc.load_result_cache(),
+                                                sc.load_metrics()).check_lottery_windows()
+        except Exception as e:
+            print(f"Date windows are not available: {e}")
+            return
+        if not length:
+            return
+
+        st.subheader(txt["window_title"])
+        first, last = windows.first_date, windows.last_date
+        options = txt["window_options"]
+        choice = st.selectbox(txt["window_select"], list(options), format_func=options.get,
+                              key=f"window_{_lottery_id}")
+
+        start, end = {
+            "all": (first, last),
+            "since_2010": (datetime.date(2010, 1, 1), last),
+            "last_5_years": (self._years_before(last, 5), last),
+            "last_year": (self._years_before(last, 1), last),
+        }.get(choice, (first, last))
+        if choice == "custom":
+            dates = st.date_input(txt["window_dates"], value=(first, last), min_value=first, max_value=last,
+                                  key=f"window_dates_{_lottery_id}")
+            if len(dates) == 2:  # Only the start is set while the user is picking
+                start, end = dates
+
+        level = st.session_state[f"matches_{_lottery_id}"]
+        draws, counts = windows.window(start, end)
+        st.write(txt["window_result"].format(start=start.strftime("%Y-%m-%d"), end=end.strftime("%Y-%m-%d"),
+                                             count=counts[level], level=level, wins=counts[sc.WIN_TIER], draws=draws))
+
+        # Wins per year of the whole history, one bar per year and series.
+        level_label = txt["window_chart_level"].format(level=level)
+        yearly_level, yearly_wins = windows.yearly(level), windows.yearly(sc.WIN_TIER)
+        st.bar_chart({"year": [str(year) for year, _ in yearly_level],
+                      level_label: [count for _, count in yearly_level],
+                      txt["window_chart_wins"]: [count for _, count in yearly_wins]},
+                     x="year", y=[level_label, txt["window_chart_wins"]], stack=False, height=250)
+
+    def _luck_section(self, _lottery_id, _user_input, txt):
+        """
+        Displays the percentile of the user's numbers among random tickets, for any prize and for the
+        selected match count, from the Monte Carlo baseline of the current data version.
+        """
+        try:
+            storage = sc.load_storage()
+            baseline = sc.load_luck_baselines().get(_lottery_id, storage.latest_draw_date(), storage.draws)
+            ranks = baseline.rank(_user_input) if baseline is not None else None
+        except Exception as e:
+            print(f"Luck baseline is not available: {e}")
+            return
+
+        st.subheader(txt["luck_title"])
+        if ranks is None:
+            st.caption(txt["luck_pending"])
+            return
+        count, percentile = ranks[sc.WIN_TIER]
+        st.write(txt["luck_win"].format(count=count, percentile=percentile, samples=self._format_amount(baseline.samples),
+                                        mean=baseline.mean(sc.WIN_TIER)))
+        level = st.session_state[f"matches_{_lottery_id}"]
+        count, percentile = ranks[level]
+        st.write(txt["luck_level"].format(level=level, count=count, percentile=percentile))
+
+    @staticmethod
+    def _format_amount(amount):
+        """Format a HUF amount with space thousands separators, e.g. 1 500 000."""
+        return f"{int(amount):,}".replace(',', ' ')
+
+    def _payout_section(self, _lottery_id, _user_input, txt):
+        """
+        Displays the stake, the prizes and the return of the user's numbers played on every draw,
+        with the prizes per match count (and per draw for hu7), from the in-memory simulator.
+        """
+        try:
+            simulator = sc.load_payout_simulator()
+            simulation = simulator.simulate(_lottery_id, [sorted(_user_input)])
+        except Exception as e:
+            print(f"Payout simulation is not available: {e}")
+            return
+
+        st.subheader(txt["payout_title"])
+        draws = len(simulator.dates(_lottery_id))
+        st.write(txt["payout_summary"].format(draws=draws, stake=self._format_amount(simulation['stake']),
+                                              winnings=self._format_amount(simulation['winnings'][0]),
+                                              roi=simulation['roi'][0]))
+
+        labels = {"hu7a": txt["numbers_mech_col"], "hu7b": txt["numbers_manual_col"]}
+        for draw_id, levels in simulation['tiers'].items():
+            tiers = ', '.join(
+                f"{level} ⭐: {levels[0][level]} × {self._format_amount(prize)} Ft"
+                for level, prize in sorted(simulator.prizes[draw_id].items(), reverse=True)
+            )
+            prefix = f"**{labels[draw_id]}** " if draw_id in labels else ""
+            st.write(prefix + txt["payout_tiers"] + " " + tiers)
+
     def call_pages(self, page, language=None, txt=None, lottery_id=None, selected_numbers=None):
         """
         Calls the correct page rendering method based on the 'page' string.
@@ -5,6 +5,7 @@ import datetime
 import pandas as pd
 
 from backend import WinningNumbers
+from cache import ResultCache
 
 # Mock streamlit for the whole class
 @patch('backend.st', new_callable=MagicMock)
@@ -159,7 +160,7 @@ class TestWinningNumbersValidation(unittest.TestCase):
 @patch('backend.st', new_callable=MagicMock)
 class TestWinningNumbersQueries(unittest.TestCase):
     """
-    Tests the main check_lottery_numbers method and _run_db_queries
+    Tests the main check_lottery_numbers method and _run_db_query
     with mocked database interaction to test the logic.
     """
 
@@ -168,14 +169,13 @@ class TestWinningNumbersQueries(unittest.TestCase):
         self.mock_date = datetime.datetime(2023, 1, 1)
         self.mock_match_count = 2
 
-    @patch('backend.WinningNumbers._run_db_queries')
-    def test_check_lottery_numbers_hu5_success(self, mock_run_db_queries, mock_st):
+    @patch('storage.PostgresStorage._run_db_query')
+    def test_check_lottery_numbers_hu5_success(self, mock_run_db_query, mock_st):
         """Test the hu5 logic with mocked db results."""
         # 1. Define mock results in the format of check_lottery_numbers output.
-        # (date, [draw numbers], match count, draw matches)
-        mock_raw_results = [(self.mock_date, [1, 2, 6, 7, 8], 2, 1)]
+        # (date, [draw numbers], match count, draw matches, total draws)
         mock_total_draws = 50
-        mock_run_db_queries.return_value = (mock_raw_results, mock_total_draws)
+        mock_run_db_query.return_value = [(self.mock_date, [1, 2, 6, 7, 8], 2, 1, mock_total_draws)]
 
         # Set the session state for this test
         mock_st.session_state = {"matches_hu5": self.mock_match_count}
@@ -193,14 +193,13 @@ class TestWinningNumbersQueries(unittest.TestCase):
         self.assertEqual(total_draws, mock_total_draws)
         self.assertEqual(winning_draws, 1)
 
-    @patch('backend.WinningNumbers._run_db_queries')
-    def test_check_lottery_numbers_hu6_success(self, mock_run_db_queries, mock_st):
+    @patch('storage.PostgresStorage._run_db_query')
+    def test_check_lottery_numbers_hu6_success(self, mock_run_db_query, mock_st):
         """Test the hu5 logic with mocked db results."""
         # 1. Define mock results in the format of check_lottery_numbers output.
-        # (date, [draw numbers], match count, draw matches)
-        mock_raw_results = [(self.mock_date, [1, 2, 7, 8, 9, 10], 2, 1)]
+        # (date, [draw numbers], match count, draw matches, total draws)
         mock_total_draws = 50
-        mock_run_db_queries.return_value = (mock_raw_results, mock_total_draws)
+        mock_run_db_query.return_value = [(self.mock_date, [1, 2, 7, 8, 9, 10], 2, 1, mock_total_draws)]
 
         # Set the session state for this test
         mock_st.session_state = {"matches_hu6": self.mock_match_count}
@@ -218,14 +217,15 @@ class TestWinningNumbersQueries(unittest.TestCase):
         self.assertEqual(total_draws, mock_total_draws)
         self.assertEqual(winning_draws, 1)
 
-    @patch('backend.WinningNumbers._run_db_queries')
-    def test_check_lottery_numbers_hu7_success(self, mock_run_db_queries, mock_st):
+    @patch('storage.PostgresStorage._run_db_query')
+    def test_check_lottery_numbers_hu7_success(self, mock_run_db_query, mock_st):
         """Test the hu7 logic with mocked db results."""
         # 1. Define mock results in the format of check_lottery_numbers output.
-        # (date, [draw numbers], match count, draw matches)
-        mock_raw_results = [(self.mock_date, [1, 2, 8, 9, 10, 11, 12], 2, [1, 2, 3, 13, 14, 15, 16], 3, 1)]
+        # (date, [numbers A], match A, [numbers B], match B, draw matches, total draws)
         mock_total_draws = 50
-        mock_run_db_queries.return_value = (mock_raw_results, mock_total_draws)
+        mock_run_db_query.return_value = [
+            (self.mock_date, [1, 2, 8, 9, 10, 11, 12], 2, [1, 2, 3, 13, 14, 15, 16], 3, 1, mock_total_draws)
+        ]
 
         # Set the session state for this test
         mock_st.session_state = {"matches_hu7": self.mock_match_count}
@@ -243,8 +243,58 @@ class TestWinningNumbersQueries(unittest.TestCase):
         self.assertEqual(total_draws, mock_total_draws)
         self.assertEqual(winning_draws, 1)
 
-    @patch('backend.WinningNumbers._run_db_queries')
-    def test_check_lottery_numbers_invalid_id(self, mock_run_db_queries, mock_st):
+    @patch('storage.PostgresStorage._run_db_query')
+    def test_check_lottery_numbers_storage(self, mock_run_db_query, mock_st):
+        """Test that a provided storage answers the query instead of the database."""
+        mock_storage = MagicMock()
+        mock_storage.check.return_value = ([("2023-01-01", [1, 2, 6, 7, 8], 2)], 50, 1)
+
+        mock_st.session_state = {"matches_hu5": self.mock_match_count}
+        wn = WinningNumbers('hu5', {5, 4, 3, 2, 1}, mock_storage)
+        results, total_draws, winning_draws = wn.check_lottery_numbers()
+
+        mock_storage.check.assert_called_once_with('hu5', [1, 2, 3, 4, 5], self.mock_match_count, 20, None)
+        mock_run_db_query.assert_not_called()
+        self.assertEqual(results, [("2023-01-01", [1, 2, 6, 7, 8], 2)])
+        self.assertEqual(total_draws, 50)
+        self.assertEqual(winning_draws, 1)
+
+    @patch('backend.WinningNumbers._latest_draw_date')
+    @patch('storage.PostgresStorage._run_db_query')
+    def test_check_lottery_numbers_cache(self, mock_run_db_query, mock_latest_draw_date, mock_st):
+        """Test the same ticket in any order is answered from the cache until a new draw arrives."""
+        mock_run_db_query.return_value = [(self.mock_date, [1, 2, 6, 7, 8], 2, 1, 50)]
+        mock_latest_draw_date.return_value = datetime.date(2023, 1, 1)
+        mock_st.session_state = {"matches_hu5": self.mock_match_count}
+        cache = ResultCache()
+
+        first = WinningNumbers('hu5', [1, 2, 3, 4, 5], cache=cache).check_lottery_numbers()
+        second = WinningNumbers('hu5', {5, 3, 1, 2, 4}, cache=cache).check_lottery_numbers()
+        self.assertEqual(first, second)
+        self.assertEqual(mock_run_db_query.call_count, 1)
+        self.assertEqual(cache.stats()['hits'], 1)
+
+        # A new draw invalidates the cached result
+        mock_latest_draw_date.return_value = datetime.date(2023, 1, 8)
+        WinningNumbers('hu5', [1, 2, 3, 4, 5], cache=cache).check_lottery_numbers()
+        self.assertEqual(mock_run_db_query.call_count, 2)
+
+    @patch('backend.WinningNumbers._latest_draw_date')
+    @patch('storage.PostgresStorage._run_db_query')
+    def test_check_lottery_numbers_cache_skips_errors(self, mock_run_db_query, mock_latest_draw_date, mock_st):
+        """Test a failed query is not cached."""
+        mock_run_db_query.return_value = []
+        mock_latest_draw_date.return_value = datetime.date(2023, 1, 1)
+        mock_st.session_state = {"matches_hu5": self.mock_match_count}
+        cache = ResultCache()
+
+        WinningNumbers('hu5', [1, 2, 3, 4, 5], cache=cache).check_lottery_numbers()
+        WinningNumbers('hu5', [1, 2, 3, 4, 5], cache=cache).check_lottery_numbers()
+        self.assertEqual(mock_run_db_query.call_count, 2)
+        self.assertEqual(cache.stats()['size'], 0)
+
+    @patch('storage.PostgresStorage._run_db_query')
+    def test_check_lottery_numbers_invalid_id(self, mock_run_db_query, mock_st):
         """Test that an invalid lottery ID stops execution."""
         mock_st.session_state = {"matches_hu5": self.mock_match_count}
         wn = WinningNumbers('invalid', [1, 2, 3, 4, 5])
@@ -254,10 +304,10 @@ class TestWinningNumbersQueries(unittest.TestCase):
         self.assertEqual(results, [])
         self.assertEqual(total_draws, 0)
         self.assertEqual(winning_draws, 0)
-        mock_run_db_queries.assert_not_called()
+        mock_run_db_query.assert_not_called()
 
-    @patch('backend.WinningNumbers._run_db_queries')
-    def test_check_lottery_numbers_invalid_match_count(self, mock_run_db_queries, mock_st):
+    @patch('storage.PostgresStorage._run_db_query')
+    def test_check_lottery_numbers_invalid_match_count(self, mock_run_db_query, mock_st):
         """Test that an invalid lottery ID stops execution."""
         mock_st.session_state = {"matches_hu8": self.mock_match_count}
         wn = WinningNumbers('hu5', [1, 2, 3, 4, 5])
@@ -267,10 +317,10 @@ class TestWinningNumbersQueries(unittest.TestCase):
         self.assertEqual(results, [])
         self.assertEqual(total_draws, 0)
         self.assertEqual(winning_draws, 0)
-        mock_run_db_queries.assert_not_called()
+        mock_run_db_query.assert_not_called()
 
-    @patch('backend.WinningNumbers._run_db_queries')
-    def test_check_lottery_numbers_h5_invalid_numbers(self, mock_run_db_queries, mock_st):
+    @patch('storage.PostgresStorage._run_db_query')
+    def test_check_lottery_numbers_h5_invalid_numbers(self, mock_run_db_query, mock_st):
         """Test that invalid numbers stop execution."""
         mock_st.session_state = {"matches_hu5": self.mock_match_count}
         wn = WinningNumbers('hu5', [1, 2])  # Invalid length
@@ -280,10 +330,10 @@ class TestWinningNumbersQueries(unittest.TestCase):
         self.assertEqual(results, [])
         self.assertEqual(total_draws, 0)
         self.assertEqual(winning_draws, 0)
-        mock_run_db_queries.assert_not_called()
+        mock_run_db_query.assert_not_called()
 
-    @patch('backend.WinningNumbers._run_db_queries')
-    def test_check_lottery_numbers_h6_invalid_numbers(self, mock_run_db_queries, mock_st):
+    @patch('storage.PostgresStorage._run_db_query')
+    def test_check_lottery_numbers_h6_invalid_numbers(self, mock_run_db_query, mock_st):
         """Test that invalid numbers stop execution."""
         mock_st.session_state = {"matches_hu6": self.mock_match_count}
         wn = WinningNumbers('hu6', [1, 2, 3])  # Invalid length
@@ -293,10 +343,10 @@ class TestWinningNumbersQueries(unittest.TestCase):
         self.assertEqual(results, [])
         self.assertEqual(total_draws, 0)
         self.assertEqual(winning_draws, 0)
-        mock_run_db_queries.assert_not_called()
+        mock_run_db_query.assert_not_called()
 
-    @patch('backend.WinningNumbers._run_db_queries')
-    def test_check_lottery_numbers_h7_invalid_numbers(self, mock_run_db_queries, mock_st):
+    @patch('storage.PostgresStorage._run_db_query')
+    def test_check_lottery_numbers_h7_invalid_numbers(self, mock_run_db_query, mock_st):
         """Test that invalid numbers stop execution."""
         mock_st.session_state = {"matches_hu7": self.mock_match_count}
         wn = WinningNumbers('hu6', [1, 2, 3, 4])  # Invalid length
@@ -306,38 +356,80 @@ class TestWinningNumbersQueries(unittest.TestCase):
         self.assertEqual(results, [])
         self.assertEqual(total_draws, 0)
         self.assertEqual(winning_draws, 0)
-        mock_run_db_queries.assert_not_called()
+        mock_run_db_query.assert_not_called()
 
-    def test_run_db_queries_success(self, mock_st):
-        """Test the _run_db_queries helper method on success."""
-        mock_conn = MagicMock()
-        mock_df_matches = pd.DataFrame([(self.mock_date, [1, 2, 6, 7, 8], 2)])
-        mock_df_total = pd.DataFrame([100])
+    @patch('storage.PostgresStorage._run_db_query')
+    def test_check_lottery_histogram_hu5(self, mock_run_db_query, mock_st):
+        """Test the histogram rows of a single query are grouped by match count."""
+        # (date, [draw numbers], match count, draws at this match count, total draws)
+        mock_run_db_query.return_value = [
+            (self.mock_date, [6, 7, 8, 9, 10], 0, 40, 50),
+            (self.mock_date, [1, 2, 6, 7, 8], 2, 10, 50),
+        ]
+
+        wn = WinningNumbers('hu5', [1, 2, 3, 4, 5])
+        histogram, total_draws = wn.check_lottery_histogram()
+
+        mock_run_db_query.assert_called_once()
+        self.assertEqual(total_draws, 50)
+        self.assertEqual(histogram[0], (40, [("2023-01-01", [6, 7, 8, 9, 10], 0)]))
+        self.assertEqual(histogram[2], (10, [("2023-01-01", [1, 2, 6, 7, 8], 2)]))
+        self.assertEqual(histogram[5], (0, []))
+
+    @patch('storage.PostgresStorage._run_db_query')
+    def test_check_lottery_histogram_hu7(self, mock_run_db_query, mock_st):
+        """Test a hu7 date is listed at the level of both of its draws."""
+        # (date, [numbers A], match A, [numbers B], match B, level, draws at level, total draws)
+        row = (self.mock_date, [1, 2, 8, 9, 10, 11, 12], 2, [1, 2, 3, 13, 14, 15, 16], 3)
+        mock_run_db_query.return_value = [row + (2, 1, 50), row + (3, 1, 50)]
+
+        wn = WinningNumbers('hu7', [1, 2, 3, 4, 5, 6, 7])
+        histogram, total_draws = wn.check_lottery_histogram()
+
+        expected_row = ("2023-01-01", [1, 2, 8, 9, 10, 11, 12], 2, [1, 2, 3, 13, 14, 15, 16], 3)
+        self.assertEqual(total_draws, 50)
+        self.assertEqual(histogram[2], (1, [expected_row]))
+        self.assertEqual(histogram[3], (1, [expected_row]))
+        self.assertEqual(histogram[7], (0, []))
+
+    @patch('storage.PostgresStorage._run_db_query')
+    def test_check_lottery_histogram_invalid_numbers(self, mock_run_db_query, mock_st):
+        """Test that invalid numbers stop execution before the query."""
+        wn = WinningNumbers('hu5', [1, 2])
+        self.assertEqual(wn.check_lottery_histogram(), ({}, 0))
+        mock_run_db_query.assert_not_called()
+
+    @patch('storage.PostgresStorage._run_db_query')
+    def test_check_lottery_numbers_no_match(self, mock_run_db_query, mock_st):
+        """Test a query row without a draw only carries the counts."""
+        mock_run_db_query.return_value = [(None, None, None, 0, 50)]
 
-        mock_conn.query.side_effect = [mock_df_matches, mock_df_total]
+        mock_st.session_state = {"matches_hu5": 5}
+        wn = WinningNumbers('hu5', [1, 2, 3, 4, 5])
+        results, total_draws, winning_draws = wn.check_lottery_numbers()
+
+        self.assertEqual(results, [])
+        self.assertEqual(total_draws, 50)
+        self.assertEqual(winning_draws, 0)
+
+    def test_run_db_query_success(self, mock_st):
+        """Test the _run_db_query helper method sends a single query."""
+        mock_conn = MagicMock()
+        mock_conn.query.return_value = pd.DataFrame([(self.mock_date, [1, 2, 6, 7, 8], 2, 1, 100)])
         mock_st.connection.return_value = mock_conn
 
         mock_st.session_state = {"matches_hu5": 2}
         wn = WinningNumbers('hu5', [1, 2, 3, 4, 5])
 
-        results, total_draws = wn._run_db_queries(
-            "fake_match_query", {"p": 1}, "fake_total_query", {"p": 2}
-        )
-
-        expected_results = [(self.mock_date, [1, 2, 6, 7, 8], 2)]
-        self.assertEqual(results, expected_results)
-        self.assertEqual(total_draws, 100)
+        rows = wn._storage._run_db_query("fake_match_query", {"p": 1})
 
+        self.assertEqual(rows, [(self.mock_date, [1, 2, 6, 7, 8], 2, 1, 100)])
         mock_st.connection.assert_called_once_with("postgresql", type="sql")
-        self.assertEqual(mock_conn.query.call_count, 2)
-        mock_conn.query.assert_any_call("fake_match_query", params={"p": 1}, ttl="1m")
-        mock_conn.query.assert_any_call("fake_total_query", params={"p": 2}, ttl="1m")
-        self.assertEqual(results, expected_results)
-        self.assertEqual(total_draws, 100)
+        mock_conn.query.assert_called_once_with("fake_match_query", params={"p": 1}, ttl="1m")
 
-    def test_run_db_queries_db_error(self, mock_st):
+    def test_run_db_query_db_error(self, mock_st):
         """
-        Test that _run_db_queries catches a connection/query error
+        Test that _run_db_query catches a connection/query error
         raised by st.connection and returns empty results.
         """
         # 1. Mock st.connection().query to raise an exception
@@ -349,15 +441,15 @@ class TestWinningNumbersQueries(unittest.TestCase):
         mock_st.session_state = {"matches_hu5": 2}
         wn = WinningNumbers('hu5', [1, 2, 3, 4, 5])
 
-        # 3. Call the helper method directly
-        results, total_draws = wn._run_db_queries(
-            "fake_query", {}, "fake_query_total", {}
-        )
+        # 3. Call the helper method directly and split the (missing) totals
+        rows = wn._storage._run_db_query("fake_query", {})
+        results, total_draws, winning_draws = wn._storage._split_totals(rows)
 
         # 4. Assert it catches the error and returns empty results
+        self.assertEqual(rows, [])
         self.assertEqual(results, [])
         self.assertEqual(total_draws, 0)
-
+        self.assertEqual(winning_draws, 0)
 
 if __name__ == '__main__':
     unittest.main()
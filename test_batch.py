@@ -0,0 +1,75 @@
+import unittest
+import datetime
+
+import numpy as np
+
+from batch import BatchChecker, one_hot
+from benchmarks.synthetic import synthetic_history
+from engine import BitmaskEngine
+
+
+class TestBatchChecker(unittest.TestCase):
+    """Tests for the batch ticket checking API."""
+
+    def setUp(self):
+        """Create a small history and a checker over it."""
+        self.rows = synthetic_history(('hu5', 'hu7a', 'hu7b'), 30, seed=7, last_date=datetime.date(2023, 7, 23))
+        self.checker = BatchChecker(self.rows)
+        self.engine = BitmaskEngine(self.rows)
+
+    def test_one_hot(self):
+        """Test ball n sets column n - 1 and the 0 padding is dropped."""
+        np.testing.assert_array_equal(one_hot([[1, 3, 0]], 4), [[1, 0, 1, 0]])
+
+    def test_histograms_match_engine(self):
+        """Test every ticket's histogram equals the BitmaskEngine histogram, across chunks."""
+        tickets = {'hu5': [[1, 2, 3, 4, 5], [10, 20, 30, 40, 90], [5, 6, 7, 8, 9]],
+                   'hu7': [[1, 2, 3, 4, 5, 6, 7], [29, 30, 31, 32, 33, 34, 35]]}
+        for lottery_id, lottery_tickets in tickets.items():
+            with self.subTest(lottery_id=lottery_id):
+                histograms, wins = self.checker.check(lottery_id, lottery_tickets, chunk_size=2)
+                for ticket, ticket_histogram in zip(lottery_tickets, histograms):
+                    expected, _ = self.engine.histogram(lottery_id, ticket)
+                    self.assertEqual(ticket_histogram.tolist(), [expected[level][0] for level in sorted(expected)])
+
+    def test_chunk_counts_are_uint8(self):
+        """Test the chunk match counts are uint8, so a chunk holds its float32 product and a quarter more."""
+        tickets = self.checker._validate_tickets('hu7', [[1, 2, 3, 4, 5, 6, 7]])
+        for _, _, counts in self.checker._chunk_counts('hu7', tickets):
+            self.assertEqual([c.dtype for c in counts], [np.uint8, np.uint8])
+
+    def test_wins_hu5(self):
+        """Test hu5 wins are the draws with at least 2 matches."""
+        tickets = [[1, 2, 3, 4, 5], [10, 20, 30, 40, 90]]
+        histograms, wins = self.checker.check('hu5', tickets)
+        np.testing.assert_array_equal(wins, histograms[:, 2:].sum(axis=1))
+
+    def test_wins_hu7_either_draw(self):
+        """Test a hu7 date wins once if either draw has at least 4 matches."""
+        rows = [('hu7a', datetime.date(2023, 1, 1), [1, 2, 3, 4, 5, 6, 7]),
+                ('hu7b', datetime.date(2023, 1, 1), [1, 2, 3, 4, 5, 6, 8])]
+        histograms, wins = BatchChecker(rows).check('hu7', [[1, 2, 3, 4, 5, 6, 7]])
+        self.assertEqual(wins.tolist(), [1])
+        self.assertEqual(histograms[0, 7], 1)
+        self.assertEqual(histograms[0, 6], 1)
+
+    def test_empty_batch(self):
+        """Test an empty batch returns empty arrays of the right shape."""
+        histograms, wins = self.checker.check('hu5', np.empty((0, 5), dtype=int))
+        self.assertEqual(histograms.shape, (0, 6))
+        self.assertEqual(wins.shape, (0,))
+
+    def test_invalid_tickets(self):
+        """Test invalid lottery IDs, shapes, ranges and duplicates raise ValueError."""
+        invalid = [('hu8', [[1, 2, 3, 4, 5]]),
+                   ('hu5', [[1, 2, 3, 4]]),
+                   ('hu5', [[1, 2, 3, 4, 91]]),
+                   ('hu5', [[1, 1, 3, 4, 5]])]
+        for lottery_id, tickets in invalid:
+            with self.subTest(lottery_id=lottery_id, tickets=tickets):
+                with self.assertRaises(ValueError):
+                    self.checker.check(lottery_id, tickets)
+
+
+if __name__ == '__main__':
+    unittest.main()
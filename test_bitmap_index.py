@@ -0,0 +1,67 @@
+import unittest
+import datetime
+
+import numpy as np
+
+from bitmap_index import BitSlicedIndex, build_indexes
+from engine import BitmaskEngine
+
+
+class TestBitSlicedIndex(unittest.TestCase):
+    """Tests for the vertical bitmap index with bit-sliced counters."""
+
+    def setUp(self):
+        """Create a random hu5-shaped history that spans several 64-bit words."""
+        rng = np.random.default_rng(42)
+        self.draws = np.array([rng.choice(np.arange(1, 91), 5, replace=False) for _ in range(200)])
+        self.index = BitSlicedIndex(self.draws, 90)
+        self.ticket = [1, 2, 3, 4, 5]
+        self.expected = np.array([len(set(draw) & set(self.ticket)) for draw in self.draws])
+
+    def test_match_counts(self):
+        """Test the counts equal a plain set intersection for every draw."""
+        np.testing.assert_array_equal(self.index.match_counts(self.ticket), self.expected)
+
+    def test_count_and_matching_draws(self):
+        """Test every match level including 0 against the plain counts."""
+        for match_count in range(6):
+            with self.subTest(match_count=match_count):
+                self.assertEqual(self.index.count_matches(self.ticket, match_count),
+                                 int((self.expected == match_count).sum()))
+                np.testing.assert_array_equal(self.index.matching_draws(self.ticket, match_count),
+                                              np.flatnonzero(self.expected == match_count))
+
+    def test_level_masks(self):
+        """Test the masks of many tickets at once equal the single-ticket masks at every level."""
+        tickets = np.array([self.ticket, [10, 20, 30, 40, 50], [86, 87, 88, 89, 90]])
+        masks = self.index.level_masks(tickets)
+        self.assertEqual(masks.shape, (3, 6, 4))
+        for t, ticket in enumerate(tickets):
+            for match_count in range(6):
+                np.testing.assert_array_equal(masks[t, match_count], self.index.match_mask(ticket, match_count))
+        np.testing.assert_array_equal(np.bitwise_count(masks).sum(axis=(1, 2)), [200, 200, 200])
+
+    def test_empty_index(self):
+        """Test an index without draws returns empty results."""
+        index = BitSlicedIndex([], 45)
+        self.assertEqual(len(index.match_counts([1, 2, 3, 4, 5, 6])), 0)
+        self.assertEqual(index.count_matches([1, 2, 3, 4, 5, 6], 0), 0)
+
+    def test_build_indexes_matches_bitmask_engine(self):
+        """Test the indexes built per lottery_id agree with the BitmaskEngine, short draws included."""
+        rows = [
+            ('hu7a', datetime.date(2023, 1, 1), [7, 8, 13, 16, 20, 2]),  # 6-number draw
+            ('hu7a', datetime.date(2023, 1, 8), [1, 2, 3, 4, 5, 6, 7]),
+            ('hu6', datetime.date(2023, 1, 1), [1, 2, 7, 8, 9, 10]),
+        ]
+        indexes = build_indexes(rows)
+        engine = BitmaskEngine(rows)
+        for lottery_id, ticket in [('hu7a', [1, 2, 3, 7, 8, 9, 10]), ('hu6', [1, 2, 3, 4, 5, 6])]:
+            with self.subTest(lottery_id=lottery_id):
+                dates, index = indexes[lottery_id]
+                self.assertEqual(dates, sorted(dates, reverse=True))
+                self.assertEqual(index.match_counts(ticket).tolist(), engine.match_counts(lottery_id, ticket))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from cache import ResultCache
+
+
+class TestResultCache(unittest.TestCase):
+    """Tests for the canonical-key LRU result cache."""
+
+    def test_make_key_is_canonical(self):
+        """Test the order and type of the numbers do not change the key."""
+        self.assertEqual(ResultCache.make_key('hu5', {5, 3, 1, 2, 4}, 2),
+                         ResultCache.make_key('hu5', ['1', 2, 3, 4, 5], 2))
+        self.assertNotEqual(ResultCache.make_key('hu5', [1, 2, 3, 4, 5], 2),
+                            ResultCache.make_key('hu5', [1, 2, 3, 4, 5], 3))
+
+    def test_hits_and_misses(self):
+        """Test the counters follow the lookups."""
+        cache = ResultCache()
+        key = ResultCache.make_key('hu5', [1, 2, 3, 4, 5], 2)
+        self.assertIsNone(cache.get(key))
+        cache.put(key, ([], 50, 0))
+        self.assertEqual(cache.get(key), ([], 50, 0))
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_contains_keeps_counters(self):
+        """Test the membership check is not counted as a lookup."""
+        cache = ResultCache()
+        cache.put('a', 1)
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertEqual((cache.stats()['hits'], cache.stats()['misses']), (0, 0))
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted when the cache is full."""
+        cache = ResultCache(max_size=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')  # 'b' is now the least recently used
+        cache.put('c', 3)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.stats()['size'], 2)
+
+    def test_validate_clears_on_new_version(self):
+        """Test a new latest draw date empties the cache, the same one keeps it."""
+        cache = ResultCache()
+        cache.validate('2025-11-01')
+        cache.put('a', 1)
+        cache.validate('2025-11-01')
+        self.assertEqual(cache.get('a'), 1)
+        cache.validate('2025-11-08')
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.stats()['version'], '2025-11-08')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+import datetime
+import subprocess
+import sys
+from unittest.mock import MagicMock
+
+from cache import ResultCache
+from core import TicketChecker
+from metrics import Metrics
+from storage import EmbeddedStorage
+
+
+class TestTicketChecker(unittest.TestCase):
+    """Tests for the Streamlit-free ticket checker."""
+
+    def setUp(self):
+        """Create an embedded storage with two hu5 draws."""
+        self.storage = EmbeddedStorage([
+            ('hu5', datetime.date(2023, 1, 1), [1, 2, 6, 7, 8]),
+            ('hu5', datetime.date(2023, 1, 8), [1, 2, 3, 7, 90]),
+        ])
+
+    def test_check_lottery_numbers(self):
+        """Test the match count is an explicit parameter."""
+        checker = TicketChecker('hu5', {5, 4, 3, 2, 1}, self.storage, match_count=3)
+        self.assertEqual(checker.check_lottery_numbers(), ([("2023-01-08", [1, 2, 3, 7, 90], 3)], 2, 1))
+
+    def test_check_lottery_numbers_without_match_count(self):
+        """Test a missing match count returns empty results."""
+        checker = TicketChecker('hu5', [1, 2, 3, 4, 5], self.storage)
+        self.assertEqual(checker.check_lottery_numbers(), ([], 0, 0))
+
+    def test_check_lottery_numbers_pages(self):
+        """Test the pages of one row walk every winning draw once, newest first."""
+        checker = TicketChecker('hu5', [1, 2, 4, 5, 7], self.storage, match_count=3)
+        first, total_draws, winning_draws = checker.check_lottery_numbers(limit=1)
+        second, _, _ = checker.check_lottery_numbers(limit=1, before=first[-1][0])
+        last, _, _ = checker.check_lottery_numbers(limit=1, before=datetime.date(2023, 1, 1))
+
+        self.assertEqual((total_draws, winning_draws), (2, 2))
+        self.assertEqual([row[0] for row in first + second], ["2023-01-08", "2023-01-01"])
+        self.assertEqual(last, [])
+
+    def test_check_lottery_numbers_invalid_cursor(self):
+        """Test a cursor that is not a date returns empty results."""
+        checker = TicketChecker('hu5', [1, 2, 3, 4, 5], self.storage, match_count=2)
+        self.assertEqual(checker.check_lottery_numbers(before="08/01/2023"), ([], 0, 0))
+
+    def test_invalid_limit(self):
+        """Test a page size that is not a positive int returns empty results on every storage."""
+        checker = TicketChecker('hu5', [1, 2, 3, 4, 5], self.storage, match_count=2)
+        for limit in (-1, 0, '3', 2.5, True):
+            with self.subTest(limit=limit):
+                self.assertEqual(checker.check_lottery_numbers(limit=limit), ([], 0, 0))
+                self.assertEqual(checker.check_lottery_histogram(limit=limit), ({}, 0))
+
+    def test_check_lottery_histogram_cache(self):
+        """Test the histogram is cached against the storage's latest draw date."""
+        cache = ResultCache()
+        first = TicketChecker('hu5', [1, 2, 3, 4, 5], self.storage, cache=cache).check_lottery_histogram()
+        second = TicketChecker('hu5', [5, 4, 3, 2, 1], self.storage, cache=cache).check_lottery_histogram()
+        self.assertEqual(first, second)
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['version'], datetime.date(2023, 1, 8))
+
+    def test_cache_counts_each_lookup_once(self):
+        """Test a miss and a hit count one lookup each, and a miss queries the storage once."""
+        storage = MagicMock()
+        storage.latest_draw_date.return_value = datetime.date(2023, 1, 8)
+        storage.histogram.return_value = ({}, 2)
+        cache = ResultCache()
+        for _ in range(2):
+            self.assertEqual(TicketChecker('hu5', [1, 2, 3, 4, 5], storage, cache=cache).check_lottery_histogram(), ({}, 2))
+        self.assertEqual(storage.histogram.call_count, 1)
+        self.assertEqual((cache.stats()['hits'], cache.stats()['misses']), (1, 1))
+
+    def test_check_lottery_windows(self):
+        """Test the windows of a ticket are built once and answered from the cache."""
+        cache = ResultCache()
+        windows, total_draws = TicketChecker('hu5', [1, 2, 3, 4, 5], self.storage, cache=cache).check_lottery_windows()
+        self.assertEqual(total_draws, 2)
+        self.assertEqual(windows.window(datetime.date(2023, 1, 2))[1][3], 1)
+        self.assertIs(TicketChecker('hu5', [5, 4, 3, 2, 1], self.storage, cache=cache).check_lottery_windows()[0], windows)
+        self.assertEqual(TicketChecker('hu5', [1, 2, 3], self.storage).check_lottery_windows(), (None, 0))
+
+    def test_metrics(self):
+        """Test the validation and lookup stages, the cache lookups and the validation errors are recorded."""
+        cache, metrics = ResultCache(), Metrics()
+        for _ in range(2):
+            TicketChecker('hu5', [1, 2, 3, 4, 5], self.storage, 2, cache, metrics).check_lottery_numbers()
+        TicketChecker('hu5', [1, 2, 3, 4], self.storage, 2, cache, metrics).check_lottery_numbers()
+        TicketChecker('xx', [1, 2, 3, 4, 5], self.storage, cache=cache, metrics=metrics).check_lottery_histogram()
+
+        self.assertEqual(metrics.value('lottery_stage_seconds', stage='validation', lottery='hu5')[0], 3)
+        self.assertEqual(metrics.value('lottery_stage_seconds', stage='lookup', lottery='hu5')[0], 1)
+        self.assertEqual(metrics.value('lottery_cache_requests_total', result='miss', lottery='hu5'), 1)
+        self.assertEqual(metrics.value('lottery_cache_requests_total', result='hit', lottery='hu5'), 1)
+        self.assertEqual(metrics.value('lottery_errors_total', stage='validation', lottery='hu5'), 1)
+        self.assertEqual(metrics.value('lottery_errors_total', stage='validation', lottery='invalid'), 1)
+
+    def test_import_without_streamlit(self):
+        """Test the core, the storages and the cache import without Streamlit, pandas or the metrics HTTP server."""
+        code = ("import sys, core, storage, cache, metrics; "
+                "print('streamlit' in sys.modules, 'pandas' in sys.modules, 'http.server' in sys.modules)")
+        completed = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        self.assertEqual(completed.stdout.strip(), "False False False")
+
+
+if __name__ == '__main__':
+    unittest.main()
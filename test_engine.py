@@ -0,0 +1,105 @@
+import unittest
+import datetime
+
+from engine import BitmaskEngine, numbers_to_bit_string, numbers_to_mask
+
+
+class TestBitmaskEngine(unittest.TestCase):
+    """Tests for the in-memory bitmask match engine."""
+
+    def setUp(self):
+        """Create a small history with two draws per lottery."""
+        self.old_date = datetime.date(2023, 1, 1)
+        self.new_date = datetime.date(2023, 1, 8)
+        self.rows = [
+            ('hu5', self.old_date, [1, 2, 6, 7, 8]),
+            ('hu5', self.new_date, [1, 2, 3, 7, 90]),
+            ('hu6', self.old_date, [1, 2, 7, 8, 9, 10]),
+            ('hu6', self.new_date, [40, 41, 42, 43, 44, 45]),
+            ('hu7a', self.old_date, [1, 2, 8, 9, 10, 11, 12]),
+            ('hu7a', self.new_date, [20, 21, 22, 23, 24, 25, 26]),
+            ('hu7b', self.old_date, [1, 2, 3, 13, 14, 15, 16]),
+            ('hu7b', self.new_date, [1, 2, 27, 28, 29, 30, 35]),
+        ]
+        self.engine = BitmaskEngine(self.rows)
+
+    def test_numbers_to_mask(self):
+        """Test that number n sets bit n - 1."""
+        self.assertEqual(numbers_to_mask([1, 3]), 0b101)
+        self.assertEqual(numbers_to_mask([90]), 1 << 89)
+
+    def test_numbers_to_bit_string(self):
+        """Test the bit string matches the BIT(90) draw.mask layout, ball n at position n."""
+        bits = numbers_to_bit_string([1, 3, 90])
+        self.assertEqual(len(bits), 90)
+        self.assertEqual(bits[:3], '101')
+        self.assertEqual(bits[-1], '1')
+        self.assertEqual(bits.count('1'), 3)
+
+    def test_latest_draw_date(self):
+        """Test the newest draw date over every lottery is the data version."""
+        self.assertEqual(self.engine.latest_draw_date(), self.new_date)
+        self.assertIsNone(BitmaskEngine([]).latest_draw_date())
+
+    def test_match_counts_newest_first(self):
+        """Test match counts are returned in draw_date DESC order."""
+        self.assertEqual(self.engine.match_counts('hu5', [1, 2, 3, 4, 5]), [3, 2])
+
+    def test_check_hu5(self):
+        """Test the hu5 output has the same format as the SQL path."""
+        results, total_draws, winning_draws = self.engine.check('hu5', [1, 2, 3, 4, 5], 2)
+        self.assertEqual(results, [("2023-01-01", [1, 2, 6, 7, 8], 2)])
+        self.assertEqual(total_draws, 2)
+        self.assertEqual(winning_draws, 1)
+
+    def test_check_hu6_no_match(self):
+        """Test a match count that never happened returns empty results with the total."""
+        results, total_draws, winning_draws = self.engine.check('hu6', [1, 2, 3, 4, 5, 6], 6)
+        self.assertEqual(results, [])
+        self.assertEqual(total_draws, 2)
+        self.assertEqual(winning_draws, 0)
+
+    def test_check_hu7_either_draw(self):
+        """Test a hu7 date wins if either the mechanical or the manual draw matches."""
+        results, total_draws, winning_draws = self.engine.check('hu7', [1, 2, 3, 4, 5, 6, 7], 2)
+        expected_results = [
+            ("2023-01-08", [20, 21, 22, 23, 24, 25, 26], 0, [1, 2, 27, 28, 29, 30, 35], 2),
+            ("2023-01-01", [1, 2, 8, 9, 10, 11, 12], 2, [1, 2, 3, 13, 14, 15, 16], 3),
+        ]
+        self.assertEqual(results, expected_results)
+        self.assertEqual(total_draws, 2)
+        self.assertEqual(winning_draws, 2)
+
+    def test_check_limit(self):
+        """Test that only the newest rows up to the limit are formatted."""
+        results, _, winning_draws = self.engine.check('hu7', [1, 2, 3, 4, 5, 6, 7], 2, limit=1)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0][0], "2023-01-08")
+        self.assertEqual(winning_draws, 2)
+
+    def test_histogram_hu5(self):
+        """Test every match level is counted with its latest rows in one call."""
+        histogram, total_draws = self.engine.histogram('hu5', [1, 2, 3, 4, 5])
+        self.assertEqual(total_draws, 2)
+        self.assertEqual(sorted(histogram), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(histogram[2], (1, [("2023-01-01", [1, 2, 6, 7, 8], 2)]))
+        self.assertEqual(histogram[3], (1, [("2023-01-08", [1, 2, 3, 7, 90], 3)]))
+        self.assertEqual(histogram[5], (0, []))
+
+    def test_histogram_agrees_with_check(self):
+        """Test every level of the hu7 histogram equals a separate check call."""
+        numbers = [1, 2, 3, 4, 5, 6, 7]
+        histogram, total_draws = self.engine.histogram('hu7', numbers)
+        for match_count in range(1, 8):
+            with self.subTest(match_count=match_count):
+                results, total, winning_draws = self.engine.check('hu7', numbers, match_count)
+                self.assertEqual(histogram[match_count], (winning_draws, results))
+                self.assertEqual(total_draws, total)
+
+    def test_check_unknown_lottery(self):
+        """Test an empty engine returns empty results."""
+        self.assertEqual(BitmaskEngine([]).check('hu5', [1, 2, 3, 4, 5], 1), ([], 0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+import datetime
+from unittest.mock import MagicMock
+
+from ingest import (SCHEMA_QUERY, copy_buffer, copy_pairs_buffer, ingest, new_draws, pair_hu7_rows,
+                    schema_is_current, validate_rows)
+
+
+class TestIngest(unittest.TestCase):
+    """Tests for the incremental COPY ingest."""
+
+    def setUp(self):
+        """Create CSV rows of two lotteries, newest first like the CSVs."""
+        self.rows = [
+            ('hu5', datetime.date(2023, 1, 15), [1, 2, 3, 4, 5]),
+            ('hu5', datetime.date(2023, 1, 8), [6, 7, 8, 9, 10]),
+            ('hu5', datetime.date(2023, 1, 1), [11, 12, 13, 14, 15]),
+            ('hu6', datetime.date(2023, 1, 12), [1, 2, 3, 4, 5, 6]),
+        ]
+
+    def test_schema_is_current(self):
+        """Test the ingest checks for the draw.mask column and the draw_hu7 table of the current schema."""
+        cursor = MagicMock()
+        cursor.fetchone.return_value = (False,)
+        self.assertFalse(schema_is_current(cursor))
+        cursor.execute.assert_called_once_with(SCHEMA_QUERY)
+        cursor.fetchone.return_value = (True,)
+        self.assertTrue(schema_is_current(cursor))
+
+    def test_validate_rows(self):
+        """Test rows breaking the DRAW_RULES of their lottery are reported, valid ones are not."""
+        self.assertEqual(validate_rows(self.rows), [])
+        date = datetime.date(2023, 1, 22)
+        self.assertEqual(validate_rows([
+            ('hu5', date, [1, 2, 3, 4]),
+            ('hu6', date, [1, 2, 3, 4, 5, 46]),
+            ('hu7a', date, [1, 2, 3, 4, 5, 6, 6]),
+            ('hu5', datetime.date(2023, 1, 15), [1, 2, 3, 4, 5]),
+            ('hu5', datetime.date(2023, 1, 15), [1, 2, 3, 4, 5]),
+            ('xx', date, [1]),
+        ]), [
+            "hu5 2023-01-22: not 5 numbers",
+            "hu6 2023-01-22: number outside 1..45",
+            "hu7a 2023-01-22: repeated number",
+            "hu5 2023-01-15: repeated date",
+            "xx 2023-01-22: unknown lottery_id",
+        ])
+
+    def test_new_draws(self):
+        """Test only draws after the latest stored date are kept, oldest first."""
+        rows = new_draws(self.rows, {'hu5': datetime.date(2023, 1, 1), 'hu6': datetime.date(2023, 1, 12)})
+        self.assertEqual([row[1] for row in rows], [datetime.date(2023, 1, 8), datetime.date(2023, 1, 15)])
+
+    def test_new_draws_empty_lottery(self):
+        """Test a lottery_id without stored draws gets every row."""
+        rows = new_draws(self.rows, {'hu5': datetime.date(2023, 1, 15)})
+        self.assertEqual(rows, [self.rows[3]])
+
+    def test_new_draws_unpaired_hu7_date(self):
+        """Test a hu7 date with one draw stays new after a later paired date was stored."""
+        rows = [
+            ('hu7a', datetime.date(2023, 1, 18), [1, 2, 3, 4, 5, 6, 7]),
+            ('hu7b', datetime.date(2023, 1, 18), [8, 9, 10, 11, 12, 13, 14]),
+            ('hu7a', datetime.date(2023, 1, 11), [1, 2, 3, 4, 5, 6, 8]),
+            ('hu7b', datetime.date(2023, 1, 11), [1, 2, 3, 4, 5, 6, 9]),
+        ]
+        # The first run stored 2023-01-18, 2023-01-11 only had its hu7a draw then.
+        new = new_draws(rows, {}, hu7_dates=[datetime.date(2023, 1, 18)])
+        self.assertEqual(new, [rows[2], rows[3]])
+        self.assertEqual(pair_hu7_rows(new)[1], [(datetime.date(2023, 1, 11), [1, 2, 3, 4, 5, 6, 8], [1, 2, 3, 4, 5, 6, 9])])
+
+    def test_copy_buffer(self):
+        """Test the COPY text format of the rows."""
+        self.assertEqual(copy_buffer(self.rows[3:]).read(), "hu6\t2023-01-12\t{1,2,3,4,5,6}\n")
+
+    def test_pair_hu7_rows(self):
+        """Test the hu7 draws of a date become one pair, a date with one draw is left out."""
+        rows = self.rows[3:] + [
+            ('hu7a', datetime.date(2023, 1, 11), [1, 2, 3, 4, 5, 6, 7]),
+            ('hu7b', datetime.date(2023, 1, 11), [8, 9, 10, 11, 12, 13, 14]),
+            ('hu7a', datetime.date(2023, 1, 18), [1, 2, 3, 4, 5, 6, 8]),
+        ]
+        draw_rows, pairs, unpaired = pair_hu7_rows(rows)
+        self.assertEqual(draw_rows, self.rows[3:])
+        self.assertEqual(pairs, [(datetime.date(2023, 1, 11), [1, 2, 3, 4, 5, 6, 7], [8, 9, 10, 11, 12, 13, 14])])
+        self.assertEqual(unpaired, rows[-1:])
+        self.assertEqual(copy_pairs_buffer(pairs).read(), "2023-01-11\t{1,2,3,4,5,6,7}\t{8,9,10,11,12,13,14}\n")
+
+    def test_ingest_pairs(self):
+        """Test hu7 pairs go into draw_hu7 in the same transaction as the draw rows."""
+        connection = MagicMock()
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.rowcount = 1
+
+        pairs = [(datetime.date(2023, 1, 11), [1, 2, 3, 4, 5, 6, 7], [8, 9, 10, 11, 12, 13, 14])]
+        self.assertEqual(ingest(connection, self.rows[3:], pairs), 2)
+        self.assertIn("ON CONFLICT (draw_date) DO NOTHING", cursor.execute.call_args.args[0])
+        self.assertEqual(cursor.copy_expert.call_count, 2)
+        connection.commit.assert_called_once()
+
+    def test_ingest_commits(self):
+        """Test the rows are copied and inserted in one committed transaction."""
+        connection = MagicMock()
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.rowcount = 1
+
+        self.assertEqual(ingest(connection, self.rows[3:]), 1)
+        self.assertIn("ON CONFLICT (lottery_id, draw_date) DO NOTHING", cursor.execute.call_args.args[0])
+        cursor.copy_expert.assert_called_once()
+        connection.commit.assert_called_once()
+        connection.rollback.assert_not_called()
+
+    def test_ingest_rolls_back(self):
+        """Test a failing COPY leaves the draw table unchanged."""
+        connection = MagicMock()
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.copy_expert.side_effect = Exception("Mocked COPY failure")
+
+        with self.assertRaises(Exception):
+            ingest(connection, self.rows)
+        connection.rollback.assert_called_once()
+        connection.commit.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
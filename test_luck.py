@@ -0,0 +1,116 @@
+import unittest
+import datetime
+import os
+import tempfile
+import threading
+from unittest.mock import patch
+
+import numpy as np
+
+from batch import BatchChecker
+from benchmarks.synthetic import synthetic_history
+from luck import BaselineLoader, MonteCarloBaseline, baseline_path, load_baseline, random_tickets
+from search import WIN_TIER
+
+
+class TestMonteCarloBaseline(unittest.TestCase):
+    """Tests for the Monte Carlo baseline of random tickets."""
+
+    def setUp(self):
+        """Create a small hu5 and hu7 history."""
+        self.rows = synthetic_history(('hu5', 'hu7a', 'hu7b'), 40, seed=22, last_date=datetime.date(2023, 10, 1))
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'baseline_hu5.npz')
+
+    def test_random_tickets(self):
+        """Test random tickets are sorted, distinct and cover every number of the lottery."""
+        tickets = random_tickets('hu7', 5000, np.random.default_rng(0))
+        self.assertEqual(tickets.shape, (5000, 7))
+        self.assertTrue((np.diff(tickets, axis=1) > 0).all())
+        self.assertEqual(set(np.unique(tickets).tolist()), set(range(1, 36)))
+
+    @patch('luck.CHUNK_SIZE', 300)
+    def test_seeded_and_independent_of_workers(self):
+        """Test the same seed gives the same distribution in one process and across a pool, another seed differs."""
+        single = MonteCarloBaseline(self.rows, 'hu7', seed=3).run(1000, workers=1)
+        pooled = MonteCarloBaseline(self.rows, 'hu7', seed=3).run(1000, workers=2)
+        other = MonteCarloBaseline(self.rows, 'hu7', seed=4).run(1000, workers=1)
+
+        np.testing.assert_array_equal(single.distribution, pooled.distribution)
+        self.assertFalse(np.array_equal(single.distribution, other.distribution))
+        self.assertEqual(single.distribution.sum(axis=1).tolist(), [1000] * len(single.tiers))
+
+    def test_rank_matches_batch_checker(self):
+        """Test a ticket is ranked by its level and win counts of the BatchChecker."""
+        baseline = MonteCarloBaseline(self.rows, 'hu5').run(2000, workers=1)
+        ticket = [3, 14, 15, 65, 90]
+        histograms, wins = BatchChecker(self.rows).check('hu5', [ticket])
+        ranks = baseline.rank(ticket)
+
+        self.assertEqual([ranks[level][0] for level in range(6)], histograms[0].tolist())
+        self.assertEqual(ranks[WIN_TIER][0], wins[0])
+        self.assertEqual(ranks[WIN_TIER][1], baseline.percentile(WIN_TIER, wins[0]))
+
+    def test_percentile_counts_ties_as_half(self):
+        """Test the mid-rank percentile of a hand-made distribution."""
+        baseline = MonteCarloBaseline(self.rows, 'hu5')
+        baseline.distribution[-1, :3] = [2, 4, 4]
+        baseline.samples = 10
+        self.assertEqual(baseline.percentile(WIN_TIER, 0), 0.1)
+        self.assertEqual(baseline.percentile(WIN_TIER, 1), 0.4)
+        self.assertEqual(baseline.percentile(WIN_TIER, 3), 1.0)
+        self.assertAlmostEqual(baseline.mean(WIN_TIER), 1.2)
+
+    def test_saved_baseline_is_tied_to_the_history(self):
+        """Test a saved baseline is reused on the same history only, and recomputed for more samples."""
+        first = load_baseline(self.rows, 'hu5', samples=500, workers=1, path=self.path)
+        with patch.object(MonteCarloBaseline, 'run') as run:
+            second = load_baseline(self.rows, 'hu5', samples=500, workers=1, path=self.path)
+        run.assert_not_called()
+        np.testing.assert_array_equal(first.distribution, second.distribution)
+
+        newer = self.rows + [('hu5', datetime.date(2024, 1, 1), [1, 2, 3, 4, 5])]
+        self.assertFalse(MonteCarloBaseline(newer, 'hu5').load(self.path))
+        self.assertFalse(MonteCarloBaseline(self.rows, 'hu5', seed=1).load(self.path))
+        self.assertFalse(MonteCarloBaseline(self.rows, 'hu5').load(self.path, samples=600))
+        self.assertFalse(MonteCarloBaseline(self.rows, 'hu5').load(self.path + '.missing'))
+
+    def test_baseline_dir_from_environment(self):
+        """Test the baseline files are kept in LOTTERY_BASELINE_DIR if it is set."""
+        directory = os.path.dirname(self.path)
+        with patch.dict(os.environ, {'LOTTERY_BASELINE_DIR': directory}):
+            self.assertEqual(baseline_path('hu5'), self.path)
+
+    def test_loader_computes_in_the_background(self):
+        """Test a missing baseline is computed in a thread, saved and then returned without the history."""
+        loader = BaselineLoader(samples=500)
+        with patch.dict(os.environ, {'LOTTERY_BASELINE_DIR': os.path.dirname(self.path)}):
+            self.assertIsNone(loader.get('hu5', 'v1', lambda: self.rows))
+            for thread in threading.enumerate():
+                if thread.name == 'luck-hu5':
+                    thread.join()
+            baseline = loader.get('hu5', 'v1', self.fail)
+            self.assertEqual(baseline.samples, 500)
+            self.assertTrue(MonteCarloBaseline(self.rows, 'hu5').load(self.path, 500))
+
+    def test_loader_reads_a_saved_baseline(self):
+        """Test a baseline file of the same history is read in the request, a stale one is recomputed."""
+        saved = load_baseline(self.rows, 'hu5', samples=500, workers=1, path=self.path)
+        loader = BaselineLoader(samples=500)
+        newer = self.rows + [('hu5', datetime.date(2024, 1, 1), [1, 2, 3, 4, 5])]
+        with patch.dict(os.environ, {'LOTTERY_BASELINE_DIR': os.path.dirname(self.path)}), \
+                patch('luck.threading.Thread') as thread:
+            baseline = loader.get('hu5', 'v1', lambda: self.rows)
+            np.testing.assert_array_equal(baseline.distribution, saved.distribution)
+            thread.assert_not_called()
+
+            self.assertIsNone(loader.get('hu5', 'v2', lambda: newer))
+            thread.assert_called_once()
+            self.assertIsNone(loader.get('hu5', 'v2', self.fail))
+            thread.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+import os
+import tempfile
+import urllib.request
+
+from metrics import Metrics, serve_metrics, write_metrics
+
+
+class TestMetrics(unittest.TestCase):
+    """Tests for the counters, the duration histograms and their Prometheus text exposition."""
+
+    def setUp(self):
+        """Create metrics with three bucket bounds."""
+        self.metrics = Metrics(buckets=(0.01, 0.1, 1.0))
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test every observation counts in its bucket and in every larger one."""
+        for seconds in (0.005, 0.05, 0.05, 2.0):
+            self.metrics.observe('lottery_stage_seconds', seconds, stage='query', lottery='hu5')
+        text = self.metrics.render()
+
+        for bound, count in (('0.01', 1), ('0.1', 3), ('1.0', 3), ('+Inf', 4)):
+            self.assertIn(f'lottery_stage_seconds_bucket{{lottery="hu5",stage="query",le="{bound}"}} {count}\n', text)
+        self.assertIn('lottery_stage_seconds_count{lottery="hu5",stage="query"} 4\n', text)
+        self.assertIn('lottery_stage_seconds_sum{lottery="hu5",stage="query"} 2.105000\n', text)
+        self.assertIn("# TYPE lottery_stage_seconds histogram\n", text)
+
+    def test_counters(self):
+        """Test the cache and error counters are kept per label set."""
+        self.metrics.cache_request(True, 'hu5')
+        self.metrics.cache_request(True, 'hu5')
+        self.metrics.cache_request(False, 'hu7')
+        self.metrics.error('query', 'hu6')
+        text = self.metrics.render()
+
+        self.assertIn('lottery_cache_requests_total{lottery="hu5",result="hit"} 2\n', text)
+        self.assertIn('lottery_cache_requests_total{lottery="hu7",result="miss"} 1\n', text)
+        self.assertIn('lottery_errors_total{lottery="hu6",stage="query"} 1\n', text)
+        self.assertEqual(self.metrics.value('lottery_errors_total', lottery='hu6', stage='query'), 1)
+
+    def test_time_records_when_raising(self):
+        """Test a failing with block is timed too."""
+        with self.assertRaises(ValueError):
+            with self.metrics.time('lookup', 'hu5'):
+                raise ValueError
+        self.assertEqual(self.metrics.value('lottery_stage_seconds', stage='lookup', lottery='hu5')[0], 1)
+
+    def test_label_values_are_escaped(self):
+        """Test quotes and backslashes in a label value keep the line parseable."""
+        self.metrics.error('validation', 'a"b\\c')
+        self.assertIn('lottery_errors_total{lottery="a\\"b\\\\c",stage="validation"} 1\n', self.metrics.render())
+
+    def test_unknown_lottery_label(self):
+        """Test a stage without a known lottery id is labelled 'unknown', not 'None'."""
+        with self.metrics.time('query', None):
+            pass
+        self.metrics.error('query', None)
+        text = self.metrics.render()
+        self.assertIn('lottery_errors_total{lottery="unknown",stage="query"} 1\n', text)
+        self.assertNotIn('"None"', text)
+
+    def test_unknown_metric(self):
+        """Test a metric missing from METRICS is rejected."""
+        with self.assertRaises(KeyError):
+            self.metrics.inc('lottery_typo_total')
+
+    def test_write_metrics(self):
+        """Test the metrics file holds the rendered text."""
+        self.metrics.error('query', 'hu5')
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'lottery.prom')
+            write_metrics(self.metrics, path)
+            with open(path) as f:
+                self.assertEqual(f.read(), self.metrics.render())
+            self.assertEqual(os.listdir(directory), ['lottery.prom'])
+
+    def test_serve_metrics(self):
+        """Test the HTTP endpoint serves the text format at /metrics only."""
+        self.metrics.error('query', 'hu5')
+        server = serve_metrics(self.metrics, 0, host='127.0.0.1')
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+
+        with urllib.request.urlopen(f"{url}/metrics", timeout=5) as response:
+            self.assertEqual(response.headers['Content-Type'], 'text/plain; version=0.0.4; charset=utf-8')
+            self.assertEqual(response.read().decode(), self.metrics.render())
+        with self.assertRaises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"{url}/other", timeout=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+import datetime
+
+import numpy as np
+
+from benchmarks.synthetic import synthetic_history
+from engine import BitmaskEngine
+from payout import PayoutSimulator, prize_vector
+
+
+class TestPayoutSimulator(unittest.TestCase):
+    """Tests for the prize and ROI simulator."""
+
+    def setUp(self):
+        """Create a small history of hu5 and paired hu7 draws."""
+        self.rows = synthetic_history(('hu5', 'hu7a', 'hu7b'), 30, seed=21, last_date=datetime.date(2023, 7, 23))
+        self.prizes = {'hu5': {1: 10, 2: 100, 3: 1000}, 'hu7a': {2: 5, 3: 50}, 'hu7b': {2: 7, 3: 70}}
+        self.simulator = PayoutSimulator(self.rows, self.prizes, {'hu5': 20, 'hu7': 30})
+        self.engine = BitmaskEngine(self.rows)
+
+    def expected_payouts(self, lottery_id, ticket):
+        """Return the prize of a ticket at every draw, oldest first, from the BitmaskEngine match counts."""
+        draw_ids = ['hu7a', 'hu7b'] if lottery_id == 'hu7' else [lottery_id]
+        payouts = 0
+        for draw_id in draw_ids:
+            counts = self.engine.match_counts(draw_id, ticket)[::-1]
+            payouts = payouts + np.array([self.prizes[draw_id].get(count, 0) for count in counts])
+        return payouts
+
+    def test_prize_vector(self):
+        """Test the prize table becomes an array indexed by the match count."""
+        np.testing.assert_array_equal(prize_vector({2: 100, 5: 9}, 5), [0, 0, 100, 0, 0, 9])
+
+    def test_simulate_matches_engine(self):
+        """Test the totals of a batch equal the per-draw prizes of the engine's match counts, across chunks."""
+        tickets = {'hu5': [[1, 2, 3, 4, 5], [10, 20, 30, 40, 90], [5, 6, 7, 8, 9]],
+                   'hu7': [[1, 2, 3, 4, 5, 6, 7], [29, 30, 31, 32, 33, 34, 35]]}
+        for lottery_id, lottery_tickets in tickets.items():
+            with self.subTest(lottery_id=lottery_id):
+                simulation = self.simulator.simulate(lottery_id, lottery_tickets, chunk_size=2)
+                stake = {'hu5': 20, 'hu7': 30}[lottery_id] * 30
+                self.assertEqual(simulation['stake'], stake)
+                for i, ticket in enumerate(lottery_tickets):
+                    winnings = self.expected_payouts(lottery_id, ticket).sum()
+                    self.assertEqual(simulation['winnings'][i], winnings)
+                    self.assertAlmostEqual(simulation['roi'][i], (winnings - stake) / stake)
+
+    def test_hu7_pools_are_paid_separately(self):
+        """Test a hu7 date pays the prize of both draws, each from its own pool."""
+        rows = [('hu7a', datetime.date(2023, 1, 1), [1, 2, 3, 10, 11, 12, 13]),
+                ('hu7b', datetime.date(2023, 1, 1), [1, 2, 3, 20, 21, 22, 23])]
+        simulation = PayoutSimulator(rows, self.prizes).simulate('hu7', [[1, 2, 3, 4, 5, 6, 7]])
+
+        self.assertEqual(simulation['pool_winnings']['hu7a'].tolist(), [50])
+        self.assertEqual(simulation['pool_winnings']['hu7b'].tolist(), [70])
+        self.assertEqual(simulation['winnings'].tolist(), [120])
+        self.assertEqual(simulation['tiers']['hu7b'].tolist(), [[0, 0, 0, 1, 0, 0, 0, 0]])
+
+    def test_timeline(self):
+        """Test the cumulative stake and winnings run oldest first and end at the simulated totals."""
+        ticket = [1, 2, 3, 4, 5, 6, 7]
+        timeline = self.simulator.timeline('hu7', [ticket])
+        simulation = self.simulator.simulate('hu7', [ticket])
+
+        self.assertEqual(timeline['dates'][0], datetime.date(2023, 1, 1))
+        np.testing.assert_array_equal(timeline['stake'], 30 * np.arange(1, 31))
+        np.testing.assert_array_equal(timeline['winnings'][0], np.cumsum(self.expected_payouts('hu7', ticket)))
+        self.assertEqual(timeline['winnings'][0, -1], simulation['winnings'][0])
+        self.assertAlmostEqual(timeline['roi'][0, -1], simulation['roi'][0])
+
+    def test_invalid_tickets(self):
+        """Test invalid tickets raise ValueError like the batch checker."""
+        with self.assertRaises(ValueError):
+            self.simulator.simulate('hu5', [[1, 2, 3, 4, 91]])
+        with self.assertRaises(ValueError):
+            self.simulator.timeline('hu6x', [[1, 2, 3, 4, 5, 6]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+
+from planner import CONTAINMENT, EQUALITY, SCAN, candidate_share, choose_strategy, ticket_subsets
+
+
+class TestPlanner(unittest.TestCase):
+    """Tests for the check query planner."""
+
+    def test_candidate_share(self):
+        """Test the share of draws with at least match_count of a ticket's numbers."""
+        self.assertAlmostEqual(candidate_share('hu5', 0), 1.0)
+        self.assertAlmostEqual(candidate_share('hu5', 5), 1 / 43_949_268)
+        # A hu7 date is a candidate if either of its draws is.
+        self.assertAlmostEqual(candidate_share('hu7', 7), 1 - (1 - 1 / 6_724_520) ** 2)
+
+    def test_choose_strategy(self):
+        """Test the plan of every (lottery_id, match_count)."""
+        self.assertEqual([choose_strategy('hu5', m) for m in range(6)],
+                         [SCAN, CONTAINMENT, CONTAINMENT, CONTAINMENT, CONTAINMENT, EQUALITY])
+        self.assertEqual([choose_strategy('hu6', m) for m in range(7)],
+                         [SCAN, SCAN, SCAN, SCAN, SCAN, CONTAINMENT, EQUALITY])
+        self.assertEqual([choose_strategy('hu7', m) for m in range(8)], [SCAN] * 7 + [EQUALITY])
+
+    def test_ticket_subsets(self):
+        """Test the sorted subsets of a ticket."""
+        self.assertEqual(ticket_subsets([5, 3, 1], 2), [[1, 3], [1, 5], [3, 5]])
+        self.assertEqual(ticket_subsets([5, 3, 1], 3), [[1, 3, 5]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+import os
+import tempfile
+
+from engine import DRAW_RULES
+from refine import read_lottery_rules, refine_hu7, refine_lottery, to_sql, validate_draws
+from storage import read_draws_frame
+
+
+class TestRefine(unittest.TestCase):
+    """Tests for the refine pipeline of the data_refining CSVs."""
+
+    def setUp(self):
+        """Create a temporary directory for the CSVs and the txt files."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write_csv(self, text):
+        """Write a hu6 CSV and return its path."""
+        path = os.path.join(self.directory.name, 'draw_numbers_hu6.csv')
+        with open(path, 'w') as f:
+            f.write("date,lottery_id,n1,n2,n3,n4,n5,n6,\n" + text)
+        return path
+
+    def test_lottery_rules_match_draw_rules(self):
+        """Test the lottery table of lottery.sql defines the same lotteries as the engine."""
+        self.assertEqual(read_lottery_rules(), DRAW_RULES)
+
+    def test_valid_csv_to_sql(self):
+        """Test the txt of a valid CSV, with filled dates and without the old bonus number."""
+        path = self.write_csv("2023.01.15.,hu6,1,2,3,4,5,6,\n"
+                              ",hu6,7,8,9,10,11,45,20\n")
+        self.assertEqual(refine_lottery('hu6', path, DRAW_RULES['hu6'], self.directory.name), ('hu6', 2, []))
+
+        with open(os.path.join(self.directory.name, 'draw_numbers_hu6_SQL.txt')) as f:
+            self.assertEqual(f.read(), "INSERT INTO draw (draw_date, lottery_id, numbers) VALUES\n"
+                                       "('2023-01-15', 'hu6', ARRAY[1,2,3,4,5,6]),\n"
+                                       "('2023-01-08', 'hu6', ARRAY[7,8,9,10,11,45]),")
+
+    def test_invalid_rows_are_reported(self):
+        """Test every kind of invalid row is reported with its CSV line, and no txt is written."""
+        path = self.write_csv("2023.01.22.,hu6,1,2,3,4,5,6,\n"
+                              "2023.01.15.,hu6,1,2,3,4,5,,\n"
+                              "2023.01.08.,hu6,1,2,3,4,5,46,\n"
+                              "2023.01.01.,hu6,1,2,3,4,5,5,\n"
+                              "2022.12.25.,hu5,1,2,3,4,5,x,\n"
+                              "2022.12.25.,hu6,1,2,3,4,5,6,\n")
+        problems = validate_draws(read_draws_frame(path), 'hu6', DRAW_RULES['hu6'])
+
+        self.assertEqual(problems, [
+            "line 6 (2022-12-25): lottery_id is not hu6",
+            "line 3 (2023-01-15): not 6 numbers",
+            "line 6 (2022-12-25): not a whole number",
+            "line 4 (2023-01-08): number outside 1..45",
+            "line 5 (2023-01-01): repeated number",
+            "line 6 (2022-12-25): repeated date",
+            "line 7 (2022-12-25): repeated date",
+        ])
+        self.assertEqual(len(refine_lottery('hu6', path, DRAW_RULES['hu6'], self.directory.name)[2]), 7)
+        self.assertFalse(os.path.exists(os.path.join(self.directory.name, 'draw_numbers_hu6_SQL.txt')))
+
+    def test_missing_first_date(self):
+        """Test a CSV starting without a date is reported instead of guessed."""
+        path = self.write_csv(",hu6,1,2,3,4,5,6,\n")
+        self.assertEqual(validate_draws(read_draws_frame(path), 'hu6', DRAW_RULES['hu6']),
+                         ["line 2 (?): missing date before the first known one"])
+
+    def test_to_sql_hu7(self):
+        """Test the txt lines of a 7-number lottery."""
+        path = os.path.join(self.directory.name, 'draw_numbers_hu7a.csv')
+        with open(path, 'w') as f:
+            f.write("date,lottery_id,n1,n2,n3,n4,n5,n6,n7\n2023.1.4.,hu7a,7,8,13,16,20,25,31\n")
+        self.assertEqual(to_sql(read_draws_frame(path), 'hu7a', DRAW_RULES['hu7a']).splitlines()[1],
+                         "('2023-01-04', 'hu7a', ARRAY[7,8,13,16,20,25,31]),")
+
+    def write_hu7_csvs(self, text_a, text_b):
+        """Write the hu7a and hu7b CSVs and return their paths."""
+        paths = []
+        for draw_id, text in (('hu7a', text_a), ('hu7b', text_b)):
+            paths.append(os.path.join(self.directory.name, f'draw_numbers_{draw_id}.csv'))
+            with open(paths[-1], 'w') as f:
+                f.write("date,lottery_id,n1,n2,n3,n4,n5,n6,n7\n" + text)
+        return paths
+
+    def test_hu7_paired_sql(self):
+        """Test the hu7a and hu7b draws of a date are written as one draw_hu7 row."""
+        paths = self.write_hu7_csvs("2023.1.11.,hu7a,1,2,3,4,5,6,7\n2023.1.4.,hu7a,7,8,13,16,20,25,31\n",
+                                    "2023.1.4.,hu7b,2,3,6,12,13,14,31\n2023.1.11.,hu7b,8,9,10,11,12,13,14\n")
+        self.assertEqual(refine_hu7(paths, DRAW_RULES, self.directory.name), ('hu7', 2, []))
+
+        with open(os.path.join(self.directory.name, 'draw_numbers_hu7_SQL.txt')) as f:
+            self.assertEqual(f.read(), "INSERT INTO draw_hu7 (draw_date, numbers_a, numbers_b) VALUES\n"
+                                       "('2023-01-11', ARRAY[1,2,3,4,5,6,7], ARRAY[8,9,10,11,12,13,14]),\n"
+                                       "('2023-01-04', ARRAY[7,8,13,16,20,25,31], ARRAY[2,3,6,12,13,14,31]),")
+
+    def test_hu7_unpaired_dates_are_reported(self):
+        """Test a date with only one hu7 draw and an invalid hu7b row are reported, and no txt is written."""
+        paths = self.write_hu7_csvs("2023.1.11.,hu7a,1,2,3,4,5,6,7\n2023.1.4.,hu7a,7,8,13,16,20,25,31\n",
+                                    "2023.1.11.,hu7b,8,9,10,11,12,13,36\n")
+        self.assertEqual(refine_hu7(paths, DRAW_RULES, self.directory.name)[2], [
+            "hu7b line 2 (2023-01-11): number outside 1..35",
+            "hu7a line 3 (2023-01-04): no hu7b draw on the date",
+        ])
+        self.assertFalse(os.path.exists(os.path.join(self.directory.name, 'draw_numbers_hu7_SQL.txt')))
+
+
+if __name__ == '__main__':
+    unittest.main()
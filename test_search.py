@@ -0,0 +1,78 @@
+import unittest
+import datetime
+import os
+import tempfile
+
+import numpy as np
+
+from batch import BatchChecker
+from benchmarks.synthetic import synthetic_history
+from search import TicketSearch, WIN_TIER, prefix_tickets, ticket_prefixes, top_k_indices
+
+
+class TestTicketSearch(unittest.TestCase):
+    """Tests for the exhaustive best/worst ticket search."""
+
+    def setUp(self):
+        """Create a random hu6 and hu7 history over a few 64-bit words."""
+        self.rows = synthetic_history(('hu6', 'hu7a', 'hu7b'), 150, seed=7, last_date=datetime.date(2023, 1, 1))
+        # The last chunks are the smallest, e.g. (38, 39) holds the 15 tickets 38, 39 + 4 of 40..45.
+        self.prefixes = ticket_prefixes('hu6')[-6:]
+
+    def test_prefixes_cover_every_ticket(self):
+        """Test the chunks hold every ticket exactly once."""
+        self.assertEqual(sum(len(prefix_tickets('hu7', prefix)) for prefix in ticket_prefixes('hu7')), 6724520)
+        np.testing.assert_array_equal(prefix_tickets('hu6', (38, 39))[0], [38, 39, 40, 41, 42, 43])
+
+    def test_top_k_indices_ties(self):
+        """Test the highest scores come first and ties go to the lower index."""
+        scores = np.array([1, 5, 3, 5, 3, 3, 0])
+        self.assertEqual(top_k_indices(scores, 3).tolist(), [1, 3, 2])
+        self.assertEqual(top_k_indices(-scores, 2).tolist(), [6, 0])
+        self.assertEqual(top_k_indices(scores[:2], 3).tolist(), [1, 0])
+
+    def test_score_matches_batch_checker(self):
+        """Test the level counts and wins equal the BatchChecker histograms."""
+        checker = BatchChecker(self.rows)
+        for lottery_id, prefix in (('hu6', (1, 40)), ('hu7', (2, 30))):
+            with self.subTest(lottery_id=lottery_id):
+                tickets = prefix_tickets(lottery_id, prefix)
+                histograms, wins = checker.check(lottery_id, tickets)
+                scores = TicketSearch(self.rows, lottery_id).score(tickets)
+                np.testing.assert_array_equal(scores[:, :-1], histograms)
+                np.testing.assert_array_equal(scores[:, -1], wins)
+
+    def test_run_matches_brute_force(self):
+        """Test the kept tickets are the best of all scored tickets, ties to the smaller ticket."""
+        results = TicketSearch(self.rows, 'hu6', top_k=3).run(workers=1, prefixes=self.prefixes)
+
+        tickets = np.vstack([prefix_tickets('hu6', prefix) for prefix in self.prefixes])
+        _, wins = BatchChecker(self.rows).check('hu6', tickets)
+        ranked = sorted(zip(tickets.tolist(), wins.tolist()), key=lambda item: (-item[1], item[0]))
+        self.assertEqual(results[WIN_TIER]['most'], [tuple(item) for item in ranked[:3]])
+        ranked = sorted(zip(tickets.tolist(), wins.tolist()), key=lambda item: (item[1], item[0]))
+        self.assertEqual(results[WIN_TIER]['least'], [tuple(item) for item in ranked[:3]])
+
+    def test_process_pool_matches_single_process(self):
+        """Test the pool gives the same results as a single process."""
+        search = TicketSearch(self.rows, 'hu6', top_k=3)
+        self.assertEqual(search.run(workers=2, prefixes=self.prefixes), search.run(workers=1, prefixes=self.prefixes))
+
+    def test_checkpoint_resume(self):
+        """Test a resumed run skips the saved chunks and ends with the results of a full run."""
+        search = TicketSearch(self.rows, 'hu6', top_k=3)
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = os.path.join(directory, 'search.json')
+            search.run(workers=1, checkpoint=checkpoint, prefixes=self.prefixes[:3])
+            state = search._load_state(checkpoint)
+            self.assertEqual(len(state['done']), 3)
+
+            resumed = search.run(workers=1, checkpoint=checkpoint, prefixes=self.prefixes)
+            self.assertEqual(resumed, search.run(workers=1, prefixes=self.prefixes))
+
+            # A checkpoint of another top-K is not resumed.
+            self.assertEqual(TicketSearch(self.rows, 'hu6', top_k=5)._load_state(checkpoint)['done'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
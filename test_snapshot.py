@@ -0,0 +1,85 @@
+import unittest
+import datetime
+import os
+import tempfile
+
+import numpy as np
+
+from benchmarks.synthetic import synthetic_history
+from snapshot import SnapshotStorage, numbers_to_words, words_to_numbers, write_snapshot
+from storage import EmbeddedStorage
+
+
+class TestSnapshotStorage(unittest.TestCase):
+    """Tests for the memory-mapped draw snapshot."""
+
+    def setUp(self):
+        """Write a snapshot of a random history of every lottery, with one 6-number hu7a draw."""
+        self.rows = synthetic_history(('hu5', 'hu6', 'hu7a', 'hu7b'), 100, seed=15, last_date=datetime.date(2023, 1, 1))
+        self.rows.append(('hu7a', datetime.date(2000, 1, 5), [7, 8, 13, 16, 20, 25]))
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'draws.snapshot')
+        write_snapshot(self.path, self.rows)
+        self.storage = SnapshotStorage(self.path)
+
+    def test_masks_round_trip(self):
+        """Test the two-word masks hold every ball of every lottery, including 64 and 90."""
+        draws = [[1, 63, 64, 65, 90, 0], [7, 8, 13, 16, 20, 25]]
+        masks = numbers_to_words(draws)
+        self.assertEqual(masks[0].tolist(), [(1 << 0) | (1 << 62) | (1 << 63), (1 << 0) | (1 << 25)])
+        self.assertEqual(words_to_numbers(masks), [[1, 63, 64, 65, 90], [7, 8, 13, 16, 20, 25]])
+
+    def test_header(self):
+        """Test the data version and the draw counts read from the file."""
+        self.assertEqual(self.storage.latest_draw_date(), datetime.date(2023, 1, 1))
+        self.assertEqual(self.storage.total_draws('hu7a'), 101)
+        self.assertEqual(self.storage.total_draws('hu7b'), 100)
+        self.assertEqual(sorted(self.storage.draws()), sorted(self.rows))
+
+    def test_results_match_embedded_storage(self):
+        """Test check and histogram equal the EmbeddedStorage results for every lottery."""
+        embedded = EmbeddedStorage(self.rows)
+        rng = np.random.default_rng(16)
+        for lottery_id, length, max_number in (('hu5', 5, 90), ('hu6', 6, 45), ('hu7', 7, 35)):
+            for _ in range(10):
+                numbers = rng.choice(np.arange(1, max_number + 1), length, replace=False).tolist()
+                with self.subTest(lottery_id=lottery_id, numbers=numbers):
+                    ordinals, counts = self.storage.match_series(lottery_id, numbers)
+                    self.assertEqual((ordinals.tolist(), [draw_counts.tolist() for draw_counts in counts]),
+                                     embedded.match_series(lottery_id, numbers))
+                    self.assertEqual(self.storage.histogram(lottery_id, numbers, limit=5),
+                                     embedded.histogram(lottery_id, numbers, limit=5))
+                    for match_count in range(length + 1):
+                        self.assertEqual(self.storage.check(lottery_id, numbers, match_count, limit=5),
+                                         embedded.check(lottery_id, numbers, match_count, limit=5))
+                        before = datetime.date(2022, 6, 1)
+                        self.assertEqual(self.storage.check(lottery_id, numbers, match_count, limit=5, before=before),
+                                         embedded.check(lottery_id, numbers, match_count, limit=5, before=before))
+
+    def test_rewrite_keeps_open_mapping(self):
+        """Test a rewritten snapshot is seen by new storages, while an open one keeps its data."""
+        write_snapshot(self.path, self.rows[:4])
+        self.assertEqual(SnapshotStorage(self.path).total_draws('hu5'), 1)
+        self.assertEqual(self.storage.total_draws('hu5'), 100)
+        self.assertEqual(len(self.storage.check('hu5', self.rows[0][2], 5)[0]), 1)
+
+    def test_invalid_file(self):
+        """Test a file without the snapshot header is rejected."""
+        path = f"{self.path}.invalid"
+        with open(path, 'wb') as f:
+            f.write(b'\0' * 128)
+        with self.assertRaises(ValueError):
+            SnapshotStorage(path)
+
+    def test_missing_lottery(self):
+        """Test a lottery without draws returns empty results."""
+        write_snapshot(self.path, self.rows[:1])
+        storage = SnapshotStorage(self.path)
+        self.assertEqual(storage.check('hu7', [1, 2, 3, 4, 5, 6, 7], 4), ([], 0, 0))
+        self.assertEqual(storage.histogram('hu6', [1, 2, 3, 4, 5, 6])[1], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import datetime
+
+from stats import CoOccurrenceStats
+
+
+class TestCoOccurrenceStats(unittest.TestCase):
+    """Tests for the number, pair and triple frequency tables."""
+
+    def setUp(self):
+        """Create a small hu5 history, the newest draw last."""
+        self.rows = [
+            ('hu5', datetime.date(2023, 1, 1), [1, 2, 3, 4, 5]),
+            ('hu5', datetime.date(2023, 1, 8), [5, 3, 1, 80, 90]),
+            ('hu7a', datetime.date(2023, 1, 4), [7, 8, 13, 16, 20, 2]),  # 6-number draw
+        ]
+        self.statistics = CoOccurrenceStats(self.rows)
+
+    def test_ticket_entries(self):
+        """Test counts and last seen dates of a ticket's numbers and pairs."""
+        self.assertEqual(self.statistics.ticket('hu5', [3, 1, 6]), [
+            ((1,), 2, datetime.date(2023, 1, 8)),
+            ((3,), 2, datetime.date(2023, 1, 8)),
+            ((6,), 0, None),
+        ])
+        self.assertEqual(self.statistics.ticket('hu5', [2, 4], size=2), [((2, 4), 1, datetime.date(2023, 1, 1))])
+
+    def test_top_hot_and_cold(self):
+        """Test the most and least frequent entries, ties broken by the smaller numbers."""
+        self.assertEqual(self.statistics.top('hu5', size=3, n=1), [((1, 3, 5), 2, datetime.date(2023, 1, 8))])
+        self.assertEqual([entry for entry, _, _ in self.statistics.top('hu5', n=3)], [(1,), (3,), (5,)])
+        self.assertEqual(self.statistics.top('hu5', n=1, cold=True), [((6,), 0, None)])
+
+    def test_short_draw_padding_is_not_reported(self):
+        """Test the padding of a 6-number hu7a draw never shows up as a number."""
+        entries = [entry for entry, _, _ in self.statistics.top('hu7a', size=2, n=15)]
+        self.assertEqual(len(entries), 15)
+        self.assertTrue(all(0 not in entry for entry in entries))
+        self.assertEqual(self.statistics.total_draws('hu7a'), 1)
+
+    def test_incremental_update_equals_rebuild(self):
+        """Test adding draws one by one, in any order, equals building from all of them."""
+        new_draw = ('hu5', datetime.date(2023, 1, 15), [1, 2, 3, 88, 89])
+        incremental = CoOccurrenceStats()
+        for row in reversed(self.rows + [new_draw]):
+            incremental.add_rows([row])
+        rebuilt = CoOccurrenceStats(self.rows + [new_draw])
+
+        for size in (1, 2, 3):
+            with self.subTest(size=size):
+                self.assertEqual(incremental.top('hu5', size, 50), rebuilt.top('hu5', size, 50))
+        self.assertEqual(incremental.latest_draw_date(), datetime.date(2023, 1, 15))
+        self.assertEqual(incremental.total_draws('hu5'), 3)
+
+    def test_add_new_draws(self):
+        """Test only the draws newer than the latest one of their lottery_id are added."""
+        statistics = CoOccurrenceStats(self.rows)
+        new_draw = ('hu5', datetime.date(2023, 1, 15), [1, 2, 3, 88, 89])
+        self.assertEqual(statistics.add_new_draws(self.rows + [new_draw]), 1)
+        self.assertEqual(statistics.add_new_draws(self.rows + [new_draw]), 0)
+        self.assertEqual(statistics.top('hu5', 3, 50), CoOccurrenceStats(self.rows + [new_draw]).top('hu5', 3, 50))
+
+    def test_unknown_lottery(self):
+        """Test a lottery without draws returns empty results."""
+        self.assertEqual(self.statistics.top('hu6'), [])
+        self.assertEqual(self.statistics.ticket('hu6', [1, 2, 3]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import unittest
+import datetime
+import os
+import tempfile
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from metrics import Metrics
+from storage import LATEST_DRAW_DATE_QUERY, EmbeddedStorage, PostgresStorage, read_draws_csv
+
+
+class TestPostgresStorage(unittest.TestCase):
+    """Tests for the PostgreSQL storage."""
+
+    def test_connection_is_lazy(self):
+        """Test that the connection is only opened by the first query."""
+        connect = MagicMock()
+        storage = PostgresStorage(connect)
+        connect.assert_not_called()
+
+        connect.return_value.query.return_value = pd.DataFrame([(datetime.date(2023, 1, 8),)])
+        self.assertEqual(storage.latest_draw_date(), datetime.date(2023, 1, 8))
+        connect.return_value.query.assert_called_once_with(LATEST_DRAW_DATE_QUERY, ttl="1h")
+
+    def test_check_passes_limit(self):
+        """Test that the row limit and the page cursor are query parameters."""
+        connect = MagicMock()
+        connect.return_value.query.return_value = pd.DataFrame([(None, None, None, 0, 50)])
+        results, total_draws, winning_draws = PostgresStorage(connect).check(
+            'hu5', [1, 2, 3, 4, 5], 5, limit=3, before=datetime.date(2023, 1, 8))
+
+        self.assertEqual((results, total_draws, winning_draws), ([], 50, 0))
+        params = connect.return_value.query.call_args.kwargs['params']
+        self.assertEqual((params['limit'], params['before']), (3, datetime.date(2023, 1, 8)))
+        self.assertIn("draw_date < CAST(:before AS DATE)", connect.return_value.query.call_args.args[0])
+
+    def test_check_hu7_reads_paired_table(self):
+        """Test a hu7 check reads both draws of a date from one draw_hu7 row, without a join on the date."""
+        connect = MagicMock()
+        connect.return_value.query.return_value = pd.DataFrame(
+            [(datetime.date(2023, 1, 11), [1, 2, 3, 4, 5, 6, 7], 3, [8, 9, 10, 11, 12, 13, 14], 0, 1, 50)])
+        self.assertEqual(PostgresStorage(connect).check('hu7', [1, 2, 3, 20, 21, 22, 23], 3),
+                         ([('2023-01-11', [1, 2, 3, 4, 5, 6, 7], 3, [8, 9, 10, 11, 12, 13, 14], 0)], 50, 1))
+
+        query = connect.return_value.query.call_args.args[0]
+        self.assertIn("FROM draw_hu7", query)
+        self.assertNotIn("INNER JOIN", query)
+
+    def test_check_index_plans(self):
+        """Test high match counts only score the draws found by the mask or the numbers index."""
+        connect = MagicMock()
+        connect.return_value.query.return_value = pd.DataFrame([(None, None, None, 0, 50)])
+        storage = PostgresStorage(connect)
+
+        storage.check('hu5', [1, 2, 3, 4, 5], 5)
+        query = connect.return_value.query.call_args.args[0]
+        self.assertIn("lottery_id = :id AND (mask = CAST(:mask AS BIT(90)))", query)
+        self.assertIn("(SELECT COUNT(*) FROM draw WHERE lottery_id = :id) AS total_count", query)
+
+        storage.check('hu5', [1, 2, 3, 4, 5], 4)
+        query = connect.return_value.query.call_args.args[0]
+        params = connect.return_value.query.call_args.kwargs['params']
+        self.assertIn("numbers @> CAST(:subset_0 AS INT[]) OR", query)
+        self.assertEqual([params[f"subset_{i}"] for i in range(5)],
+                         [[1, 2, 3, 4], [1, 2, 3, 5], [1, 2, 4, 5], [1, 3, 4, 5], [2, 3, 4, 5]])
+
+        storage.check('hu7', [1, 2, 3, 4, 5, 6, 7], 7)
+        self.assertIn("WHERE mask_a = CAST(:mask AS BIT(90)) OR mask_b = CAST(:mask AS BIT(90))",
+                      connect.return_value.query.call_args.args[0])
+
+    def test_match_series(self):
+        """Test the date ordinals and the paired hu7 match counts of the series query."""
+        connect = MagicMock()
+        connect.return_value.query.return_value = pd.DataFrame([(738893, 3, 1), (738886, 0, 7)])
+        self.assertEqual(PostgresStorage(connect).match_series('hu7', [1, 2, 3, 4, 5, 6, 7]),
+                         ([738893, 738886], [[3, 0], [1, 7]]))
+
+        connect.return_value.query.side_effect = Exception("Mocked query failure")
+        self.assertEqual(PostgresStorage(connect).match_series('hu5', [1, 2, 3, 4, 5]), ([], [[]]))
+
+    def test_metrics(self):
+        """Test the query, conversion and formatting stages are timed per lottery, and errors counted."""
+        connect = MagicMock()
+        connect.return_value.query.return_value = pd.DataFrame([(datetime.date(2023, 1, 8), [1, 2, 3, 7, 90], 3, 1, 50)])
+        metrics = Metrics()
+        PostgresStorage(connect, metrics).check('hu5', [1, 2, 3, 4, 5], 3)
+        for stage in ('query', 'conversion', 'formatting'):
+            self.assertEqual(metrics.value('lottery_stage_seconds', stage=stage, lottery='hu5')[0], 1)
+
+        connect.return_value.query.side_effect = Exception("Mocked query failure")
+        PostgresStorage(connect, metrics).histogram('hu6', [1, 2, 3, 4, 5, 6])
+        self.assertEqual(metrics.value('lottery_errors_total', stage='query', lottery='hu6'), 1)
+
+    def test_connection_error(self):
+        """Test that a failing connection returns empty results."""
+        connect = MagicMock(side_effect=Exception("Mocked connection failure"))
+        storage = PostgresStorage(connect)
+        self.assertEqual(storage.check('hu5', [1, 2, 3, 4, 5], 2), ([], 0, 0))
+        self.assertIsNone(storage.latest_draw_date())
+
+    def test_draws_connection_error(self):
+        """Test that the history of a failing connection is empty and counted as a query error."""
+        metrics = Metrics()
+        storage = PostgresStorage(MagicMock(side_effect=Exception("Mocked connection failure")), metrics)
+        self.assertEqual(storage.draws(), [])
+        self.assertEqual(metrics.value('lottery_errors_total', stage='query', lottery='unknown'), 1)
+
+
+class TestEmbeddedStorage(unittest.TestCase):
+    """Tests for the storage built from the data_refining CSVs."""
+
+    def test_read_draws_csv_fixes_dates(self):
+        """Test dates are parsed and missing ones are filled with the previous date - 7 days."""
+        with tempfile.TemporaryDirectory() as data_dir:
+            path = os.path.join(data_dir, 'draw_numbers_hu6.csv')
+            with open(path, 'w') as f:
+                f.write("date,lottery_id,n1,n2,n3,n4,n5,n6,\n"
+                        "2023.01.15.,hu6,1,2,3,4,5,6,\n"
+                        ",hu6,7,8,9,10,11,12,\n"
+                        ",hu6,13,14,15,16,17,18,19\n")
+            rows = read_draws_csv(path, 'hu6')
+
+        self.assertEqual(rows, [
+            ('hu6', datetime.date(2023, 1, 15), [1, 2, 3, 4, 5, 6]),
+            ('hu6', datetime.date(2023, 1, 8), [7, 8, 9, 10, 11, 12]),
+            ('hu6', datetime.date(2023, 1, 1), [13, 14, 15, 16, 17, 18]),
+        ])
+
+    def test_from_csv(self):
+        """Test the shipped CSVs load every draw of every lottery."""
+        storage = EmbeddedStorage.from_csv()
+        self.assertEqual(storage.total_draws('hu5'), 3583)
+        self.assertEqual(storage.total_draws('hu6'), 1757)
+        self.assertEqual(storage.total_draws('hu7a'), 1360)
+        self.assertEqual(storage.total_draws('hu7b'), 1360)
+
+        histogram, total_draws = storage.histogram('hu7', [1, 2, 3, 4, 5, 6, 7])
+        self.assertEqual(total_draws, 1360)
+        # Every date is counted at the level of both of its draws, once if they are equal.
+        self.assertGreaterEqual(sum(count for count, _ in histogram.values()), total_draws)
+
+    def test_from_storage(self):
+        """Test a copy of another storage answers the same as that storage."""
+        source = EmbeddedStorage([('hu5', datetime.date(2023, 1, 1), [1, 2, 6, 7, 8])])
+        storage = EmbeddedStorage.from_storage(source)
+        self.assertEqual(storage.check('hu5', [1, 2, 3, 4, 5], 2), source.check('hu5', [1, 2, 3, 4, 5], 2))
+        self.assertEqual(storage.draws(), source.draws())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import datetime
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.synthetic import synthetic_history
+from cache import ResultCache
+from core import TicketChecker
+from search import WIN_TIER
+from storage import EmbeddedStorage
+from windows import MatchWindows
+
+
+class TestMatchWindows(unittest.TestCase):
+    """Tests for the prefix sum date windows of a ticket."""
+
+    def setUp(self):
+        """Create a random hu5 and hu7 history of irregular dates."""
+        self.rows = synthetic_history(('hu5', 'hu7a', 'hu7b'), 120, seed=23, last_date=datetime.date(2021, 8, 31),
+                                      irregular=True)
+        self.storage = EmbeddedStorage(self.rows)
+
+    def brute_force(self, lottery_id, ticket, start, end):
+        """Count the draws of a window at every tier draw by draw."""
+        draw_ids = ['hu7a', 'hu7b'] if lottery_id == 'hu7' else [lottery_id]
+        by_date = {}
+        for draw_id, date, numbers in self.rows:
+            if draw_id in draw_ids and start <= date <= end:
+                by_date.setdefault(date, []).append(len(set(numbers) & set(ticket)))
+        tiers = list(range(len(ticket) + 1)) + [WIN_TIER]
+        counts = {tier: 0 for tier in tiers}
+        for matches in by_date.values():
+            for level in set(matches):
+                counts[level] += 1
+            counts[WIN_TIER] += max(matches) >= {'hu5': 2, 'hu7': 4}[lottery_id]
+        return len(by_date), counts
+
+    def test_windows_match_brute_force(self):
+        """Test random windows, inside and around the history, against draw by draw counts."""
+        rng = np.random.default_rng(24)
+        for lottery_id, ticket in (('hu5', [1, 2, 3, 4, 5]), ('hu7', [1, 2, 3, 4, 5, 6, 7])):
+            windows = MatchWindows(lottery_id, *self.storage.match_series(lottery_id, ticket))
+            for _ in range(50):
+                start, end = sorted(datetime.date(2019, 12, 1) + datetime.timedelta(days=int(days))
+                                    for days in rng.integers(0, 800, 2))
+                with self.subTest(lottery_id=lottery_id, start=start, end=end):
+                    self.assertEqual(windows.window(start, end), self.brute_force(lottery_id, ticket, start, end))
+
+    def test_whole_history_matches_histogram(self):
+        """Test the open window equals the match count histogram of the storage."""
+        ticket = [1, 2, 3, 4, 5, 6, 7]
+        windows = MatchWindows('hu7', *self.storage.match_series('hu7', ticket))
+        histogram, total_draws = self.storage.histogram('hu7', ticket)
+        draws, counts = windows.window()
+        self.assertEqual(draws, total_draws)
+        self.assertEqual({level: counts[level] for level in histogram}, {level: histogram[level][0] for level in histogram})
+
+    def test_yearly(self):
+        """Test the yearly counts cover every year and add up to the whole history."""
+        windows = MatchWindows('hu5', *self.storage.match_series('hu5', [1, 2, 3, 4, 5]))
+        yearly = windows.yearly(1)
+        self.assertEqual([year for year, _ in yearly], list(range(windows.first_date.year, windows.last_date.year + 1)))
+        self.assertEqual(sum(count for _, count in yearly), windows.window()[1][1])
+        self.assertEqual(yearly[0][1], windows.window(end=datetime.date(2020, 12, 31))[1][1])
+
+    def test_empty_and_reversed_windows(self):
+        """Test a history without draws and a window ending before it starts count nothing."""
+        empty = MatchWindows('hu5', [], [[]])
+        self.assertEqual(empty.window(), (0, {0: 0, 1: 0, 2: 0, 3: 0, 4: 0, 5: 0, WIN_TIER: 0}))
+        self.assertEqual(empty.yearly(WIN_TIER), [])
+
+        windows = MatchWindows('hu5', *self.storage.match_series('hu5', [1, 2, 3, 4, 5]))
+        self.assertEqual(windows.window(datetime.date(2021, 1, 1), datetime.date(2020, 1, 1))[0], 0)
+
+    def test_cached_entry_size(self):
+        """Test a cached hu5 ticket of the full history keeps only its int16 prefix sums, the calendar is shared."""
+        storage, cache = EmbeddedStorage.from_csv(), ResultCache()
+        first, _ = TicketChecker('hu5', [1, 2, 3, 4, 5], storage, cache=cache).check_lottery_windows()
+        tracemalloc.start()
+        for ticket in ([6, 7, 8, 9, 10], [11, 12, 13, 14, 15], [16, 17, 18, 19, 20], [21, 22, 23, 24, 25]):
+            windows, _ = TicketChecker('hu5', ticket, storage, cache=cache).check_lottery_windows()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.assertIs(windows.calendar, first.calendar)
+        self.assertEqual(windows.nbytes, (3583 + 1) * 7 * 2)
+        self.assertLess(size / 4, 64 * 1024)  # a whole MatchWindows of int64 arrays was 430 KB
+
+
+if __name__ == '__main__':
+    unittest.main()
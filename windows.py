@@ -0,0 +1,125 @@
+# --- Import necessary libraries ---
+import datetime
+
+import numpy as np
+
+from batch import PRIZE_MIN_MATCHES, TICKET_RULES
+from search import WIN_TIER
+
+
+class DrawCalendar:
+    """
+    The draw dates of a lottery: a table indexed by the day ordinal gives the number of draws up to
+    any date. It is the same for every ticket, so it is built once per lottery and history (see shared)
+    and only the prefix sums are kept per ticket.
+    """
+
+    # lottery_id: the DrawCalendar of the latest history seen, shared by the MatchWindows of every ticket.
+    _shared = {}
+
+    def __init__(self, ordinals):
+        """Build the table from the date ordinals of the draws, oldest first."""
+        self.ordinals = np.asarray(ordinals, dtype=np.int32)
+        self.n_draws = len(self.ordinals)
+
+        # _draws_until[day - first ordinal] = draws on or before that day.
+        if self.n_draws:
+            days = np.arange(self.ordinals[0], self.ordinals[-1] + 1, dtype=np.int32)
+            self._draws_until = np.searchsorted(self.ordinals, days, side='right').astype(np.int32)
+        else:
+            self._draws_until = np.zeros(0, dtype=np.int32)
+
+    @classmethod
+    def shared(cls, lottery_id, ordinals):
+        """Return the calendar of a lottery's draw ordinals (oldest first), built again only when they change."""
+        calendar = cls._shared.get(lottery_id)
+        if calendar is None or not np.array_equal(calendar.ordinals, ordinals):
+            calendar = cls._shared[lottery_id] = cls(ordinals)
+        return calendar
+
+    @property
+    def first_date(self):
+        """The date of the oldest draw, or None without draws."""
+        return datetime.date.fromordinal(int(self.ordinals[0])) if self.n_draws else None
+
+    @property
+    def last_date(self):
+        """The date of the newest draw, or None without draws."""
+        return datetime.date.fromordinal(int(self.ordinals[-1])) if self.n_draws else None
+
+    def draws_until(self, ordinal):
+        """Return the number of draws on or before a day ordinal."""
+        if not self.n_draws or ordinal < self.ordinals[0]:
+            return 0
+        if ordinal >= self.ordinals[-1]:
+            return self.n_draws
+        return int(self._draws_until[ordinal - self.ordinals[0]])
+
+
+class MatchWindows:
+    """
+    Draw counts of one ticket in any date window, from prefix sums over the draws.
+    prefix[i, column] is the number of the i oldest draws at a tier (the match levels 0..k and,
+    last, any prize), so a window is the difference of two rows. The DrawCalendar of the lottery
+    gives the draws up to any date, so every window is answered in O(1).
+    """
+
+    def __init__(self, lottery_id, ordinals, counts):
+        """
+        Build the prefix sums from the (ordinals, counts) of Storage.match_series: the date ordinals and
+        one match count list per draw (two for hu7), newest draw first.
+        A hu7 date is counted at the level of both its draws (once if they are equal) and wins if either does.
+        """
+        self.lottery_id = lottery_id
+        self.tiers = list(range(TICKET_RULES[lottery_id]['length'] + 1)) + [WIN_TIER]
+
+        self.calendar = DrawCalendar.shared(lottery_id, np.asarray(ordinals, dtype=np.int32)[::-1])
+        counts = [np.asarray(draw_counts, dtype=np.uint8)[::-1] for draw_counts in counts]
+        self.n_draws = self.calendar.n_draws
+
+        hits = np.zeros((self.n_draws, len(self.tiers)), dtype=bool)
+        for draw_counts in counts:
+            hits[np.arange(self.n_draws), draw_counts] = True
+            hits[:, -1] |= draw_counts >= PRIZE_MIN_MATCHES[lottery_id]
+
+        # The smallest type holding the count of every draw, int16 up to 32767 draws.
+        dtype = np.int16 if self.n_draws <= np.iinfo(np.int16).max else np.int32
+        self._prefix = np.zeros((self.n_draws + 1, len(self.tiers)), dtype=dtype)
+        np.cumsum(hits, axis=0, dtype=dtype, out=self._prefix[1:])
+
+    @property
+    def nbytes(self):
+        """The memory of the ticket's prefix sums, the calendar is shared by every ticket of the lottery."""
+        return self._prefix.nbytes
+
+    @property
+    def first_date(self):
+        """The date of the oldest draw, or None without draws."""
+        return self.calendar.first_date
+
+    @property
+    def last_date(self):
+        """The date of the newest draw, or None without draws."""
+        return self.calendar.last_date
+
+    def window(self, start=None, end=None):
+        """
+        Count the draws between the dates start and end (both included, None for no limit).
+        Returns (draws in the window, {tier: draws at the tier}).
+        """
+        low = self.calendar.draws_until(start.toordinal() - 1) if start else 0
+        high = self.calendar.draws_until(end.toordinal()) if end else self.n_draws
+        high = max(high, low)
+        counts = self._prefix[high] - self._prefix[low]
+        return high - low, {tier: int(count) for tier, count in zip(self.tiers, counts)}
+
+    def yearly(self, tier):
+        """Return the [(year, draws at the tier)] of every calendar year from the first to the last draw."""
+        if not self.n_draws:
+            return []
+        column = self.tiers.index(tier)
+        years = range(self.first_date.year, self.last_date.year + 1)
+        bounds = [self.calendar.draws_until(datetime.date(year, 1, 1).toordinal() - 1) for year in years]
+        bounds.append(self.n_draws)
+        return [(year, int(self._prefix[high, column] - self._prefix[low, column]))
+                for year, low, high in zip(years, bounds, bounds[1:])]